@@ -0,0 +1,5 @@
+"""Suíte de benchmarks do TaskCrafter CLI.
+
+Os testes em ``tests/`` cobrem corretude; este pacote mede como o
+``TaskManager`` escala com o tamanho do armazenamento.
+"""
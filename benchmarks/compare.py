@@ -0,0 +1,102 @@
+"""Compara dois resultados de benchmark e aponta regressões.
+
+Uso:
+    python -m benchmarks.compare base.json atual.json --limiar 0.10 \\
+        --limiar-por load_tasks=0.25 --limiar-por "cli*=0.5"
+
+O código de saída é 1 quando algum benchmark ficou mais lento que o limiar.
+"""
+
+import argparse
+import fnmatch
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+
+def carregar(caminho: str) -> Dict:
+    """Carrega um arquivo de resultados gerado por ``benchmarks.run``."""
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def limiar_para(nome: str, padrao: float, especificos: Dict[str, float]) -> float:
+    """Retorna o limiar do benchmark, aceitando padrões no estilo glob.
+    
+    Args:
+        nome: Nome do benchmark
+        padrao: Limiar padrão (fração, ex.: 0.10 = 10%)
+        especificos: Limiares por nome ou padrão glob
+    """
+    if nome in especificos:
+        return especificos[nome]
+    for padrao_nome, limiar in especificos.items():
+        if fnmatch.fnmatchcase(nome, padrao_nome):
+            return limiar
+    return padrao
+
+
+def comparar(base: Dict, atual: Dict, limiar: float = 0.10,
+             especificos: Optional[Dict[str, float]] = None) -> List[Tuple[str, str, float, float, float, bool]]:
+    """Compara os menores tempos de cada benchmark presente nos dois resultados.
+    
+    Args:
+        base: Resultados de referência
+        atual: Resultados a avaliar
+        limiar: Aumento relativo tolerado
+        especificos: Limiares por benchmark
+        
+    Returns:
+        Lista de (tamanho, nome, base, atual, variação, regrediu)
+    """
+    especificos = especificos or {}
+    linhas = []
+    for tamanho, medidas in atual["resultados"].items():
+        referencia = base["resultados"].get(tamanho, {})
+        for nome, medida in medidas.items():
+            if nome not in referencia:
+                continue
+            antes = referencia[nome]["min"]
+            depois = medida["min"]
+            variacao = (depois - antes) / antes if antes else 0.0
+            regrediu = variacao > limiar_para(nome, limiar, especificos)
+            linhas.append((tamanho, nome, antes, depois, variacao, regrediu))
+    return linhas
+
+
+def _parse_limiar(valor: str) -> Tuple[str, float]:
+    """Converte ``nome=fração`` em tupla."""
+    nome, _, limiar = valor.rpartition('=')
+    if not nome:
+        raise argparse.ArgumentTypeError("Use o formato nome=fração")
+    return nome, float(limiar)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da comparação."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.compare',
+                                     description='Compara resultados de benchmark')
+    parser.add_argument('base', help='Resultados de referência')
+    parser.add_argument('atual', help='Resultados a avaliar')
+    parser.add_argument('--limiar', type=float, default=0.10,
+                        help='Aumento relativo tolerado (padrão: 0.10)')
+    parser.add_argument('--limiar-por', type=_parse_limiar, action='append', default=[],
+                        help='Limiar específico no formato nome=fração (aceita glob)')
+    args = parser.parse_args(argv)
+    
+    linhas = comparar(carregar(args.base), carregar(args.atual), args.limiar, dict(args.limiar_por))
+    regressoes = 0
+    for tamanho, nome, antes, depois, variacao, regrediu in linhas:
+        marca = "❌" if regrediu else "✅"
+        print(f"{marca} {tamanho:>8} {nome:<50} {antes * 1000:10.3f}ms -> {depois * 1000:10.3f}ms ({variacao:+.1%})")
+        regressoes += regrediu
+    
+    if regressoes:
+        print(f"\n❌ {regressoes} regressão(ões) acima do limiar", file=sys.stderr)
+        return 1
+    print("\n✅ Nenhuma regressão acima do limiar")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
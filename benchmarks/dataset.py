@@ -0,0 +1,84 @@
+"""Gerador determinístico de armazenamentos sintéticos.
+
+As distribuições imitam um uso real: poucas tags concentram a maior parte das
+tarefas (Zipf), a prioridade ``media`` domina e cerca de um terço das tarefas
+já está concluída.
+"""
+
+import itertools
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+
+PRIORIDADES = ["media", "baixa", "alta"]
+PESOS_PRIORIDADE = [60, 25, 15]
+STATUS = ["pendente", "andamento", "concluida"]
+PESOS_STATUS = [50, 15, 35]
+TOTAL_TAGS = 200
+EXPOENTE_ZIPF = 1.1
+INICIO = datetime(2024, 1, 1)
+
+
+def vocabulario_tags(total: int = TOTAL_TAGS) -> List[str]:
+    """Retorna o vocabulário de tags, da mais frequente para a menos frequente."""
+    return [f"tag-{i:03d}" for i in range(total)]
+
+
+def gerar_tarefas(n: int, seed: int = 42) -> Iterator[Dict]:
+    """Gera ``n`` tarefas no formato de ``Task.to_dict``.
+    
+    Args:
+        n: Quantidade de tarefas
+        seed: Semente do gerador pseudoaleatório
+        
+    Yields:
+        Dicionários de tarefa com títulos únicos
+    """
+    rng = random.Random(seed)
+    tags = vocabulario_tags()
+    pesos_tags = list(itertools.accumulate(1 / (i + 1) ** EXPOENTE_ZIPF for i in range(len(tags))))
+    pesos_prioridade = list(itertools.accumulate(PESOS_PRIORIDADE))
+    pesos_status = list(itertools.accumulate(PESOS_STATUS))
+    janela = 2 * 365 * 24 * 3600
+    
+    for i in range(n):
+        criacao = INICIO + timedelta(seconds=rng.randrange(janela))
+        status = rng.choices(STATUS, cum_weights=pesos_status)[0]
+        quantidade_tags = rng.choices([0, 1, 2, 3], weights=[15, 45, 30, 10])[0]
+        vencimento = None
+        if rng.random() < 0.6:
+            vencimento = (criacao + timedelta(days=rng.randint(-30, 180))).strftime("%Y-%m-%d")
+        conclusao = None
+        if status == "concluida":
+            conclusao = (criacao + timedelta(hours=rng.expovariate(1 / 72))).isoformat()
+        yield {
+            "titulo": f"Tarefa {i:07d}",
+            "descricao": "x" * rng.choice([0, 0, 20, 80, 400]),
+            "prioridade": rng.choices(PRIORIDADES, cum_weights=pesos_prioridade)[0],
+            "status": status,
+            "tags": sorted(set(rng.choices(tags, cum_weights=pesos_tags, k=quantidade_tags))),
+            "data_criacao": criacao.isoformat(),
+            "data_vencimento": vencimento,
+            "data_conclusao": conclusao,
+        }
+
+
+def gerar_arquivo(caminho: Path, n: int, seed: int = 42) -> Path:
+    """Grava um armazenamento sintético com ``n`` tarefas.
+    
+    Args:
+        caminho: Arquivo de destino
+        n: Quantidade de tarefas
+        seed: Semente do gerador
+        
+    Returns:
+        Caminho do arquivo gravado
+    """
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(list(gerar_tarefas(n, seed)), f, ensure_ascii=False, indent=2)
+    return caminho
@@ -0,0 +1,177 @@
+"""Executa a suíte de benchmarks e grava os resultados em JSON.
+
+Uso:
+    python -m benchmarks.run --tamanhos 10000 100000 --saida resultados.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import taskcrafter
+from taskcrafter import __version__
+from taskcrafter.manager import TaskManager
+
+from .dataset import gerar_arquivo, vocabulario_tags
+
+
+TAMANHOS_PADRAO = [10_000, 100_000, 1_000_000]
+ORDENACOES = ["data_criacao", "prioridade", "titulo", "data_vencimento"]
+FILTROS = {
+    "status": "pendente",
+    "prioridade": "alta",
+    "tag": vocabulario_tags()[0],
+    "vencimento": "2024-06-30",
+}
+
+
+def medir(func: Callable[[], object], repeticoes: int = 3) -> Dict[str, float]:
+    """Mede o tempo de parede de ``func``.
+    
+    Args:
+        func: Operação a medir
+        repeticoes: Número de execuções
+        
+    Returns:
+        Dicionário com o menor tempo, a média e o número de repetições
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+    return {"min": min(tempos), "media": sum(tempos) / len(tempos), "repeticoes": repeticoes}
+
+
+def combinacoes_filtros() -> List[Dict[str, str]]:
+    """Retorna todos os subconjuntos de filtros aceitos por ``list_tasks``."""
+    nomes = list(FILTROS)
+    combinacoes = []
+    for tamanho in range(len(nomes) + 1):
+        for escolhidos in itertools.combinations(nomes, tamanho):
+            combinacoes.append({nome: FILTROS[nome] for nome in escolhidos})
+    return combinacoes
+
+
+def medir_cli(diretorio: Path, argumentos: List[str], repeticoes: int) -> Dict[str, float]:
+    """Mede a partida a frio da CLI em um processo novo.
+    
+    Args:
+        diretorio: Diretório de trabalho contendo ``data/tasks.json``
+        argumentos: Argumentos da CLI
+        repeticoes: Número de execuções
+    """
+    comando = [sys.executable, '-m', 'taskcrafter', *argumentos]
+    # Garante que o processo filho importe este mesmo código-fonte
+    raiz = str(Path(taskcrafter.__file__).resolve().parent.parent)
+    ambiente = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [raiz, os.environ.get('PYTHONPATH')])
+    ))
+    return medir(
+        lambda: subprocess.run(comando, cwd=diretorio, env=ambiente, check=True, capture_output=True),
+        repeticoes
+    )
+
+
+def executar_tamanho(n: int, seed: int, repeticoes: int) -> Dict[str, Dict[str, float]]:
+    """Executa todos os benchmarks para um armazenamento de ``n`` tarefas.
+    
+    Args:
+        n: Quantidade de tarefas
+        seed: Semente do gerador
+        repeticoes: Repetições por benchmark
+        
+    Returns:
+        Resultados indexados pelo nome do benchmark
+    """
+    resultados = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        diretorio = Path(tmp)
+        arquivo = gerar_arquivo(diretorio / "data" / "tasks.json", n, seed)
+        
+        resultados["load_tasks[sem cache]"] = medir(
+            lambda: TaskManager(str(arquivo), load_cache=False), repeticoes
+        )
+        resultados["load_tasks"] = medir(lambda: TaskManager(str(arquivo)), repeticoes)
+        manager = TaskManager(str(arquivo))
+        resultados["save_tasks"] = medir(manager.save_tasks, repeticoes)
+        
+        contador = itertools.count()
+        resultados["add_task"] = medir(
+            lambda: manager.add_task(f"Benchmark {next(contador)}", tags=["bench"]),
+            repeticoes
+        )
+        
+        meio = manager.tasks[len(manager.tasks) // 2].titulo
+        resultados["get_task_by_title[encontrada]"] = medir(
+            lambda: manager.get_task_by_title(meio), repeticoes
+        )
+        resultados["get_task_by_title[ausente]"] = medir(
+            lambda: manager.get_task_by_title("Não existe"), repeticoes
+        )
+        
+        for filtros in combinacoes_filtros():
+            for ordenacao in ORDENACOES:
+                nome = f"list_tasks[{'+'.join(filtros) or 'todos'}|{ordenacao}]"
+                resultados[nome] = medir(
+                    lambda: manager.list_tasks(ordenar_por=ordenacao, **filtros),
+                    repeticoes
+                )
+        
+        resultados["get_statistics"] = medir(manager.get_statistics, repeticoes)
+        resultados["cli[--version]"] = medir_cli(diretorio, ['--version'], repeticoes)
+        resultados["cli[stats]"] = medir_cli(diretorio, ['stats'], repeticoes)
+    return resultados
+
+
+def revisao_git() -> Optional[str]:
+    """Retorna o commit atual, se disponível."""
+    try:
+        saida = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return saida.stdout.strip()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Ponto de entrada dos benchmarks."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run',
+                                     description='Benchmarks de escala do TaskManager')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=TAMANHOS_PADRAO,
+                        help='Tamanhos de armazenamento (padrão: 10k, 100k e 1M)')
+    parser.add_argument('--seed', type=int, default=42, help='Semente do gerador (padrão: 42)')
+    parser.add_argument('--repeticoes', type=int, default=3, help='Repetições por benchmark (padrão: 3)')
+    parser.add_argument('--saida', default='benchmark-results.json', help='Arquivo JSON de saída')
+    args = parser.parse_args(argv)
+    
+    relatorio = {
+        "meta": {
+            "versao": __version__,
+            "commit": revisao_git(),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "seed": args.seed,
+            "data": datetime.now().isoformat(),
+        },
+        "resultados": {},
+    }
+    for n in args.tamanhos:
+        print(f"⏱️  Executando benchmarks com {n} tarefas...", file=sys.stderr)
+        relatorio["resultados"][str(n)] = executar_tamanho(n, args.seed, args.repeticoes)
+    
+    with open(args.saida, 'w', encoding='utf-8') as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    print(f"✅ Resultados gravados em {args.saida}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Compara os codecs de serialização do arquivo de tarefas.
+
+Para cada codec mede o tempo de gravação (``save_tasks``), o tempo de
+carga (``TaskManager(...)``) e o tamanho do arquivo em disco.
+
+Uso:
+    python -m benchmarks.serialization --tamanho 100000 --saida codecs.json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from taskcrafter.manager import TaskManager
+from taskcrafter.serialization import CODECS, orjson
+
+from .dataset import gerar_arquivo
+from .run import medir
+
+
+def comparar_codecs(n: int, seed: int = 42, repeticoes: int = 3,
+                    codecs: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    """Mede gravação, carga e tamanho em disco de cada codec.
+
+    Args:
+        n: Quantidade de tarefas do armazenamento sintético
+        seed: Semente do gerador
+        repeticoes: Repetições por medição
+        codecs: Codecs a comparar (padrão: todos)
+
+    Returns:
+        Resultados por codec: ``save_s``, ``load_s`` (menor tempo) e ``bytes``
+    """
+    resultados = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        origem = gerar_arquivo(Path(tmp) / "origem" / "tasks.json", n, seed)
+        for nome in codecs or list(CODECS):
+            arquivo = Path(tmp) / nome / "tasks.json"
+            arquivo.parent.mkdir()
+            arquivo.write_bytes(origem.read_bytes())
+            manager = TaskManager(str(arquivo), codec=nome)
+            gravacao = medir(manager.save_tasks, repeticoes)
+            carga = medir(lambda: TaskManager(str(arquivo), codec=nome), repeticoes)
+            resultados[nome] = {
+                "save_s": gravacao["min"],
+                "load_s": carga["min"],
+                "bytes": arquivo.stat().st_size,
+            }
+    return resultados
+
+
+def formatar(resultados: Dict[str, Dict[str, float]]) -> str:
+    """Formata os resultados como tabela, com o tamanho relativo ao JSON indentado."""
+    base = resultados.get("json", next(iter(resultados.values())))["bytes"]
+    linhas = [f"{'codec':<14} {'gravação (ms)':>14} {'carga (ms)':>11} {'bytes':>12} {'relativo':>9}"]
+    for nome, dados in resultados.items():
+        linhas.append(
+            f"{nome:<14} {dados['save_s'] * 1000:>14.1f} {dados['load_s'] * 1000:>11.1f} "
+            f"{dados['bytes']:>12} {dados['bytes'] / base:>8.1%}"
+        )
+    return "\n".join(linhas)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Ponto de entrada da comparação de codecs."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.serialization',
+                                     description='Compara os codecs de serialização')
+    parser.add_argument('--tamanho', type=int, default=100_000, help='Quantidade de tarefas (padrão: 100k)')
+    parser.add_argument('--seed', type=int, default=42, help='Semente do gerador (padrão: 42)')
+    parser.add_argument('--repeticoes', type=int, default=3, help='Repetições por medição (padrão: 3)')
+    parser.add_argument('--codecs', nargs='+', choices=list(CODECS), help='Codecs a comparar (padrão: todos)')
+    parser.add_argument('--saida', help='Grava os resultados também em JSON')
+    args = parser.parse_args(argv)
+
+    if orjson is None:
+        print("ℹ️  orjson não instalado: o codec 'orjson' usa o JSON compacto da biblioteca padrão",
+              file=sys.stderr)
+    resultados = comparar_codecs(args.tamanho, args.seed, args.repeticoes, args.codecs)
+    print(formatar(resultados))
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump({"tamanho": args.tamanho, "resultados": resultados}, f, ensure_ascii=False, indent=2)
+        print(f"✅ Resultados gravados em {args.saida}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+"""Teste de estresse com vários processos sobre o mesmo arquivo de dados.
+
+Cada processo trabalhador repete, até o fim da duração, operações sorteadas
+conforme a mistura configurada (add, update, done, delete, list). Como na
+CLI, cada operação carrega o armazenamento, aplica a mutação e grava. Cada
+trabalhador só altera as tarefas que ele mesmo criou e registra em um log
+oráculo (NDJSON) toda operação confirmada, com a sua latência.
+
+Ao final, o log oráculo é reproduzido para obter o estado esperado de cada
+tarefa, que é comparado com o arquivo final: adições, atualizações e
+remoções confirmadas que não aparecem no arquivo são atualizações
+perdidas. O arquivo também passa pelo ``fsck``.
+
+Uso:
+    python -m benchmarks.stress --processos 4 --duracao 10 --mistura add=40,update=25,done=10,delete=10,list=15
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from taskcrafter.manager import TaskManager
+
+
+OPERACOES = ("add", "update", "done", "delete", "list")
+MISTURA_PADRAO = "add=40,update=25,done=10,delete=10,list=15"
+
+
+def parse_mix(texto: str) -> Dict[str, float]:
+    """Converte ``add=40,update=25`` em pesos por operação.
+
+    Raises:
+        ValueError: Se houver operação desconhecida, peso inválido ou nenhum peso positivo
+    """
+    mistura = {}
+    for parte in filter(None, (p.strip() for p in texto.split(','))):
+        operacao, _, peso = parte.partition('=')
+        if operacao not in OPERACOES:
+            raise ValueError(f"Operação inválida: {operacao}. Use: {', '.join(OPERACOES)}")
+        try:
+            mistura[operacao] = float(peso)
+        except ValueError:
+            raise ValueError(f"Peso inválido para {operacao}: {peso!r}")
+        if mistura[operacao] < 0:
+            raise ValueError(f"Peso inválido para {operacao}: {peso!r}")
+    if not any(mistura.values()):
+        raise ValueError("A mistura precisa de ao menos uma operação com peso positivo")
+    return mistura
+
+
+def worker(indice: int, arquivo: str, duracao: float, mistura: Dict[str, float],
+           seed: int, oraculo: str):
+    """Executa operações sorteadas até o fim da duração (processo trabalhador).
+
+    Args:
+        indice: Número do trabalhador (prefixo dos títulos que ele cria)
+        arquivo: Arquivo de dados compartilhado
+        duracao: Duração em segundos
+        mistura: Peso de cada operação
+        seed: Semente do sorteio
+        oraculo: Arquivo NDJSON onde as operações são registradas
+    """
+    rng = random.Random(seed * 1000 + indice)
+    operacoes, pesos = zip(*mistura.items())
+    vivas: List[str] = []
+    criadas = 0
+    versao = 0
+    fim = time.monotonic() + duracao
+    with open(oraculo, 'w', encoding='utf-8') as log:
+        while time.monotonic() < fim:
+            operacao = rng.choices(operacoes, pesos)[0]
+            if operacao in ("update", "done", "delete") and not vivas:
+                operacao = "add"
+            registro = {"op": operacao}
+            inicio = time.perf_counter()
+            try:
+                manager = TaskManager(arquivo)
+                if operacao == "add":
+                    registro["titulo"] = f"w{indice}-{criadas}"
+                    criadas += 1
+                    manager.add_task(registro["titulo"])
+                    vivas.append(registro["titulo"])
+                elif operacao == "update":
+                    versao += 1
+                    registro.update(titulo=rng.choice(vivas), descricao=f"v{versao}",
+                                    prioridade=rng.choice(["baixa", "media", "alta"]))
+                    manager.update_task(registro["titulo"], descricao=registro["descricao"],
+                                        prioridade=registro["prioridade"])
+                elif operacao == "done":
+                    registro["titulo"] = rng.choice(vivas)
+                    manager.mark_as_done(registro["titulo"])
+                elif operacao == "delete":
+                    registro["titulo"] = vivas.pop(rng.randrange(len(vivas)))
+                    if not manager.delete_task(registro["titulo"]):
+                        raise ValueError("tarefa não encontrada")
+                else:
+                    manager.list_tasks()
+                registro["ok"] = True
+            except Exception as e:
+                registro.update(ok=False, erro=f"{type(e).__name__}: {e}")
+            registro["latencia_s"] = time.perf_counter() - inicio
+            log.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+
+def expected_state(oraculos: List[Path]) -> Dict[str, Optional[dict]]:
+    """Reproduz os logs oráculo e retorna o estado esperado de cada tarefa.
+
+    Apenas operações confirmadas contam. Cada tarefa é alterada por um único
+    trabalhador, então a ordem do seu log é a ordem das mutações.
+
+    Returns:
+        Estado esperado por título (None para tarefas removidas)
+    """
+    esperado: Dict[str, Optional[dict]] = {}
+    for oraculo in oraculos:
+        with open(oraculo, 'r', encoding='utf-8') as f:
+            for linha in f:
+                registro = json.loads(linha)
+                if not registro["ok"] or registro["op"] == "list":
+                    continue
+                titulo = registro["titulo"]
+                if registro["op"] == "add":
+                    esperado[titulo] = {"status": "pendente", "descricao": "", "prioridade": "media"}
+                elif registro["op"] == "delete":
+                    esperado[titulo] = None
+                elif esperado.get(titulo) is not None:
+                    if registro["op"] == "done":
+                        esperado[titulo]["status"] = "concluida"
+                    else:
+                        esperado[titulo].update(descricao=registro["descricao"],
+                                                prioridade=registro["prioridade"])
+    return esperado
+
+
+def verify(arquivo: Path, oraculos: List[Path]) -> Dict[str, object]:
+    """Compara o arquivo final com o estado esperado pelos logs oráculo.
+
+    Returns:
+        Dicionário com ``integro`` (resultado do fsck), ``erro_fsck`` e as
+        contagens de atualizações perdidas por tipo (``add``, ``update``,
+        ``delete``), o total ``perdidas`` e as tarefas ``nao_confirmadas``
+        (presentes no arquivo sem uma adição confirmada)
+    """
+    relatorio_fsck = TaskManager(str(arquivo)).fsck()
+    finais = {task.titulo: task for task in TaskManager(str(arquivo)).tasks}
+    perdidas = {"add": 0, "update": 0, "delete": 0}
+    esperado = expected_state(oraculos)
+    for titulo, estado in esperado.items():
+        task = finais.get(titulo)
+        if estado is None:
+            perdidas["delete"] += task is not None
+        elif task is None:
+            perdidas["add"] += 1
+        elif any(getattr(task, campo) != valor for campo, valor in estado.items()):
+            perdidas["update"] += 1
+    return {
+        "integro": relatorio_fsck["ok"],
+        "erro_fsck": relatorio_fsck["erro"],
+        "tarefas_finais": len(finais),
+        "perdidas": sum(perdidas.values()),
+        "perdidas_por_tipo": perdidas,
+        "nao_confirmadas": len(set(finais) - set(esperado)),
+    }
+
+
+def _percentil(ordenados: List[float], q: float) -> float:
+    """Percentil por posição mais próxima de uma lista já ordenada."""
+    return ordenados[min(len(ordenados) - 1, int(q * len(ordenados)))]
+
+
+def summarize(oraculos: List[Path], duracao: float) -> Dict[str, Dict[str, float]]:
+    """Vazão, erros e percentis de latência (ms) por operação e no total.
+
+    A entrada ``total`` inclui também ``falhas``: as mensagens de erro mais
+    frequentes, com a contagem de cada uma.
+    """
+    latencias: Dict[str, List[float]] = defaultdict(list)
+    erros: Dict[str, int] = defaultdict(int)
+    mensagens: Counter = Counter()
+    for oraculo in oraculos:
+        with open(oraculo, 'r', encoding='utf-8') as f:
+            for linha in f:
+                registro = json.loads(linha)
+                for chave in (registro["op"], "total"):
+                    latencias[chave].append(registro["latencia_s"])
+                    erros[chave] += not registro["ok"]
+                if not registro["ok"]:
+                    mensagens[registro["erro"][:120]] += 1
+    resumo = {}
+    for operacao in [*OPERACOES, "total"]:
+        valores = sorted(latencias.get(operacao, []))
+        if not valores:
+            continue
+        resumo[operacao] = {
+            "operacoes": len(valores),
+            "erros": erros[operacao],
+            "por_segundo": len(valores) / duracao,
+            **{f"p{q}_ms": _percentil(valores, q / 100) * 1000 for q in (50, 95, 99)},
+        }
+    if "total" in resumo:
+        resumo["total"]["falhas"] = dict(mensagens.most_common(5))
+    return resumo
+
+
+def run_stress(arquivo: Path, processos: int, duracao: float, mistura: Dict[str, float],
+               seed: int = 42) -> Dict[str, object]:
+    """Executa os trabalhadores e verifica o resultado.
+
+    Args:
+        arquivo: Arquivo de dados (criado se não existir)
+        processos: Quantidade de processos trabalhadores
+        duracao: Duração em segundos
+        mistura: Peso de cada operação (ver ``parse_mix``)
+        seed: Semente dos sorteios
+
+    Returns:
+        Dicionário com ``config``, ``operacoes`` (ver ``summarize``) e
+        ``verificacao`` (ver ``verify``)
+    """
+    arquivo = Path(arquivo)
+    TaskManager(str(arquivo)).save_tasks()
+    oraculos = [arquivo.with_name(f"{arquivo.name}.oracle.{i}.jsonl") for i in range(processos)]
+    trabalhadores = [
+        multiprocessing.Process(target=worker, args=(i, str(arquivo), duracao, mistura, seed, str(oraculos[i])))
+        for i in range(processos)
+    ]
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    for trabalhador in trabalhadores:
+        trabalhador.join()
+    if any(t.exitcode != 0 for t in trabalhadores):
+        raise RuntimeError("Um processo trabalhador terminou com erro")
+    return {
+        "config": {"processos": processos, "duracao_s": duracao, "mistura": mistura, "seed": seed},
+        "operacoes": summarize(oraculos, duracao),
+        "verificacao": verify(arquivo, oraculos),
+    }
+
+
+def formatar(relatorio: Dict[str, object]) -> str:
+    """Formata o relatório como tabela seguida do resultado da verificação."""
+    linhas = [f"{'operação':<10} {'total':>7} {'erros':>6} {'ops/s':>8} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9}"]
+    for operacao, dados in relatorio["operacoes"].items():
+        linhas.append(
+            f"{operacao:<10} {dados['operacoes']:>7} {dados['erros']:>6} {dados['por_segundo']:>8.1f} "
+            f"{dados['p50_ms']:>9.1f} {dados['p95_ms']:>9.1f} {dados['p99_ms']:>9.1f}"
+        )
+    verificacao = relatorio["verificacao"]
+    por_tipo = ", ".join(f"{tipo}={n}" for tipo, n in verificacao["perdidas_por_tipo"].items())
+    linhas += [
+        "",
+        f"Arquivo final íntegro: {'sim' if verificacao['integro'] else 'não (' + verificacao['erro_fsck'] + ')'}",
+        f"Tarefas no arquivo final: {verificacao['tarefas_finais']}",
+        f"Atualizações perdidas: {verificacao['perdidas']} ({por_tipo})",
+        f"Tarefas sem adição confirmada: {verificacao['nao_confirmadas']}",
+    ]
+    falhas = relatorio["operacoes"].get("total", {}).get("falhas")
+    if falhas:
+        linhas += ["", "Erros mais frequentes:"]
+        linhas += [f"  {n:>6}  {mensagem}" for mensagem, n in falhas.items()]
+    return "\n".join(linhas)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Ponto de entrada do teste de estresse."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.stress',
+                                     description='Teste de estresse com vários processos sobre um arquivo de dados')
+    parser.add_argument('--processos', type=int, default=4, help='Processos trabalhadores (padrão: 4)')
+    parser.add_argument('--duracao', type=float, default=10.0, help='Duração em segundos (padrão: 10)')
+    parser.add_argument('--mistura', default=MISTURA_PADRAO,
+                        help=f'Pesos das operações (padrão: {MISTURA_PADRAO})')
+    parser.add_argument('--arquivo', help='Arquivo de dados (padrão: um arquivo temporário novo)')
+    parser.add_argument('--seed', type=int, default=42, help='Semente dos sorteios (padrão: 42)')
+    parser.add_argument('--saida', help='Grava o relatório também em JSON')
+    args = parser.parse_args(argv)
+
+    try:
+        mistura = parse_mix(args.mistura)
+    except ValueError as e:
+        parser.error(str(e))
+    with tempfile.TemporaryDirectory() as tmp:
+        arquivo = Path(args.arquivo) if args.arquivo else Path(tmp) / "tasks.json"
+        relatorio = run_stress(arquivo, args.processos, args.duracao, mistura, args.seed)
+    print(formatar(relatorio))
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+        print(f"✅ Relatório gravado em {args.saida}", file=sys.stderr)
+    # Código de saída diferente de zero permite usar o teste como guarda em CI
+    if relatorio["verificacao"]["perdidas"] or not relatorio["verificacao"]["integro"]:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
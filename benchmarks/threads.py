@@ -0,0 +1,160 @@
+"""Mede como as leituras escalam com o número de threads.
+
+Várias threads compartilham um ``TaskManager`` e repetem consultas
+(``list_tasks`` filtrado e ``get_statistics``) durante a duração
+configurada; opcionalmente, uma thread escritora altera tarefas ao mesmo
+tempo. Para cada quantidade de threads são medidas a vazão total de leituras
+e a aceleração em relação a uma thread.
+
+As leituras rodam em paralelo sob a trava de leitura, mas são limitadas por
+CPU: no CPython com GIL a aceleração fica perto de 1 (a trava não serializa
+nada a mais que o próprio interpretador); em um build sem GIL (3.13t) as
+leituras escalam com os núcleos.
+
+Uso:
+    python -m benchmarks.threads --tamanho 10000 --threads 1 2 4 8 --duracao 2 --escritor
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from taskcrafter.manager import TaskManager
+
+from .dataset import gerar_arquivo
+
+
+def _gil_ativo() -> bool:
+    """Se o interpretador executa com o GIL."""
+    verificar = getattr(sys, "_is_gil_enabled", None)
+    return True if verificar is None else verificar()
+
+
+def medir_leituras(manager: TaskManager, threads: int, duracao: float,
+                   escritor: bool = False, seed: int = 42) -> Dict[str, float]:
+    """Executa as leituras em ``threads`` threads durante ``duracao`` segundos.
+
+    Args:
+        manager: Gerenciador compartilhado
+        threads: Quantidade de threads leitoras
+        duracao: Duração em segundos
+        escritor: Se True, uma thread altera tarefas (em memória) ao mesmo tempo
+        seed: Semente das alterações
+
+    Returns:
+        Dicionário com ``leituras_s`` (vazão total) e ``escritas_s``
+    """
+    leituras = [0] * threads
+    escritas = [0]
+    barreira = threading.Barrier(threads + escritor + 1)
+    parar = threading.Event()
+
+    def ler(indice: int):
+        barreira.wait()
+        n = 0
+        while not parar.is_set():
+            manager.list_tasks(status="pendente", ordenar_por="prioridade")
+            manager.get_statistics()
+            n += 2
+        leituras[indice] = n
+
+    def escrever():
+        rng = random.Random(seed)
+        ids = [task.id for task in manager.tasks]
+        barreira.wait()
+        # Em lote: mede a disputa pela trava, não a gravação do arquivo
+        with manager.batch():
+            while not parar.is_set():
+                manager.update_task(rng.choice(ids), prioridade=rng.choice(["baixa", "media", "alta"]))
+                escritas[0] += 1
+                time.sleep(0.001)
+
+    trabalhadores = [threading.Thread(target=ler, args=(i,)) for i in range(threads)]
+    if escritor:
+        trabalhadores.append(threading.Thread(target=escrever))
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    barreira.wait()
+    inicio = time.perf_counter()
+    time.sleep(duracao)
+    parar.set()
+    for trabalhador in trabalhadores:
+        trabalhador.join()
+    decorrido = time.perf_counter() - inicio
+    return {"leituras_s": sum(leituras) / decorrido, "escritas_s": escritas[0] / decorrido}
+
+
+def escalar(n: int, threads: List[int], duracao: float, escritor: bool = False,
+            seed: int = 42) -> Dict[int, Dict[str, float]]:
+    """Mede as leituras para cada quantidade de threads em um armazenamento sintético.
+
+    Args:
+        n: Quantidade de tarefas
+        threads: Quantidades de threads leitoras a medir
+        duracao: Duração de cada medição, em segundos
+        escritor: Se True, inclui uma thread escritora
+        seed: Semente do gerador
+
+    Returns:
+        Resultados por quantidade de threads, com ``aceleracao`` em relação
+        à primeira medição
+    """
+    resultados = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        arquivo = gerar_arquivo(Path(tmp) / "tasks.json", n, seed)
+        manager = TaskManager(str(arquivo))
+        # Constrói a visão e a agregação antes de medir
+        manager.list_tasks(ordenar_por="prioridade")
+        manager.get_statistics()
+        for quantidade in threads:
+            resultados[quantidade] = medir_leituras(manager, quantidade, duracao, escritor, seed)
+    base = next(iter(resultados.values()))["leituras_s"] or 1.0
+    for dados in resultados.values():
+        dados["aceleracao"] = dados["leituras_s"] / base
+    return resultados
+
+
+def formatar(resultados: Dict[int, Dict[str, float]]) -> str:
+    """Formata os resultados como tabela."""
+    linhas = [f"{'threads':>7} {'leituras/s':>11} {'aceleração':>11} {'escritas/s':>11}"]
+    for threads, dados in resultados.items():
+        linhas.append(
+            f"{threads:>7} {dados['leituras_s']:>11.1f} {dados['aceleracao']:>10.2f}x "
+            f"{dados['escritas_s']:>11.1f}"
+        )
+    return "\n".join(linhas)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Ponto de entrada da medição de escala das leituras."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.threads',
+                                     description='Mede a escala das leituras com o número de threads')
+    parser.add_argument('--tamanho', type=int, default=10_000, help='Quantidade de tarefas (padrão: 10k)')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Quantidades de threads leitoras (padrão: 1 2 4 8)')
+    parser.add_argument('--duracao', type=float, default=2.0, help='Segundos por medição (padrão: 2)')
+    parser.add_argument('--escritor', action='store_true', help='Inclui uma thread escritora')
+    parser.add_argument('--seed', type=int, default=42, help='Semente do gerador (padrão: 42)')
+    parser.add_argument('--saida', help='Grava os resultados também em JSON')
+    args = parser.parse_args(argv)
+
+    if _gil_ativo():
+        print("ℹ️  Interpretador com GIL: leituras limitadas por CPU não escalam com as threads",
+              file=sys.stderr)
+    resultados = escalar(args.tamanho, args.threads, args.duracao, args.escritor, args.seed)
+    print(formatar(resultados))
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump({"tamanho": args.tamanho, "gil": _gil_ativo(), "resultados": resultados},
+                      f, ensure_ascii=False, indent=2)
+        print(f"✅ Resultados gravados em {args.saida}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
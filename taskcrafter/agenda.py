@@ -0,0 +1,182 @@
+"""Agenda de vencimentos do TaskCrafter CLI.
+
+Este módulo mantém um heap das tarefas abertas que possuem data de vencimento,
+permitindo consultar tarefas atrasadas e os próximos prazos sem ordenar a
+lista inteira a cada chamada.
+"""
+
+import heapq
+import itertools
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .models import Task
+
+
+PRIORIDADE_ORDEM = {"alta": 0, "media": 1, "baixa": 2}
+
+
+class DeadlineAgenda:
+    """Heap de prazos com remoção preguiçosa.
+
+    Cada entrada do heap é ``(data_vencimento, prioridade, seq, task)``. Quando
+    uma tarefa é concluída, removida ou tem o prazo alterado, a entrada antiga
+    não é retirada do heap: ela apenas deixa de ser a entrada atual da tarefa
+    e é descartada quando chega ao topo.
+
+    Attributes:
+        tamanho: Número de entradas no heap (incluindo as obsoletas)
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """Constrói a agenda em O(N) a partir das tarefas fornecidas.
+
+        Args:
+            tasks: Tarefas iniciais
+        """
+        self._heap: List[tuple] = []
+        self._atual: Dict[int, tuple] = {}
+        self._seq = itertools.count()
+        for task in tasks:
+            entrada = self._nova_entrada(task)
+            if entrada:
+                self._heap.append(entrada)
+        heapq.heapify(self._heap)
+
+    @property
+    def tamanho(self) -> int:
+        """Número de entradas no heap."""
+        return len(self._heap)
+
+    def _nova_entrada(self, task: Task) -> Optional[tuple]:
+        """Cria a entrada do heap para a tarefa, se ela tiver prazo em aberto."""
+        if task.status == "concluida" or not task.data_vencimento:
+            return None
+        seq = next(self._seq)
+        entrada = (task.data_vencimento, PRIORIDADE_ORDEM.get(task.prioridade, 3), seq, task)
+        self._atual[id(task)] = entrada
+        return entrada
+
+    def push(self, task: Task):
+        """Registra (ou reposiciona) uma tarefa na agenda.
+
+        Args:
+            task: Tarefa adicionada ou alterada
+        """
+        if self._valida_chave(self._atual.get(id(task))):
+            return
+        self._atual.pop(id(task), None)
+        entrada = self._nova_entrada(task)
+        if entrada:
+            heapq.heappush(self._heap, entrada)
+
+    def discard(self, task: Task):
+        """Remove a tarefa da agenda (a entrada é descartada depois).
+
+        Args:
+            task: Tarefa removida
+        """
+        self._atual.pop(id(task), None)
+
+    @staticmethod
+    def _valida_chave(entrada: Optional[tuple]) -> bool:
+        """Verifica se a chave da entrada corresponde ao estado da tarefa."""
+        if entrada is None:
+            return False
+        venc, prio, _, task = entrada
+        return (task.status != "concluida" and task.data_vencimento == venc
+                and PRIORIDADE_ORDEM.get(task.prioridade, 3) == prio)
+
+    def _valida(self, entrada: tuple) -> bool:
+        """Verifica se a entrada ainda é a entrada atual e válida da tarefa."""
+        task = entrada[3]
+        if self._atual.get(id(task)) is not entrada:
+            return False
+        if not self._valida_chave(entrada):
+            del self._atual[id(task)]
+            return False
+        return True
+
+    def _coletar(self, parar: Callable[[tuple, int], bool]) -> List[tuple]:
+        """Retira entradas válidas do topo até ``parar`` e as devolve ao heap.
+
+        Entradas obsoletas encontradas no caminho são descartadas de vez.
+
+        Args:
+            parar: Predicado que recebe a entrada do topo e quantas já foram
+                coletadas, encerrando a coleta quando verdadeiro
+
+        Returns:
+            Entradas coletadas em ordem de vencimento e prioridade
+        """
+        coletadas: List[tuple] = []
+        while self._heap:
+            topo = self._heap[0]
+            if not self._valida(topo):
+                heapq.heappop(self._heap)
+                continue
+            if parar(topo, len(coletadas)):
+                break
+            coletadas.append(heapq.heappop(self._heap))
+        for entrada in coletadas:
+            heapq.heappush(self._heap, entrada)
+        return coletadas
+
+    def overdue(self, hoje: Optional[date] = None) -> List[Task]:
+        """Retorna as tarefas abertas com vencimento anterior a hoje.
+
+        Args:
+            hoje: Data de referência (padrão: data atual)
+
+        Returns:
+            Tarefas atrasadas, das mais antigas para as mais recentes
+        """
+        limite = (hoje or date.today()).isoformat()
+        return [e[3] for e in self._coletar(lambda topo, _: topo[0] >= limite)]
+
+    def upcoming(self, limite: int = 10, hoje: Optional[date] = None) -> List[Task]:
+        """Retorna os próximos ``limite`` prazos a partir de hoje.
+
+        O custo é O((A + K) log N), onde A é o número de tarefas atrasadas.
+
+        Args:
+            limite: Quantidade máxima de tarefas
+            hoje: Data de referência (padrão: data atual)
+
+        Returns:
+            Tarefas com vencimento a partir de hoje, em ordem de prazo
+        """
+        referencia = (hoje or date.today()).isoformat()
+        proximas: List[Task] = []
+
+        def parar(topo: tuple, _: int) -> bool:
+            if len(proximas) >= limite:
+                return True
+            if topo[0] >= referencia:
+                proximas.append(topo[3])
+            return False
+
+        self._coletar(parar)
+        return proximas
+
+    def next_wakeup(self, agora: Optional[datetime] = None) -> Optional[datetime]:
+        """Calcula o próximo instante em que a agenda muda.
+
+        Uma tarefa que vence hoje passa a estar atrasada à meia-noite; uma
+        tarefa com vencimento futuro entra em "vence hoje" à meia-noite do
+        seu dia de vencimento.
+
+        Args:
+            agora: Instante de referência (padrão: agora)
+
+        Returns:
+            Próximo instante de mudança ou None se não houver prazos futuros
+        """
+        agora = agora or datetime.now()
+        proximas = self.upcoming(1, agora.date())
+        if not proximas:
+            return None
+        vencimento = date.fromisoformat(proximas[0].data_vencimento)
+        if vencimento <= agora.date():
+            vencimento = agora.date() + timedelta(days=1)
+        return datetime.combine(vencimento, datetime.min.time())
@@ -0,0 +1,172 @@
+"""Agregações agrupadas das tarefas do TaskCrafter CLI.
+
+Um ``GroupBy`` conta as tarefas por uma combinação de dimensões (status,
+prioridade, tag, semana ou mês de vencimento, mês de criação), com filtros
+opcionais, em uma única passada. O resultado fica em cache e é atualizado a
+cada mutação, de modo que repetir a mesma agregação (ex.: um painel que
+consulta ``stats --by tag,status``) não percorre as tarefas de novo.
+"""
+
+import itertools
+from collections import Counter
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import Task
+from .tags import tag_matcher
+
+
+SEM_VALOR = "-"
+"""Grupo das tarefas sem valor na dimensão (sem tag, sem vencimento)."""
+
+
+def _semana(data: Optional[str]) -> Tuple[str, ...]:
+    """Semana ISO (``2026-W42``) de uma data ``YYYY-MM-DD``."""
+    if not data:
+        return (SEM_VALOR,)
+    ano, semana, _ = date.fromisoformat(data[:10]).isocalendar()
+    return (f"{ano}-W{semana:02d}",)
+
+
+def _mes(data: Optional[str]) -> Tuple[str, ...]:
+    """Mês (``2026-10``) de uma data ISO."""
+    return (data[:7],) if data else (SEM_VALOR,)
+
+
+DIMENSOES: Dict[str, Callable[[Task], Sequence[str]]] = {
+    "status": lambda task: (task.status,),
+    "prioridade": lambda task: (task.prioridade,),
+    "tag": lambda task: tuple(dict.fromkeys(task.tags)) or (SEM_VALOR,),
+    "vencimento_semana": lambda task: _semana(task.data_vencimento),
+    "vencimento_mes": lambda task: _mes(task.data_vencimento),
+    "criacao_mes": lambda task: _mes(task.data_criacao),
+}
+
+FILTROS_AGREGACAO = ("status", "prioridade", "tag")
+
+MAX_AGREGACOES = 32
+"""Quantidade de agregações mantidas em cache (as mais antigas saem primeiro)."""
+
+
+class GroupBy:
+    """Contagem de tarefas agrupadas, mantida incrementalmente.
+
+    Uma tarefa com várias tags conta uma vez em cada grupo de tag.
+
+    Attributes:
+        dimensoes: Dimensões do agrupamento (chaves de ``DIMENSOES``)
+        filtros: Filtros por igualdade (chaves de ``FILTROS_AGREGACAO``)
+    """
+
+    def __init__(self, dimensoes: Sequence[str], filtros: Optional[Dict[str, str]],
+                 tasks: Iterable[Task]):
+        """Valida a definição e conta as tarefas em uma passada.
+
+        Args:
+            dimensoes: Dimensões do agrupamento
+            filtros: Filtros opcionais
+            tasks: Tarefas atuais
+
+        Raises:
+            ValueError: Se uma dimensão ou filtro for desconhecido
+        """
+        self.dimensoes = tuple(dimensoes)
+        self.filtros = dict(filtros or {})
+        if not self.dimensoes:
+            raise ValueError(f"Informe ao menos uma dimensão. Use: {', '.join(DIMENSOES)}")
+        invalidas = [d for d in self.dimensoes if d not in DIMENSOES]
+        if invalidas:
+            raise ValueError(f"Dimensão inválida: {', '.join(invalidas)}. Use: {', '.join(DIMENSOES)}")
+        invalidos = sorted(set(self.filtros) - set(FILTROS_AGREGACAO))
+        if invalidos:
+            raise ValueError(f"Filtro inválido: {', '.join(invalidos)}. Use: {', '.join(FILTROS_AGREGACAO)}")
+        self._funcoes = [DIMENSOES[d] for d in self.dimensoes]
+        self._tag = tag_matcher(self.filtros["tag"]) if "tag" in self.filtros else None
+        self.contagens: Counter = Counter()
+        self._chaves: Dict[int, List[tuple]] = {}
+        for task in tasks:
+            self.add(task)
+
+    def _aceita(self, task: Task) -> bool:
+        filtros = self.filtros
+        if "status" in filtros and task.status != filtros["status"]:
+            return False
+        if "prioridade" in filtros and task.prioridade != filtros["prioridade"]:
+            return False
+        return self._tag is None or self._tag(task.tags)
+
+    def add(self, task: Task):
+        """Conta uma tarefa (nova ou reavaliada após ``discard``)."""
+        if not self._aceita(task):
+            return
+        chaves = list(itertools.product(*(funcao(task) for funcao in self._funcoes)))
+        self.contagens.update(chaves)
+        self._chaves[task.id] = chaves
+
+    def discard(self, task: Task):
+        """Remove a contribuição da tarefa, se contada."""
+        for chave in self._chaves.pop(task.id, ()):
+            self.contagens[chave] -= 1
+            if not self.contagens[chave]:
+                del self.contagens[chave]
+
+    def update(self, task: Task):
+        """Reavalia uma tarefa alterada."""
+        self.discard(task)
+        self.add(task)
+
+    def rows(self) -> List[Dict[str, object]]:
+        """Retorna os grupos ordenados, cada um com as dimensões e o ``total``."""
+        return [
+            {**dict(zip(self.dimensoes, chave)), "total": total}
+            for chave, total in sorted(self.contagens.items())
+        ]
+
+
+class Aggregations:
+    """Cache de agregações, atualizado a cada mutação."""
+
+    def __init__(self):
+        self._cache: Dict[tuple, GroupBy] = {}
+
+    @property
+    def construidas(self) -> Dict[str, int]:
+        """Número de grupos de cada agregação em cache."""
+        return {
+            "+".join(grupo.dimensoes) + "".join(f"[{c}={v}]" for c, v in sorted(grupo.filtros.items())):
+                len(grupo.contagens)
+            for grupo in self._cache.values()
+        }
+
+    def get(self, dimensoes: Sequence[str], filtros: Optional[Dict[str, str]],
+            tasks: Iterable[Task]) -> Tuple[GroupBy, bool]:
+        """Retorna a agregação, calculando-a se não estiver em cache.
+
+        Args:
+            dimensoes: Dimensões do agrupamento
+            filtros: Filtros opcionais (valores vazios são ignorados)
+            tasks: Tarefas atuais, usadas apenas no cálculo
+
+        Returns:
+            Tupla (agregação, se foi calculada nesta chamada)
+        """
+        filtros = {campo: valor for campo, valor in (filtros or {}).items() if valor}
+        chave = (tuple(dimensoes), tuple(sorted(filtros.items())))
+        grupo = self._cache.get(chave)
+        if grupo is not None:
+            return grupo, False
+        grupo = GroupBy(dimensoes, filtros, tasks)
+        if len(self._cache) >= MAX_AGREGACOES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[chave] = grupo
+        return grupo, True
+
+    def update(self, task: Task):
+        """Reavalia uma tarefa nova ou alterada em todas as agregações."""
+        for grupo in self._cache.values():
+            grupo.update(task)
+
+    def discard(self, task: Task):
+        """Remove uma tarefa de todas as agregações."""
+        for grupo in self._cache.values():
+            grupo.discard(task)
@@ -0,0 +1,95 @@
+"""Segmentos de arquivo do TaskCrafter CLI.
+
+Arquivar move tarefas concluídas antigas para um segmento imutável ao lado
+do armazenamento (``<dados>.archive.<n>.jsonl``). A primeira linha do
+segmento é um cabeçalho com as métricas de fluxo e os esboços das
+estatísticas aproximadas já agregados das tarefas arquivadas; as linhas
+seguintes são as tarefas, uma por linha. Relatórios leem apenas o
+cabeçalho de cada segmento.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .flow import FlowStats
+from .sketches import StoreSketches
+
+
+def segments(base: Path) -> List[Path]:
+    """Segmentos existentes do armazenamento, em ordem de criação.
+
+    Args:
+        base: Arquivo de dados das tarefas
+    """
+    padrao = re.compile(re.escape(base.name) + r"\.archive\.(\d+)\.jsonl$")
+    encontrados = []
+    for caminho in base.parent.glob(f"{base.name}.archive.*.jsonl"):
+        casamento = padrao.match(caminho.name)
+        if casamento:
+            encontrados.append((int(casamento.group(1)), caminho))
+    return [caminho for _, caminho in sorted(encontrados)]
+
+
+def write_segment(base: Path, registros: List[dict], fluxo: FlowStats,
+                  esbocos: Optional[StoreSketches] = None) -> Path:
+    """Grava um novo segmento com as tarefas e suas métricas agregadas.
+
+    O segmento é gravado em um arquivo temporário e renomeado, de modo que
+    um segmento visível está sempre completo.
+
+    Args:
+        base: Arquivo de dados das tarefas
+        registros: Tarefas arquivadas (``Task.to_dict``)
+        fluxo: Métricas de fluxo das tarefas arquivadas
+        esbocos: Esboços das estatísticas aproximadas das tarefas arquivadas
+
+    Returns:
+        Caminho do segmento
+    """
+    existentes = segments(base)
+    numero = int(existentes[-1].name.split(".")[-2]) + 1 if existentes else 1
+    caminho = base.with_name(f"{base.name}.archive.{numero}.jsonl")
+    temporario = caminho.with_name(caminho.name + ".tmp")
+    with open(temporario, 'w', encoding='utf-8') as f:
+        cabecalho = {"tarefas": len(registros), "fluxo": fluxo.to_dict()}
+        if esbocos is not None:
+            cabecalho["esbocos"] = esbocos.to_dict()
+        f.write(json.dumps(cabecalho, ensure_ascii=False) + "\n")
+        for registro in registros:
+            f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    os.replace(temporario, caminho)
+    return caminho
+
+
+def read_header(caminho: Path) -> Dict:
+    """Lê apenas o cabeçalho (primeira linha) de um segmento.
+
+    Raises:
+        ValueError: Se o cabeçalho estiver ausente ou inválido
+    """
+    with open(caminho, 'r', encoding='utf-8') as f:
+        linha = f.readline()
+    try:
+        cabecalho = json.loads(linha)
+        cabecalho["fluxo"]
+    except (ValueError, TypeError, KeyError):
+        raise ValueError(f"Segmento de arquivo inválido: {caminho.name}")
+    return cabecalho
+
+
+def read_records(caminho: Path) -> Iterator[dict]:
+    """Lê as tarefas de um segmento (todas as linhas após o cabeçalho).
+
+    Raises:
+        ValueError: Se alguma linha for inválida
+    """
+    with open(caminho, 'r', encoding='utf-8') as f:
+        f.readline()
+        for numero, linha in enumerate(f, start=2):
+            try:
+                yield json.loads(linha)
+            except ValueError:
+                raise ValueError(f"Linha {numero} inválida no segmento {caminho.name}")
@@ -0,0 +1,105 @@
+"""Cache de carga do TaskCrafter CLI.
+
+Ler o arquivo de tarefas custa, a cada chamada da CLI, o parse do JSON, a
+verificação dos checksums e a validação de cada ``Task``. Como em
+``__pycache__``, as tarefas já validadas ficam em um arquivo auxiliar
+(``<dados>.cache``) junto com a chave do arquivo de dados de onde vieram:
+tamanho, mtime e hash do conteúdo. Se a chave confere, as tarefas são
+recriadas direto das tuplas de valores, sem parse e sem validação; caso
+contrário, o cache é ignorado e regravado na carga seguinte.
+
+O cache usa ``marshal``, que só conhece tipos básicos (tuplas, listas,
+textos, números, None): ao contrário de ``pickle``, carregar o arquivo não
+executa código. O formato do ``marshal`` varia entre versões do Python, por
+isso a versão faz parte da chave.
+"""
+
+import hashlib
+import marshal
+import operator
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .models import CAMPOS
+
+
+VERSAO_CACHE = 1
+"""Versão do formato do cache; mudar o formato do registro exige incrementá-la."""
+
+_ASSINATURA = (VERSAO_CACHE, marshal.version, sys.version_info[:2], CAMPOS)
+
+
+def content_key(conteudo: bytes, stat: os.stat_result) -> Tuple[int, int, str]:
+    """Chave do arquivo de dados: tamanho, mtime (ns) e hash do conteúdo."""
+    return stat.st_size, stat.st_mtime_ns, hashlib.blake2b(conteudo, digest_size=16).hexdigest()
+
+
+_EM_LINHA = operator.itemgetter(*CAMPOS)
+_FORA_DE_LINHA = operator.itemgetter(*("descricao_ref" if c == "descricao" else c for c in CAMPOS))
+
+
+def to_values(registro: dict) -> tuple:
+    """Converte um registro validado (``Task.to_record``) em tupla na ordem de ``CAMPOS``.
+
+    A descrição fora de linha é guardada como a lista ``[geração, offset, tamanho]``.
+    """
+    return (_FORA_DE_LINHA if "descricao_ref" in registro else _EM_LINHA)(registro)
+
+
+class LoadCache:
+    """Arquivo auxiliar com as tarefas validadas de uma versão do arquivo de dados."""
+
+    def __init__(self, caminho: Path):
+        """Inicializa o cache.
+
+        Args:
+            caminho: Arquivo do cache
+        """
+        self.caminho = Path(caminho)
+
+    def read(self, chave: Tuple[int, int, str]) -> Optional[List[tuple]]:
+        """Retorna as tuplas de valores em cache, se a chave conferir.
+
+        Args:
+            chave: Chave atual do arquivo de dados (``content_key``)
+
+        Returns:
+            Tuplas de valores ou None (cache ausente, desatualizado ou ilegível)
+        """
+        try:
+            with open(self.caminho, 'rb') as f:
+                # O cabeçalho vem antes para que um cache desatualizado não seja lido inteiro
+                tamanho = int.from_bytes(f.read(4), 'little')
+                if marshal.loads(f.read(tamanho)) != (_ASSINATURA, chave):
+                    return None
+                valores = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return valores if isinstance(valores, list) else None
+
+    def write(self, chave: Tuple[int, int, str], registros: List[dict]):
+        """Grava o cache dos registros validados.
+
+        O cache é gravado em um arquivo temporário e renomeado, de modo que
+        um leitor nunca vê um cache pela metade. Falhas de gravação são
+        ignoradas: o cache é apenas uma otimização.
+
+        Args:
+            chave: Chave do arquivo de dados de onde vieram os registros
+            registros: Registros validados (``Task.to_record``)
+        """
+        temporario = self.caminho.with_name(f"{self.caminho.name}.{os.getpid()}.tmp")
+        try:
+            cabecalho = marshal.dumps((_ASSINATURA, chave))
+            with open(temporario, 'wb') as f:
+                f.write(len(cabecalho).to_bytes(4, 'little'))
+                f.write(cabecalho)
+                f.write(marshal.dumps([to_values(registro) for registro in registros]))
+            os.replace(temporario, self.caminho)
+        except (OSError, ValueError):
+            try:
+                temporario.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,133 @@
+"""Log de mudanças do TaskCrafter CLI.
+
+Este módulo define os eventos de mutação emitidos pelo ``TaskManager`` e o log
+persistente (NDJSON, somente anexação) que permite a consumidores buscar
+apenas o que mudou desde uma revisão conhecida.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+
+@dataclass
+class ChangeEvent:
+    """Representa uma mutação do armazenamento.
+
+    Attributes:
+        revisao: Número da revisão produzida pela mutação (crescente)
+        operacao: Tipo da mutação (add, update, done, delete)
+        titulo: Título da tarefa afetada
+        antes: Estado da tarefa antes da mutação (``Task.to_snapshot``, com
+            um marcador no lugar da descrição; None em add)
+        depois: Estado da tarefa após a mutação (idem; None em delete)
+        data: Data/hora da mutação (ISO 8601)
+        replica: Réplica onde a mutação se originou
+    """
+
+    revisao: int
+    operacao: str
+    titulo: str
+    antes: Optional[dict] = None
+    depois: Optional[dict] = None
+    data: str = field(default_factory=lambda: datetime.now().isoformat())
+    replica: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Converte o evento para dicionário."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ChangeEvent':
+        """Cria um evento a partir de um dicionário."""
+        return cls(**data)
+
+
+class ChangeLog:
+    """Log de mudanças em NDJSON, uma linha por evento.
+
+    A leitura é feita de trás para frente, de modo que ``since(rev)`` e
+    ``last_revision()`` custam proporcionalmente ao número de eventos
+    retornados, e não ao tamanho do log.
+
+    Attributes:
+        caminho: Arquivo do log
+    """
+
+    TAMANHO_BLOCO = 64 * 1024
+
+    def __init__(self, caminho):
+        """Inicializa o log.
+
+        Args:
+            caminho: Arquivo NDJSON do log
+        """
+        self.caminho = Path(caminho)
+
+    def append(self, eventos: List[ChangeEvent]):
+        """Anexa eventos ao final do log.
+
+        Args:
+            eventos: Eventos em ordem crescente de revisão
+        """
+        if not eventos:
+            return
+        linhas = "".join(json.dumps(e.to_dict(), ensure_ascii=False) + "\n" for e in eventos)
+        with open(self.caminho, 'a', encoding='utf-8') as f:
+            f.write(linhas)
+
+    def _reverse_lines(self) -> Iterator[bytes]:
+        """Itera as linhas do log da última para a primeira."""
+        try:
+            f = open(self.caminho, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            posicao = f.seek(0, os.SEEK_END)
+            resto = b""
+            while posicao > 0:
+                tamanho = min(self.TAMANHO_BLOCO, posicao)
+                posicao -= tamanho
+                f.seek(posicao)
+                linhas = (f.read(tamanho) + resto).split(b"\n")
+                resto = linhas.pop(0)
+                for linha in reversed(linhas):
+                    if linha.strip():
+                        yield linha
+            if resto.strip():
+                yield resto
+
+    def _reverse_events(self) -> Iterator[ChangeEvent]:
+        """Itera os eventos do log do mais recente para o mais antigo."""
+        for linha in self._reverse_lines():
+            try:
+                yield ChangeEvent.from_dict(json.loads(linha))
+            except (ValueError, TypeError):
+                # Linha parcial (gravação interrompida): ignora
+                continue
+
+    def last_revision(self) -> int:
+        """Retorna a última revisão registrada (0 se o log estiver vazio)."""
+        for evento in self._reverse_events():
+            return evento.revisao
+        return 0
+
+    def since(self, revisao: int) -> List[ChangeEvent]:
+        """Retorna os eventos com revisão maior que ``revisao``.
+
+        Args:
+            revisao: Última revisão já conhecida pelo consumidor
+
+        Returns:
+            Eventos em ordem crescente de revisão
+        """
+        eventos = []
+        for evento in self._reverse_events():
+            if evento.revisao <= revisao:
+                break
+            eventos.append(evento)
+        eventos.reverse()
+        return eventos
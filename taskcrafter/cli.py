@@ -4,13 +4,39 @@ Este módulo implementa a interface de linha de comando para todas as operaçõe
 """
 
 import argparse
+import cProfile
+import json
+import os
 import sys
-from typing import List, Optional
+import re
+import shlex
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
 
+from .aggregation import DIMENSOES
 from .manager import TaskManager
+from .profiling import NULL_PROFILER, Profiler
+from .serialization import CODECS, codec_for
+from .server import serve
+from .shell import TaskShell
+from .sync import sync_stores
+from .workspace import FederatedResult, Workspace
 from . import __version__, __author__
 
 
+CAMPOS_TAREFA = ('id', 'titulo', 'descricao', 'prioridade', 'status', 'tags', 'depende_de', 'data_criacao',
+                 'data_vencimento', 'data_conclusao', 'modificado_em', 'replica')
+
+VERIFICACAO_WATCH = 5.0
+"""Intervalo máximo (segundos) entre verificações do arquivo de dados em ``agenda --watch``.
+
+A biblioteca padrão não notifica alterações de arquivos; sem essa consulta
+periódica, uma tarefa gravada por outro processo com prazo anterior ao
+próximo conhecido só seria percebida depois dele."""
+
+
 class TaskCrafterCLI:
     """Interface de linha de comando para o TaskCrafter."""
     
@@ -20,7 +46,34 @@ class TaskCrafterCLI:
         Args:
             data_file: Caminho para o arquivo de dados
         """
-        self.manager = TaskManager(data_file)
+        self.data_file = data_file
+        self.profiler = NULL_PROFILER
+        self.codec: Optional[str] = None
+        self._manager: Optional[TaskManager] = None
+        self._avisar_dano = True
+        self.workspace_file: Optional[str] = None
+        self.timeout: Optional[float] = None
+        self._workspace: Optional[Workspace] = None
+        self._sleep = time.sleep
+    
+    @property
+    def manager(self) -> TaskManager:
+        """Gerenciador de tarefas, criado (e carregado) no primeiro acesso."""
+        if self._manager is None:
+            self._manager = TaskManager(self.data_file, profiler=self.profiler, codec=self.codec)
+            dano = self._manager.damage
+            if dano is not None and self._avisar_dano:
+                print(f"⚠️  Armazenamento danificado ({dano.erro}): {dano.recuperados} tarefa(s) "
+                      "carregada(s) somente para leitura. Execute 'taskcrafter fsck --repair'.",
+                      file=sys.stderr)
+        return self._manager
+    
+    @property
+    def workspace(self) -> Workspace:
+        """Workspace de ``--workspace``, lido no primeiro acesso."""
+        if self._workspace is None:
+            self._workspace = Workspace.load(self.workspace_file)
+        return self._workspace
     
     def run(self, args: Optional[List[str]] = None):
         """Executa a CLI com os argumentos fornecidos.
@@ -40,7 +93,34 @@ class TaskCrafterCLI:
             parser.print_help()
             return
         
+        if parsed_args.codec:
+            self.codec = parsed_args.codec
+            if self._manager is not None:
+                self._manager.codec = codec_for(self.data_file, self.codec)
+        
+        self.workspace_file = parsed_args.workspace
+        self.timeout = parsed_args.timeout
+        
         try:
+            if parsed_args.profile or parsed_args.profile_dump:
+                self._run_profiled(parsed_args)
+            else:
+                self._execute(parsed_args)
+        finally:
+            if parsed_args.metrics_file and self._manager is not None:
+                self._manager.write_prometheus(parsed_args.metrics_file)
+    
+    def _execute(self, parsed_args):
+        """Executa o comando já analisado, tratando erros.
+        
+        Args:
+            parsed_args: Namespace retornado pelo argparse
+        """
+        try:
+            if self.workspace_file and parsed_args.func not in self._federated_commands():
+                raise ValueError(f"O comando '{parsed_args.command}' não é suportado com --workspace")
+            if not self.workspace_file and parsed_args.func == self._cmd_workspace:
+                raise ValueError("O comando 'workspace' exige --workspace ARQUIVO")
             parsed_args.func(parsed_args)
         except ValueError as e:
             print(f"❌ Erro: {e}", file=sys.stderr)
@@ -49,13 +129,47 @@ class TaskCrafterCLI:
             print(f"❌ Erro inesperado: {e}", file=sys.stderr)
             sys.exit(1)
     
-    def _create_parser(self) -> argparse.ArgumentParser:
+    def _federated_commands(self) -> tuple:
+        """Comandos que aceitam --workspace."""
+        return (self._cmd_list, self._cmd_filter, self._cmd_search, self._cmd_stats, self._cmd_workspace)
+    
+    def _run_profiled(self, parsed_args):
+        """Executa o comando com instrumentação de fases e/ou cProfile.
+        
+        Args:
+            parsed_args: Namespace retornado pelo argparse
+        """
+        self.profiler = Profiler()
+        if self._manager is not None:
+            self._manager.profiler = self.profiler
+        perfil = cProfile.Profile() if parsed_args.profile_dump else None
+        
+        self.profiler.start()
+        if perfil:
+            perfil.enable()
+        try:
+            with self.profiler.phase("comando"):
+                self._execute(parsed_args)
+        finally:
+            if perfil:
+                perfil.disable()
+                perfil.dump_stats(parsed_args.profile_dump)
+            self.profiler.stop()
+            if parsed_args.profile:
+                print(f"\n⏱️  Perfil de execução\n{self.profiler.format_report()}", file=sys.stderr)
+            if perfil:
+                print(f"💾 cProfile gravado em {parsed_args.profile_dump}", file=sys.stderr)
+    
+    def _create_parser(self, parser_class=argparse.ArgumentParser) -> argparse.ArgumentParser:
         """Cria o parser de argumentos principal.
         
+        Args:
+            parser_class: Classe do parser (também usada pelos subcomandos)
+        
         Returns:
             ArgumentParser configurado
         """
-        parser = argparse.ArgumentParser(
+        parser = parser_class(
             prog='taskcrafter',
             description=f'TaskCrafter CLI - Sistema de Gerenciamento de Tarefas v{__version__}',
             epilog=f'Desenvolvido por: {__author__}'
@@ -67,6 +181,48 @@ class TaskCrafterCLI:
             version=f'TaskCrafter CLI v{__version__}'
         )
         
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Mostra tempo, registros e pico de memória de cada fase (stderr)'
+        )
+        
+        parser.add_argument(
+            '--profile-dump',
+            metavar='ARQUIVO',
+            help='Grava um perfil do cProfile no arquivo (ler com pstats)'
+        )
+        
+        parser.add_argument(
+            '--codec',
+            choices=list(CODECS),
+            default=os.environ.get('TASKCRAFTER_CODEC') or None,
+            help='Formato de gravação do arquivo de dados (padrão: pelo sufixo do arquivo, '
+                 'ou a variável TASKCRAFTER_CODEC)'
+        )
+        
+        parser.add_argument(
+            '--metrics-file',
+            metavar='ARQUIVO',
+            help='Grava as métricas de operação no formato do Prometheus (.prom)'
+        )
+        
+        parser.add_argument(
+            '--workspace',
+            metavar='MANIFESTO',
+            default=os.environ.get('TASKCRAFTER_WORKSPACE') or None,
+            help='Consulta vários armazenamentos listados no manifesto (list, filter, search e stats; '
+                 'padrão: a variável TASKCRAFTER_WORKSPACE)'
+        )
+        
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            metavar='SEGUNDOS',
+            help='Prazo das consultas com --workspace; armazenamentos atrasados ficam de fora '
+                 '(resultado parcial)'
+        )
+        
         subparsers = parser.add_subparsers(title='comandos', dest='command')
         
         # Comando: add
@@ -87,9 +243,51 @@ class TaskCrafterCLI:
         # Comando: filter
         self._add_filter_parser(subparsers)
         
+        # Comando: search
+        self._add_search_parser(subparsers)
+        
         # Comando: stats
         self._add_stats_parser(subparsers)
         
+        # Comando: agenda
+        self._add_agenda_parser(subparsers)
+        
+        # Comando: ready
+        self._add_ready_parser(subparsers)
+        
+        # Comando: tags
+        self._add_tags_parser(subparsers)
+        
+        # Comando: changes
+        self._add_changes_parser(subparsers)
+        
+        # Comando: sync
+        self._add_sync_parser(subparsers)
+        
+        # Comando: view
+        self._add_view_parser(subparsers)
+        
+        # Comando: batch
+        self._add_batch_parser(subparsers)
+        
+        # Comando: shell
+        self._add_shell_parser(subparsers)
+        
+        # Comando: fsck
+        self._add_fsck_parser(subparsers)
+        
+        # Comando: report
+        self._add_report_parser(subparsers)
+        
+        # Comando: archive
+        self._add_archive_parser(subparsers)
+        
+        # Comando: workspace
+        self._add_workspace_parser(subparsers)
+        
+        # Comando: http
+        self._add_http_parser(subparsers)
+        
         return parser
     
     def _add_add_parser(self, subparsers):
@@ -123,6 +321,13 @@ class TaskCrafterCLI:
             '-v', '--vencimento',
             help='Data de vencimento no formato YYYY-MM-DD'
         )
+        add_parser.add_argument(
+            '--depende',
+            nargs='+',
+            default=[],
+            metavar='TAREFA',
+            help='Tarefas (id ou título) que precisam ser concluídas antes desta'
+        )
         add_parser.set_defaults(func=self._cmd_add)
     
     def _add_list_parser(self, subparsers):
@@ -143,7 +348,7 @@ class TaskCrafterCLI:
         )
         list_parser.add_argument(
             '-t', '--tag',
-            help='Filtrar por tag'
+            help='Filtrar por tag (exata, tag/* para a subárvore ou prefixo*)'
         )
         list_parser.add_argument(
             '-o', '--ordenar',
@@ -151,6 +356,22 @@ class TaskCrafterCLI:
             default='data_criacao',
             help='Ordenar por campo (padrão: data_criacao)'
         )
+        list_parser.add_argument(
+            '-f', '--format',
+            choices=['texto', 'json', 'ndjson'],
+            default='texto',
+            help='Formato de saída (padrão: texto)'
+        )
+        list_parser.add_argument(
+            '--campos',
+            help=f"Campos exibidos nos formatos json/ndjson, separados por vírgula ({', '.join(CAMPOS_TAREFA)})"
+        )
+        list_parser.add_argument(
+            '-n', '--limite',
+            type=int,
+            metavar='N',
+            help='Mostra apenas as N primeiras tarefas'
+        )
         list_parser.set_defaults(func=self._cmd_list)
     
     def _add_update_parser(self, subparsers):
@@ -160,8 +381,14 @@ class TaskCrafterCLI:
             help='Atualiza uma tarefa existente'
         )
         update_parser.add_argument(
-            'titulo',
-            help='Título da tarefa a atualizar'
+            'ref',
+            metavar='tarefa',
+            nargs='?',
+            help='Id (ex.: 12 ou #12) ou título da tarefa a atualizar'
+        )
+        update_parser.add_argument(
+            '--titulo',
+            help='Novo título (renomeia a tarefa)'
         )
         update_parser.add_argument(
             '-d', '--descricao',
@@ -186,6 +413,20 @@ class TaskCrafterCLI:
             '-v', '--vencimento',
             help='Nova data de vencimento (YYYY-MM-DD)'
         )
+        update_parser.add_argument(
+            '--depende',
+            nargs='*',
+            metavar='TAREFA',
+            help='Novas dependências (substitui as existentes; sem valores, remove todas)'
+        )
+        update_parser.add_argument(
+            '--set',
+            action='append',
+            default=[],
+            metavar='CAMPO=VALOR',
+            help='Campo a alterar em massa (descricao, prioridade, status, tags, vencimento)'
+        )
+        self._add_bulk_arguments(update_parser)
         update_parser.set_defaults(func=self._cmd_update)
     
     def _add_done_parser(self, subparsers):
@@ -195,9 +436,12 @@ class TaskCrafterCLI:
             help='Marca uma tarefa como concluída'
         )
         done_parser.add_argument(
-            'titulo',
-            help='Título da tarefa'
+            'ref',
+            metavar='tarefa',
+            nargs='?',
+            help='Id (ex.: 12 ou #12) ou título da tarefa'
         )
+        self._add_bulk_arguments(done_parser)
         done_parser.set_defaults(func=self._cmd_done)
     
     def _add_delete_parser(self, subparsers):
@@ -207,11 +451,34 @@ class TaskCrafterCLI:
             help='Remove uma tarefa'
         )
         delete_parser.add_argument(
-            'titulo',
-            help='Título da tarefa'
+            'ref',
+            metavar='tarefa',
+            nargs='?',
+            help='Id (ex.: 12 ou #12) ou título da tarefa'
         )
+        self._add_bulk_arguments(delete_parser)
         delete_parser.set_defaults(func=self._cmd_delete)
     
+    def _add_bulk_arguments(self, parser):
+        """Adiciona as opções de seleção em massa (--where, --older-than, --dry-run)."""
+        parser.add_argument(
+            '--where',
+            action='append',
+            default=[],
+            metavar='CAMPO=VALOR',
+            help='Aplica a todas as tarefas que atendem ao filtro (status, prioridade, tag, vencimento)'
+        )
+        parser.add_argument(
+            '--older-than',
+            metavar='IDADE',
+            help='Apenas tarefas concluídas (ou criadas) há mais que IDADE (ex.: 90d, 2w, 12h)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Mostra quantas tarefas seriam afetadas, sem alterar nada'
+        )
+    
     def _add_filter_parser(self, subparsers):
         """Adiciona o parser do comando 'filter'."""
         filter_parser = subparsers.add_parser(
@@ -230,7 +497,7 @@ class TaskCrafterCLI:
         )
         filter_parser.add_argument(
             '-t', '--tag',
-            help='Filtrar por tag'
+            help='Filtrar por tag (exata, tag/* para a subárvore ou prefixo*)'
         )
         filter_parser.add_argument(
             '-v', '--vencimento',
@@ -242,16 +509,370 @@ class TaskCrafterCLI:
             default='data_criacao',
             help='Ordenar por campo (padrão: data_criacao)'
         )
+        filter_parser.add_argument(
+            '-n', '--limite',
+            type=int,
+            metavar='N',
+            help='Mostra apenas as N primeiras tarefas'
+        )
         filter_parser.set_defaults(func=self._cmd_filter)
     
+    def _add_search_parser(self, subparsers):
+        """Adiciona o parser do comando 'search'."""
+        search_parser = subparsers.add_parser(
+            'search',
+            help='Busca tarefas pelo texto do título ou da descrição'
+        )
+        search_parser.add_argument(
+            'texto',
+            help='Texto a procurar (sem diferenciar maiúsculas)'
+        )
+        search_parser.add_argument(
+            '-c', '--campo',
+            choices=['titulo', 'descricao'],
+            help='Procura apenas no campo indicado (padrão: título e descrição)'
+        )
+        search_parser.add_argument(
+            '-n', '--limite',
+            type=int,
+            metavar='N',
+            help='Mostra apenas as N primeiras tarefas'
+        )
+        search_parser.set_defaults(func=self._cmd_search)
+    
     def _add_stats_parser(self, subparsers):
         """Adiciona o parser do comando 'stats'."""
         stats_parser = subparsers.add_parser(
             'stats',
             help='Mostra estatísticas das tarefas'
         )
+        stats_parser.add_argument(
+            '--by',
+            help=f"Agrupa a contagem pelas dimensões, separadas por vírgula ({', '.join(DIMENSOES)})"
+        )
+        stats_parser.add_argument(
+            '-s', '--status',
+            choices=['pendente', 'andamento', 'concluida'],
+            help='Filtrar por status (com --by)'
+        )
+        stats_parser.add_argument(
+            '-p', '--prioridade',
+            choices=['baixa', 'media', 'alta'],
+            help='Filtrar por prioridade (com --by)'
+        )
+        stats_parser.add_argument(
+            '-t', '--tag',
+            help='Filtrar por tag (com --by; aceita tag/* e prefixo*)'
+        )
+        stats_parser.add_argument(
+            '--approx',
+            action='store_true',
+            help='Estatísticas aproximadas por esboços, incluindo as tarefas arquivadas'
+        )
+        stats_parser.add_argument(
+            '-n', '--top',
+            type=int,
+            default=10,
+            help='Quantidade de tags mais frequentes (com --approx, padrão: 10)'
+        )
+        stats_parser.add_argument(
+            '-f', '--format',
+            choices=['texto', 'json', 'ndjson'],
+            default='texto',
+            help='Formato de saída (padrão: texto)'
+        )
         stats_parser.set_defaults(func=self._cmd_stats)
     
+    def _add_agenda_parser(self, subparsers):
+        """Adiciona o parser do comando 'agenda'."""
+        agenda_parser = subparsers.add_parser(
+            'agenda',
+            aliases=['next'],
+            help='Mostra tarefas atrasadas e os próximos vencimentos'
+        )
+        agenda_parser.add_argument(
+            '-n', '--limite',
+            type=int,
+            default=10,
+            help='Quantidade de próximos vencimentos (padrão: 10)'
+        )
+        agenda_parser.add_argument(
+            '-w', '--watch',
+            action='store_true',
+            help=(f'Permanece em execução e reexibe a agenda a cada novo prazo ou alteração das tarefas. '
+                  f'Acorda no próximo prazo, mas confere o arquivo de dados a cada {VERIFICACAO_WATCH:g}s '
+                  f'para perceber tarefas gravadas por outros processos')
+        )
+        agenda_parser.set_defaults(func=self._cmd_agenda)
+    
+    def _add_ready_parser(self, subparsers):
+        """Adiciona o parser do comando 'ready'."""
+        ready_parser = subparsers.add_parser(
+            'ready',
+            help='Lista as tarefas prontas para trabalhar (sem dependências pendentes)'
+        )
+        ready_parser.add_argument(
+            '-o', '--ordenar',
+            choices=['data_criacao', 'prioridade', 'titulo', 'data_vencimento'],
+            default='prioridade',
+            help='Ordenar por campo (padrão: prioridade)'
+        )
+        ready_parser.add_argument(
+            '-f', '--format',
+            choices=['texto', 'json', 'ndjson'],
+            default='texto',
+            help='Formato de saída (padrão: texto)'
+        )
+        ready_parser.add_argument(
+            '--campos',
+            help=f"Campos exibidos nos formatos json/ndjson, separados por vírgula ({', '.join(CAMPOS_TAREFA)})"
+        )
+        ready_parser.add_argument(
+            '-n', '--limite',
+            type=int,
+            metavar='N',
+            help='Mostra apenas as N primeiras tarefas'
+        )
+        ready_parser.set_defaults(func=self._cmd_ready)
+    
+    def _add_tags_parser(self, subparsers):
+        """Adiciona o parser do comando 'tags'."""
+        tags_parser = subparsers.add_parser(
+            'tags',
+            help='Lista as tags em uso com a quantidade de tarefas'
+        )
+        tags_parser.add_argument(
+            'padrao',
+            nargs='?',
+            default='*',
+            help='Tag exata, tag/* (subárvore) ou prefixo* (padrão: todas)'
+        )
+        tags_parser.add_argument(
+            '-f', '--format',
+            choices=['texto', 'json', 'ndjson'],
+            default='texto',
+            help='Formato de saída (padrão: texto)'
+        )
+        tags_parser.set_defaults(func=self._cmd_tags)
+    
+    def _add_changes_parser(self, subparsers):
+        """Adiciona o parser do comando 'changes'."""
+        changes_parser = subparsers.add_parser(
+            'changes',
+            help='Lista as mudanças ocorridas após uma revisão'
+        )
+        changes_parser.add_argument(
+            '--since',
+            type=int,
+            default=0,
+            help='Última revisão já conhecida (padrão: 0, todas)'
+        )
+        changes_parser.add_argument(
+            '-f', '--format',
+            choices=['texto', 'ndjson'],
+            default='texto',
+            help='Formato de saída (padrão: texto)'
+        )
+        changes_parser.set_defaults(func=self._cmd_changes)
+    
+    def _add_sync_parser(self, subparsers):
+        """Adiciona o parser do comando 'sync'."""
+        sync_parser = subparsers.add_parser(
+            'sync',
+            help='Sincroniza com outro armazenamento de tarefas'
+        )
+        sync_parser.add_argument(
+            'outro',
+            help='Arquivo de dados (ou diretório que o contém) do outro armazenamento'
+        )
+        sync_parser.set_defaults(func=self._cmd_sync)
+    
+    def _add_view_parser(self, subparsers):
+        """Adiciona o parser do comando 'view' e de suas ações."""
+        view_parser = subparsers.add_parser(
+            'view',
+            help='Gerencia e executa visões salvas (filtros nomeados)'
+        )
+        acoes = view_parser.add_subparsers(title='ações', dest='acao', required=True)
+        
+        save_parser = acoes.add_parser('save', help='Cria ou substitui uma visão')
+        save_parser.add_argument('nome', help='Nome da visão')
+        save_parser.add_argument(
+            '-s', '--status',
+            choices=['pendente', 'andamento', 'concluida'],
+            help='Filtrar por status'
+        )
+        save_parser.add_argument(
+            '-p', '--prioridade',
+            choices=['baixa', 'media', 'alta'],
+            help='Filtrar por prioridade'
+        )
+        save_parser.add_argument(
+            '-t', '--tag',
+            help='Filtrar por tag (exata, tag/* para a subárvore ou prefixo*)'
+        )
+        save_parser.add_argument(
+            '-v', '--vencimento',
+            help='Filtrar por data de vencimento (YYYY-MM-DD)'
+        )
+        save_parser.add_argument(
+            '--vence-em',
+            metavar='DIAS',
+            help='Vencimento entre hoje e hoje + DIAS (ex.: 7d)'
+        )
+        save_parser.add_argument(
+            '-o', '--ordenar',
+            choices=['data_criacao', 'prioridade', 'titulo', 'data_vencimento'],
+            default='data_criacao',
+            help='Ordenar por campo (padrão: data_criacao)'
+        )
+        
+        run_parser = acoes.add_parser('run', help='Executa uma visão')
+        run_parser.add_argument('nome', help='Nome da visão')
+        
+        acoes.add_parser('list', help='Lista as visões salvas')
+        
+        delete_parser = acoes.add_parser('delete', help='Remove uma visão')
+        delete_parser.add_argument('nome', help='Nome da visão')
+        
+        view_parser.set_defaults(func=self._cmd_view)
+    
+    def _add_batch_parser(self, subparsers):
+        """Adiciona o parser do comando 'batch'."""
+        batch_parser = subparsers.add_parser(
+            'batch',
+            help='Executa vários comandos (um por linha) em um único processo'
+        )
+        batch_parser.add_argument(
+            'arquivo',
+            nargs='?',
+            default='-',
+            help="Comandos na sintaxe da CLI ou operações NDJSON, um por linha ('-' lê da entrada padrão)"
+        )
+        batch_parser.add_argument(
+            '--stop-on-error',
+            action='store_true',
+            help='Interrompe no primeiro erro (padrão: informa o erro e continua)'
+        )
+        batch_parser.set_defaults(func=self._cmd_batch)
+    
+    def _add_shell_parser(self, subparsers):
+        """Adiciona o parser do comando 'shell'."""
+        shell_parser = subparsers.add_parser(
+            'shell',
+            help='Abre um shell interativo que mantém as tarefas em memória'
+        )
+        shell_parser.add_argument(
+            '--intervalo',
+            type=float,
+            default=2.0,
+            metavar='SEGUNDOS',
+            help='Atraso da gravação em segundo plano após uma alteração (padrão: 2; 0 grava a cada comando)'
+        )
+        shell_parser.set_defaults(func=self._cmd_shell)
+    
+    def _add_fsck_parser(self, subparsers):
+        """Adiciona o parser do comando 'fsck'."""
+        fsck_parser = subparsers.add_parser(
+            'fsck',
+            help='Verifica os checksums do arquivo de dados e recupera os registros válidos'
+        )
+        fsck_parser.add_argument(
+            '--repair',
+            action='store_true',
+            help='Regrava apenas os registros válidos (o original é copiado para <arquivo>.corrupt-<data>)'
+        )
+        fsck_parser.set_defaults(func=self._cmd_fsck)
+    
+    def _add_report_parser(self, subparsers):
+        """Adiciona o parser do comando 'report' e de seus relatórios."""
+        report_parser = subparsers.add_parser(
+            'report',
+            help='Relatórios sobre as tarefas concluídas'
+        )
+        relatorios = report_parser.add_subparsers(title='relatórios', dest='relatorio', required=True)
+        
+        flow_parser = relatorios.add_parser(
+            'flow',
+            help='Vazão por período e lead time (p50/p90/p99) por prioridade e tag'
+        )
+        flow_parser.add_argument(
+            '--por',
+            choices=['dia', 'semana'],
+            default='semana',
+            help='Período da vazão (padrão: semana)'
+        )
+        flow_parser.add_argument(
+            '--ultimos',
+            type=int,
+            default=12,
+            metavar='N',
+            help='Quantidade de períodos mais recentes exibidos (padrão: 12)'
+        )
+        flow_parser.add_argument(
+            '-f', '--format',
+            choices=['texto', 'json'],
+            default='texto',
+            help='Formato de saída (padrão: texto)'
+        )
+        report_parser.set_defaults(func=self._cmd_report)
+    
+    def _add_archive_parser(self, subparsers):
+        """Adiciona o parser do comando 'archive'."""
+        archive_parser = subparsers.add_parser(
+            'archive',
+            help='Move tarefas concluídas antigas para um segmento de arquivo'
+        )
+        archive_parser.add_argument(
+            '--older-than',
+            required=True,
+            metavar='IDADE',
+            help='Arquiva as tarefas concluídas há mais que IDADE (ex.: 90d, 2w, 12h)'
+        )
+        archive_parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Mostra quantas tarefas seriam arquivadas, sem alterar nada'
+        )
+        archive_parser.set_defaults(func=self._cmd_archive)
+    
+    def _add_workspace_parser(self, subparsers):
+        """Adiciona o parser do comando 'workspace' e de suas ações."""
+        workspace_parser = subparsers.add_parser(
+            'workspace',
+            help='Gerencia os armazenamentos do manifesto de --workspace'
+        )
+        acoes = workspace_parser.add_subparsers(title='ações', dest='acao', required=True)
+        add_parser = acoes.add_parser('add', help='Inclui ou substitui um armazenamento')
+        add_parser.add_argument('nome', help='Nome do armazenamento (ex.: a equipe)')
+        add_parser.add_argument('arquivo', help='Arquivo de dados (relativo ao manifesto ou absoluto)')
+        acoes.add_parser('list', help='Lista os armazenamentos')
+        workspace_parser.set_defaults(func=self._cmd_workspace)
+    
+    def _add_http_parser(self, subparsers):
+        """Adiciona o parser do comando 'http'."""
+        http_parser = subparsers.add_parser(
+            'http',
+            help='Serve as tarefas como uma API HTTP local (JSON/NDJSON)'
+        )
+        http_parser.add_argument(
+            '--host',
+            default='127.0.0.1',
+            help='Endereço de escuta (padrão: 127.0.0.1)'
+        )
+        http_parser.add_argument(
+            '--port',
+            type=int,
+            default=8080,
+            help='Porta de escuta (padrão: 8080; 0 escolhe uma porta livre)'
+        )
+        http_parser.add_argument(
+            '-q', '--quiet',
+            action='store_true',
+            help='Não registra as requisições em stderr'
+        )
+        http_parser.set_defaults(func=self._cmd_http)
+    
     # Implementação dos comandos
     
     def _cmd_add(self, args):
@@ -261,30 +882,60 @@ class TaskCrafterCLI:
             descricao=args.descricao,
             prioridade=args.prioridade,
             tags=args.tags,
-            data_vencimento=args.vencimento
+            data_vencimento=args.vencimento,
+            depende_de=args.depende
         )
-        print(f"✅ Tarefa criada: {task}")
+        print(f"✅ Tarefa criada (#{task.id}): {task}")
     
     def _cmd_list(self, args):
         """Executa o comando list."""
-        tasks = self.manager.list_tasks(
-            status=args.status,
-            prioridade=args.prioridade,
-            tag=args.tag,
-            ordenar_por=args.ordenar
-        )
+        filtros = dict(status=args.status, prioridade=args.prioridade, tag=args.tag, ordenar_por=args.ordenar)
+        if self.workspace_file:
+            resultado = self.workspace.list_tasks(limite=args.limite, timeout=self.timeout, **filtros)
+            self._print_federated(resultado, args.format, args.campos, "📭 Nenhuma tarefa encontrada")
+            return
+        tasks = self.manager.list_tasks(**filtros)[:args.limite]
+        
+        if args.format != 'texto':
+            self._print_records(tasks, args.format, args.campos)
+            return
+        if args.campos:
+            raise ValueError("--campos só pode ser usado com --format json ou ndjson")
         
         if not tasks:
             print("📭 Nenhuma tarefa encontrada")
             return
         
         print(f"\n📋 Total de tarefas: {len(tasks)}\n")
-        for i, task in enumerate(tasks, 1):
-            self._print_task(i, task)
+        self._print_tasks(tasks)
     
     def _cmd_update(self, args):
         """Executa o comando update."""
+        if self._is_bulk(args):
+            updates = self._parse_updates(args.set)
+            updates.update(self._collect_updates(args))
+            if not updates:
+                print("⚠️  Nenhuma atualização fornecida")
+                return
+            tasks = self.manager.bulk_update(changes=updates, **self._bulk_kwargs(args))
+            self._print_bulk(tasks, args.dry_run, "atualizada(s)")
+            return
+        
+        if args.set:
+            raise ValueError("--set só pode ser usado com --where")
+        updates = self._collect_updates(args)
+        if not updates:
+            print("⚠️  Nenhuma atualização fornecida")
+            return
+        
+        task = self.manager.update_task(args.ref, **updates)
+        print(f"✅ Tarefa atualizada: {task}")
+    
+    def _collect_updates(self, args) -> Dict[str, object]:
+        """Reúne as alterações informadas pelas opções do comando update."""
         updates = {}
+        if args.titulo is not None:
+            updates['titulo'] = args.titulo
         if args.descricao is not None:
             updates['descricao'] = args.descricao
         if args.prioridade is not None:
@@ -295,47 +946,138 @@ class TaskCrafterCLI:
             updates['tags'] = args.tags
         if args.vencimento is not None:
             updates['data_vencimento'] = args.vencimento
-        
-        if not updates:
-            print("⚠️  Nenhuma atualização fornecida")
-            return
-        
-        task = self.manager.update_task(args.titulo, **updates)
-        print(f"✅ Tarefa atualizada: {task}")
+        if args.depende is not None:
+            updates['depende_de'] = args.depende
+        return updates
     
     def _cmd_done(self, args):
         """Executa o comando done."""
-        task = self.manager.mark_as_done(args.titulo)
+        if self._is_bulk(args):
+            tasks = self.manager.bulk_done(**self._bulk_kwargs(args))
+            self._print_bulk(tasks, args.dry_run, "concluída(s)")
+            return
+        
+        task = self.manager.mark_as_done(args.ref)
         print(f"✅ Tarefa concluída: {task}")
     
     def _cmd_delete(self, args):
         """Executa o comando delete."""
-        if self.manager.delete_task(args.titulo):
-            print(f"✅ Tarefa '{args.titulo}' removida com sucesso")
+        if self._is_bulk(args):
+            tasks = self.manager.bulk_delete(**self._bulk_kwargs(args))
+            self._print_bulk(tasks, args.dry_run, "removida(s)")
+            return
+        
+        if self.manager.delete_task(args.ref):
+            print(f"✅ Tarefa '{args.ref}' removida com sucesso")
         else:
-            print(f"❌ Tarefa '{args.titulo}' não encontrada")
+            print(f"❌ Tarefa '{args.ref}' não encontrada")
+    
+    def _is_bulk(self, args) -> bool:
+        """Indica se o comando foi chamado na forma em massa (--where/--older-than).
+        
+        Raises:
+            ValueError: Se a tarefa e a seleção em massa forem informadas juntas,
+                ou se nenhuma das duas for informada
+        """
+        em_massa = bool(args.where or args.older_than)
+        if em_massa and args.ref is not None:
+            raise ValueError("Informe a tarefa ou --where/--older-than, não ambos")
+        if not em_massa and args.ref is None:
+            raise ValueError("Informe a tarefa (id ou título) ou --where")
+        return em_massa
+    
+    def _bulk_kwargs(self, args) -> Dict[str, object]:
+        """Converte as opções de seleção em massa em argumentos do manager."""
+        return {
+            'where': _parse_pairs(args.where, '--where'),
+            'older_than': _parse_age(args.older_than) if args.older_than else None,
+            'dry_run': args.dry_run,
+        }
+    
+    def _parse_updates(self, pares: List[str]) -> Dict[str, object]:
+        """Converte os valores de --set em campos de ``update_task``."""
+        updates: Dict[str, object] = {}
+        for campo, valor in _parse_pairs(pares, '--set').items():
+            if campo == 'vencimento':
+                campo = 'data_vencimento'
+            if campo not in ('descricao', 'prioridade', 'status', 'tags', 'data_vencimento'):
+                raise ValueError(
+                    f"Campo inválido em --set: {campo}. "
+                    "Use: descricao, prioridade, status, tags, vencimento"
+                )
+            if campo == 'tags':
+                valor = [tag.strip() for tag in valor.split(',') if tag.strip()]
+            updates[campo] = valor
+        return updates
+    
+    def _print_bulk(self, tasks, dry_run: bool, acao: str):
+        """Imprime o resultado de uma operação em massa.
+        
+        Args:
+            tasks: Tarefas selecionadas
+            dry_run: Se a operação foi apenas simulada
+            acao: Particípio usado na mensagem (ex.: "concluída(s)")
+        """
+        if dry_run:
+            print(f"🔎 {len(tasks)} tarefa(s) seriam {acao} (dry-run)")
+            for task in tasks:
+                print(f"  • #{task.id} {task.titulo}")
+        else:
+            print(f"✅ {len(tasks)} tarefa(s) {acao}")
     
     def _cmd_filter(self, args):
         """Executa o comando filter."""
-        tasks = self.manager.list_tasks(
-            status=args.status,
-            prioridade=args.prioridade,
-            tag=args.tag,
-            vencimento=args.vencimento,
-            ordenar_por=args.ordenar
-        )
+        filtros = dict(status=args.status, prioridade=args.prioridade, tag=args.tag,
+                       vencimento=args.vencimento, ordenar_por=args.ordenar)
+        if self.workspace_file:
+            resultado = self.workspace.list_tasks(limite=args.limite, timeout=self.timeout, **filtros)
+            self._print_federated(resultado, 'texto', None,
+                                  "📭 Nenhuma tarefa encontrada com os filtros especificados")
+            return
+        tasks = self.manager.list_tasks(**filtros)[:args.limite]
         
         if not tasks:
             print("📭 Nenhuma tarefa encontrada com os filtros especificados")
             return
         
         print(f"\n📋 Total de tarefas: {len(tasks)}\n")
-        for i, task in enumerate(tasks, 1):
-            self._print_task(i, task)
+        self._print_tasks(tasks)
+    
+    def _cmd_search(self, args):
+        """Executa o comando search."""
+        campos = (args.campo,) if args.campo else ('titulo', 'descricao')
+        if self.workspace_file:
+            resultado = self.workspace.search(args.texto, campos, limite=args.limite, timeout=self.timeout)
+            self._print_federated(resultado, 'texto', None, f"📭 Nenhuma tarefa contém '{args.texto}'")
+            return
+        tasks = self.manager.search(args.texto, campos)[:args.limite]
+        
+        if not tasks:
+            print(f"📭 Nenhuma tarefa contém '{args.texto}'")
+            return
+        
+        print(f"\n🔍 Tarefas com '{args.texto}': {len(tasks)}\n")
+        self._print_tasks(tasks)
     
     def _cmd_stats(self, args):
         """Executa o comando stats."""
-        stats = self.manager.get_statistics()
+        if args.approx:
+            self._print_approx(args)
+            return
+        if args.by:
+            self._print_groups(args)
+            return
+        if args.status or args.prioridade or args.tag:
+            raise ValueError("Os filtros de stats exigem --by")
+        if self.workspace_file:
+            resultado = self.workspace.get_statistics(timeout=self.timeout)
+            self._report_failures(resultado)
+            stats = resultado.itens[0]
+        else:
+            stats = self.manager.get_statistics()
+        if args.format != 'texto':
+            self._print_json(stats, args.format)
+            return
         
         print("\n📊 Estatísticas das Tarefas\n")
         print(f"Total de tarefas: {stats['total']}")
@@ -348,12 +1090,479 @@ class TaskCrafterCLI:
         print(f"  • Média: {stats['por_prioridade']['media']}")
         print(f"  • Alta: {stats['por_prioridade']['alta']}")
     
-    def _print_task(self, index: int, task):
+    def _print_approx(self, args):
+        """Imprime as estatísticas aproximadas de ``stats --approx``."""
+        if args.by or args.status or args.prioridade or args.tag:
+            raise ValueError("stats --approx não aceita --by nem filtros")
+        if self.workspace_file:
+            raise ValueError("stats --approx não é suportado com --workspace")
+        stats = self.manager.approx_statistics(top=args.top)
+        if args.format != 'texto':
+            self._print_json(stats, args.format)
+            return
+        
+        print("\n📊 Estatísticas aproximadas (incluindo arquivadas)\n")
+        print(f"Total de tarefas: {stats['total']}")
+        if stats['segmentos']:
+            print(f"Segmentos de arquivo: {stats['segmentos']}")
+        print(f"\n📌 Por status (prioridades estimadas por amostra, IC 95%):")
+        for status, grupo in stats['por_status'].items():
+            prioridades = ", ".join(
+                f"{prioridade} ~{e['estimativa']} ±{e['erro']}"
+                for prioridade, e in grupo['por_prioridade'].items()
+            )
+            print(f"  • {status}: {grupo['total']} ({prioridades})")
+        distintas = stats['tags_distintas']
+        print(f"\n🏷️  Tags distintas: ~{distintas['estimativa']} ±{distintas['erro']}")
+        if stats['top_tags']:
+            print(f"\n🔝 Tags mais frequentes (confiança {stats['confianca_top_tags']:.0%}):")
+            for item in stats['top_tags']:
+                print(f"  • {item['tag']}: {item['minimo']}–{item['estimativa']}")
+    
+    def _print_groups(self, args):
+        """Imprime a contagem agrupada de ``stats --by``."""
+        dimensoes = [d.strip() for d in args.by.split(',') if d.strip()]
+        filtros = dict(status=args.status, prioridade=args.prioridade, tag=args.tag)
+        if self.workspace_file:
+            resultado = self.workspace.aggregate(dimensoes, timeout=self.timeout, **filtros)
+            self._report_failures(resultado)
+            grupos = resultado.itens
+        else:
+            grupos = self.manager.aggregate(dimensoes, **filtros)
+        if args.format != 'texto':
+            self._print_json(grupos, args.format)
+            return
+        if not grupos:
+            print("📭 Nenhuma tarefa encontrada com os filtros especificados")
+            return
+        
+        colunas = dimensoes + ['total']
+        larguras = [max(len(c), *(len(str(g[c])) for g in grupos)) for c in colunas]
+        print(f"\n📊 Tarefas por {', '.join(dimensoes)}\n")
+        print("  ".join(c.ljust(n) for c, n in zip(colunas, larguras)))
+        for grupo in grupos:
+            valores = [str(grupo[c]).ljust(n) for c, n in zip(dimensoes, larguras)]
+            print("  ".join(valores + [str(grupo['total']).rjust(larguras[-1])]))
+    
+    def _cmd_workspace(self, args):
+        """Executa o comando workspace."""
+        if args.acao == 'add':
+            loja = self.workspace.add_store(args.nome, args.arquivo)
+            print(f"✅ Armazenamento '{loja.nome}' incluído: {self.workspace.path(loja)}")
+            return
+        if not self.workspace.lojas:
+            print(f"📭 Nenhum armazenamento em {self.workspace.caminho}")
+            return
+        for loja in self.workspace.lojas:
+            existe = "" if self.workspace.path(loja).exists() else " (arquivo não encontrado)"
+            print(f"🗂️  {loja.nome}: {self.workspace.path(loja)}{existe}")
+    
+    def _cmd_http(self, args):
+        """Executa o comando http."""
+        def pronto(servidor):
+            print(f"🌐 Servindo {self.manager.data_file} em {servidor.url} (Ctrl+C para encerrar)", flush=True)
+        
+        serve(self.manager, args.host, args.port, args.quiet, pronto)
+        print("👋 Servidor encerrado")
+    
+    def _print_federated(self, resultado: FederatedResult, formato: str,
+                         campos: Optional[str], vazio: str):
+        """Imprime as tarefas de uma consulta federada, indicando o armazenamento de cada uma.
+        
+        Args:
+            resultado: Resultado da consulta
+            formato: ``texto``, ``json`` ou ``ndjson``
+            campos: Campos dos formatos json/ndjson
+            vazio: Mensagem para um resultado vazio
+        """
+        self._report_failures(resultado)
+        lojas = [loja for loja, _ in resultado.itens]
+        tasks = [task for _, task in resultado.itens]
+        if formato != 'texto':
+            self._print_records(tasks, formato, campos, lojas)
+            return
+        if campos:
+            raise ValueError("--campos só pode ser usado com --format json ou ndjson")
+        if not tasks:
+            print(vazio)
+            return
+        
+        print(f"\n📋 Total de tarefas: {len(tasks)} ({len(self.workspace.lojas)} armazenamento(s))\n")
+        with self.profiler.phase("impressao", len(tasks)):
+            for i, (loja, task) in enumerate(resultado.itens, 1):
+                self._print_task(i, task, loja)
+    
+    def _report_failures(self, resultado: FederatedResult):
+        """Avisa (em stderr) quais armazenamentos ficaram de fora de um resultado parcial."""
+        if not resultado.parcial:
+            return
+        print(f"⚠️  Resultado parcial: {len(resultado.falhas)} de {len(self.workspace.lojas)} "
+              "armazenamento(s) com falha", file=sys.stderr)
+        for loja, motivo in resultado.falhas.items():
+            print(f"  • {loja}: {motivo}", file=sys.stderr)
+    
+    def _print_json(self, dados, formato: str):
+        """Imprime um resultado como JSON ou, se for uma lista, NDJSON."""
+        if formato == 'ndjson' and isinstance(dados, list):
+            for item in dados:
+                print(json.dumps(item, ensure_ascii=False))
+        else:
+            print(json.dumps(dados, ensure_ascii=False, indent=2 if formato == 'json' else None))
+    
+    def _cmd_ready(self, args):
+        """Executa o comando ready."""
+        tasks = self.manager.ready_tasks(ordenar_por=args.ordenar)[:args.limite]
+        
+        if args.format != 'texto':
+            self._print_records(tasks, args.format, args.campos)
+            return
+        if args.campos:
+            raise ValueError("--campos só pode ser usado com --format json ou ndjson")
+        
+        if not tasks:
+            print("📭 Nenhuma tarefa pronta: todas as abertas aguardam dependências")
+            return
+        
+        print(f"\n🚦 Tarefas prontas: {len(tasks)}\n")
+        self._print_tasks(tasks)
+    
+    def _cmd_tags(self, args):
+        """Executa o comando tags."""
+        contagens = self.manager.tags(args.padrao)
+        if args.format != 'texto':
+            self._print_json([{"tag": tag, "total": total} for tag, total in contagens], args.format)
+            return
+        if not contagens:
+            print("🏷️  Nenhuma tag encontrada")
+            return
+        
+        largura = max(len(tag) for tag, _ in contagens)
+        print(f"\n🏷️  Tags: {len(contagens)}\n")
+        for tag, total in contagens:
+            print(f"  {tag.ljust(largura)}  {total:>5}")
+    
+    def _cmd_agenda(self, args):
+        """Executa o comando agenda."""
+        self._print_agenda(args.limite)
+        if not args.watch:
+            return
+        
+        try:
+            while True:
+                despertar = self.manager.agenda.next_wakeup()
+                if despertar is None:
+                    print("💤 Nenhum prazo futuro; aguardando novas tarefas")
+                else:
+                    print(f"💤 Próxima verificação em {despertar.isoformat(sep=' ')}")
+                self._aguardar_agenda(despertar)
+                self.manager.load_tasks()
+                self._print_agenda(args.limite)
+        except KeyboardInterrupt:
+            print()
+    
+    def _aguardar_agenda(self, despertar: Optional[datetime]):
+        """Espera o próximo prazo ou uma gravação de outro processo no arquivo de dados.
+        
+        Com um prazo conhecido, acorda nele; entre um e outro (ou sem prazo),
+        consulta a assinatura do arquivo a cada ``VERIFICACAO_WATCH`` segundos,
+        que é a única forma de perceber gravações de outros processos.
+        
+        Args:
+            despertar: Próximo instante em que a agenda muda (None: nenhum)
+        """
+        while not self.manager.changed_on_disk:
+            if despertar is None:
+                self._sleep(VERIFICACAO_WATCH)
+                continue
+            restante = (despertar - datetime.now()).total_seconds()
+            if restante <= 0:
+                return
+            self._sleep(min(restante, VERIFICACAO_WATCH))
+    
+    def _cmd_changes(self, args):
+        """Executa o comando changes."""
+        eventos = self.manager.changes(since=args.since)
+        
+        if args.format == 'ndjson':
+            for evento in eventos:
+                print(json.dumps(evento.to_dict(), ensure_ascii=False))
+            return
+        
+        if not eventos:
+            print(f"📭 Nenhuma mudança após a revisão {args.since} (revisão atual: {self.manager.revision})")
+            return
+        
+        print(f"\n🔁 Mudanças após a revisão {args.since}: {len(eventos)}\n")
+        for evento in eventos:
+            print(f"#{evento.revisao} {evento.data} {evento.operacao:<6} {evento.titulo}")
+        print(f"\nRevisão atual: {self.manager.revision}")
+    
+    def _cmd_sync(self, args):
+        """Executa o comando sync."""
+        outro = Path(args.outro)
+        if outro.is_dir():
+            outro = outro / Path(self.data_file).name
+        if not outro.exists():
+            raise ValueError(f"Armazenamento '{outro}' não encontrado")
+        
+        resultado = sync_stores(self.manager, TaskManager(str(outro)))
+        tipo = "completa" if resultado.completa else "incremental"
+        print(f"🔄 Sincronização {tipo} com {outro}")
+        print(f"  • Enviadas: {resultado.enviadas}")
+        print(f"  • Recebidas: {resultado.recebidas}")
+        print(f"  • Conflitos resolvidos: {resultado.conflitos}")
+    
+    def _cmd_view(self, args):
+        """Executa o comando view."""
+        if args.acao == 'save':
+            filtros = {
+                campo: valor for campo, valor in (
+                    ('status', args.status), ('prioridade', args.prioridade), ('tag', args.tag),
+                    ('vencimento', args.vencimento), ('vence_em', args.vence_em),
+                ) if valor is not None
+            }
+            view = self.manager.save_view(args.nome, filtros, args.ordenar)
+            print(f"✅ Visão '{view.nome}' salva: {_describe_view(view)}")
+        elif args.acao == 'run':
+            tasks = self.manager.run_view(args.nome)
+            if not tasks:
+                print(f"📭 Nenhuma tarefa na visão '{args.nome}'")
+                return
+            print(f"\n🔖 Visão '{args.nome}': {len(tasks)} tarefa(s)\n")
+            self._print_tasks(tasks)
+        elif args.acao == 'list':
+            views = self.manager.saved_views()
+            if not views:
+                print("📭 Nenhuma visão salva")
+                return
+            for view in views:
+                print(f"🔖 {view.nome}: {_describe_view(view)}")
+        elif self.manager.delete_view(args.nome):
+            print(f"✅ Visão '{args.nome}' removida")
+        else:
+            print(f"❌ Visão '{args.nome}' não encontrada")
+    
+    def _cmd_batch(self, args):
+        """Executa o comando batch.
+        
+        Todas as linhas usam o mesmo ``TaskManager``, carregado uma vez, e o
+        armazenamento é gravado uma única vez ao final (inclusive com
+        ``--stop-on-error``, mantendo as linhas já executadas).
+        """
+        parser = self._line_parser()
+        if args.arquivo == '-':
+            entrada = sys.stdin
+        else:
+            try:
+                entrada = open(args.arquivo, 'r', encoding='utf-8')
+            except OSError as e:
+                raise ValueError(f"Não foi possível abrir '{args.arquivo}': {e.strerror}")
+        
+        executadas = erros = 0
+        try:
+            with self.manager.batch():
+                for numero, linha in enumerate(entrada, 1):
+                    linha = linha.strip()
+                    if not linha or linha.startswith('#'):
+                        continue
+                    executadas += 1
+                    try:
+                        self._run_batch_line(parser, numero, linha)
+                    except Exception as e:
+                        erros += 1
+                        self._print_batch_error(numero, linha, e)
+                        if args.stop_on_error:
+                            break
+                    finally:
+                        sys.stdout.flush()
+        finally:
+            if entrada is not sys.stdin:
+                entrada.close()
+        
+        print(f"📦 Lote concluído: {executadas} linha(s), {erros} erro(s)", file=sys.stderr)
+        if erros:
+            sys.exit(1)
+    
+    def _run_batch_line(self, parser: argparse.ArgumentParser, numero: int, linha: str):
+        """Executa uma linha do lote: operação NDJSON ou comando da CLI.
+        
+        Args:
+            parser: Parser cujos erros levantam ValueError
+            numero: Número da linha no arquivo
+            linha: Conteúdo da linha, sem espaços nas pontas
+            
+        Raises:
+            ValueError: Se a linha for inválida ou o comando falhar
+        """
+        if linha.startswith('{'):
+            try:
+                operacao = json.loads(linha)
+            except ValueError as e:
+                raise ValueError(f"JSON inválido: {e}")
+            resultado = self.manager.apply_operation(operacao)
+            print(json.dumps({"linha": numero, "ok": True, **resultado}, ensure_ascii=False))
+            return
+        
+        self._run_command_line(parser, linha)
+    
+    def _line_parser(self) -> argparse.ArgumentParser:
+        """Cria o parser usado para linhas de comando dentro do processo (lote e shell)."""
+        return self._create_parser(_BatchArgumentParser)
+    
+    def _run_command_line(self, parser: argparse.ArgumentParser, linha: str):
+        """Executa uma linha na sintaxe da CLI com o gerenciador atual.
+        
+        Args:
+            parser: Parser criado por ``_line_parser``
+            linha: Comando e argumentos, como digitados no terminal
+            
+        Raises:
+            ValueError: Se a linha for inválida ou o comando falhar
+        """
+        try:
+            parsed_args = parser.parse_args(shlex.split(linha))
+        except SystemExit:
+            # --help e --version imprimem a saída e encerram o parser
+            return
+        if not hasattr(parsed_args, 'func'):
+            raise ValueError("Nenhum comando informado")
+        if parsed_args.command in ('batch', 'shell'):
+            raise ValueError(f"O comando {parsed_args.command} não pode ser usado dentro de um lote ou do shell")
+        try:
+            parsed_args.func(parsed_args)
+        except SystemExit as e:
+            # Comandos que encerram a CLI com erro (ex.: fsck com dano) falham só nesta linha
+            if e.code not in (None, 0):
+                raise ValueError(f"O comando {parsed_args.command} terminou com erro (código {e.code})")
+    
+    def _print_batch_error(self, numero: int, linha: str, erro: Exception):
+        """Informa o erro de uma linha do lote no formato da própria linha.
+        
+        Args:
+            numero: Número da linha no arquivo
+            linha: Conteúdo da linha
+            erro: Exceção levantada
+        """
+        if linha.startswith('{'):
+            print(json.dumps({"linha": numero, "ok": False, "erro": str(erro)}, ensure_ascii=False))
+        else:
+            print(f"❌ Linha {numero}: {erro}", file=sys.stderr)
+    
+    def _cmd_shell(self, args):
+        """Executa o comando shell."""
+        TaskShell(self, intervalo=args.intervalo).cmdloop()
+    
+    def _cmd_fsck(self, args):
+        """Executa o comando fsck."""
+        self._avisar_dano = False
+        relatorio = self.manager.fsck(repair=args.repair)
+        
+        if relatorio["ok"]:
+            print(f"✅ Armazenamento íntegro: {relatorio['registros']} registro(s)")
+            return
+        
+        print(f"⚠️  Armazenamento danificado: {relatorio['erro']}")
+        print(f"  • Registros válidos: {relatorio['registros']}")
+        print(f"  • Descartados: {relatorio['descartados']}")
+        if not args.repair:
+            print("Execute 'taskcrafter fsck --repair' para regravar apenas os registros válidos")
+            sys.exit(1)
+        if relatorio["backup"]:
+            print(f"💾 Original copiado para {relatorio['backup']}")
+        print(f"🛠️  Armazenamento reparado com {relatorio['registros']} registro(s)")
+    
+    def _cmd_report(self, args):
+        """Executa o comando report."""
+        relatorio = self.manager.flow_report(por=args.por, ultimos=args.ultimos)
+        if args.format == 'json':
+            self._print_json(relatorio, 'json')
+            return
+        if not relatorio["throughput"] and not relatorio["lead_time"]:
+            print("📭 Nenhuma tarefa concluída")
+            return
+        
+        print(f"\n📈 Vazão por {args.por} (últimos {args.ultimos})\n")
+        for linha in relatorio["throughput"]:
+            print(f"  • {linha['periodo']}: {linha['concluidas']}")
+        print("\n⏱️  Lead time (criação → conclusão)\n")
+        largura = max(len("grupo"), *(len(g["grupo"]) for g in relatorio["lead_time"]))
+        print(f"  {'grupo'.ljust(largura)}  {'n':>6}  {'p50':>8}  {'p90':>8}  {'p99':>8}")
+        for grupo in relatorio["lead_time"]:
+            quantis = "  ".join(f"{_format_hours(grupo[q]):>8}" for q in ('p50', 'p90', 'p99'))
+            print(f"  {grupo['grupo'].ljust(largura)}  {grupo['n']:>6}  {quantis}")
+        if relatorio["segmentos"]:
+            print(f"\n📦 Inclui {relatorio['segmentos']} segmento(s) arquivado(s)")
+    
+    def _cmd_archive(self, args):
+        """Executa o comando archive."""
+        tasks, segmento = self.manager.archive(_parse_age(args.older_than), dry_run=args.dry_run)
+        if not tasks:
+            print("📭 Nenhuma tarefa concluída para arquivar")
+        elif args.dry_run:
+            print(f"🔎 {len(tasks)} tarefa(s) seriam arquivadas")
+        else:
+            print(f"📦 {len(tasks)} tarefa(s) arquivada(s) em {segmento}")
+    
+    def _print_agenda(self, limite: int):
+        """Imprime as tarefas atrasadas e os próximos vencimentos.
+        
+        Args:
+            limite: Quantidade máxima de próximos vencimentos
+        """
+        atrasadas, proximas = self.manager.get_agenda(limite)
+        
+        if not atrasadas and not proximas:
+            print("📭 Nenhuma tarefa com vencimento em aberto")
+            return
+        
+        if atrasadas:
+            print(f"\n⏰ Tarefas atrasadas: {len(atrasadas)}\n")
+            self._print_tasks(atrasadas)
+        
+        if proximas:
+            print(f"\n📅 Próximos vencimentos: {len(proximas)}\n")
+            self._print_tasks(proximas)
+    
+    def _print_tasks(self, tasks):
+        """Imprime uma lista numerada de tarefas.
+        
+        Args:
+            tasks: Tarefas a imprimir
+        """
+        with self.profiler.phase("impressao", len(tasks)):
+            for i, task in enumerate(tasks, 1):
+                self._print_task(i, task)
+    
+    def _print_records(self, tasks, formato: str, campos: Optional[str], lojas: Optional[List[str]] = None):
+        """Imprime as tarefas como JSON ou NDJSON.
+        
+        Apenas os campos pedidos são lidos; uma descrição guardada fora de
+        linha só é carregada se ``descricao`` estiver entre eles.
+        
+        Args:
+            tasks: Tarefas a imprimir
+            formato: ``json`` ou ``ndjson``
+            campos: Campos separados por vírgula (padrão: todos)
+            lojas: Armazenamento de cada tarefa (consultas com --workspace)
+        """
+        selecionados = _parse_fields(campos) if campos else CAMPOS_TAREFA
+        with self.profiler.phase("impressao", len(tasks)):
+            registros = ({campo: getattr(task, campo) for campo in selecionados} for task in tasks)
+            if lojas is not None:
+                registros = ({"loja": loja, **registro} for loja, registro in zip(lojas, registros))
+            if formato == 'ndjson':
+                for registro in registros:
+                    print(json.dumps(registro, ensure_ascii=False))
+            else:
+                print(json.dumps(list(registros), ensure_ascii=False, indent=2))
+    
+    def _print_task(self, index: int, task, loja: Optional[str] = None):
         """Imprime uma tarefa formatada.
         
         Args:
             index: Número da tarefa na lista
             task: Objeto Task
+            loja: Armazenamento da tarefa (consultas com --workspace)
         """
         status_icons = {
             'pendente': '⏳',
@@ -369,16 +1578,86 @@ class TaskCrafterCLI:
         icon = status_icons.get(task.status, '📌')
         priority = priority_icons.get(task.prioridade, '⚪')
         
-        print(f"{index}. {icon} {priority} {task.titulo}")
+        origem = f"[{loja}] " if loja else ""
+        print(f"{index}. {origem}{icon} {priority} #{task.id} {task.titulo}")
         if task.descricao:
             print(f"   📝 {task.descricao}")
         if task.tags:
             print(f"   🏷️  {', '.join(task.tags)}")
         if task.data_vencimento:
             print(f"   📅 Vence: {task.data_vencimento}")
+        if task.depende_de:
+            print(f"   🔗 Depende de: {', '.join(f'#{d}' for d in task.depende_de)}")
         print()
 
 
+def _parse_fields(texto: str) -> List[str]:
+    """Converte ``id,titulo,status`` em lista de campos de tarefa.
+    
+    Raises:
+        ValueError: Se algum campo não existir
+    """
+    campos = [campo.strip() for campo in texto.split(',') if campo.strip()]
+    invalidos = [campo for campo in campos if campo not in CAMPOS_TAREFA]
+    if invalidos or not campos:
+        raise ValueError(f"Campo(s) inválido(s): {', '.join(invalidos) or texto!r}. Use: {', '.join(CAMPOS_TAREFA)}")
+    return campos
+
+
+def _describe_view(view) -> str:
+    """Descreve os filtros e a ordenação de uma visão salva em uma linha."""
+    filtros = ", ".join(f"{campo}={valor}" for campo, valor in view.filtros.items()) or "todas"
+    return f"{filtros} (ordenar por {view.ordenar_por})"
+
+
+class _BatchArgumentParser(argparse.ArgumentParser):
+    """Parser usado nas linhas do lote: erros viram ValueError em vez de encerrar."""
+    
+    def error(self, message: str):
+        """Levanta ValueError com a mensagem do argparse."""
+        raise ValueError(message)
+
+
+def _parse_pairs(pares: List[str], opcao: str) -> Dict[str, str]:
+    """Converte uma lista de ``campo=valor`` em dicionário.
+    
+    Raises:
+        ValueError: Se algum item não estiver no formato campo=valor
+    """
+    resultado = {}
+    for par in pares:
+        campo, separador, valor = par.partition('=')
+        if not separador or not campo.strip():
+            raise ValueError(f"{opcao} deve estar no formato campo=valor (recebido: '{par}')")
+        resultado[campo.strip()] = valor.strip()
+    return resultado
+
+
+def _format_hours(horas: Optional[float]) -> str:
+    """Formata uma duração em horas como minutos, horas ou dias."""
+    if horas is None:
+        return "-"
+    if horas < 1:
+        return f"{horas * 60:.0f}min"
+    if horas < 48:
+        return f"{horas:.1f}h"
+    return f"{horas / 24:.1f}d"
+
+
+def _parse_age(texto: str) -> timedelta:
+    """Converte uma idade como ``90d``, ``2w`` ou ``12h`` em timedelta.
+    
+    Raises:
+        ValueError: Se o formato for inválido
+    """
+    correspondencia = re.fullmatch(r'\s*(\d+)\s*([hdw])\s*', texto)
+    if not correspondencia:
+        raise ValueError("Idade deve estar no formato <número><h|d|w> (ex.: 90d)")
+    quantidade, unidade = int(correspondencia.group(1)), correspondencia.group(2)
+    return {'h': timedelta(hours=quantidade), 'd': timedelta(days=quantidade),
+            'w': timedelta(weeks=quantidade)}[unidade]
+
+
 def main():
     """Ponto de entrada principal da aplicação."""
     cli = TaskCrafterCLI()
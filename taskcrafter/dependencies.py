@@ -0,0 +1,157 @@
+"""Dependências entre tarefas do TaskCrafter CLI.
+
+Uma tarefa pode depender de outras (``Task.depende_de``, lista de ids): ela
+só fica pronta para ser trabalhada quando todas as suas dependências estão
+concluídas (ou foram removidas). O ``DependencyGraph`` mantém, para cada
+tarefa, quantas dependências ainda a bloqueiam (grau de entrada) e o
+conjunto das tarefas prontas; cada mutação ajusta só a tarefa alterada e as
+que dependem dela, de modo que consultar as prontas não percorre o grafo.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .models import Task
+
+
+class _Estado(NamedTuple):
+    """O que o grafo guarda de cada tarefa: dependências e se está concluída."""
+
+    dependencias: tuple
+    concluida: bool
+
+
+class DependencyGraph:
+    """Grafo de dependências com contagem de bloqueios e conjunto de prontas.
+
+    Dependências que apontam para ids inexistentes (tarefas removidas ou
+    arquivadas) não bloqueiam. Ids não são reutilizados, então uma tarefa
+    nova nunca herda dependentes.
+
+    Attributes:
+        tamanho: Quantidade de tarefas no grafo
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """Constrói o grafo em O(tarefas + dependências).
+
+        Args:
+            tasks: Tarefas iniciais
+        """
+        self._estado: Dict[int, _Estado] = {}
+        self._dependentes: Dict[int, Set[int]] = {}
+        self._bloqueios: Dict[int, int] = {}
+        self._prontas: Set[int] = set()
+        tasks = list(tasks)
+        for task in tasks:
+            self._estado[task.id] = _Estado(tuple(task.depende_de), task.status == "concluida")
+            for dependencia in task.depende_de:
+                self._dependentes.setdefault(dependencia, set()).add(task.id)
+        for task in tasks:
+            self._recontar(task.id)
+
+    @property
+    def tamanho(self) -> int:
+        """Quantidade de tarefas no grafo."""
+        return len(self._estado)
+
+    def _bloqueia(self, task_id: int) -> bool:
+        """Se a tarefa existe e ainda não foi concluída."""
+        estado = self._estado.get(task_id)
+        return estado is not None and not estado.concluida
+
+    def _recontar(self, task_id: int):
+        """Recalcula os bloqueios de uma tarefa a partir das suas dependências."""
+        estado = self._estado[task_id]
+        self._bloqueios[task_id] = sum(1 for d in estado.dependencias if self._bloqueia(d))
+        self._atualizar_pronta(task_id)
+
+    def _atualizar_pronta(self, task_id: int):
+        if not self._estado[task_id].concluida and not self._bloqueios[task_id]:
+            self._prontas.add(task_id)
+        else:
+            self._prontas.discard(task_id)
+
+    def apply(self, task_id: int, task: Optional[Task]):
+        """Atualiza o grafo após uma mutação.
+
+        Custa O(dependências da tarefa + tarefas que dependem dela).
+
+        Args:
+            task_id: Id da tarefa alterada
+            task: Estado atual da tarefa (None se foi removida)
+        """
+        antigo = self._estado.get(task_id)
+        novo = None if task is None else _Estado(tuple(task.depende_de), task.status == "concluida")
+        if antigo == novo:
+            return
+        bloqueava = antigo is not None and not antigo.concluida
+        bloqueia = novo is not None and not novo.concluida
+
+        if antigo is not None:
+            for dependencia in antigo.dependencias:
+                dependentes = self._dependentes.get(dependencia)
+                if dependentes is not None:
+                    dependentes.discard(task_id)
+                    if not dependentes:
+                        del self._dependentes[dependencia]
+        if novo is None:
+            del self._estado[task_id]
+            del self._bloqueios[task_id]
+            self._prontas.discard(task_id)
+        else:
+            self._estado[task_id] = novo
+            for dependencia in novo.dependencias:
+                self._dependentes.setdefault(dependencia, set()).add(task_id)
+            self._recontar(task_id)
+
+        if bloqueava != bloqueia:
+            delta = 1 if bloqueia else -1
+            for dependente in self._dependentes.get(task_id, ()):
+                self._bloqueios[dependente] += delta
+                self._atualizar_pronta(dependente)
+
+    def ready(self) -> Set[int]:
+        """Ids das tarefas abertas sem dependências pendentes."""
+        return set(self._prontas)
+
+    def blockers(self, task_id: int) -> List[int]:
+        """Ids das dependências que ainda bloqueiam a tarefa."""
+        estado = self._estado.get(task_id)
+        if estado is None:
+            return []
+        return [d for d in estado.dependencias if self._bloqueia(d)]
+
+    def creates_cycle(self, task_id: int, dependencias: Iterable[int]) -> bool:
+        """Indica se fazer ``task_id`` depender de ``dependencias`` fecharia um ciclo.
+
+        Um ciclo só é possível se alguma das novas dependências depender,
+        direta ou indiretamente, da própria tarefa. Uma tarefa da qual nada
+        depende (o caso comum, inclusive toda tarefa nova) é verificada em
+        O(1); nos demais casos, a busca percorre só as tarefas alcançáveis a
+        partir das novas dependências.
+
+        Args:
+            task_id: Tarefa que recebe as dependências
+            dependencias: Ids das dependências pretendidas
+
+        Returns:
+            True se houver ciclo (inclusive a tarefa depender de si mesma)
+        """
+        dependencias = set(dependencias)
+        if task_id in dependencias:
+            return True
+        if task_id not in self._dependentes:
+            return False
+        visitadas = set()
+        pilha = list(dependencias)
+        while pilha:
+            atual = pilha.pop()
+            if atual == task_id:
+                return True
+            if atual in visitadas:
+                continue
+            visitadas.add(atual)
+            estado = self._estado.get(atual)
+            if estado is not None:
+                pilha.extend(estado.dependencias)
+        return False
@@ -0,0 +1,212 @@
+"""Descrições longas fora de linha do TaskCrafter CLI.
+
+Descrições grandes (logs colados, especificações) não são gravadas dentro do
+arquivo de tarefas: ficam em um arquivo auxiliar somente-anexação e o
+registro da tarefa guarda apenas a referência ``[geração, offset, tamanho]``.
+``Task.descricao`` é um campo preguiçoso: o texto só é lido do disco no
+primeiro acesso, de modo que listar, filtrar e ordenar não tocam nele.
+
+Quando o arquivo acumula muito texto morto (descrições alteradas ou de
+tarefas removidas), ele é compactado em uma nova geração; a geração antiga
+só é apagada depois que o arquivo de tarefas passa a apontar para a nova.
+
+Os textos são sincronizados com o disco antes de o arquivo de tarefas que os
+referencia ser gravado. Uma anexação interrompida deixa no máximo bytes
+soltos no fim do arquivo, que nenhuma referência alcança; uma nova geração é
+gravada em um temporário e renomeada.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from .serialization import write_atomic
+
+
+LIMIAR_EXTERNO = 1024
+"""Tamanho (em caracteres) a partir do qual a descrição é gravada fora de linha."""
+
+TAMANHO_MINIMO_COMPACTACAO = 64 * 1024
+"""Abaixo deste tamanho o arquivo de descrições nunca é compactado."""
+
+
+class TextRef:
+    """Referência a um texto guardado em um ``DescriptionStore``.
+
+    Attributes:
+        geracao: Geração do arquivo de descrições
+        offset: Posição do texto no arquivo, em bytes
+        tamanho: Tamanho do texto codificado em UTF-8, em bytes
+    """
+
+    __slots__ = ("store", "geracao", "offset", "tamanho")
+
+    def __init__(self, store: 'DescriptionStore', geracao: int, offset: int, tamanho: int):
+        self.store = store
+        self.geracao = geracao
+        self.offset = offset
+        self.tamanho = tamanho
+
+    def load(self) -> str:
+        """Lê o texto do disco."""
+        return self.store.read(self)
+
+    def to_record(self) -> List[int]:
+        """Retorna a forma gravada no registro da tarefa."""
+        return [self.geracao, self.offset, self.tamanho]
+
+
+class LazyText:
+    """Descritor de campo de dataclass cujo valor pode ser um ``TextRef``.
+
+    Atribuir um ``TextRef`` adia a leitura até o primeiro acesso; atribuir
+    um texto descarta a referência (o texto mudou e precisa ser regravado).
+    """
+
+    def __set_name__(self, owner, nome: str):
+        self._valor = f"_{nome}_valor"
+        self._ref = f"_{nome}_ref"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            # Acesso pela classe: valor padrão do campo da dataclass
+            return ""
+        valor = obj.__dict__.get(self._valor)
+        if valor is None:
+            ref = obj.__dict__.get(self._ref)
+            valor = ref.load() if ref is not None else ""
+            obj.__dict__[self._valor] = valor
+        return valor
+
+    def __set__(self, obj, valor):
+        if isinstance(valor, TextRef):
+            obj.__dict__[self._ref] = valor
+            obj.__dict__[self._valor] = None
+        else:
+            obj.__dict__[self._ref] = None
+            obj.__dict__[self._valor] = valor
+
+    def ref(self, obj) -> Optional[TextRef]:
+        """Referência ainda válida do texto (None se em linha ou alterado)."""
+        return obj.__dict__.get(self._ref)
+
+    def attach(self, obj, ref: TextRef):
+        """Associa uma referência ao texto atual, mantendo-o em memória."""
+        obj.__dict__[self._ref] = ref
+
+    def is_loaded(self, obj) -> bool:
+        """Se o texto já está em memória."""
+        return obj.__dict__.get(self._valor) is not None
+
+
+class DescriptionStore:
+    """Arquivos de descrições, um por geração (``<dados>.desc.<geração>``).
+
+    Attributes:
+        geracao: Geração em que novos textos são anexados
+    """
+
+    def __init__(self, base: Path):
+        """Inicializa o armazenamento de descrições.
+
+        Args:
+            base: Arquivo de dados das tarefas (os arquivos de descrição ficam ao lado)
+        """
+        self.base = Path(base)
+        self.geracao = 0
+        self._obsoletas: List[int] = []
+
+    def path(self, geracao: int) -> Path:
+        """Caminho do arquivo de uma geração."""
+        return self.base.with_name(f"{self.base.name}.desc.{geracao}")
+
+    def reset(self):
+        """Volta à geração 0 (usado ao recarregar as tarefas)."""
+        self.geracao = 0
+        self._obsoletas = []
+
+    def ref(self, geracao: int, offset: int, tamanho: int) -> TextRef:
+        """Cria a referência lida de um registro, acompanhando a geração atual."""
+        self.geracao = max(self.geracao, geracao)
+        return TextRef(self, geracao, offset, tamanho)
+
+    def read(self, ref: TextRef) -> str:
+        """Lê o texto referenciado.
+
+        Raises:
+            ValueError: Se o arquivo de descrições estiver ausente ou truncado
+        """
+        try:
+            with open(self.path(ref.geracao), 'rb') as f:
+                f.seek(ref.offset)
+                dados = f.read(ref.tamanho)
+        except FileNotFoundError:
+            raise ValueError(f"Arquivo de descrições '{self.path(ref.geracao).name}' não encontrado")
+        if len(dados) != ref.tamanho:
+            raise ValueError(f"Arquivo de descrições '{self.path(ref.geracao).name}' truncado")
+        return dados.decode('utf-8')
+
+    def size(self) -> int:
+        """Tamanho do arquivo da geração atual, em bytes."""
+        try:
+            return self.path(self.geracao).stat().st_size
+        except OSError:
+            return 0
+
+    def append(self, textos: List[str]) -> List[TextRef]:
+        """Anexa textos ao arquivo da geração atual.
+
+        Args:
+            textos: Textos a gravar
+
+        Returns:
+            Referências, na mesma ordem
+        """
+        if not textos:
+            return []
+        return self._anexar(self.geracao, textos)
+
+    def compact(self, textos: List[str]) -> List[TextRef]:
+        """Grava apenas os textos vivos em uma nova geração.
+
+        A geração anterior continua legível até ``discard_obsolete``.
+
+        Args:
+            textos: Textos ainda referenciados
+
+        Returns:
+            Novas referências, na mesma ordem
+        """
+        refs, offset = [], 0
+        partes = [texto.encode('utf-8') for texto in textos]
+        for dados in partes:
+            refs.append(TextRef(self, self.geracao + 1, offset, len(dados)))
+            offset += len(dados)
+        write_atomic(self.path(self.geracao + 1), b"".join(partes))
+        self._obsoletas.append(self.geracao)
+        self.geracao += 1
+        return refs
+
+    def discard_obsolete(self):
+        """Apaga as gerações substituídas por uma compactação."""
+        for geracao in self._obsoletas:
+            try:
+                self.path(geracao).unlink()
+            except OSError:
+                # Outro processo pode estar com o arquivo aberto (Windows)
+                pass
+        self._obsoletas = []
+
+    def _anexar(self, geracao: int, textos: List[str]) -> List[TextRef]:
+        """Anexa os textos ao arquivo da geração e devolve as referências."""
+        refs = []
+        with open(self.path(geracao), 'ab') as f:
+            offset = f.seek(0, 2)
+            for texto in textos:
+                dados = texto.encode('utf-8')
+                f.write(dados)
+                refs.append(TextRef(self, geracao, offset, len(dados)))
+                offset += len(dados)
+            f.flush()
+            os.fsync(f.fileno())
+        return refs
@@ -0,0 +1,228 @@
+"""Métricas de fluxo do TaskCrafter CLI: vazão e lead time.
+
+O lead time (da criação à conclusão) é resumido em esboços de quantis no
+estilo do DDSketch: cada valor cai em um balde logarítmico, o que garante
+erro relativo limitado (1% por padrão) em qualquer quantil com memória
+proporcional ao intervalo de valores, e não à quantidade de tarefas. Os
+baldes são contagens, então esboços podem ser somados (segmentos
+arquivados, outras réplicas) e uma conclusão desfeita pode ser removida
+exatamente.
+"""
+
+import math
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .models import Task
+
+
+PRECISAO_PADRAO = 0.01
+"""Erro relativo máximo dos quantis."""
+
+MINIMO_HORAS = 1e-3
+"""Lead times abaixo deste valor (em horas) contam como zero."""
+
+QUANTIS = (0.5, 0.9, 0.99)
+
+
+class QuantileSketch:
+    """Esboço de quantis com erro relativo limitado e mesclável.
+
+    Attributes:
+        precisao: Erro relativo máximo dos quantis
+        contagens: Quantidade de valores por índice de balde
+        zeros: Quantidade de valores abaixo de ``MINIMO_HORAS``
+        count: Quantidade total de valores
+    """
+
+    def __init__(self, precisao: float = PRECISAO_PADRAO):
+        """Inicializa um esboço vazio.
+
+        Args:
+            precisao: Erro relativo máximo (entre 0 e 1)
+        """
+        self.precisao = precisao
+        self._gama = (1 + precisao) / (1 - precisao)
+        self._log_gama = math.log(self._gama)
+        self.contagens: Dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, valor: float, n: int = 1):
+        """Acrescenta ``n`` ocorrências do valor (``n`` negativo remove)."""
+        self.count += n
+        if valor < MINIMO_HORAS:
+            self.zeros += n
+            return
+        indice = math.ceil(math.log(valor) / self._log_gama)
+        total = self.contagens.get(indice, 0) + n
+        if total:
+            self.contagens[indice] = total
+        else:
+            del self.contagens[indice]
+
+    def remove(self, valor: float):
+        """Remove uma ocorrência do valor, acrescentada antes com ``add``."""
+        self.add(valor, -1)
+
+    def merge(self, outro: 'QuantileSketch'):
+        """Soma outro esboço a este.
+
+        Raises:
+            ValueError: Se os esboços tiverem precisões diferentes
+        """
+        if outro.precisao != self.precisao:
+            raise ValueError("Não é possível mesclar esboços com precisões diferentes")
+        for indice, n in outro.contagens.items():
+            self.contagens[indice] = self.contagens.get(indice, 0) + n
+        self.zeros += outro.zeros
+        self.count += outro.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Retorna o quantil ``q`` (entre 0 e 1), ou None se o esboço estiver vazio."""
+        if self.count <= 0:
+            return None
+        posicao = q * (self.count - 1)
+        acumulado = self.zeros
+        if acumulado > posicao:
+            return 0.0
+        for indice in sorted(self.contagens):
+            acumulado += self.contagens[indice]
+            if acumulado > posicao:
+                # Ponto do balde cujo erro relativo em relação a qualquer valor dele é <= precisao
+                return 2 * self._gama ** indice / (self._gama + 1)
+        return 2 * self._gama ** max(self.contagens) / (self._gama + 1)
+
+    def to_dict(self) -> dict:
+        """Converte o esboço para dicionário (serializável em JSON)."""
+        return {
+            "precisao": self.precisao,
+            "zeros": self.zeros,
+            "contagens": {str(indice): n for indice, n in self.contagens.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QuantileSketch':
+        """Cria o esboço a partir de um dicionário."""
+        sketch = cls(data["precisao"])
+        sketch.zeros = data["zeros"]
+        sketch.contagens = {int(indice): n for indice, n in data["contagens"].items()}
+        sketch.count = sketch.zeros + sum(sketch.contagens.values())
+        return sketch
+
+
+def _campos(registro: Union[Task, dict]) -> Tuple[str, str, Optional[str], str, List[str]]:
+    """Extrai status, criação, conclusão, prioridade e tags de uma tarefa ou registro."""
+    if isinstance(registro, Task):
+        return (registro.status, registro.data_criacao, registro.data_conclusao,
+                registro.prioridade, registro.tags)
+    return (registro.get("status"), registro.get("data_criacao"), registro.get("data_conclusao"),
+            registro.get("prioridade"), registro.get("tags") or [])
+
+
+def lead_time_hours(criacao: str, conclusao: str) -> Optional[float]:
+    """Horas entre a criação e a conclusão (None se alguma data for inválida)."""
+    try:
+        segundos = (datetime.fromisoformat(conclusao) - datetime.fromisoformat(criacao)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+    return max(segundos, 0.0) / 3600
+
+
+class FlowStats:
+    """Vazão diária e esboços de lead time das tarefas concluídas.
+
+    Attributes:
+        conclusoes: Quantidade de conclusões por dia (``YYYY-MM-DD``)
+        lead_time: Esboço do lead time em horas por grupo (``total``,
+            ``prioridade:<p>`` e ``tag:<t>``)
+    """
+
+    def __init__(self):
+        self.conclusoes: Counter = Counter()
+        self.lead_time: Dict[str, QuantileSketch] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> 'FlowStats':
+        """Calcula as métricas das tarefas concluídas em uma passada."""
+        fluxo = cls()
+        for task in tasks:
+            fluxo.add(task)
+        return fluxo
+
+    def _ajustar(self, registro: Union[Task, dict], n: int):
+        status, criacao, conclusao, prioridade, tags = _campos(registro)
+        if status != "concluida" or not conclusao:
+            return
+        dia = conclusao[:10]
+        self.conclusoes[dia] += n
+        if self.conclusoes[dia] <= 0:
+            del self.conclusoes[dia]
+        horas = lead_time_hours(criacao, conclusao)
+        if horas is None:
+            return
+        for grupo in ("total", f"prioridade:{prioridade}", *(f"tag:{t}" for t in dict.fromkeys(tags))):
+            sketch = self.lead_time.get(grupo)
+            if sketch is None:
+                sketch = self.lead_time[grupo] = QuantileSketch()
+            sketch.add(horas, n)
+            if sketch.count <= 0:
+                del self.lead_time[grupo]
+
+    def add(self, registro: Union[Task, dict]):
+        """Conta uma tarefa (ou registro) se estiver concluída."""
+        self._ajustar(registro, 1)
+
+    def remove(self, registro: Union[Task, dict]):
+        """Desconta uma tarefa (ou registro) contada antes com ``add``."""
+        self._ajustar(registro, -1)
+
+    def apply(self, antes: Optional[Union[Task, dict]], depois: Optional[Union[Task, dict]]):
+        """Aplica uma mutação: desconta o estado anterior e conta o novo.
+
+        Args:
+            antes: Estado anterior (None em inclusões)
+            depois: Estado posterior (None em remoções)
+        """
+        if antes is not None:
+            self.remove(antes)
+        if depois is not None:
+            self.add(depois)
+
+    def merge(self, outro: 'FlowStats'):
+        """Soma outras métricas (ex.: de um segmento arquivado) a estas."""
+        self.conclusoes.update(outro.conclusoes)
+        for grupo, sketch in outro.lead_time.items():
+            if grupo not in self.lead_time:
+                self.lead_time[grupo] = QuantileSketch(sketch.precisao)
+            self.lead_time[grupo].merge(sketch)
+
+    def throughput(self, por: str = "dia") -> List[Tuple[str, int]]:
+        """Conclusões por período, em ordem cronológica.
+
+        Args:
+            por: ``dia`` ou ``semana`` (semana ISO, ex.: ``2026-W42``)
+        """
+        if por == "dia":
+            return sorted(self.conclusoes.items())
+        semanas: Counter = Counter()
+        for dia, n in self.conclusoes.items():
+            ano, semana, _ = date.fromisoformat(dia).isocalendar()
+            semanas[f"{ano}-W{semana:02d}"] += n
+        return sorted(semanas.items())
+
+    def to_dict(self) -> dict:
+        """Converte as métricas para dicionário (serializável em JSON)."""
+        return {
+            "conclusoes": dict(self.conclusoes),
+            "lead_time": {grupo: sketch.to_dict() for grupo, sketch in self.lead_time.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'FlowStats':
+        """Cria as métricas a partir de um dicionário."""
+        fluxo = cls()
+        fluxo.conclusoes.update(data["conclusoes"])
+        fluxo.lead_time = {grupo: QuantileSketch.from_dict(s) for grupo, s in data["lead_time"].items()}
+        return fluxo
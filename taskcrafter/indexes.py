@@ -0,0 +1,143 @@
+"""Visões ordenadas das tarefas do TaskCrafter CLI.
+
+Este módulo mantém, para cada critério de ``list_tasks(ordenar_por=...)``,
+uma lista de entradas ``(chave, seq, task)`` já ordenada. As chaves são
+calculadas uma vez por mutação, e não a cada listagem; listar um subconjunto
+filtrado passa a ser uma caminhada pela visão em vez de uma nova ordenação.
+"""
+
+import bisect
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .agenda import PRIORIDADE_ORDEM
+from .models import Task
+
+
+def _chave_vencimento(task: Task) -> Tuple[bool, str]:
+    """Tarefas sem vencimento vão para o final."""
+    return (task.data_vencimento is None, task.data_vencimento or "")
+
+
+CHAVES: Dict[str, Callable[[Task], object]] = {
+    "data_criacao": lambda task: task.data_criacao,
+    "prioridade": lambda task: PRIORIDADE_ORDEM.get(task.prioridade, 3),
+    "titulo": lambda task: task.titulo.lower(),
+    "data_vencimento": _chave_vencimento,
+}
+
+
+class SortedView:
+    """Tarefas ordenadas por um critério, mantidas com ``bisect``.
+
+    O desempate usa a sequência de inserção da tarefa, o que reproduz a
+    ordenação estável sobre a lista de tarefas do gerenciador.
+
+    Attributes:
+        criterio: Nome do critério (chave de ``CHAVES``)
+    """
+
+    def __init__(self, criterio: str, tasks: Iterable[Task], sequencia: Dict[int, int]):
+        """Constrói a visão com uma única ordenação.
+
+        Args:
+            criterio: Nome do critério de ordenação
+            tasks: Tarefas atuais
+            sequencia: Sequência de inserção de cada tarefa, por id
+        """
+        self.criterio = criterio
+        self._chave = CHAVES[criterio]
+        self._entradas: List[tuple] = sorted(
+            (self._chave(task), sequencia[task.id], task) for task in tasks
+        )
+        self._atual: Dict[int, tuple] = {entrada[2].id: entrada for entrada in self._entradas}
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def tasks(self) -> List[Task]:
+        """Retorna as tarefas na ordem da visão."""
+        return [entrada[2] for entrada in self._entradas]
+
+    def insert(self, task: Task, seq: int):
+        """Insere (ou reposiciona) a tarefa na visão.
+
+        Args:
+            task: Tarefa adicionada ou alterada
+            seq: Sequência de inserção da tarefa
+        """
+        chave = self._chave(task)
+        entrada = self._atual.get(task.id)
+        if entrada is not None:
+            if entrada[0] == chave:
+                return
+            self.discard(task)
+        entrada = (chave, seq, task)
+        bisect.insort(self._entradas, entrada)
+        self._atual[task.id] = entrada
+
+    def discard(self, task: Task):
+        """Remove a tarefa da visão, se presente.
+
+        Args:
+            task: Tarefa removida
+        """
+        entrada = self._atual.pop(task.id, None)
+        if entrada is not None:
+            del self._entradas[bisect.bisect_left(self._entradas, entrada)]
+
+
+class SortedViews:
+    """Conjunto de visões ordenadas, construídas sob demanda.
+
+    Uma visão só é construída na primeira listagem com o seu critério; a
+    partir daí, é mantida a cada mutação.
+    """
+
+    def __init__(self, tasks: Iterable[Task]):
+        """Inicializa as sequências de inserção na ordem atual da lista.
+
+        Args:
+            tasks: Tarefas atuais, na ordem da lista do gerenciador
+        """
+        self._sequencia: Dict[int, int] = {task.id: seq for seq, task in enumerate(tasks)}
+        self._proxima = len(self._sequencia)
+        self._visoes: Dict[str, SortedView] = {}
+
+    @property
+    def construidas(self) -> Dict[str, int]:
+        """Tamanho de cada visão já construída, por critério."""
+        return {criterio: len(visao) for criterio, visao in self._visoes.items()}
+
+    def get(self, criterio: str, tasks: Iterable[Task]) -> Tuple[SortedView, bool]:
+        """Retorna a visão do critério, construindo-a se necessário.
+
+        Args:
+            criterio: Critério de ordenação (ver ``CHAVES``)
+            tasks: Tarefas atuais, usadas apenas na construção
+
+        Returns:
+            Tupla (visão, se foi construída nesta chamada)
+        """
+        visao = self._visoes.get(criterio)
+        if visao is not None:
+            return visao, False
+        visao = self._visoes[criterio] = SortedView(criterio, tasks, self._sequencia)
+        return visao, True
+
+    def add(self, task: Task):
+        """Registra uma tarefa nova (ao final da sequência)."""
+        self._sequencia[task.id] = self._proxima
+        self._proxima += 1
+        for visao in self._visoes.values():
+            visao.insert(task, self._sequencia[task.id])
+
+    def update(self, task: Task):
+        """Reposiciona uma tarefa alterada nas visões construídas."""
+        for visao in self._visoes.values():
+            visao.insert(task, self._sequencia[task.id])
+
+    def discard(self, task: Task):
+        """Remove uma tarefa de todas as visões."""
+        for visao in self._visoes.values():
+            visao.discard(task)
+        self._sequencia.pop(task.id, None)
@@ -0,0 +1,187 @@
+"""Trava de leitores e escritor do TaskCrafter CLI.
+
+Várias threads podem ler ao mesmo tempo (listar, filtrar, estatísticas),
+enquanto uma mutação tem acesso exclusivo: espera os leitores em curso
+terminarem e impede novos leitores até acabar. Um escritor esperando tem
+preferência sobre novos leitores, para que um fluxo contínuo de leituras não
+adie as mutações indefinidamente.
+
+A trava é reentrante: uma thread que já lê pode ler de novo, e o escritor
+pode ler e escrever de novo (uma mutação usa consultas internamente). Passar
+de leitor a escritor não é permitido, porque dois leitores fazendo isso ao
+mesmo tempo esperariam um pelo outro para sempre.
+
+Entre processos (vários comandos da CLI, o shell e o servidor sobre o mesmo
+arquivo), as mutações são serializadas pela ``FileLock``, uma trava
+exclusiva sobre um arquivo auxiliar do armazenamento (``flock`` em POSIX,
+``msvcrt.locking`` no Windows).
+"""
+
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+class RWLock:
+    """Trava reentrante de vários leitores e um escritor, com preferência ao escritor."""
+
+    def __init__(self):
+        # O mutex é usado diretamente (mais barato); a condição, só para esperar
+        self._mutex = threading.Lock()
+        self._condicao = threading.Condition(self._mutex)
+        self._leitores: Dict[int, int] = {}
+        self._escritor: Optional[int] = None
+        self._escritas = 0
+        self._escritores_esperando = 0
+
+    def acquire_read(self):
+        """Adquire a trava para leitura (bloqueia enquanto houver escritor)."""
+        eu = threading.get_ident()
+        with self._mutex:
+            if self._escritor == eu or eu in self._leitores:
+                # Reentrada: esperar aqui travaria a própria thread
+                self._leitores[eu] = self._leitores.get(eu, 0) + 1
+                return
+            while self._escritor is not None or self._escritores_esperando:
+                self._condicao.wait()
+            self._leitores[eu] = 1
+
+    def release_read(self):
+        """Libera uma aquisição de leitura."""
+        eu = threading.get_ident()
+        with self._mutex:
+            restantes = self._leitores[eu] - 1
+            if restantes:
+                self._leitores[eu] = restantes
+                return
+            del self._leitores[eu]
+            if not self._leitores:
+                self._condicao.notify_all()
+
+    def acquire_write(self):
+        """Adquire a trava para escrita (exclusiva).
+
+        Raises:
+            RuntimeError: Se a thread já tiver a trava apenas para leitura
+        """
+        eu = threading.get_ident()
+        with self._mutex:
+            if self._escritor == eu:
+                self._escritas += 1
+                return
+            if eu in self._leitores:
+                raise RuntimeError("Não é possível escrever enquanto a mesma thread lê")
+            self._escritores_esperando += 1
+            try:
+                while self._escritor is not None or self._leitores:
+                    self._condicao.wait()
+            finally:
+                self._escritores_esperando -= 1
+            self._escritor = eu
+            self._escritas = 1
+
+    def release_write(self):
+        """Libera uma aquisição de escrita."""
+        with self._mutex:
+            self._escritas -= 1
+            if not self._escritas:
+                self._escritor = None
+                self._condicao.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Bloco com a trava de leitura."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Bloco com a trava de escrita."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class FileLock:
+    """Trava exclusiva entre processos sobre um arquivo.
+
+    Usa ``flock`` em POSIX e, no Windows, ``msvcrt.locking`` sobre o
+    primeiro byte do arquivo. Reentrante para a mesma instância: só a
+    primeira aquisição trava o arquivo. Sem nenhum dos dois módulos,
+    serializa apenas as threads do processo.
+    """
+
+    def __init__(self, caminho):
+        """Inicializa a trava.
+
+        Args:
+            caminho: Arquivo da trava (criado na primeira aquisição)
+        """
+        self.caminho = Path(caminho)
+        self._trava = threading.RLock()
+        self._profundidade = 0
+        self._arquivo = None
+
+    def acquire(self):
+        """Adquire a trava (bloqueia enquanto outro processo a tiver)."""
+        self._trava.acquire()
+        if self._profundidade == 0 and (fcntl is not None or msvcrt is not None):
+            try:
+                self._arquivo = open(self.caminho, 'a+b')
+                self._travar_arquivo()
+            except BaseException:
+                if self._arquivo is not None:
+                    self._arquivo.close()
+                    self._arquivo = None
+                self._trava.release()
+                raise
+        self._profundidade += 1
+
+    def _travar_arquivo(self):
+        """Trava o arquivo aberto, esperando enquanto outro processo o tiver."""
+        if fcntl is not None:
+            fcntl.flock(self._arquivo.fileno(), fcntl.LOCK_EX)
+            return
+        self._arquivo.seek(0)
+        while True:
+            try:
+                # LK_LOCK desiste após ~10 s; continua tentando como o flock
+                msvcrt.locking(self._arquivo.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def release(self):
+        """Libera uma aquisição."""
+        self._profundidade -= 1
+        if self._profundidade == 0 and self._arquivo is not None:
+            if fcntl is None:  # pragma: no cover - Windows
+                self._arquivo.seek(0)
+                msvcrt.locking(self._arquivo.fileno(), msvcrt.LK_UNLCK, 1)
+            # Fechar o arquivo libera o flock
+            self._arquivo.close()
+            self._arquivo = None
+        self._trava.release()
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
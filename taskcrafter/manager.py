@@ -3,31 +3,199 @@
 Este módulo implementa todas as operações CRUD e lógica de negócio.
 """
 
+import functools
+import gc
 import json
 import os
-from datetime import datetime
+import shutil
+import threading
+import time
+import uuid
+import warnings
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterator, List, Optional, Dict, Any, Tuple
 
-from .models import Task
+from .agenda import DeadlineAgenda
+from .aggregation import Aggregations
+from .archive import read_header, read_records, segments, write_segment
+from .cache import LoadCache, content_key
+from .changes import ChangeEvent, ChangeLog
+from .dependencies import DependencyGraph
+from .descriptions import LIMIAR_EXTERNO, TAMANHO_MINIMO_COMPACTACAO, DescriptionStore
+from .flow import QUANTIS, FlowStats
+from .indexes import CHAVES, SortedViews
+from .locking import FileLock, RWLock
+from .metrics import MetricsRegistry, render_prometheus, write_textfile
+from .models import CAMPOS, DESCRICAO, Task
+from .profiling import NULL_PROFILER
+from .saved_views import SavedView, SavedViews
+from .serialization import StoreDamage, codec_for, decode_records, write_atomic
+from .sketches import StoreSketches
+from .tags import TagTrie
+
+
+DESCRICAO_POSICAO = CAMPOS.index("descricao")
+
+
+class StoreConflictError(ValueError):
+    """Gravação recusada porque outro processo gravou o arquivo desde a última carga."""
+
+
+@contextmanager
+def _sem_coleta():
+    """Pausa o coletor de ciclos enquanto muitos objetos são criados de uma vez.
+    
+    Criar centenas de milhares de tarefas dispara várias coletas completas,
+    que percorrem tudo o que já foi criado sem liberar nada.
+    """
+    ativo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if ativo:
+            gc.enable()
+
+
+def _medido(operacao: str):
+    """Registra contagem, erros e latência do método nas métricas do manager.
+    
+    Args:
+        operacao: Nome da operação nas métricas
+    """
+    def decorador(metodo):
+        @functools.wraps(metodo)
+        def wrapper(self, *args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return metodo(self, *args, **kwargs)
+            except Exception:
+                self.metrics_registry.error(operacao)
+                raise
+            finally:
+                self.metrics_registry.observe(operacao, time.perf_counter() - inicio)
+        return wrapper
+    return decorador
+
+
+def _leitura(metodo):
+    """Executa o método com a trava de leitura do manager (várias threads ao mesmo tempo)."""
+    @functools.wraps(metodo)
+    def wrapper(self, *args, **kwargs):
+        self._trava.acquire_read()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            self._trava.release_read()
+    return wrapper
+
+
+def _escrita(metodo):
+    """Executa o método com a trava de escrita do manager (uma thread por vez)."""
+    @functools.wraps(metodo)
+    def wrapper(self, *args, **kwargs):
+        self._trava.acquire_write()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            self._trava.release_write()
+    return wrapper
+
+
+def _mutacao(metodo):
+    """Executa a mutação com a trava do arquivo de dados, sobre o estado gravado mais recente.
+    
+    Outro processo pode ter gravado desde a carga; sem mutações pendentes, as
+    tarefas são recarregadas antes de aplicar a mutação, para que ela não
+    sobrescreva a gravação do outro processo.
+    """
+    @functools.wraps(metodo)
+    def wrapper(self, *args, **kwargs):
+        with self._trava_arquivo:
+            if not self._eventos_pendentes and not self._lote_pendente \
+                    and _assinatura(self.data_file) != self._assinatura:
+                self.load_tasks()
+            return metodo(self, *args, **kwargs)
+    return wrapper
+
+
+def _assinatura(caminho: Path, stat: Optional[os.stat_result] = None) -> Optional[Tuple[int, int, int]]:
+    """Identifica a versão gravada do arquivo: inode, tamanho e data de modificação.
+    
+    Cada gravação substitui o arquivo (``write_atomic``), então o inode muda
+    mesmo quando tamanho e data coincidem.
+    """
+    if stat is None:
+        try:
+            stat = caminho.stat()
+        except OSError:
+            return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
 
 
 class TaskManager:
     """Gerenciador de tarefas com persistência em JSON.
     
+    Pode ser compartilhado entre threads: consultas rodam em paralelo sob a
+    trava de leitura e mutações são serializadas pela trava de escrita (ver
+    ``locking.RWLock``). Estruturas construídas sob demanda durante uma
+    consulta (visões ordenadas, agregações, agenda, métricas de fluxo) são
+    construídas por uma thread de cada vez.
+    
     Attributes:
         data_file: Caminho para o arquivo JSON de persistência
         tasks: Lista de tarefas carregadas em memória
+        profiler: Coletor de métricas por fase (``profiling.Profiler``)
+        metrics_registry: Contadores e histogramas de latência por operação
+        revision: Revisão atual do armazenamento (cresce a cada mutação)
+        damage: Dano encontrado na última carga (None se o arquivo estava
+            íntegro); enquanto houver dano, gravar é recusado
     """
     
-    def __init__(self, data_file: str = "data/tasks.json"):
+    def __init__(self, data_file: str = "data/tasks.json", profiler=None, codec: Optional[str] = None,
+                 load_cache: bool = True):
         """Inicializa o gerenciador de tarefas.
         
         Args:
             data_file: Caminho para o arquivo de dados JSON
+            profiler: Profiler opcional para instrumentar as fases
+            codec: Codec de gravação (``serialization.CODECS``); o padrão
+                depende do sufixo do arquivo (``.gz``, ``.xz`` ou JSON indentado)
+            load_cache: Se True, usa o cache de tarefas validadas
+                (``<dados>.cache``) para evitar o parse na carga
         """
         self.data_file = Path(data_file)
+        self._trava = RWLock()
+        self._trava_arquivo = FileLock(self._sidecar("lock"))
+        self._assinatura: Optional[Tuple[int, int, int]] = None
+        self._construcao = threading.RLock()
+        self.codec = codec_for(self.data_file, codec)
+        self.profiler = profiler or NULL_PROFILER
+        self.metrics_registry = MetricsRegistry()
         self.tasks: List[Task] = []
+        self.revision = 0
+        self.damage: Optional[StoreDamage] = None
+        self._por_id: Dict[int, int] = {}
+        self._por_titulo: Dict[str, Task] = {}
+        self._proximo_id = 1
+        self._lote = 0
+        self._lote_pendente = False
+        self._agenda: Optional[DeadlineAgenda] = None
+        self._dependencias: Optional[DependencyGraph] = None
+        self._trie_tags: Optional[TagTrie] = None
+        self._visoes = SortedViews(())
+        self._agregacoes = Aggregations()
+        self._fluxo: Optional[FlowStats] = None
+        self._esbocos: Optional[StoreSketches] = None
+        self._changelog = ChangeLog(self._sidecar("changes.jsonl"))
+        self._saved_views = SavedViews(self._sidecar("views.json"))
+        self._descricoes = DescriptionStore(self.data_file)
+        self._cache = LoadCache(self._sidecar("cache")) if load_cache else None
+        self._meta: Optional[Dict[str, Any]] = None
+        self._eventos_pendentes: List[ChangeEvent] = []
+        self._assinantes: List[Callable[[ChangeEvent], None]] = []
         self._ensure_data_directory()
         self.load_tasks()
     
@@ -35,27 +203,532 @@ class TaskManager:
         """Garante que o diretório de dados existe."""
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
     
+    def _sidecar(self, sufixo: str) -> Path:
+        """Retorna o caminho de um arquivo auxiliar ao lado do arquivo de dados.
+        
+        Args:
+            sufixo: Sufixo do arquivo auxiliar (ex.: ``changes.jsonl``)
+        """
+        return self.data_file.with_name(f"{self.data_file.name}.{sufixo}")
+    
+    @_medido("load")
+    @_escrita
     def load_tasks(self):
-        """Carrega tarefas do arquivo JSON."""
-        if self.data_file.exists():
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.tasks = [Task.from_dict(task_data) for task_data in data]
-            except (json.JSONDecodeError, Exception) as e:
-                # Se houver erro ao carregar, inicia com lista vazia
-                self.tasks = []
-        else:
-            self.tasks = []
+        """Carrega tarefas do arquivo de dados (JSON, comprimido ou não).
+        
+        Se o arquivo estiver danificado, apenas os registros válidos são
+        carregados e ``damage`` descreve o problema; o arquivo não é
+        sobrescrito até ser reparado com ``fsck(repair=True)``.
+        
+        Mutações adiadas por um lote aberto e ainda não gravadas são
+        descartadas.
+        """
+        self._descricoes.reset()
+        with _sem_coleta():
+            self.tasks, self.damage, self._assinatura = self._read_store()
+        self._agenda = None
+        self._dependencias = None
+        self._trie_tags = None
+        self._eventos_pendentes = []
+        self._lote_pendente = False
+        self._meta = None
+        self._saved_views.reset()
+        self._fluxo = None
+        self._esbocos = None
+        self.revision = self._changelog.last_revision()
+        self._rebuild_indexes()
+    
+    def _read_store(self) -> Tuple[List[Task], Optional[StoreDamage], Optional[Tuple[int, int, int]]]:
+        """Lê e valida as tarefas do arquivo de dados.
+        
+        Returns:
+            Tupla (tarefas válidas, dano ou None se o arquivo estava íntegro,
+            assinatura do arquivo lido ou None se ele não existia)
+        """
+        if not self.data_file.exists():
+            return [], None, None
+        try:
+            with open(self.data_file, 'rb') as f:
+                conteudo = f.read()
+                stat = os.fstat(f.fileno())
+        except OSError as e:
+            return [], StoreDamage(f"não foi possível ler o arquivo: {e}", 0, 0), None
+        assinatura = _assinatura(self.data_file, stat)
+        chave = content_key(conteudo, stat) if self._cache else None
+        if chave is not None:
+            with self.profiler.phase("carregar.cache") as fase:
+                valores = self._cache.read(chave)
+                if valores is not None:
+                    fase.registros = len(valores)
+                    return [self._task_from_values(v) for v in valores], None, assinatura
+        with self.profiler.phase("carregar.leitura") as fase:
+            registros, dano = decode_records(conteudo)
+            fase.registros = len(registros)
+        with self.profiler.phase("carregar.validacao", len(registros)):
+            tasks = []
+            invalidos = 0
+            for registro in registros:
+                try:
+                    tasks.append(self._task_from_record(registro))
+                except (ValueError, TypeError, KeyError, AttributeError):
+                    invalidos += 1
+        if invalidos:
+            dano = dano or StoreDamage(f"{invalidos} registro(s) inválido(s)", 0, 0)
+            dano.recuperados = len(tasks)
+            dano.descartados += invalidos
+        if chave is not None and dano is None:
+            self._cache.write(chave, [task.to_record() for task in tasks])
+        return tasks, dano, assinatura
+    
+    def _task_from_record(self, dados: dict) -> Task:
+        """Cria a tarefa a partir do registro gravado, sem ler descrições externas."""
+        ref = dados.pop("descricao_ref", None)
+        if ref is not None:
+            dados["descricao"] = self._descricoes.ref(*ref)
+        return Task.from_dict(dados)
+    
+    def _task_from_values(self, valores: tuple) -> Task:
+        """Recria a tarefa a partir das tuplas do cache de carga, já validadas."""
+        descricao = valores[DESCRICAO_POSICAO]
+        if isinstance(descricao, list):
+            descricao = self._descricoes.ref(*descricao)
+        return Task.from_values(valores, descricao)
     
+    @_escrita
+    def fsck(self, repair: bool = False) -> Dict[str, Any]:
+        """Verifica o arquivo de dados e, opcionalmente, o repara.
+        
+        O reparo copia o arquivo danificado para ``<dados>.corrupt-<data>``
+        e regrava apenas os registros válidos.
+        
+        Args:
+            repair: Se True, regrava o arquivo quando houver dano
+            
+        Returns:
+            Dicionário com ``ok``, ``erro``, ``registros`` (válidos),
+            ``descartados`` e ``backup`` (cópia do original, se reparado)
+        """
+        tasks, dano, assinatura = self._read_store()
+        relatorio = {
+            "ok": dano is None,
+            "erro": dano.erro if dano else None,
+            "registros": len(tasks),
+            "descartados": dano.descartados if dano else 0,
+            "backup": None,
+        }
+        if repair and dano is not None:
+            backup = self._sidecar(f"corrupt-{datetime.now().strftime('%Y%m%d%H%M%S')}")
+            if self.data_file.exists():
+                shutil.copyfile(self.data_file, backup)
+                relatorio["backup"] = str(backup)
+            self.tasks, self.damage, self._assinatura = tasks, None, assinatura
+            self._rebuild_indexes()
+            self.save_tasks()
+            self.load_tasks()
+        return relatorio
+    
+    def _rebuild_indexes(self):
+        """Reconstrói os índices id→posição e título→tarefa.
+        
+        Tarefas gravadas antes da existência de ids recebem ids na ordem do
+        arquivo, a partir do maior id conhecido; eles passam a ser
+        persistidos na próxima gravação.
+        """
+        maior_id = max((t.id for t in self.tasks if t.id is not None), default=0)
+        self._proximo_id = max(self._read_meta().get("proximo_id", 1), maior_id + 1)
+        self._por_id = {}
+        self._por_titulo = {}
+        for posicao, task in enumerate(self.tasks):
+            if task.id is None or task.id in self._por_id:
+                task.id = self._proximo_id
+                self._proximo_id += 1
+            self._por_id[task.id] = posicao
+            self._por_titulo.setdefault(task.titulo.lower(), task)
+        self._visoes = SortedViews(self.tasks)
+        self._agregacoes = Aggregations()
+    
+    def _read_meta(self) -> Dict[str, Any]:
+        """Lê (uma vez) os metadados do armazenamento, como o id da réplica."""
+        with self._construcao:
+            if self._meta is None:
+                try:
+                    with open(self._sidecar("meta.json"), 'r', encoding='utf-8') as f:
+                        self._meta = json.load(f)
+                except (OSError, ValueError):
+                    self._meta = {}
+            return self._meta
+    
+    def _write_meta(self):
+        """Grava os metadados do armazenamento (substituição atômica)."""
+        conteudo = json.dumps(self._read_meta(), ensure_ascii=False, indent=2)
+        write_atomic(self._sidecar("meta.json"), conteudo.encode('utf-8'))
+    
+    @property
+    def replica_id(self) -> str:
+        """Identificador estável deste armazenamento (criado no primeiro uso)."""
+        with self._construcao:
+            meta = self._read_meta()
+            if "replica" not in meta:
+                # Outra instância pode ter criado o id depois da nossa leitura
+                self._meta = None
+                meta = self._read_meta()
+            if "replica" not in meta:
+                meta["replica"] = uuid.uuid4().hex[:12]
+                self._write_meta()
+            return meta["replica"]
+    
+    @_leitura
+    def sync_point(self, replica: str) -> Optional[Dict[str, int]]:
+        """Retorna o último ponto de sincronização com outra réplica.
+        
+        Args:
+            replica: Identificador da outra réplica
+            
+        Returns:
+            Dicionário com as revisões ``local`` e ``remoto`` ou None
+        """
+        return self._read_meta().get("sync", {}).get(replica)
+    
+    @_escrita
+    def set_sync_point(self, replica: str, local: int, remoto: int):
+        """Registra o ponto de sincronização com outra réplica.
+        
+        Args:
+            replica: Identificador da outra réplica
+            local: Revisão deste armazenamento após a sincronização
+            remoto: Revisão da outra réplica após a sincronização
+        """
+        self._read_meta().setdefault("sync", {})[replica] = {"local": local, "remoto": remoto}
+        self._write_meta()
+    
+    @property
+    def agenda(self) -> DeadlineAgenda:
+        """Agenda de prazos, construída sob demanda a partir das tarefas."""
+        with self._construcao:
+            if self._agenda is None:
+                self._agenda = DeadlineAgenda(self.tasks)
+            return self._agenda
+    
+    @property
+    def dependencies(self) -> DependencyGraph:
+        """Grafo de dependências, construído sob demanda a partir das tarefas."""
+        with self._construcao:
+            if self._dependencias is None:
+                self._dependencias = DependencyGraph(self.tasks)
+            return self._dependencias
+    
+    @property
+    def tag_index(self) -> TagTrie:
+        """Trie das tags em uso, construído sob demanda a partir das tarefas."""
+        with self._construcao:
+            if self._trie_tags is None:
+                self._trie_tags = TagTrie(self.tasks)
+            return self._trie_tags
+    
+    @_medido("save")
+    @_escrita
     def save_tasks(self):
-        """Salva tarefas no arquivo JSON."""
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            data = [task.to_dict() for task in self.tasks]
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """Salva tarefas no arquivo de dados usando o codec configurado.
+        
+        A gravação é feita com a trava do arquivo de dados e recusada se outro
+        processo gravou desde a última carga: sobrescrever o arquivo
+        descartaria as mutações dele.
+        
+        Raises:
+            ValueError: Se o arquivo carregado estava danificado (ver ``fsck``)
+            StoreConflictError: Se o arquivo foi alterado por outro processo
+        """
+        self._exigir_integro()
+        with self._trava_arquivo:
+            if _assinatura(self.data_file) != self._assinatura:
+                raise StoreConflictError(
+                    "O armazenamento foi alterado por outro processo; "
+                    "recarregue as tarefas e repita a operação"
+                )
+            with self.profiler.phase("salvar", len(self.tasks)):
+                self._externalizar_descricoes()
+                registros = [task.to_record() for task in self.tasks]
+                conteudo = self.codec.dumps(registros)
+                write_atomic(self.data_file, conteudo)
+                stat = self.data_file.stat()
+                self._assinatura = _assinatura(self.data_file, stat)
+                self._descricoes.discard_obsolete()
+            if self._cache:
+                # A próxima carga (ex.: o próximo comando da CLI) já encontra o cache atualizado
+                with self.profiler.phase("salvar.cache", len(registros)):
+                    self._cache.write(content_key(conteudo, stat), registros)
+            if self._read_meta().get("proximo_id") != self._proximo_id:
+                # Persistido à parte para que ids de tarefas removidas não sejam reutilizados
+                self._read_meta()["proximo_id"] = self._proximo_id
+                self._write_meta()
+            self._publicar_eventos()
+    
+    def _exigir_integro(self):
+        """Recusa alterar o disco enquanto o arquivo carregado estiver danificado.
+        
+        Raises:
+            ValueError: Se ``damage`` estiver definido
+        """
+        if self.damage is not None:
+            raise ValueError(
+                f"Armazenamento danificado ({self.damage.erro}); "
+                "execute 'taskcrafter fsck --repair' antes de gravar"
+            )
+    
+    def _externalizar_descricoes(self):
+        """Move descrições longas para o arquivo de descrições antes de gravar.
+        
+        Descrições já guardadas fora de linha e não alteradas continuam onde
+        estão, sem serem lidas. Quando mais da metade do arquivo é texto
+        morto, os textos vivos são regravados em uma nova geração.
+        """
+        novas = [t for t in self.tasks
+                 if t.descricao_ref is None and len(t.descricao) > LIMIAR_EXTERNO]
+        for task, ref in zip(novas, self._descricoes.append([t.descricao for t in novas])):
+            DESCRICAO.attach(task, ref)
+        
+        externas = [t for t in self.tasks if t.descricao_ref is not None]
+        vivos = sum(t.descricao_ref.tamanho for t in externas
+                    if t.descricao_ref.geracao == self._descricoes.geracao)
+        if self._descricoes.size() > max(TAMANHO_MINIMO_COMPACTACAO, 2 * vivos):
+            refs = self._descricoes.compact([t.descricao for t in externas])
+            for task, ref in zip(externas, refs):
+                DESCRICAO.attach(task, ref)
+    
+    def _persistir(self):
+        """Salva as tarefas, ou adia a gravação se houver um lote aberto."""
+        if self._lote:
+            self._lote_pendente = True
+        else:
+            self.save_tasks()
+    
+    @contextmanager
+    def batch(self) -> Iterator['TaskManager']:
+        """Agrupa várias mutações em uma única gravação.
+        
+        Dentro do bloco, as mutações só alteram a memória; o arquivo é salvo
+        uma vez ao sair do bloco mais externo (também em caso de erro, para
+        que o arquivo reflita as mutações já aplicadas).
+        
+        O bloco não trava o gerenciador: outras threads (como a gravação em
+        segundo plano do shell) continuam lendo e gravando entre as mutações.
+        As mutações em massa (``bulk_*``, ``archive``) travam a escrita do
+        início ao fim e são vistas pelas outras threads de uma vez.
+        
+        Yields:
+            O próprio gerenciador
+        """
+        with self._trava.write():
+            self._lote += 1
+        try:
+            yield self
+        finally:
+            with self._trava.write():
+                self._lote -= 1
+                if not self._lote and self._lote_pendente:
+                    self._lote_pendente = False
+                    self.save_tasks()
+    
+    @property
+    def changed_on_disk(self) -> bool:
+        """Indica se outro processo gravou o arquivo de dados desde a última carga ou gravação."""
+        return _assinatura(self.data_file) != self._assinatura
+    
+    @property
+    def pending_save(self) -> bool:
+        """Indica se há mutações adiadas por um lote aberto ainda não gravadas."""
+        return self._lote_pendente
+    
+    @_escrita
+    def flush(self) -> bool:
+        """Grava imediatamente as mutações adiadas por um lote aberto.
+        
+        Returns:
+            True se havia mutações pendentes e elas foram gravadas
+        """
+        if not self._lote_pendente:
+            return False
+        self.save_tasks()
+        self._lote_pendente = False
+        return True
     
+    def _registrar_mudanca(self, operacao: str, task: Task, antes: Optional[dict] = None,
+                           origem: Optional[Tuple[str, str]] = None):
+        """Atualiza os índices em memória e enfileira o evento da mutação.
+        
+        O evento é gravado no log e entregue aos assinantes quando as tarefas
+        são salvas, de modo que nunca descreve um estado não persistido.
+        
+        Args:
+            operacao: Tipo da mutação (add, update, done, delete)
+            task: Tarefa afetada
+            antes: Estado da tarefa antes da mutação
+            origem: (data, réplica) de uma mutação replicada; se omitido, a
+                mutação é local e a tarefa recebe a data atual e esta réplica
+        """
+        if origem is None:
+            origem = (datetime.now().isoformat(), self.replica_id)
+            if operacao != "delete":
+                task.modificado_em, task.replica = origem
+        self._atualizar_indices(operacao, task, antes)
+        self.revision += 1
+        depois = None if operacao == "delete" else task.to_snapshot()
+        self._eventos_pendentes.append(
+            ChangeEvent(self.revision, operacao, task.titulo, antes, depois, *origem)
+        )
+    
+    @_escrita
+    def apply_version(self, titulo: str, dados: Optional[dict], data: str, replica: str):
+        """Aplica uma versão de tarefa vinda de outra réplica.
+        
+        Os metadados de modificação da origem são preservados, de modo que a
+        mutação gerada aqui não parece mais recente que a original. A
+        gravação fica a cargo de quem chama (``save_tasks``).
+        
+        Args:
+            titulo: Título da tarefa
+            dados: Estado completo da tarefa ou None para uma remoção
+            data: Data da modificação na origem
+            replica: Réplica de origem
+        """
+        task = self.get_task_by_title(titulo)
+        if dados is None:
+            if task:
+                self._remove_task(task)
+                self._registrar_mudanca("delete", task, task.to_snapshot(), (data, replica))
+            return
+        
+        # Ids são locais a cada armazenamento: o da origem e os das dependências são descartados
+        nova = Task.from_dict({**dados, "id": None, "depende_de": []})
+        if task is None:
+            self._append_task(nova)
+            self._registrar_mudanca("add", nova, None, (data, replica))
+            return
+        antes = task.to_snapshot()
+        # Atualiza no lugar para preservar a identidade usada pelos índices
+        for campo, valor in nova.to_dict().items():
+            if campo not in ("id", "depende_de"):
+                setattr(task, campo, valor)
+        self._registrar_mudanca("update", task, antes, (data, replica))
+    
+    def _append_task(self, task: Task):
+        """Acrescenta a tarefa ao final da lista, atribuindo um id novo."""
+        task.id = self._proximo_id
+        self._proximo_id += 1
+        self._por_id[task.id] = len(self.tasks)
+        self.tasks.append(task)
+    
+    def _remove_task(self, task: Task):
+        """Remove a tarefa da lista, mantendo o índice id→posição."""
+        posicao = self._por_id.pop(task.id)
+        del self.tasks[posicao]
+        for seguinte in self.tasks[posicao:]:
+            self._por_id[seguinte.id] -= 1
+    
+    def _remove_tasks(self, tasks: List[Task]):
+        """Remove várias tarefas da lista em uma única passada."""
+        ids = {task.id for task in tasks}
+        self.tasks[:] = [task for task in self.tasks if task.id not in ids]
+        self._por_id = {task.id: posicao for posicao, task in enumerate(self.tasks)}
+    
+    def _atualizar_indices(self, operacao: str, task: Task, antes: Optional[dict] = None):
+        """Mantém os índices em memória após uma mutação.
+        
+        Args:
+            operacao: Tipo da mutação
+            task: Tarefa afetada
+            antes: Estado da tarefa antes da mutação
+        """
+        titulo_antigo = antes["titulo"].lower() if antes else None
+        if operacao == "delete":
+            if self._por_titulo.get(titulo_antigo) is task:
+                del self._por_titulo[titulo_antigo]
+        elif titulo_antigo != task.titulo.lower():
+            # Inclusão ou renomeação: só o índice de títulos muda
+            if titulo_antigo and self._por_titulo.get(titulo_antigo) is task:
+                del self._por_titulo[titulo_antigo]
+            self._por_titulo[task.titulo.lower()] = task
+        
+        self._saved_views.on_change(operacao, task)
+        if operacao == "delete":
+            self._visoes.discard(task)
+            self._agregacoes.discard(task)
+        else:
+            if antes is None:
+                self._visoes.add(task)
+            else:
+                self._visoes.update(task)
+            self._agregacoes.update(task)
+        
+        if self._fluxo is not None:
+            self._fluxo.apply(antes, None if operacao == "delete" else task)
+        if self._esbocos is not None:
+            self._esbocos.apply(antes, None if operacao == "delete" else task)
+        
+        if self._dependencias is not None:
+            self._dependencias.apply(task.id, None if operacao == "delete" else task)
+        if self._trie_tags is not None:
+            self._trie_tags.apply(task.id, None if operacao == "delete" else task)
+        
+        if self._agenda is not None:
+            if operacao == "delete":
+                self._agenda.discard(task)
+            elif operacao != "done":
+                # Conclusões são descartadas preguiçosamente pela agenda
+                self._agenda.push(task)
+    
+    def _publicar_eventos(self):
+        """Grava os eventos pendentes no log e notifica os assinantes."""
+        if not self._eventos_pendentes:
+            return
+        eventos, self._eventos_pendentes = self._eventos_pendentes, []
+        self._changelog.append(eventos)
+        for evento in eventos:
+            for callback in list(self._assinantes):
+                try:
+                    callback(evento)
+                except Exception as e:
+                    # Um assinante com defeito não pode desfazer uma mutação já salva
+                    warnings.warn(f"Assinante de mudanças falhou: {e}", RuntimeWarning)
+    
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> Callable[[], None]:
+        """Registra um observador dos eventos de mutação.
+        
+        Args:
+            callback: Função chamada com cada ``ChangeEvent`` após a gravação
+            
+        Returns:
+            Função que cancela a assinatura
+        """
+        self._assinantes.append(callback)
+        
+        def cancelar():
+            if callback in self._assinantes:
+                self._assinantes.remove(callback)
+        return cancelar
+    
+    @_leitura
+    def changes(self, since: int = 0) -> List[ChangeEvent]:
+        """Retorna as mutações ocorridas após a revisão ``since``.
+        
+        O custo é proporcional ao número de eventos retornados.
+        
+        Args:
+            since: Última revisão conhecida pelo consumidor
+            
+        Returns:
+            Eventos em ordem crescente de revisão
+        """
+        eventos = self._changelog.since(since)
+        eventos.extend(e for e in self._eventos_pendentes if e.revisao > since)
+        return eventos
+    
+    @_medido("add")
+    @_escrita
+    @_mutacao
     def add_task(self, titulo: str, descricao: str = "", prioridade: str = "media",
-                 tags: Optional[List[str]] = None, data_vencimento: Optional[str] = None) -> Task:
+                 tags: Optional[List[str]] = None, data_vencimento: Optional[str] = None,
+                 depende_de: Optional[List] = None) -> Task:
         """Adiciona uma nova tarefa.
         
         Args:
@@ -64,32 +737,37 @@ class TaskManager:
             prioridade: Prioridade (baixa, media, alta)
             tags: Lista de tags
             data_vencimento: Data de vencimento (YYYY-MM-DD)
+            depende_de: Tarefas (ids ou títulos) que precisam ser concluídas antes
             
         Returns:
             Tarefa criada
             
         Raises:
-            ValueError: Se o título já existe ou dados inválidos
+            ValueError: Se o título já existe, uma dependência não existe ou dados inválidos
         """
         # Verifica se título já existe
         if self.get_task_by_title(titulo):
             raise ValueError(f"Já existe uma tarefa com o título '{titulo}'")
         
-        # Cria a tarefa (validações ocorrem no __post_init__)
+        # Cria a tarefa (validações ocorrem no __post_init__); uma tarefa
+        # nova não tem dependentes, então não pode fechar um ciclo
         task = Task(
             titulo=titulo,
             descricao=descricao,
             prioridade=prioridade,
             tags=tags or [],
+            depende_de=self._resolver_dependencias(depende_de or []),
             data_vencimento=data_vencimento
         )
         
-        self.tasks.append(task)
-        self.save_tasks()
+        self._append_task(task)
+        self._registrar_mudanca("add", task)
+        self._persistir()
         return task
     
+    @_leitura
     def get_task_by_title(self, titulo: str) -> Optional[Task]:
-        """Busca uma tarefa pelo título.
+        """Busca uma tarefa pelo título (sem diferenciar maiúsculas).
         
         Args:
             titulo: Título da tarefa
@@ -97,11 +775,76 @@ class TaskManager:
         Returns:
             Tarefa encontrada ou None
         """
-        for task in self.tasks:
-            if task.titulo.lower() == titulo.lower():
+        return self._por_titulo.get(titulo.strip().lower())
+    
+    @_leitura
+    def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        """Busca uma tarefa pelo id em O(1).
+        
+        Args:
+            task_id: Id da tarefa
+            
+        Returns:
+            Tarefa encontrada ou None
+        """
+        posicao = self._por_id.get(task_id)
+        return None if posicao is None else self.tasks[posicao]
+    
+    @_leitura
+    def get_task(self, ref) -> Optional[Task]:
+        """Busca uma tarefa pelo id ou pelo título.
+        
+        ``#12`` sempre se refere ao id 12; um número sem ``#`` é tratado como
+        id quando existe uma tarefa com esse id e, caso contrário, como título.
+        
+        Args:
+            ref: Id (int, ``"12"`` ou ``"#12"``) ou título da tarefa
+            
+        Returns:
+            Tarefa encontrada ou None
+        """
+        if isinstance(ref, int):
+            return self.get_task_by_id(ref)
+        texto = str(ref).strip()
+        if texto.startswith("#") and texto[1:].isdigit():
+            return self.get_task_by_id(int(texto[1:]))
+        if texto.isdigit():
+            task = self.get_task_by_id(int(texto))
+            if task is not None:
                 return task
-        return None
+        return self.get_task_by_title(texto)
     
+    def _require_task(self, ref) -> Task:
+        """Busca uma tarefa pelo id ou título, falhando se não existir."""
+        task = self.get_task(ref)
+        if not task:
+            raise ValueError(f"Tarefa '{ref}' não encontrada")
+        return task
+    
+    def _resolver_dependencias(self, refs: List, task: Optional[Task] = None) -> List[int]:
+        """Converte referências de dependências em ids, recusando ciclos.
+        
+        Args:
+            refs: Ids ou títulos das dependências
+            task: Tarefa que recebe as dependências (None para uma tarefa nova)
+            
+        Returns:
+            Ids das dependências, sem repetição
+            
+        Raises:
+            ValueError: Se uma dependência não existir ou criar um ciclo
+        """
+        if not isinstance(refs, list):
+            raise ValueError("Dependências devem ser uma lista de tarefas")
+        ids = list(dict.fromkeys(self._require_task(ref).id for ref in refs))
+        if task is not None and task.id in ids:
+            raise ValueError(f"A tarefa '{task.titulo}' não pode depender de si mesma")
+        if task is not None and self.dependencies.creates_cycle(task.id, ids):
+            raise ValueError(f"Dependência circular: '{task.titulo}' já é pré-requisito de uma das dependências")
+        return ids
+    
+    @_medido("list")
+    @_leitura
     def list_tasks(self, status: Optional[str] = None, prioridade: Optional[str] = None,
                    tag: Optional[str] = None, vencimento: Optional[str] = None,
                    ordenar_por: str = "data_criacao") -> List[Task]:
@@ -110,78 +853,133 @@ class TaskManager:
         Args:
             status: Filtrar por status (pendente, andamento, concluida)
             prioridade: Filtrar por prioridade (baixa, media, alta)
-            tag: Filtrar por tag
+            tag: Filtrar por tag (exata, ``tag/*`` para a subárvore ou ``prefixo*``)
             vencimento: Filtrar por data de vencimento (YYYY-MM-DD)
             ordenar_por: Campo para ordenação (data_criacao, prioridade, titulo, data_vencimento)
             
         Returns:
             Lista de tarefas filtradas e ordenadas
         """
-        filtered_tasks = self.tasks.copy()
-        
-        # Aplicar filtros
-        if status:
-            filtered_tasks = [t for t in filtered_tasks if t.status == status]
+        criterio = ordenar_por if ordenar_por in CHAVES else "data_criacao"
+        with self.profiler.phase("listar.ordenacao") as fase:
+            # A visão só é ordenada na primeira listagem com o critério
+            with self._construcao:
+                visao, construida = self._visoes.get(criterio, self.tasks)
+            fase.registros = len(visao) if construida else 0
         
-        if prioridade:
-            filtered_tasks = [t for t in filtered_tasks if t.prioridade == prioridade]
+        with self.profiler.phase("listar.filtro", len(visao)):
+            if tag:
+                filtered_tasks = self._filtrar_tag(tag, visao, criterio)
+            else:
+                filtered_tasks = visao.tasks()
+            
+            # Aplicar filtros (a ordem da visão é preservada)
+            if status:
+                filtered_tasks = [t for t in filtered_tasks if t.status == status]
+            
+            if prioridade:
+                filtered_tasks = [t for t in filtered_tasks if t.prioridade == prioridade]
+            
+            if vencimento:
+                filtered_tasks = [t for t in filtered_tasks if t.data_vencimento == vencimento]
         
-        if tag:
-            filtered_tasks = [t for t in filtered_tasks if tag in t.tags]
+        return filtered_tasks
+    
+    def _filtrar_tag(self, tag: str, visao, criterio: str) -> List[Task]:
+        """Tarefas com a tag (ou padrão de tags), na ordem da visão.
         
-        if vencimento:
-            filtered_tasks = [t for t in filtered_tasks if t.data_vencimento == vencimento]
+        As tarefas são obtidas pelo trie de tags; quando são poucas em
+        relação ao total, só elas são ordenadas, sem percorrer a visão.
+        """
+        ids = self.tag_index.match(tag)
+        if len(ids) * 4 >= len(visao):
+            return [task for task in visao.tasks() if task.id in ids]
+        chave = CHAVES[criterio]
+        # O desempate pela posição reproduz a ordem estável da visão
+        return sorted((self.tasks[self._por_id[task_id]] for task_id in ids),
+                      key=lambda task: (chave(task), self._por_id[task.id]))
+    
+    @_leitura
+    def tags(self, padrao: str = "*") -> List[Tuple[str, int]]:
+        """Retorna as tags em uso com a quantidade de tarefas de cada uma.
         
-        # Ordenar
-        if ordenar_por == "prioridade":
-            # Ordem: alta > media > baixa
-            prioridade_ordem = {"alta": 0, "media": 1, "baixa": 2}
-            filtered_tasks.sort(key=lambda t: prioridade_ordem.get(t.prioridade, 3))
-        elif ordenar_por == "titulo":
-            filtered_tasks.sort(key=lambda t: t.titulo.lower())
-        elif ordenar_por == "data_vencimento":
-            # Tarefas sem vencimento vão para o final
-            filtered_tasks.sort(key=lambda t: (t.data_vencimento is None, t.data_vencimento))
-        else:  # data_criacao (padrão)
-            filtered_tasks.sort(key=lambda t: t.data_criacao)
+        A contagem vem do trie de tags, sem percorrer as tarefas.
         
-        return filtered_tasks
+        Args:
+            padrao: Tag exata, ``tag/*`` (subárvore) ou ``prefixo*`` (padrão: todas)
+            
+        Returns:
+            Pares (tag, tarefas), em ordem alfabética por segmento
+        """
+        trie = self.tag_index
+        with self._construcao:
+            return trie.counts(padrao)
+    
+    @_leitura
+    def complete_tags(self, texto: str) -> List[str]:
+        """Retorna as tags em uso que começam com o texto (autocompletar)."""
+        trie = self.tag_index
+        with self._construcao:
+            return trie.complete(texto)
     
-    def update_task(self, titulo: str, **kwargs) -> Task:
+    @_medido("update")
+    @_escrita
+    @_mutacao
+    def update_task(self, ref, **kwargs) -> Task:
         """Atualiza uma tarefa existente.
         
         Args:
-            titulo: Título da tarefa a atualizar
-            **kwargs: Campos a atualizar (descricao, prioridade, status, tags, data_vencimento)
+            ref: Id ou título da tarefa a atualizar
+            **kwargs: Campos a atualizar (titulo, descricao, prioridade, status, tags,
+                data_vencimento, depende_de)
             
         Returns:
             Tarefa atualizada
             
         Raises:
-            ValueError: Se a tarefa não existe ou dados inválidos
+            ValueError: Se a tarefa não existe, o novo título já existe, as
+                dependências criam um ciclo ou dados inválidos
         """
-        task = self.get_task_by_title(titulo)
-        if not task:
-            raise ValueError(f"Tarefa '{titulo}' não encontrada")
+        task = self._require_task(ref)
+        
+        novo_titulo = kwargs.get('titulo')
+        if novo_titulo is not None:
+            existente = self.get_task_by_title(novo_titulo)
+            if existente is not None and existente is not task:
+                raise ValueError(f"Já existe uma tarefa com o título '{novo_titulo}'")
+        if kwargs.get('depende_de') is not None:
+            kwargs['depende_de'] = self._resolver_dependencias(kwargs['depende_de'], task)
         
         # Atualizar campos permitidos
-        allowed_fields = ['descricao', 'prioridade', 'status', 'tags', 'data_vencimento']
+        allowed_fields = ['titulo', 'descricao', 'prioridade', 'status', 'tags', 'data_vencimento', 'depende_de']
+        antes = task.to_snapshot()
+        # A descrição fica fora do snapshot: guardada à parte, sem ler uma descrição externa
+        descricao_antes = task.descricao_ref or task.descricao
         
         for field, value in kwargs.items():
             if field in allowed_fields and value is not None:
                 setattr(task, field, value)
         
-        # Revalidar a tarefa
-        task.__post_init__()
+        # Revalidar a tarefa (desfazendo as alterações se forem inválidas)
+        try:
+            task.__post_init__()
+        except ValueError:
+            for field in allowed_fields:
+                setattr(task, field, descricao_antes if field == 'descricao' else antes[field])
+            raise
         
-        self.save_tasks()
+        self._registrar_mudanca("update", task, antes)
+        self._persistir()
         return task
     
-    def mark_as_done(self, titulo: str) -> Task:
+    @_medido("done")
+    @_escrita
+    @_mutacao
+    def mark_as_done(self, ref) -> Task:
         """Marca uma tarefa como concluída.
         
         Args:
-            titulo: Título da tarefa
+            ref: Id ou título da tarefa
             
         Returns:
             Tarefa atualizada
@@ -189,59 +987,607 @@ class TaskManager:
         Raises:
             ValueError: Se a tarefa não existe
         """
-        task = self.get_task_by_title(titulo)
-        if not task:
-            raise ValueError(f"Tarefa '{titulo}' não encontrada")
+        task = self._require_task(ref)
         
+        antes = task.to_snapshot()
         task.status = "concluida"
         task.data_conclusao = datetime.now().isoformat()
         
-        self.save_tasks()
+        self._registrar_mudanca("done", task, antes)
+        self._persistir()
         return task
     
-    def delete_task(self, titulo: str) -> bool:
+    @_medido("delete")
+    @_escrita
+    @_mutacao
+    def delete_task(self, ref) -> bool:
         """Remove uma tarefa.
         
         Args:
-            titulo: Título da tarefa
+            ref: Id ou título da tarefa
             
         Returns:
             True se removida, False se não encontrada
         """
-        task = self.get_task_by_title(titulo)
+        task = self.get_task(ref)
         if not task:
             return False
         
-        self.tasks.remove(task)
-        self.save_tasks()
+        self._remove_task(task)
+        self._registrar_mudanca("delete", task, task.to_snapshot())
+        self._persistir()
         return True
     
+    @_escrita
+    def save_view(self, nome: str, filtros: Optional[Dict[str, str]] = None,
+                  ordenar_por: str = "data_criacao") -> SavedView:
+        """Cria ou substitui uma visão salva.
+        
+        Args:
+            nome: Nome da visão
+            filtros: Critérios (status, prioridade, tag, vencimento, vence_em)
+            ordenar_por: Critério de ordenação
+            
+        Returns:
+            Definição gravada
+            
+        Raises:
+            ValueError: Se a definição for inválida
+        """
+        view = SavedView(nome, dict(filtros or {}), ordenar_por)
+        self._saved_views.save(view)
+        return view
+    
+    @_escrita
+    def delete_view(self, nome: str) -> bool:
+        """Remove uma visão salva.
+        
+        Returns:
+            True se removida, False se não encontrada
+        """
+        return self._saved_views.delete(nome)
+    
+    @_leitura
+    def saved_views(self) -> List[SavedView]:
+        """Retorna as visões salvas, em ordem alfabética."""
+        return sorted(self._saved_views.definitions().values(), key=lambda v: v.nome)
+    
+    @_medido("view")
+    @_leitura
+    def run_view(self, nome: str, hoje: Optional[date] = None) -> List[Task]:
+        """Executa uma visão salva.
+        
+        O resultado é materializado na primeira execução e mantido a cada
+        mutação; as execuções seguintes custam O(resultado).
+        
+        Args:
+            nome: Nome da visão
+            hoje: Data de referência para ``vence_em`` (padrão: data atual)
+            
+        Returns:
+            Tarefas da visão, ordenadas como em ``list_tasks``
+            
+        Raises:
+            ValueError: Se a visão não existe
+        """
+        view = self._saved_views.definitions().get(nome)
+        if view is None:
+            raise ValueError(f"Visão '{nome}' não encontrada")
+        with self._construcao:
+            ids = self._saved_views.result_ids(nome, self.tasks, hoje or date.today())
+        posicoes = sorted(self._por_id[task_id] for task_id in ids)
+        tasks = [self.tasks[posicao] for posicao in posicoes]
+        tasks.sort(key=CHAVES[view.ordenar_por])
+        return tasks
+    
+    @_medido("search")
+    @_leitura
+    def search(self, texto: str, campos: Tuple[str, ...] = ("titulo", "descricao")) -> List[Task]:
+        """Busca tarefas cujo título ou descrição contém o texto.
+        
+        A descrição só é lida (do arquivo de descrições, se estiver fora de
+        linha) para as tarefas cujo título não corresponde.
+        
+        Args:
+            texto: Texto a procurar (sem diferenciar maiúsculas)
+            campos: Campos pesquisados (titulo e/ou descricao)
+            
+        Returns:
+            Tarefas encontradas, em ordem de criação
+            
+        Raises:
+            ValueError: Se o texto for vazio ou algum campo não for suportado
+        """
+        if not texto or not texto.strip():
+            raise ValueError("Texto da busca não pode ser vazio")
+        invalidos = set(campos) - {"titulo", "descricao"}
+        if invalidos:
+            raise ValueError(f"Campo de busca inválido: {', '.join(sorted(invalidos))}. Use: titulo, descricao")
+        texto = texto.strip().lower()
+        no_titulo, na_descricao = "titulo" in campos, "descricao" in campos
+        return [
+            task for task in self.tasks
+            if (no_titulo and texto in task.titulo.lower())
+            or (na_descricao and texto in task.descricao.lower())
+        ]
+    
+    @_leitura
+    def get_agenda(self, limite: int = 10,
+                   hoje: Optional[date] = None) -> Tuple[List[Task], List[Task]]:
+        """Retorna as tarefas atrasadas e os próximos prazos.
+        
+        Tarefas concluídas ou sem vencimento não aparecem. A ordem é por data
+        de vencimento e, em seguida, por prioridade (alta > media > baixa).
+        
+        Args:
+            limite: Quantidade máxima de próximos prazos
+            hoje: Data de referência (padrão: data atual)
+            
+        Returns:
+            Tupla (atrasadas, próximas)
+        """
+        agenda = self.agenda
+        with self._construcao:
+            # A agenda descarta conclusões preguiçosamente ao ser consultada
+            return agenda.overdue(hoje), agenda.upcoming(limite, hoje)
+    
+    @_medido("ready")
+    @_leitura
+    def ready_tasks(self, ordenar_por: str = "prioridade") -> List[Task]:
+        """Retorna as tarefas prontas: abertas e sem dependências pendentes.
+        
+        O conjunto de prontas é mantido a cada mutação pelo grafo de
+        dependências; a consulta custa O(prontas), mais a ordenação.
+        
+        Args:
+            ordenar_por: Critério de ordenação (ver ``list_tasks``)
+            
+        Returns:
+            Tarefas prontas, ordenadas
+        """
+        criterio = ordenar_por if ordenar_por in CHAVES else "prioridade"
+        grafo = self.dependencies
+        with self._construcao:
+            ids = grafo.ready()
+        tasks = [self.tasks[self._por_id[task_id]] for task_id in ids]
+        tasks.sort(key=lambda task: (CHAVES[criterio](task), task.id))
+        return tasks
+    
+    @_leitura
+    def select(self, where: Optional[Dict[str, str]] = None,
+               older_than: Optional[timedelta] = None) -> List[Task]:
+        """Seleciona as tarefas que atendem a todos os critérios.
+        
+        Args:
+            where: Filtros aceitos por ``list_tasks`` (status, prioridade, tag, vencimento)
+            older_than: Idade mínima, medida pela data de conclusão (ou de
+                criação, para tarefas não concluídas)
+            
+        Returns:
+            Tarefas selecionadas, em ordem de criação
+            
+        Raises:
+            ValueError: Se algum filtro não for suportado
+        """
+        where = dict(where or {})
+        invalidos = set(where) - {"status", "prioridade", "tag", "vencimento"}
+        if invalidos:
+            raise ValueError(
+                f"Filtro inválido: {', '.join(sorted(invalidos))}. "
+                "Use: status, prioridade, tag, vencimento"
+            )
+        tasks = self.list_tasks(**where)
+        if older_than is not None:
+            limite = (datetime.now() - older_than).isoformat()
+            tasks = [t for t in tasks if (t.data_conclusao or t.data_criacao) < limite]
+        return tasks
+    
+    @_escrita
+    @_mutacao
+    def bulk_update(self, where: Optional[Dict[str, str]] = None, changes: Optional[Dict[str, Any]] = None,
+                    older_than: Optional[timedelta] = None, dry_run: bool = False) -> List[Task]:
+        """Atualiza todas as tarefas selecionadas, gravando uma única vez.
+        
+        Args:
+            where: Filtros da seleção (ver ``select``)
+            changes: Campos a atualizar (ver ``update_task``; renomear não é permitido)
+            older_than: Idade mínima das tarefas
+            dry_run: Apenas retorna a seleção, sem alterar nada
+            
+        Returns:
+            Tarefas selecionadas
+        """
+        changes = dict(changes or {})
+        if 'titulo' in changes:
+            raise ValueError("Não é possível renomear várias tarefas de uma vez")
+        tasks = self.select(where, older_than)
+        if not dry_run:
+            with self.batch():
+                for task in tasks:
+                    self.update_task(task.id, **changes)
+        return tasks
+    
+    @_escrita
+    @_mutacao
+    def bulk_done(self, where: Optional[Dict[str, str]] = None,
+                  older_than: Optional[timedelta] = None, dry_run: bool = False) -> List[Task]:
+        """Conclui todas as tarefas selecionadas, gravando uma única vez.
+        
+        Args:
+            where: Filtros da seleção (ver ``select``)
+            older_than: Idade mínima das tarefas
+            dry_run: Apenas retorna a seleção, sem alterar nada
+            
+        Returns:
+            Tarefas selecionadas
+        """
+        tasks = self.select(where, older_than)
+        if not dry_run:
+            with self.batch():
+                for task in tasks:
+                    self.mark_as_done(task.id)
+        return tasks
+    
+    @_escrita
+    @_mutacao
+    def bulk_delete(self, where: Optional[Dict[str, str]] = None,
+                    older_than: Optional[timedelta] = None, dry_run: bool = False) -> List[Task]:
+        """Remove todas as tarefas selecionadas, gravando uma única vez.
+        
+        Args:
+            where: Filtros da seleção (ver ``select``)
+            older_than: Idade mínima das tarefas
+            dry_run: Apenas retorna a seleção, sem alterar nada
+            
+        Returns:
+            Tarefas selecionadas
+        """
+        tasks = self.select(where, older_than)
+        if not dry_run and tasks:
+            with self.batch():
+                # Compacta a lista em uma passada em vez de uma remoção por tarefa
+                self._remove_tasks(tasks)
+                for task in tasks:
+                    self._registrar_mudanca("delete", task, task.to_snapshot())
+                self._persistir()
+        return tasks
+    
+    @_escrita
+    @_mutacao
+    def apply_operation(self, operacao: Dict[str, Any]) -> Dict[str, Any]:
+        """Aplica uma operação descrita como dicionário (ex.: uma linha NDJSON).
+        
+        Formatos aceitos::
+        
+            {"op": "add", "titulo": "Relatório", "prioridade": "alta", "tags": ["x"]}
+            {"op": "update", "tarefa": 12, "status": "andamento"}
+            {"op": "done", "tarefa": "#12"}
+            {"op": "delete", "tarefa": "Relatório"}
+        
+        ``vencimento`` é aceito como sinônimo de ``data_vencimento`` e ``id``
+        como sinônimo de ``tarefa``.
+        
+        Args:
+            operacao: Dicionário com a chave ``op`` e os campos da operação
+            
+        Returns:
+            Dicionário com a operação e a tarefa resultante (``to_dict``)
+            
+        Raises:
+            ValueError: Se a operação ou seus campos forem inválidos
+        """
+        if not isinstance(operacao, dict):
+            raise ValueError("A operação deve ser um objeto JSON")
+        dados = dict(operacao)
+        op = dados.pop("op", None)
+        if "vencimento" in dados:
+            dados["data_vencimento"] = dados.pop("vencimento")
+        ref = dados.pop("tarefa", dados.pop("id", None))
+        
+        permitidos = {
+            "add": {"titulo", "descricao", "prioridade", "tags", "data_vencimento", "depende_de"},
+            "update": {"titulo", "descricao", "prioridade", "status", "tags", "data_vencimento", "depende_de"},
+            "done": set(),
+            "delete": set(),
+        }
+        if op not in permitidos:
+            raise ValueError(f"Operação inválida: {op!r}. Use: add, update, done, delete")
+        invalidos = set(dados) - permitidos[op]
+        if invalidos:
+            raise ValueError(f"Campo(s) inválido(s) para {op}: {', '.join(sorted(invalidos))}")
+        if op == "add":
+            if "titulo" not in dados:
+                raise ValueError("A operação add exige o campo 'titulo'")
+            return {"op": op, "tarefa": self.add_task(**dados).to_dict()}
+        
+        if ref is None:
+            raise ValueError(f"A operação {op} exige o campo 'tarefa'")
+        if op == "update":
+            task = self.update_task(ref, **dados)
+        elif op == "done":
+            task = self.mark_as_done(ref)
+        else:
+            task = self._require_task(ref)
+            self.delete_task(task.id)
+        return {"op": op, "tarefa": task.to_dict()}
+    
+    @_medido("stats")
+    @_leitura
     def get_statistics(self) -> Dict[str, Any]:
         """Retorna estatísticas sobre as tarefas.
         
+        As contagens vêm da agregação por status e prioridade, calculada em
+        uma passada e mantida em cache entre as mutações.
+        
         Returns:
             Dicionário com estatísticas
         """
-        total = len(self.tasks)
-        if total == 0:
-            return {
-                "total": 0,
-                "pendentes": 0,
-                "em_andamento": 0,
-                "concluidas": 0,
-                "por_prioridade": {"baixa": 0, "media": 0, "alta": 0}
-            }
-        
-        stats = {
-            "total": total,
-            "pendentes": len([t for t in self.tasks if t.status == "pendente"]),
-            "em_andamento": len([t for t in self.tasks if t.status == "andamento"]),
-            "concluidas": len([t for t in self.tasks if t.status == "concluida"]),
-            "por_prioridade": {
-                "baixa": len([t for t in self.tasks if t.prioridade == "baixa"]),
-                "media": len([t for t in self.tasks if t.prioridade == "media"]),
-                "alta": len([t for t in self.tasks if t.prioridade == "alta"])
-            }
+        with self.profiler.phase("estatisticas", len(self.tasks)):
+            with self._construcao:
+                grupo, _ = self._agregacoes.get(("status", "prioridade"), None, self.tasks)
+            por_status = {"pendente": 0, "andamento": 0, "concluida": 0}
+            por_prioridade = {"baixa": 0, "media": 0, "alta": 0}
+            for (status, prioridade), total in grupo.contagens.items():
+                por_status[status] = por_status.get(status, 0) + total
+                por_prioridade[prioridade] = por_prioridade.get(prioridade, 0) + total
+        
+        return {
+            "total": len(self.tasks),
+            "pendentes": por_status["pendente"],
+            "em_andamento": por_status["andamento"],
+            "concluidas": por_status["concluida"],
+            "por_prioridade": por_prioridade,
         }
+    
+    @_medido("aggregate")
+    @_leitura
+    def aggregate(self, by: List[str], status: Optional[str] = None,
+                  prioridade: Optional[str] = None, tag: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Conta as tarefas agrupadas por uma combinação de dimensões.
+        
+        O resultado fica em cache e é atualizado a cada mutação; repetir a
+        mesma agregação não percorre as tarefas.
+        
+        Args:
+            by: Dimensões (``aggregation.DIMENSOES``), ex.: ``["tag", "status"]``
+            status: Filtrar por status
+            prioridade: Filtrar por prioridade
+            tag: Filtrar por tag
+            
+        Returns:
+            Grupos ordenados, cada um com o valor de cada dimensão e o ``total``
+            
+        Raises:
+            ValueError: Se uma dimensão for desconhecida
+        """
+        filtros = {"status": status, "prioridade": prioridade, "tag": tag}
+        with self.profiler.phase("agregacao") as fase:
+            with self._construcao:
+                grupo, calculada = self._agregacoes.get(by, filtros, self.tasks)
+            fase.registros = len(self.tasks) if calculada else len(grupo.contagens)
+            return grupo.rows()
+    
+    def _carregar_resumo(self, sufixo: str, chave: str, fase: str, classe):
+        """Carrega um resumo incremental das tarefas (métricas de fluxo, esboços).
+        
+        O resumo gravado em ``<dados>.<sufixo>`` é atualizado com os eventos
+        do log posteriores à revisão em que foi gravado; só há recálculo (uma
+        passada pelas tarefas) se o arquivo faltar ou o log não cobrir a
+        diferença.
+        
+        Args:
+            sufixo: Sufixo do arquivo auxiliar
+            chave: Chave do resumo no arquivo
+            fase: Nome da fase no profiler
+            classe: Classe do resumo (``from_dict``, ``from_tasks``, ``apply``)
+        """
+        with self.profiler.phase(fase) as medicao:
+            try:
+                with open(self._sidecar(sufixo), 'r', encoding='utf-8') as f:
+                    dados = json.load(f)
+                revisao, resumo = int(dados["revisao"]), classe.from_dict(dados[chave])
+            except (OSError, ValueError, TypeError, KeyError):
+                revisao, resumo = None, None
+            if resumo is not None and revisao > self.revision:
+                resumo = None  # gravado por um estado que o log não conhece
+            eventos = []
+            if resumo is not None and revisao < self.revision:
+                eventos = self._changelog.since(revisao)
+                eventos += [e for e in self._eventos_pendentes if e.revisao > revisao]
+            if resumo is not None and [e.revisao for e in eventos] == list(range(revisao + 1, self.revision + 1)):
+                for evento in eventos:
+                    resumo.apply(evento.antes, evento.depois)
+                medicao.registros = len(eventos)
+            else:
+                # Sem resumo gravado ou sem o log que o atualiza: recalcula
+                resumo = classe.from_tasks(self.tasks)
+                medicao.registros = len(self.tasks)
+        if not self._eventos_pendentes and revisao != self.revision:
+            conteudo = json.dumps({"revisao": self.revision, chave: resumo.to_dict()}, ensure_ascii=False)
+            write_atomic(self._sidecar(sufixo), conteudo.encode('utf-8'))
+        return resumo
+    
+    def _flow(self) -> FlowStats:
+        """Métricas de fluxo das tarefas atuais, carregadas uma vez por instância.
         
-        return stats
+        Gravadas em ``<dados>.flow.json`` (ver ``_carregar_resumo``).
+        """
+        with self._construcao:
+            if self._fluxo is None:
+                self._fluxo = self._carregar_resumo("flow.json", "fluxo", "fluxo.carga", FlowStats)
+            return self._fluxo
+    
+    def _sketches(self) -> StoreSketches:
+        """Esboços das tarefas atuais, carregados uma vez por instância.
+        
+        Gravados em ``<dados>.sketches.json`` (ver ``_carregar_resumo``).
+        """
+        with self._construcao:
+            if self._esbocos is None:
+                self._esbocos = self._carregar_resumo("sketches.json", "esbocos", "esbocos.carga", StoreSketches)
+            return self._esbocos
+    
+    @_medido("stats_approx")
+    @_leitura
+    def approx_statistics(self, top: int = 10) -> Dict[str, Any]:
+        """Estatísticas aproximadas, incluindo as tarefas arquivadas.
+        
+        Somam os esboços das tarefas atuais aos gravados no cabeçalho de cada
+        segmento, sem ler as tarefas arquivadas. Segmentos gravados antes dos
+        esboços existirem são lidos uma vez por consulta.
+        
+        Args:
+            top: Quantidade de tags mais frequentes
+            
+        Returns:
+            Dicionário de ``StoreSketches.report`` com ``segmentos``
+        """
+        total = StoreSketches()
+        total.merge(self._sketches())
+        arquivos = segments(self.data_file)
+        with self.profiler.phase("esbocos.segmentos", len(arquivos)):
+            for caminho in arquivos:
+                cabecalho = read_header(caminho)
+                if "esbocos" in cabecalho:
+                    total.merge(StoreSketches.from_dict(cabecalho["esbocos"]))
+                else:
+                    total.merge(StoreSketches.from_tasks(read_records(caminho)))
+        return {**total.report(top), "segmentos": len(arquivos)}
+    
+    @_medido("report")
+    @_leitura
+    def flow_report(self, por: str = "dia", ultimos: Optional[int] = None) -> Dict[str, Any]:
+        """Relatório de vazão e lead time das tarefas concluídas.
+        
+        Inclui as tarefas arquivadas, por meio das métricas já agregadas no
+        cabeçalho de cada segmento.
+        
+        Args:
+            por: Período da vazão: ``dia`` ou ``semana``
+            ultimos: Quantidade de períodos mais recentes (padrão: todos)
+            
+        Returns:
+            Dicionário com ``throughput`` (período e conclusões), ``lead_time``
+            (por grupo: quantidade e quantis em horas) e ``segmentos``
+            
+        Raises:
+            ValueError: Se o período for inválido
+        """
+        if por not in ("dia", "semana"):
+            raise ValueError("Período inválido. Use: dia, semana")
+        total = FlowStats()
+        total.merge(self._flow())
+        arquivos = segments(self.data_file)
+        with self.profiler.phase("fluxo.segmentos", len(arquivos)):
+            for caminho in arquivos:
+                total.merge(FlowStats.from_dict(read_header(caminho)["fluxo"]))
+        
+        vazao = total.throughput(por)
+        if ultimos is not None:
+            vazao = vazao[-ultimos:] if ultimos > 0 else []
+        grupos = sorted(total.lead_time, key=lambda g: (g != "total", not g.startswith("prioridade:"), g))
+        return {
+            "throughput": [{"periodo": periodo, "concluidas": n} for periodo, n in vazao],
+            "lead_time": [
+                {"grupo": grupo, "n": total.lead_time[grupo].count,
+                 **{f"p{round(q * 100)}": total.lead_time[grupo].quantile(q) for q in QUANTIS}}
+                for grupo in grupos
+            ],
+            "segmentos": len(arquivos),
+        }
+    
+    @_medido("archive")
+    @_escrita
+    @_mutacao
+    def archive(self, older_than: timedelta, dry_run: bool = False) -> Tuple[List[Task], Optional[Path]]:
+        """Move tarefas concluídas antigas para um novo segmento de arquivo.
+        
+        As tarefas saem do armazenamento (e dos índices), mas continuam nos
+        relatórios de fluxo por meio das métricas do segmento.
+        
+        O armazenamento é gravado na hora, mesmo dentro de um lote: o segmento
+        só vale junto com a remoção das tarefas. Se a gravação falhar, o
+        segmento é apagado e as tarefas são recarregadas do arquivo (mutações
+        ainda não gravadas de um lote aberto são descartadas), para que
+        nenhuma tarefa seja contada no armazenamento e no segmento.
+        
+        Args:
+            older_than: Idade mínima desde a conclusão
+            dry_run: Apenas retorna a seleção, sem alterar nada
+            
+        Returns:
+            Tupla (tarefas arquivadas, caminho do segmento ou None)
+        """
+        tasks = self.select({"status": "concluida"}, older_than)
+        if dry_run or not tasks:
+            return tasks, None
+        self._exigir_integro()
+        caminho = write_segment(self.data_file, [t.to_dict() for t in tasks], FlowStats.from_tasks(tasks),
+                                StoreSketches.from_tasks(tasks))
+        try:
+            self._remove_tasks(tasks)
+            for task in tasks:
+                self._registrar_mudanca("delete", task, task.to_snapshot())
+            self.save_tasks()
+        except BaseException:
+            caminho.unlink()
+            self.load_tasks()
+            raise
+        self._lote_pendente = False
+        return tasks, caminho
+    
+    def _index_sizes(self) -> Dict[str, int]:
+        """Retorna o número de entradas de cada índice em memória."""
+        tamanhos = {
+            "tarefas": len(self.tasks),
+            "ids": len(self._por_id),
+            "titulos": len(self._por_titulo),
+        }
+        with self._construcao:
+            for criterio, tamanho in self._visoes.construidas.items():
+                tamanhos[f"ordem.{criterio}"] = tamanho
+            for nome, tamanho in self._saved_views.tamanhos.items():
+                tamanhos[f"visao.{nome}"] = tamanho
+            for nome, tamanho in self._agregacoes.construidas.items():
+                tamanhos[f"agregacao.{nome}"] = tamanho
+            if self._agenda is not None:
+                tamanhos["agenda"] = self._agenda.tamanho
+            if self._dependencias is not None:
+                tamanhos["dependencias"] = self._dependencias.tamanho
+            if self._trie_tags is not None:
+                tamanhos["tags"] = self._trie_tags.tamanho
+        return tamanhos
+    
+    @_leitura
+    def metrics(self) -> Dict[str, Any]:
+        """Retorna as métricas de operação e os gauges do armazenamento.
+        
+        Returns:
+            Dicionário com ``operacoes`` (contagem, erros e histograma de
+            latência por operação), ``gauges`` e ``indices``
+        """
+        try:
+            tamanho_arquivo = self.data_file.stat().st_size
+        except OSError:
+            tamanho_arquivo = 0
+        return {
+            "operacoes": self.metrics_registry.snapshot(),
+            "gauges": {
+                "store_tasks": len(self.tasks),
+                "store_file_bytes": tamanho_arquivo,
+                "store_revision": self.revision,
+                "store_descriptions_bytes": self._descricoes.size(),
+            },
+            "indices": self._index_sizes(),
+        }
+    
+    def write_prometheus(self, caminho: str):
+        """Grava as métricas no formato texto do Prometheus.
+        
+        O arquivo é substituído atomicamente, podendo ser lido pelo textfile
+        collector do node-exporter a qualquer momento.
+        
+        Args:
+            caminho: Arquivo ``.prom`` de destino
+        """
+        write_textfile(caminho, render_prometheus(self.metrics()))
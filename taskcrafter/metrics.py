@@ -0,0 +1,195 @@
+"""Métricas de operação do TaskCrafter CLI.
+
+Este módulo mantém contadores e histogramas de latência por operação do
+``TaskManager`` e os exporta no formato texto do Prometheus, inclusive como
+arquivo para o textfile collector do node-exporter.
+"""
+
+import bisect
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+
+BUCKETS_PADRAO = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                  0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Histograma de latências com limites fixos (cumulativo na exportação).
+
+    Attributes:
+        limites: Limites superiores dos buckets, em segundos
+        contagens: Observações por bucket (o último é o +Inf)
+        total: Número de observações
+        soma: Soma das observações, em segundos
+    """
+
+    __slots__ = ("limites", "contagens", "total", "soma")
+
+    def __init__(self, limites=BUCKETS_PADRAO):
+        """Inicializa o histograma.
+
+        Args:
+            limites: Limites superiores crescentes dos buckets
+        """
+        self.limites = tuple(limites)
+        self.contagens = [0] * (len(self.limites) + 1)
+        self.total = 0
+        self.soma = 0.0
+
+    def observe(self, valor: float):
+        """Registra uma observação.
+
+        Args:
+            valor: Duração em segundos
+        """
+        self.contagens[bisect.bisect_left(self.limites, valor)] += 1
+        self.total += 1
+        self.soma += valor
+
+    def cumulative(self) -> List[int]:
+        """Retorna as contagens cumulativas por bucket (incluindo +Inf)."""
+        acumulado, resultado = 0, []
+        for contagem in self.contagens:
+            acumulado += contagem
+            resultado.append(acumulado)
+        return resultado
+
+
+class MetricsRegistry:
+    """Registro de contadores, erros e histogramas por operação."""
+
+    def __init__(self, limites=BUCKETS_PADRAO):
+        """Inicializa o registro.
+
+        Args:
+            limites: Limites dos histogramas de latência
+        """
+        self._limites = tuple(limites)
+        self._trava = threading.Lock()
+        self.histogramas: Dict[str, Histogram] = {}
+        self.erros: Dict[str, int] = {}
+
+    def observe(self, operacao: str, segundos: float):
+        """Registra a duração de uma operação.
+
+        Args:
+            operacao: Nome da operação (add, list, ...)
+            segundos: Duração medida
+        """
+        with self._trava:
+            histograma = self.histogramas.get(operacao)
+            if histograma is None:
+                histograma = self.histogramas[operacao] = Histogram(self._limites)
+            histograma.observe(segundos)
+
+    def error(self, operacao: str):
+        """Registra uma falha da operação.
+
+        Args:
+            operacao: Nome da operação
+        """
+        with self._trava:
+            self.erros[operacao] = self.erros.get(operacao, 0) + 1
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Retorna uma cópia serializável das métricas de operação."""
+        operacoes = {}
+        with self._trava:
+            for operacao, histograma in self.histogramas.items():
+                operacoes[operacao] = {
+                    "total": histograma.total,
+                    "erros": self.erros.get(operacao, 0),
+                    "soma_s": histograma.soma,
+                    "buckets": dict(zip([*map(str, histograma.limites), "+Inf"],
+                                        histograma.cumulative())),
+                }
+            for operacao, erros in self.erros.items():
+                operacoes.setdefault(operacao, {"total": 0, "erros": erros, "soma_s": 0.0, "buckets": {}})
+        return operacoes
+
+
+def _rotulos(**rotulos: str) -> str:
+    """Formata rótulos do Prometheus, escapando os valores."""
+    partes = []
+    for nome, valor in rotulos.items():
+        valor = str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        partes.append(f'{nome}="{valor}"')
+    return "{" + ",".join(partes) + "}"
+
+
+def render_prometheus(metricas: Dict[str, dict], prefixo: str = "taskcrafter") -> str:
+    """Converte o resultado de ``TaskManager.metrics()`` para o formato texto.
+
+    Args:
+        metricas: Dicionário com as chaves ``operacoes``, ``gauges`` e ``indices``
+        prefixo: Prefixo dos nomes de métricas
+
+    Returns:
+        Texto no formato de exposição do Prometheus (versão 0.0.4)
+    """
+    operacoes = metricas.get("operacoes", {})
+    linhas = [
+        f"# HELP {prefixo}_operations_total Operações executadas pelo TaskManager.",
+        f"# TYPE {prefixo}_operations_total counter",
+    ]
+    for operacao, dados in sorted(operacoes.items()):
+        linhas.append(f"{prefixo}_operations_total{_rotulos(op=operacao)} {dados['total']}")
+
+    linhas += [
+        f"# HELP {prefixo}_operation_errors_total Operações que terminaram em erro.",
+        f"# TYPE {prefixo}_operation_errors_total counter",
+    ]
+    for operacao, dados in sorted(operacoes.items()):
+        linhas.append(f"{prefixo}_operation_errors_total{_rotulos(op=operacao)} {dados['erros']}")
+
+    linhas += [
+        f"# HELP {prefixo}_operation_duration_seconds Latência das operações.",
+        f"# TYPE {prefixo}_operation_duration_seconds histogram",
+    ]
+    for operacao, dados in sorted(operacoes.items()):
+        for limite, contagem in dados["buckets"].items():
+            linhas.append(
+                f"{prefixo}_operation_duration_seconds_bucket{_rotulos(op=operacao, le=limite)} {contagem}"
+            )
+        linhas.append(f"{prefixo}_operation_duration_seconds_sum{_rotulos(op=operacao)} {dados['soma_s']!r}")
+        linhas.append(f"{prefixo}_operation_duration_seconds_count{_rotulos(op=operacao)} {dados['total']}")
+
+    for nome, valor in sorted(metricas.get("gauges", {}).items()):
+        linhas += [f"# TYPE {prefixo}_{nome} gauge", f"{prefixo}_{nome} {valor}"]
+
+    linhas += [
+        f"# HELP {prefixo}_index_entries Entradas em cada índice em memória.",
+        f"# TYPE {prefixo}_index_entries gauge",
+    ]
+    for indice, tamanho in sorted(metricas.get("indices", {}).items()):
+        linhas.append(f"{prefixo}_index_entries{_rotulos(index=indice)} {tamanho}")
+
+    return "\n".join(linhas) + "\n"
+
+
+def write_textfile(caminho, conteudo: str):
+    """Grava o arquivo de métricas de forma atômica.
+
+    O textfile collector do node-exporter pode ler o arquivo a qualquer
+    momento, então o conteúdo é escrito em um temporário no mesmo diretório
+    e depois renomeado.
+
+    Args:
+        caminho: Arquivo ``.prom`` de destino
+        conteudo: Texto no formato do Prometheus
+    """
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    fd, temporario = tempfile.mkstemp(dir=caminho.parent, prefix=f".{caminho.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(conteudo)
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.unlink(temporario)
+        raise
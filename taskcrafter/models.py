@@ -3,11 +3,17 @@
 Este módulo define a estrutura de dados de uma tarefa.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import List, Optional
+from hashlib import blake2b
+from typing import Any, List, Optional
 import json
 
+from .descriptions import LazyText, TextRef
+
+
+DESCRICAO = LazyText()
+
 
 @dataclass
 class Task:
@@ -15,23 +21,32 @@ class Task:
     
     Attributes:
         titulo: Título único da tarefa (obrigatório)
-        descricao: Descrição detalhada da tarefa
+        id: Identificador numérico estável, atribuído pelo gerenciador
+        descricao: Descrição detalhada da tarefa (carregada no primeiro
+            acesso quando guardada fora de linha)
         prioridade: Nível de prioridade (baixa, media, alta)
         status: Estado atual (pendente, andamento, concluida)
         tags: Lista de tags para categorização
+        depende_de: Ids das tarefas que precisam ser concluídas antes desta
         data_criacao: Data/hora de criação (ISO 8601)
         data_vencimento: Data de vencimento no formato YYYY-MM-DD
         data_conclusao: Data/hora de conclusão (ISO 8601)
+        modificado_em: Data/hora da última modificação (ISO 8601)
+        replica: Identificador do armazenamento que fez a última modificação
     """
     
     titulo: str
-    descricao: str = ""
+    descricao: str = DESCRICAO
     prioridade: str = "media"
     status: str = "pendente"
     tags: List[str] = field(default_factory=list)
+    depende_de: List[int] = field(default_factory=list)
     data_criacao: str = field(default_factory=lambda: datetime.now().isoformat())
     data_vencimento: Optional[str] = None
     data_conclusao: Optional[str] = None
+    modificado_em: Optional[str] = None
+    replica: Optional[str] = None
+    id: Optional[int] = None
     
     def __post_init__(self):
         """Valida os dados da tarefa após inicialização."""
@@ -39,6 +54,7 @@ class Task:
         self._validar_prioridade()
         self._validar_status()
         self._validar_data_vencimento()
+        self._validar_dependencias()
     
     def _validar_titulo(self):
         """Valida se o título não está vazio."""
@@ -72,21 +88,74 @@ class Task:
                     "Data de vencimento deve estar no formato YYYY-MM-DD"
                 )
     
+    def _validar_dependencias(self):
+        """Valida se as dependências são ids de tarefas, sem repetição."""
+        if not isinstance(self.depende_de, list) or not all(
+                type(d) is int and d > 0 for d in self.depende_de):
+            raise ValueError("Dependências devem ser ids de tarefas (inteiros positivos)")
+        if len(set(self.depende_de)) != len(self.depende_de):
+            self.depende_de = list(dict.fromkeys(self.depende_de))
+    
+    @property
+    def descricao_ref(self) -> Optional[TextRef]:
+        """Referência da descrição guardada fora de linha (None se em linha ou alterada)."""
+        return DESCRICAO.ref(self)
+    
     def to_dict(self) -> dict:
         """Converte a tarefa para dicionário.
         
         Returns:
             Dicionário com os dados da tarefa
         """
+        return self._as_dict("descricao", self.descricao)
+    
+    def to_record(self) -> dict:
+        """Converte a tarefa para o registro gravado no arquivo de dados.
+        
+        Uma descrição guardada fora de linha é gravada como ``descricao_ref``
+        sem ser carregada.
+        
+        Returns:
+            Dicionário com os dados da tarefa
+        """
+        ref = self.descricao_ref
+        if ref is None:
+            return self.to_dict()
+        return self._as_dict("descricao_ref", ref.to_record())
+    
+    def to_snapshot(self) -> dict:
+        """Converte a tarefa para o estado registrado no log de mudanças.
+        
+        A descrição pode ser longa e estar fora de linha; em vez dela, o
+        snapshot leva ``descricao_versao``, um marcador que muda quando a
+        descrição muda: a referência do texto fora de linha (sem lê-lo) ou um
+        hash do texto em memória.
+        
+        Returns:
+            Dicionário com os dados da tarefa, com o marcador no lugar da descrição
+        """
+        ref = self.descricao_ref
+        if ref is not None:
+            versao = "ref:" + ":".join(map(str, ref.to_record()))
+        else:
+            versao = "hash:" + blake2b((self.descricao or "").encode("utf-8"), digest_size=8).hexdigest()
+        return self._as_dict("descricao_versao", versao)
+    
+    def _as_dict(self, chave_descricao: str, descricao: Any) -> dict:
+        """Monta o dicionário da tarefa com a descrição na chave indicada."""
         return {
+            "id": self.id,
             "titulo": self.titulo,
-            "descricao": self.descricao,
+            chave_descricao: descricao,
             "prioridade": self.prioridade,
             "status": self.status,
             "tags": self.tags,
+            "depende_de": self.depende_de,
             "data_criacao": self.data_criacao,
             "data_vencimento": self.data_vencimento,
-            "data_conclusao": self.data_conclusao
+            "data_conclusao": self.data_conclusao,
+            "modificado_em": self.modificado_em,
+            "replica": self.replica
         }
     
     @classmethod
@@ -101,8 +170,38 @@ class Task:
         """
         return cls(**data)
     
+    @classmethod
+    def from_values(cls, valores: tuple, descricao: Any) -> 'Task':
+        """Recria uma tarefa validada antes (ex.: pelo cache de carga), sem revalidar.
+        
+        Args:
+            valores: Valores dos campos na ordem de ``CAMPOS`` (o da descrição é ignorado)
+            descricao: Texto ou ``TextRef`` da descrição
+            
+        Returns:
+            Instância de Task
+        """
+        task = cls.__new__(cls)
+        task.__dict__.update(zip(CAMPOS, valores))
+        del task.__dict__["descricao"]
+        task.descricao = descricao
+        return task
+    
+    def version(self) -> tuple:
+        """Chave de versão usada para resolver conflitos entre réplicas.
+        
+        Returns:
+            Tupla (modificado_em, replica); tarefas antigas, sem metadados,
+            usam a data de criação
+        """
+        return (self.modificado_em or self.data_criacao, self.replica or "")
+    
     def __str__(self) -> str:
         """Representação em string da tarefa."""
         tags_str = f" [{', '.join(self.tags)}]" if self.tags else ""
         vencimento_str = f" (vence: {self.data_vencimento})" if self.data_vencimento else ""
         return f"[{self.status.upper()}] {self.titulo} - {self.prioridade}{tags_str}{vencimento_str}"
+
+
+CAMPOS = tuple(campo.name for campo in fields(Task))
+"""Nomes dos campos de ``Task``, na ordem da declaração."""
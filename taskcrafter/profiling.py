@@ -0,0 +1,185 @@
+"""Instrumentação de fases do TaskCrafter CLI.
+
+Este módulo mede o tempo de parede, a quantidade de registros e o pico de
+memória (via ``tracemalloc``) de cada fase das operações do ``TaskManager`` e
+da CLI: leitura, validação, filtragem, ordenação, gravação e impressão.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+@dataclass
+class PhaseStats:
+    """Estatísticas acumuladas de uma fase.
+
+    Attributes:
+        fase: Nome da fase (ex.: ``carregar.leitura``)
+        chamadas: Quantas vezes a fase foi executada
+        tempo_s: Tempo de parede total em segundos
+        registros: Total de registros processados
+        pico_memoria_bytes: Maior pico de memória observado (0 sem tracemalloc)
+    """
+
+    fase: str
+    chamadas: int = 0
+    tempo_s: float = 0.0
+    registros: int = 0
+    pico_memoria_bytes: int = 0
+
+    def to_dict(self) -> dict:
+        """Converte as estatísticas para dicionário."""
+        return asdict(self)
+
+
+class _Medicao:
+    """Medição em andamento de uma fase, usada dentro do bloco ``with``."""
+
+    __slots__ = ("registros", "pico")
+
+    def __init__(self, registros: int):
+        self.registros = registros
+        self.pico = 0
+
+
+class Profiler:
+    """Coletor de métricas por fase.
+
+    Uso programático::
+
+        profiler = Profiler()
+        manager = TaskManager("tasks.json", profiler=profiler)
+        manager.list_tasks(status="pendente")
+        for fase in profiler.report():
+            exportar(fase)
+
+    Attributes:
+        memoria: Se o pico de memória é medido com tracemalloc
+    """
+
+    def __init__(self, memoria: bool = True,
+                 listeners: Optional[List[Callable[[str, float, int, int], None]]] = None):
+        """Inicializa o profiler.
+
+        Args:
+            memoria: Mede o pico de memória com tracemalloc
+            listeners: Funções chamadas ao fim de cada fase com
+                (fase, segundos, registros, pico_memoria_bytes)
+        """
+        self.memoria = memoria
+        self.listeners = list(listeners or [])
+        self._fases: Dict[str, PhaseStats] = {}
+        self._pilha: List[_Medicao] = []
+        self._iniciou_tracemalloc = False
+
+    def start(self):
+        """Inicia o rastreamento de memória, se habilitado."""
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+
+    def stop(self):
+        """Encerra o rastreamento de memória iniciado por este profiler."""
+        if self._iniciou_tracemalloc:
+            tracemalloc.stop()
+            self._iniciou_tracemalloc = False
+
+    @contextmanager
+    def phase(self, nome: str, registros: int = 0) -> Iterator[_Medicao]:
+        """Mede uma fase.
+
+        A quantidade de registros pode ser informada na entrada ou ajustada
+        dentro do bloco por meio do objeto retornado.
+
+        Args:
+            nome: Nome da fase
+            registros: Quantidade de registros processados
+
+        Yields:
+            Medição cujo atributo ``registros`` pode ser atualizado
+        """
+        medicao = _Medicao(registros)
+        rastreando = tracemalloc.is_tracing()
+        if rastreando:
+            pico_anterior = tracemalloc.get_traced_memory()[1]
+            if self._pilha:
+                self._pilha[-1].pico = max(self._pilha[-1].pico, pico_anterior)
+            tracemalloc.reset_peak()
+        self._pilha.append(medicao)
+        inicio = time.perf_counter()
+        try:
+            yield medicao
+        finally:
+            decorrido = time.perf_counter() - inicio
+            self._pilha.pop()
+            if rastreando:
+                medicao.pico = max(medicao.pico, tracemalloc.get_traced_memory()[1])
+                if self._pilha:
+                    self._pilha[-1].pico = max(self._pilha[-1].pico, medicao.pico)
+            self._registrar(nome, decorrido, medicao.registros, medicao.pico)
+
+    def _registrar(self, nome: str, segundos: float, registros: int, pico: int):
+        """Acumula a medição de uma fase e notifica os listeners."""
+        stats = self._fases.get(nome)
+        if stats is None:
+            stats = self._fases[nome] = PhaseStats(nome)
+        stats.chamadas += 1
+        stats.tempo_s += segundos
+        stats.registros += registros
+        stats.pico_memoria_bytes = max(stats.pico_memoria_bytes, pico)
+        for listener in self.listeners:
+            listener(nome, segundos, registros, pico)
+
+    def report(self) -> List[dict]:
+        """Retorna as estatísticas de todas as fases, na ordem em que terminaram.
+
+        Returns:
+            Lista de dicionários (ver ``PhaseStats``)
+        """
+        return [stats.to_dict() for stats in self._fases.values()]
+
+    def reset(self):
+        """Descarta as estatísticas coletadas."""
+        self._fases.clear()
+
+    def format_report(self) -> str:
+        """Formata as estatísticas como tabela de texto."""
+        linhas = [f"{'fase':<28} {'chamadas':>8} {'tempo (ms)':>12} {'registros':>10} {'pico (KiB)':>11}"]
+        for stats in self._fases.values():
+            linhas.append(
+                f"{stats.fase:<28} {stats.chamadas:>8} {stats.tempo_s * 1000:>12.3f} "
+                f"{stats.registros:>10} {stats.pico_memoria_bytes / 1024:>11.1f}"
+            )
+        return "\n".join(linhas)
+
+
+class _NullPhase:
+    """Contexto vazio reutilizável para o profiler desativado."""
+
+    __slots__ = ("registros",)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullProfiler:
+    """Profiler desativado: as fases não custam mais que um ``with`` vazio."""
+
+    _fase = _NullPhase()
+
+    def phase(self, nome: str, registros: int = 0) -> _NullPhase:
+        """Retorna um contexto que não mede nada."""
+        return self._fase
+
+    def report(self) -> List[dict]:
+        """Retorna uma lista vazia."""
+        return []
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,195 @@
+"""Visões salvas do TaskCrafter CLI.
+
+Uma visão salva é um filtro nomeado (ex.: ``urgentes`` = alta + pendente).
+As definições ficam em um arquivo ao lado do armazenamento; o resultado de
+cada visão é materializado como um conjunto de ids na primeira execução e,
+a partir daí, atualizado a cada mutação que toca uma tarefa, de modo que
+executar a visão custa proporcionalmente ao tamanho do resultado.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field, asdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .indexes import CHAVES
+from .models import Task
+from .serialization import write_atomic
+from .tags import tag_matcher
+
+
+FILTROS = ("status", "prioridade", "tag", "vencimento", "vence_em")
+
+
+@dataclass
+class SavedView:
+    """Definição de uma visão salva.
+
+    Attributes:
+        nome: Nome único da visão
+        filtros: Critérios combinados com "e" (status, prioridade, tag,
+            vencimento e ``vence_em``, uma janela como ``7d`` a partir de hoje)
+        ordenar_por: Critério de ordenação (o mesmo de ``list_tasks``)
+    """
+
+    nome: str
+    filtros: Dict[str, str] = field(default_factory=dict)
+    ordenar_por: str = "data_criacao"
+
+    def __post_init__(self):
+        """Valida a definição da visão."""
+        if not self.nome or not self.nome.strip():
+            raise ValueError("Nome da visão não pode ser vazio")
+        self.nome = self.nome.strip()
+        invalidos = set(self.filtros) - set(FILTROS)
+        if invalidos:
+            raise ValueError(
+                f"Filtro inválido: {', '.join(sorted(invalidos))}. Use: {', '.join(FILTROS)}"
+            )
+        if "vence_em" in self.filtros and not re.fullmatch(r"\d+d", self.filtros["vence_em"]):
+            raise ValueError("vence_em deve estar no formato <dias>d (ex.: 7d)")
+        if self.ordenar_por not in CHAVES:
+            raise ValueError(f"Ordenação inválida. Use: {', '.join(CHAVES)}")
+        self._tag = tag_matcher(self.filtros["tag"]) if "tag" in self.filtros else None
+
+    @property
+    def depende_da_data(self) -> bool:
+        """Se o resultado muda com a passagem do tempo (filtro ``vence_em``)."""
+        return "vence_em" in self.filtros
+
+    def matches(self, task: Task, hoje: date) -> bool:
+        """Verifica se a tarefa pertence à visão.
+
+        Args:
+            task: Tarefa a verificar
+            hoje: Data de referência para ``vence_em``
+        """
+        filtros = self.filtros
+        if "status" in filtros and task.status != filtros["status"]:
+            return False
+        if "prioridade" in filtros and task.prioridade != filtros["prioridade"]:
+            return False
+        if self._tag is not None and not self._tag(task.tags):
+            return False
+        if "vencimento" in filtros and task.data_vencimento != filtros["vencimento"]:
+            return False
+        if "vence_em" in filtros:
+            if not task.data_vencimento:
+                return False
+            limite = hoje + timedelta(days=int(filtros["vence_em"][:-1]))
+            return hoje.isoformat() <= task.data_vencimento <= limite.isoformat()
+        return True
+
+    def to_dict(self) -> dict:
+        """Converte a definição para dicionário."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SavedView':
+        """Cria a definição a partir de um dicionário."""
+        return cls(**data)
+
+
+class SavedViews:
+    """Definições persistidas e resultados materializados das visões.
+
+    Attributes:
+        caminho: Arquivo JSON com as definições
+    """
+
+    def __init__(self, caminho):
+        """Inicializa o repositório de visões (as definições são lidas sob demanda).
+
+        Args:
+            caminho: Arquivo JSON com as definições
+        """
+        self.caminho = Path(caminho)
+        self._definicoes: Optional[Dict[str, SavedView]] = None
+        self._materializadas: Dict[str, Tuple[date, Set[int]]] = {}
+
+    def reset(self):
+        """Descarta as definições lidas e os resultados materializados."""
+        self._definicoes = None
+        self._materializadas.clear()
+
+    def definitions(self) -> Dict[str, SavedView]:
+        """Retorna as definições, indexadas pelo nome.
+
+        Raises:
+            ValueError: Se o arquivo de definições existe mas está ilegível;
+                tratá-lo como vazio faria a próxima gravação apagar as visões
+        """
+        if self._definicoes is None:
+            try:
+                with open(self.caminho, 'r', encoding='utf-8') as f:
+                    dados = json.load(f)
+                self._definicoes = {d["nome"]: SavedView.from_dict(d) for d in dados}
+            except FileNotFoundError:
+                self._definicoes = {}
+            except (ValueError, TypeError, KeyError) as e:
+                raise ValueError(f"Arquivo de visões salvas inválido ({self.caminho}): {e}")
+        return self._definicoes
+
+    def _gravar(self):
+        """Grava as definições (substituição atômica)."""
+        conteudo = json.dumps([v.to_dict() for v in self.definitions().values()], ensure_ascii=False, indent=2)
+        write_atomic(self.caminho, conteudo.encode('utf-8'))
+
+    def save(self, view: SavedView):
+        """Cria ou substitui uma visão.
+
+        Args:
+            view: Definição da visão
+        """
+        self.definitions()[view.nome] = view
+        self._materializadas.pop(view.nome, None)
+        self._gravar()
+
+    def delete(self, nome: str) -> bool:
+        """Remove uma visão.
+
+        Returns:
+            True se removida, False se não existia
+        """
+        if self.definitions().pop(nome, None) is None:
+            return False
+        self._materializadas.pop(nome, None)
+        self._gravar()
+        return True
+
+    def result_ids(self, nome: str, tasks: List[Task], hoje: date) -> Set[int]:
+        """Retorna os ids do resultado, materializando-o se necessário.
+
+        Visões que dependem da data são recalculadas quando o dia muda.
+
+        Args:
+            nome: Nome da visão (deve existir)
+            tasks: Tarefas atuais, usadas apenas na materialização
+            hoje: Data de referência
+        """
+        view = self.definitions()[nome]
+        materializada = self._materializadas.get(nome)
+        if materializada is None or (view.depende_da_data and materializada[0] != hoje):
+            materializada = (hoje, {t.id for t in tasks if view.matches(t, hoje)})
+            self._materializadas[nome] = materializada
+        return materializada[1]
+
+    def on_change(self, operacao: str, task: Task):
+        """Atualiza os resultados materializados após uma mutação.
+
+        Args:
+            operacao: Tipo da mutação (add, update, done, delete)
+            task: Tarefa afetada, no estado posterior à mutação
+        """
+        for nome, (hoje, ids) in self._materializadas.items():
+            if operacao != "delete" and self._definicoes[nome].matches(task, hoje):
+                ids.add(task.id)
+            else:
+                ids.discard(task.id)
+
+    @property
+    def tamanhos(self) -> Dict[str, int]:
+        """Tamanho de cada resultado materializado, por nome."""
+        return {nome: len(ids) for nome, (_, ids) in self._materializadas.items()}
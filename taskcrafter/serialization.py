@@ -0,0 +1,361 @@
+"""Codecs de serialização do arquivo de tarefas do TaskCrafter CLI.
+
+O formato gravado é escolhido pelo sufixo do arquivo (``.gz``, ``.xz``) ou
+explicitamente pelo nome do codec. A leitura não depende do codec
+configurado: a compressão é reconhecida pelos primeiros bytes do arquivo,
+então trocar de codec não exige converter o armazenamento.
+
+Todos os codecs gravam uma lista JSON com um registro por linha, e cada
+linha começa com o CRC32 do restante dela (``{"_crc":"…",…}``). Assim um
+byte corrompido invalida apenas o registro da sua linha: ``decode_records``
+verifica os checksums e, se o arquivo não puder ser lido inteiro, recupera
+os registros válidos em uma única passada linear.
+
+O codec ``orjson`` usa a biblioteca de mesmo nome quando instalada; sem ela,
+recai no JSON compacto da biblioteca padrão.
+"""
+
+import gzip
+import json
+import lzma
+import os
+import tempfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+
+MAGICA_GZIP = b"\x1f\x8b"
+MAGICA_XZ = b"\xfd7zXZ\x00"
+
+PREFIXO_CRC = b'{"_crc":"'
+_INICIO_CORPO = len(PREFIXO_CRC) + 8 + 2  # prefixo, 8 dígitos hexadecimais e '",'
+
+_BLOCO_DESCOMPRESSAO = 1 << 20
+
+
+@dataclass
+class StoreDamage:
+    """Resultado da leitura de um arquivo que não pôde ser lido inteiro.
+
+    Attributes:
+        erro: Motivo da falha
+        recuperados: Registros válidos recuperados
+        descartados: Registros (ou trechos) descartados
+    """
+
+    erro: str
+    recuperados: int
+    descartados: int
+
+
+class Codec:
+    """Converte a lista de registros em bytes e de volta.
+
+    Attributes:
+        nome: Nome do codec (usado em ``--codec``)
+        descricao: Descrição curta exibida na ajuda
+    """
+
+    def __init__(self, nome: str, descricao: str, registro: Callable[[dict], bytes],
+                 comprimir: Optional[Callable[[bytes], bytes]] = None):
+        """Inicializa o codec.
+
+        Args:
+            nome: Nome do codec
+            descricao: Descrição curta
+            registro: Função que serializa um registro em bytes (um objeto JSON)
+            comprimir: Compressão aplicada ao arquivo inteiro, se houver
+        """
+        self.nome = nome
+        self.descricao = descricao
+        self._registro = registro
+        self._comprimir = comprimir
+
+    def dumps(self, registros: List[dict]) -> bytes:
+        """Serializa os registros, um por linha e com checksum."""
+        conteudo = frame(registros, self._registro)
+        return self._comprimir(conteudo) if self._comprimir else conteudo
+
+    def loads(self, conteudo: bytes) -> List[dict]:
+        """Desserializa o conteúdo de qualquer codec (ver ``load_bytes``)."""
+        return load_bytes(conteudo)
+
+
+def _json_legivel(registro: dict) -> bytes:
+    return json.dumps(registro, ensure_ascii=False).encode('utf-8')
+
+
+def _json_compacto(registro: dict) -> bytes:
+    return json.dumps(registro, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _orjson(registro: dict) -> bytes:
+    if orjson is None:
+        return _json_compacto(registro)
+    return orjson.dumps(registro)
+
+
+def _gzip(conteudo: bytes) -> bytes:
+    # mtime=0 torna a saída determinística para o mesmo conteúdo
+    return gzip.compress(conteudo, compresslevel=6, mtime=0)
+
+
+def _xz(conteudo: bytes) -> bytes:
+    return lzma.compress(conteudo, preset=6)
+
+
+CODECS: Dict[str, Codec] = {
+    codec.nome: codec for codec in (
+        Codec("json", "JSON, um registro por linha (padrão, legível)", _json_legivel),
+        Codec("json-compact", "JSON sem espaços", _json_compacto),
+        Codec("orjson", "JSON compacto via orjson, se instalado", _orjson),
+        Codec("gzip", "JSON compacto comprimido com gzip", _json_compacto, _gzip),
+        Codec("xz", "JSON compacto comprimido com lzma/xz", _json_compacto, _xz),
+    )
+}
+
+SUFIXOS = {".gz": "gzip", ".xz": "xz"}
+
+
+def codec_for(caminho, nome: Optional[str] = None) -> Codec:
+    """Escolhe o codec de gravação.
+
+    Args:
+        caminho: Arquivo de dados (o sufixo define o padrão)
+        nome: Codec explícito, que tem precedência sobre o sufixo
+
+    Returns:
+        Codec selecionado
+
+    Raises:
+        ValueError: Se o nome do codec for desconhecido
+    """
+    if nome:
+        if nome not in CODECS:
+            raise ValueError(f"Codec inválido: {nome}. Use: {', '.join(CODECS)}")
+        return CODECS[nome]
+    return CODECS[SUFIXOS.get(Path(caminho).suffix.lower(), "json")]
+
+
+def frame(registros: List[dict], serializar: Callable[[dict], bytes]) -> bytes:
+    """Monta a lista JSON com um registro por linha, cada um com seu CRC32.
+
+    Args:
+        registros: Registros a gravar (dicionários não vazios)
+        serializar: Função que serializa um registro como objeto JSON
+
+    Returns:
+        Conteúdo do arquivo, sem compressão
+    """
+    if not registros:
+        return b"[]\n"
+    linhas = []
+    for registro in registros:
+        corpo = serializar(registro)[1:]
+        linhas.append(b'%s%08x",%s' % (PREFIXO_CRC, zlib.crc32(corpo), corpo))
+    return b"[\n" + b",\n".join(linhas) + b"\n]\n"
+
+
+def _crc_ok(linha: bytes) -> bool:
+    """Verifica o checksum de uma linha (sem a vírgula final)."""
+    try:
+        return int(linha[len(PREFIXO_CRC):_INICIO_CORPO - 2], 16) == zlib.crc32(linha[_INICIO_CORPO:])
+    except ValueError:
+        return False
+
+
+def _descomprimir(conteudo: bytes) -> Tuple[bytes, Optional[str]]:
+    """Descomprime o conteúdo, se necessário, preservando o que for legível.
+
+    Returns:
+        Tupla (conteúdo descomprimido, erro ou None); em caso de erro o
+        conteúdo é o prefixo que pôde ser descomprimido
+    """
+    if conteudo.startswith(MAGICA_GZIP):
+        descompressor = zlib.decompressobj(wbits=31)
+        erros = zlib.error
+    elif conteudo.startswith(MAGICA_XZ):
+        descompressor = lzma.LZMADecompressor()
+        erros = lzma.LZMAError
+    else:
+        return conteudo, None
+    partes = []
+    try:
+        # Em blocos, para que um erro no meio não descarte o que veio antes
+        for inicio in range(0, len(conteudo), _BLOCO_DESCOMPRESSAO):
+            partes.append(descompressor.decompress(conteudo[inicio:inicio + _BLOCO_DESCOMPRESSAO]))
+            if descompressor.eof:
+                break
+    except erros as e:
+        return b"".join(partes), f"arquivo comprimido inválido: {e}"
+    if not descompressor.eof:
+        return b"".join(partes), "arquivo comprimido truncado"
+    return b"".join(partes), None
+
+
+def _loads(conteudo: bytes):
+    if orjson is not None:
+        return orjson.loads(conteudo)
+    return json.loads(conteudo.decode('utf-8'))
+
+
+def _checksums_invalidos(conteudo: bytes, total: int) -> int:
+    """Conta os registros com checksum inválido em um arquivo já desserializado.
+
+    Arquivos gravados antes dos checksums (sem nenhuma linha com prefixo)
+    não são verificados.
+    """
+    linhas = [linha for linha in conteudo.split(b"\n") if linha.startswith(PREFIXO_CRC)]
+    if not linhas:
+        return 0
+    invalidos = sum(1 for linha in linhas if not _crc_ok(linha.rstrip(b",")))
+    return invalidos + abs(total - len(linhas))
+
+
+def salvage(conteudo: bytes) -> Tuple[List[dict], int]:
+    """Recupera os registros válidos de um conteúdo danificado, em uma passada.
+
+    Em arquivos com checksums, cada linha é verificada e desserializada
+    isoladamente. Em arquivos antigos, sem checksums, cada ``{`` é tentado
+    como início de um objeto JSON, e a busca continua após cada objeto lido.
+
+    Args:
+        conteudo: Conteúdo já descomprimido (possivelmente truncado)
+
+    Returns:
+        Tupla (registros recuperados, registros ou trechos descartados)
+    """
+    registros: List[dict] = []
+    descartados = 0
+    linhas = conteudo.split(b"\n")
+    if any(linha.startswith(PREFIXO_CRC) for linha in linhas):
+        for linha in linhas:
+            linha = linha.strip().rstrip(b",")
+            if not linha.startswith(b"{"):
+                continue  # '[', ']' e linhas vazias
+            try:
+                if not _crc_ok(linha):
+                    raise ValueError("checksum inválido")
+                registro = _loads(linha)
+            except ValueError:
+                descartados += 1
+                continue
+            del registro["_crc"]
+            registros.append(registro)
+        return registros, descartados
+
+    texto = conteudo.decode('utf-8', errors='replace')
+    decodificador = json.JSONDecoder()
+    posicao = texto.find("{")
+    while posicao != -1:
+        try:
+            registro, fim = decodificador.raw_decode(texto, posicao)
+        except ValueError:
+            descartados += 1
+            posicao = texto.find("{", posicao + 1)
+            continue
+        if isinstance(registro, dict) and "titulo" in registro:
+            registros.append(registro)
+        posicao = texto.find("{", fim)
+    return registros, descartados
+
+
+def decode_records(conteudo: bytes) -> Tuple[List[dict], Optional[StoreDamage]]:
+    """Desserializa os registros, verificando os checksums.
+
+    Um conteúdo vazio é um armazenamento vazio. Se o conteúdo não puder ser
+    lido inteiro (compressão ou JSON inválidos, checksum divergente), os
+    registros válidos são recuperados com ``salvage``.
+
+    Args:
+        conteudo: Bytes lidos do arquivo de dados
+
+    Returns:
+        Tupla (registros, dano ou None se o conteúdo estava íntegro)
+    """
+    conteudo, erro = _descomprimir(conteudo)
+    if erro is None:
+        if not conteudo.strip():
+            return [], None
+        try:
+            dados = _loads(conteudo)
+        except ValueError as e:
+            erro = f"JSON inválido: {e}"
+        else:
+            if not isinstance(dados, list) or not all(isinstance(d, dict) for d in dados):
+                erro = "o arquivo não contém uma lista de registros"
+            else:
+                invalidos = _checksums_invalidos(conteudo, len(dados))
+                if not invalidos:
+                    for registro in dados:
+                        registro.pop("_crc", None)
+                    return dados, None
+                erro = f"{invalidos} registro(s) com checksum inválido"
+    registros, descartados = salvage(conteudo)
+    return registros, StoreDamage(erro, len(registros), descartados)
+
+
+def load_bytes(conteudo: bytes) -> List[dict]:
+    """Desserializa o conteúdo, descomprimindo-o se necessário.
+
+    Args:
+        conteudo: Bytes lidos do arquivo de dados
+
+    Returns:
+        Registros desserializados
+
+    Raises:
+        ValueError: Se o conteúdo estiver danificado (ver ``decode_records``)
+    """
+    registros, dano = decode_records(conteudo)
+    if dano is not None:
+        raise ValueError(dano.erro)
+    return registros
+
+
+def write_atomic(caminho, conteudo: bytes):
+    """Substitui o arquivo pelo conteúdo de forma atômica e durável.
+
+    O conteúdo é gravado em um temporário no mesmo diretório, sincronizado
+    com o disco e renomeado sobre o destino. Uma queda no meio da gravação
+    (ou um segundo processo gravando ao mesmo tempo) deixa o arquivo antigo
+    ou o novo inteiro, nunca um arquivo truncado ou misturado.
+
+    Args:
+        caminho: Arquivo de destino
+        conteudo: Bytes a gravar
+    """
+    caminho = Path(caminho)
+    fd, temporario = tempfile.mkstemp(dir=caminho.parent, prefix=f".{caminho.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.unlink(temporario)
+        raise
+    _sincronizar_diretorio(caminho.parent)
+
+
+def _sincronizar_diretorio(diretorio: Path):
+    """Sincroniza a entrada do diretório após um rename (onde suportado)."""
+    try:
+        fd = os.open(diretorio, os.O_RDONLY)
+    except OSError:  # pragma: no cover - diretórios não podem ser abertos no Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover - depende do sistema de arquivos
+        pass
+    finally:
+        os.close(fd)
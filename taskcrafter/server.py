@@ -0,0 +1,536 @@
+"""API HTTP local do TaskCrafter CLI.
+
+Expõe as operações do ``TaskManager`` como endpoints REST com respostas JSON
+(ou NDJSON), para painéis e scripts que hoje executam a CLI a cada
+atualização. O servidor usa a biblioteca padrão (``ThreadingHTTPServer``),
+mantém o armazenamento carregado em memória, atende cada conexão em uma
+thread e mantém conexões persistentes (HTTP/1.1 keep-alive).
+
+Endpoints::
+
+    GET    /tasks                 lista (filtros de list_tasks, paginação)
+    POST   /tasks                 cria (corpo: campos de add)
+    GET    /tasks/<id|título>     uma tarefa
+    PATCH  /tasks/<id|título>     atualiza (corpo: campos de update)
+    POST   /tasks/<id|título>/done
+    DELETE /tasks/<id|título>
+    GET    /search?q=texto        busca no título e na descrição
+    GET    /stats[?by=tag,status] estatísticas ou agregação
+    GET    /agenda                atrasadas e próximos prazos
+    GET    /changes?since=N       mutações após a revisão N
+    GET    /metrics               métricas no formato do Prometheus
+
+Toda resposta de consulta leva um ``ETag`` derivado da revisão do
+armazenamento; um cliente que repete a consulta com ``If-None-Match``
+recebe ``304 Not Modified``, sem corpo, enquanto nada mudar. Alterações
+feitas por outros processos (a CLI, por exemplo) são percebidas pelo
+tamanho e mtime do arquivo de dados, que é então recarregado.
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+from . import __version__
+from .indexes import CHAVES
+from .manager import TaskManager
+from .metrics import MetricsRegistry, render_prometheus
+from .models import CAMPOS, Task
+
+
+LIMITE_PADRAO = 100
+"""Tamanho de página padrão das listagens."""
+
+LIMITE_MAXIMO = 1000
+"""Maior tamanho de página aceito."""
+
+TAMANHO_BLOCO_NDJSON = 64 * 1024
+"""Bytes acumulados antes de enviar um bloco de uma resposta NDJSON."""
+
+FILTROS_LISTA = ("status", "prioridade", "tag", "vencimento")
+
+
+class HTTPError(Exception):
+    """Erro com status HTTP, convertido em resposta ``{"erro": ...}``."""
+
+    def __init__(self, status: int, mensagem: str, cabecalhos: Optional[Dict[str, str]] = None):
+        super().__init__(mensagem)
+        self.status = status
+        self.cabecalhos = cabecalhos or {}
+
+
+def _assinatura(caminho) -> Optional[Tuple[int, int]]:
+    """Tamanho e mtime do arquivo de dados (None se não existir)."""
+    try:
+        stat = caminho.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _inteiro(valor: Optional[str], nome: str, padrao: int, minimo: int = 0,
+             maximo: Optional[int] = None) -> int:
+    """Converte um parâmetro da URL em inteiro dentro dos limites.
+
+    Raises:
+        ValueError: Se o valor não for um inteiro válido
+    """
+    if valor is None or valor == "":
+        return padrao
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise ValueError(f"Parâmetro '{nome}' deve ser um inteiro")
+    if numero < minimo or (maximo is not None and numero > maximo):
+        limites = f"entre {minimo} e {maximo}" if maximo is not None else f">= {minimo}"
+        raise ValueError(f"Parâmetro '{nome}' deve estar {limites}")
+    return numero
+
+
+def _campos(texto: Optional[str]) -> Optional[List[str]]:
+    """Converte ``id,titulo`` na lista de campos pedidos (None: todos).
+
+    Raises:
+        ValueError: Se algum campo não existir
+    """
+    if not texto:
+        return None
+    campos = [campo.strip() for campo in texto.split(',') if campo.strip()]
+    invalidos = [campo for campo in campos if campo not in CAMPOS]
+    if invalidos or not campos:
+        raise ValueError(f"Campo(s) inválido(s): {', '.join(invalidos) or texto!r}. Use: {', '.join(CAMPOS)}")
+    return campos
+
+
+def _registro(task: Task, campos: Optional[List[str]]) -> dict:
+    """Converte a tarefa em dicionário, lendo só os campos pedidos."""
+    if campos is None:
+        return task.to_dict()
+    return {campo: getattr(task, campo) for campo in campos}
+
+
+class TaskServer(ThreadingHTTPServer):
+    """Servidor HTTP de um armazenamento.
+
+    Attributes:
+        manager: Gerenciador compartilhado pelas threads das conexões
+        http_metrics: Contagem e latência das requisições por rota
+        quiet: Se True, não registra as requisições em stderr
+    """
+
+    daemon_threads = True
+
+    def __init__(self, endereco: Tuple[str, int], manager: TaskManager, quiet: bool = False):
+        """Inicializa o servidor (a porta 0 escolhe uma porta livre).
+
+        Args:
+            endereco: Par (host, porta)
+            manager: Gerenciador do armazenamento servido
+            quiet: Se True, não registra as requisições
+        """
+        super().__init__(endereco, TaskRequestHandler)
+        self.manager = manager
+        self.http_metrics = MetricsRegistry()
+        self.quiet = quiet
+        self._trava_disco = threading.Lock()
+        self._assinatura = _assinatura(manager.data_file)
+
+    @property
+    def url(self) -> str:
+        """URL base do servidor."""
+        host, porta = self.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    def refresh(self):
+        """Recarrega o armazenamento se outro processo alterou o arquivo de dados.
+
+        Um arquivo lido no meio de uma gravação de outro processo parece
+        danificado; nesse caso a leitura é repetida algumas vezes.
+        """
+        with self._trava_disco:
+            atual = _assinatura(self.manager.data_file)
+            if atual == self._assinatura:
+                return
+            for _ in range(3):
+                self.manager.load_tasks()
+                depois = _assinatura(self.manager.data_file)
+                if self.manager.damage is None or depois == atual:
+                    break
+                atual = depois
+                time.sleep(0.05)
+            self._assinatura = atual
+
+    def mutate(self, operacao: Callable[[], Any]) -> Any:
+        """Executa uma mutação e registra o estado do arquivo gravado por ela."""
+        with self._trava_disco:
+            try:
+                return operacao()
+            finally:
+                self._assinatura = _assinatura(self.manager.data_file)
+
+
+class TaskRequestHandler(BaseHTTPRequestHandler):
+    """Trata as requisições de um ``TaskServer`` (uma instância por requisição)."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = f"TaskCrafter/{__version__}"
+    timeout = 30
+    """Segundos até fechar uma conexão persistente ociosa."""
+
+    ROTAS = [
+        ("GET", r"/tasks", "_listar"),
+        ("POST", r"/tasks", "_criar"),
+        ("GET", r"/tasks/(?P<ref>[^/]+)", "_obter"),
+        ("PATCH", r"/tasks/(?P<ref>[^/]+)", "_atualizar"),
+        ("DELETE", r"/tasks/(?P<ref>[^/]+)", "_remover"),
+        ("POST", r"/tasks/(?P<ref>[^/]+)/done", "_concluir"),
+        ("GET", r"/search", "_buscar"),
+        ("GET", r"/stats", "_estatisticas"),
+        ("GET", r"/agenda", "_agenda"),
+        ("GET", r"/changes", "_mudancas"),
+        ("GET", r"/metrics", "_metricas"),
+    ]
+    _COMPILADAS = [(metodo, re.compile(padrao + "$"), padrao, nome) for metodo, padrao, nome in ROTAS]
+
+    @property
+    def manager(self) -> TaskManager:
+        return self.server.manager
+
+    def do_GET(self):
+        self._despachar("GET")
+
+    def do_POST(self):
+        self._despachar("POST")
+
+    def do_PATCH(self):
+        self._despachar("PATCH")
+
+    def do_PUT(self):
+        self._despachar("PUT")
+
+    def do_DELETE(self):
+        self._despachar("DELETE")
+
+    def log_message(self, formato: str, *args):
+        if not self.server.quiet:
+            super().log_message(formato, *args)
+
+    # Despacho
+
+    def _despachar(self, metodo: str):
+        """Encontra a rota, executa o tratador e converte erros em respostas."""
+        inicio = time.perf_counter()
+        self._dados = b""
+        self._query = {}
+        rota = "?"
+        try:
+            # O corpo é sempre lido, mesmo se a requisição for recusada, para manter a conexão utilizável
+            self._dados = self._ler_corpo()
+            caminho = self._ler_url()
+            tratador, parametros, rota = self._rota(metodo, caminho)
+            self.server.refresh()
+            tratador(**parametros)
+        except HTTPError as e:
+            self._enviar_erro(e.status, str(e), e.cabecalhos)
+        except ValueError as e:
+            self._enviar_erro(400, str(e))
+        except Exception as e:
+            self.server.http_metrics.error(rota)
+            self._enviar_erro(500, f"Erro inesperado: {e}")
+        finally:
+            self.server.http_metrics.observe(rota, time.perf_counter() - inicio)
+
+    def _ler_corpo(self) -> bytes:
+        """Lê o corpo da requisição conforme o ``Content-Length``.
+
+        Raises:
+            HTTPError: 400 se o cabeçalho for inválido; a conexão é encerrada,
+                porque não se sabe onde o corpo termina
+        """
+        valor = self.headers.get("Content-Length") or "0"
+        if not valor.strip().isdigit():
+            raise HTTPError(400, f"Cabeçalho Content-Length inválido: {valor!r}", {"Connection": "close"})
+        tamanho = int(valor)
+        return self.rfile.read(tamanho) if tamanho > 0 else b""
+
+    def _ler_url(self) -> str:
+        """Separa o caminho da requisição e guarda os parâmetros da query.
+
+        Returns:
+            Caminho, sem a query
+
+        Raises:
+            HTTPError: 400 se o alvo da requisição não for uma URL válida
+        """
+        try:
+            partes = urlsplit(self.path)
+        except ValueError as e:
+            raise HTTPError(400, f"URL inválida: {self.path!r} ({e})")
+        self._query = {chave: valores[-1] for chave, valores in parse_qs(partes.query, keep_blank_values=True).items()}
+        return partes.path
+
+    def _rota(self, metodo: str, caminho: str) -> Tuple[Callable, Dict[str, str], str]:
+        """Retorna o tratador, os parâmetros do caminho e o nome da rota.
+
+        Raises:
+            HTTPError: 404 se o caminho não existir, 405 se o método não for aceito
+        """
+        permitidos = []
+        for metodo_rota, regex, padrao, nome in self._COMPILADAS:
+            casamento = regex.match(caminho)
+            if casamento is None:
+                continue
+            if metodo_rota == metodo:
+                parametros = {chave: unquote(valor) for chave, valor in casamento.groupdict().items()}
+                return getattr(self, nome), parametros, f"{metodo} {padrao}"
+            permitidos.append(metodo_rota)
+        if permitidos:
+            raise HTTPError(405, f"Método {metodo} não permitido", {"Allow": ", ".join(permitidos)})
+        raise HTTPError(404, f"Recurso '{caminho}' não encontrado")
+
+    def _parametros(self, *aceitos: str) -> Dict[str, str]:
+        """Parâmetros da URL, recusando os desconhecidos.
+
+        Raises:
+            ValueError: Se houver parâmetro não aceito pela rota
+        """
+        invalidos = sorted(set(self._query) - set(aceitos))
+        if invalidos:
+            raise ValueError(f"Parâmetro(s) inválido(s): {', '.join(invalidos)}. Use: {', '.join(aceitos)}")
+        return self._query
+
+    def _corpo(self) -> dict:
+        """Lê o corpo JSON da requisição (um objeto).
+
+        Raises:
+            ValueError: Se o corpo não for um objeto JSON válido
+        """
+        if not self._dados.strip():
+            return {}
+        try:
+            corpo = json.loads(self._dados)
+        except ValueError as e:
+            raise ValueError(f"Corpo JSON inválido: {e}")
+        if not isinstance(corpo, dict):
+            raise ValueError("O corpo deve ser um objeto JSON")
+        return corpo
+
+    # Respostas
+
+    def _etag(self) -> str:
+        return f'"{self.manager.revision}"'
+
+    def _nao_modificado(self, etag: str) -> bool:
+        """Responde 304 se o cliente já tem a versão atual (``If-None-Match``)."""
+        pedidos = self.headers.get("If-None-Match")
+        if not pedidos:
+            return False
+        valores = {valor.strip().removeprefix("W/") for valor in pedidos.split(",")}
+        if "*" not in valores and etag not in valores:
+            return False
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return True
+
+    def _enviar(self, status: int, corpo: bytes, tipo: str, cabecalhos: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(corpo)))
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _enviar_json(self, dados: Any, status: int = 200, etag: Optional[str] = None,
+                     cabecalhos: Optional[Dict[str, str]] = None):
+        cabecalhos = dict(cabecalhos or {})
+        if etag:
+            cabecalhos.update({"ETag": etag, "Cache-Control": "no-cache"})
+        corpo = json.dumps(dados, ensure_ascii=False).encode("utf-8")
+        self._enviar(status, corpo, "application/json; charset=utf-8", cabecalhos)
+
+    def _enviar_ndjson(self, itens: Iterable[dict], etag: str, cabecalhos: Optional[Dict[str, str]] = None):
+        """Envia os itens como NDJSON, em blocos (``Transfer-Encoding: chunked``)."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.end_headers()
+        bloco = bytearray()
+        for item in itens:
+            bloco += json.dumps(item, ensure_ascii=False).encode("utf-8") + b"\n"
+            if len(bloco) >= TAMANHO_BLOCO_NDJSON:
+                self._enviar_bloco(bloco)
+                bloco = bytearray()
+        if bloco:
+            self._enviar_bloco(bloco)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _enviar_bloco(self, dados: bytes):
+        self.wfile.write(f"{len(dados):x}\r\n".encode("ascii") + dados + b"\r\n")
+
+    def _enviar_erro(self, status: int, mensagem: str, cabecalhos: Optional[Dict[str, str]] = None):
+        self._enviar_json({"erro": mensagem}, status, cabecalhos=cabecalhos)
+
+    def _formato(self) -> str:
+        """``json`` ou ``ndjson``, pelo parâmetro ``format`` ou pelo cabeçalho ``Accept``."""
+        formato = self._query.get("format")
+        if formato is None:
+            return "ndjson" if "application/x-ndjson" in (self.headers.get("Accept") or "") else "json"
+        if formato not in ("json", "ndjson"):
+            raise ValueError("Formato inválido. Use: json, ndjson")
+        return formato
+
+    def _pagina(self, tasks: List[Task], caminho: str):
+        """Responde com uma página de tarefas (``limite`` e ``offset``)."""
+        limite = _inteiro(self._query.get("limite"), "limite", LIMITE_PADRAO, 1, LIMITE_MAXIMO)
+        offset = _inteiro(self._query.get("offset"), "offset", 0)
+        campos = _campos(self._query.get("campos"))
+        formato = self._formato()
+        etag = self._etag()
+        if self._nao_modificado(etag):
+            return
+        pagina = tasks[offset:offset + limite]
+        proximo = None
+        if offset + limite < len(tasks):
+            proximo = f"{caminho}?{urlencode({**self._query, 'offset': offset + limite})}"
+        cabecalhos = {"X-Total-Count": str(len(tasks))}
+        if proximo:
+            cabecalhos["Link"] = f'<{proximo}>; rel="next"'
+        registros = (_registro(task, campos) for task in pagina)
+        if formato == "ndjson":
+            self._enviar_ndjson(registros, etag, cabecalhos)
+            return
+        self._enviar_json({"tarefas": list(registros), "total": len(tasks), "offset": offset,
+                           "limite": limite, "proximo": proximo}, etag=etag, cabecalhos=cabecalhos)
+
+    def _tarefa(self, ref: str) -> Task:
+        """Tarefa pelo id ou título.
+
+        Raises:
+            HTTPError: 404 se não existir
+        """
+        task = self.manager.get_task(ref)
+        if task is None:
+            raise HTTPError(404, f"Tarefa '{ref}' não encontrada")
+        return task
+
+    # Tratadores
+
+    def _listar(self):
+        query = self._parametros(*FILTROS_LISTA, "ordenar", "limite", "offset", "campos", "format")
+        ordenar = query.get("ordenar") or "data_criacao"
+        if ordenar not in CHAVES:
+            raise ValueError(f"Ordenação inválida. Use: {', '.join(CHAVES)}")
+        filtros = {campo: query[campo] for campo in FILTROS_LISTA if query.get(campo)}
+        self._pagina(self.manager.list_tasks(ordenar_por=ordenar, **filtros), "/tasks")
+
+    def _buscar(self):
+        query = self._parametros("q", "campos_busca", "limite", "offset", "campos", "format")
+        campos = tuple(c.strip() for c in (query.get("campos_busca") or "titulo,descricao").split(",") if c.strip())
+        self._pagina(self.manager.search(query.get("q", ""), campos), "/search")
+
+    def _obter(self, ref: str):
+        campos = _campos(self._parametros("campos").get("campos"))
+        task = self._tarefa(ref)
+        etag = self._etag()
+        if not self._nao_modificado(etag):
+            self._enviar_json(_registro(task, campos), etag=etag)
+
+    def _mutar(self, operacao: Dict[str, Any], status: int = 200):
+        """Aplica a operação (``TaskManager.apply_operation``) e responde com a tarefa."""
+        self._parametros()
+        resultado = self.server.mutate(lambda: self.manager.apply_operation(operacao))
+        cabecalhos = {"ETag": self._etag()}
+        if status == 201:
+            cabecalhos["Location"] = f"/tasks/{resultado['tarefa']['id']}"
+        self._enviar_json(resultado["tarefa"], status, cabecalhos=cabecalhos)
+
+    def _criar(self):
+        corpo = self._corpo()
+        corpo.pop("op", None)
+        self._mutar({**corpo, "op": "add"}, 201)
+
+    def _atualizar(self, ref: str):
+        corpo = self._corpo()
+        task = self._tarefa(ref)
+        self._mutar({**corpo, "op": "update", "tarefa": task.id})
+
+    def _concluir(self, ref: str):
+        self._corpo()
+        self._mutar({"op": "done", "tarefa": self._tarefa(ref).id})
+
+    def _remover(self, ref: str):
+        self._mutar({"op": "delete", "tarefa": self._tarefa(ref).id})
+
+    def _estatisticas(self):
+        query = self._parametros("by", "status", "prioridade", "tag")
+        etag = self._etag()
+        if self._nao_modificado(etag):
+            return
+        if query.get("by"):
+            dimensoes = [d.strip() for d in query["by"].split(",") if d.strip()]
+            filtros = {campo: query.get(campo) for campo in ("status", "prioridade", "tag")}
+            self._enviar_json(self.manager.aggregate(dimensoes, **filtros), etag=etag)
+            return
+        if any(query.get(campo) for campo in ("status", "prioridade", "tag")):
+            raise ValueError("Os filtros de stats exigem 'by'")
+        self._enviar_json(self.manager.get_statistics(), etag=etag)
+
+    def _agenda(self):
+        limite = _inteiro(self._parametros("limite").get("limite"), "limite", 10, 1, LIMITE_MAXIMO)
+        # A agenda muda com a data, não só com a revisão: sem ETag
+        atrasadas, proximas = self.manager.get_agenda(limite)
+        self._enviar_json({"atrasadas": [t.to_dict() for t in atrasadas],
+                           "proximas": [t.to_dict() for t in proximas]})
+
+    def _mudancas(self):
+        since = _inteiro(self._parametros("since", "format").get("since"), "since", 0)
+        formato = self._formato()
+        etag = self._etag()
+        if self._nao_modificado(etag):
+            return
+        eventos = [evento.to_dict() for evento in self.manager.changes(since)]
+        cabecalhos = {"X-Revision": str(self.manager.revision)}
+        if formato == "ndjson":
+            self._enviar_ndjson(eventos, etag, cabecalhos)
+        else:
+            self._enviar_json({"revisao": self.manager.revision, "eventos": eventos},
+                              etag=etag, cabecalhos=cabecalhos)
+
+    def _metricas(self):
+        self._parametros()
+        texto = render_prometheus(self.manager.metrics())
+        texto += render_prometheus({"operacoes": self.server.http_metrics.snapshot()},
+                                   prefixo="taskcrafter_http")
+        self._enviar(200, texto.encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+
+
+def serve(manager: TaskManager, host: str = "127.0.0.1", port: int = 8080,
+          quiet: bool = False, pronto: Optional[Callable[[TaskServer], None]] = None):
+    """Atende requisições até ser interrompido (Ctrl+C).
+
+    Args:
+        manager: Gerenciador do armazenamento servido
+        host: Endereço de escuta
+        port: Porta (0 escolhe uma porta livre)
+        quiet: Se True, não registra as requisições em stderr
+        pronto: Chamada com o servidor assim que ele estiver escutando
+    """
+    with TaskServer((host, port), manager, quiet) as servidor:
+        if pronto is not None:
+            pronto(servidor)
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            print(file=sys.stderr)
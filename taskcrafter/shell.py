@@ -0,0 +1,265 @@
+"""Shell interativo do TaskCrafter CLI.
+
+Este módulo implementa um REPL (``cmd.Cmd``) que executa os mesmos
+subcomandos da CLI contra um único ``TaskManager`` residente: o arquivo é
+carregado e os índices são construídos uma vez, e cada comando custa apenas
+o próprio processamento. As alterações são gravadas em segundo plano
+(write-behind) pouco depois de cada mutação, no comando ``salvar`` e ao sair.
+
+Se outro processo gravar o arquivo enquanto há alterações pendentes, a
+gravação é recusada (``StoreConflictError``); o shell recarrega as tarefas e
+reaplica os comandos da sessão ainda não gravados sobre a versão atual.
+"""
+
+import argparse
+import cmd
+import io
+import sys
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from typing import List, Optional, Tuple
+
+from .manager import StoreConflictError
+
+
+OPCOES_TAG = ('-t', '--tag', '--tags')
+TENTATIVAS_CONFLITO = 3
+COMANDOS_COM_TAREFA = ('update', 'done', 'delete')
+
+
+class TaskShell(cmd.Cmd):
+    """REPL que reutiliza os subcomandos de ``TaskCrafterCLI``.
+
+    Attributes:
+        cli: CLI cujo gerenciador e comandos são usados
+        intervalo: Segundos entre a primeira alteração não gravada e a gravação
+            em segundo plano (0 ou menos grava ao fim de cada comando)
+    """
+
+    intro = "🐚 TaskCrafter shell — 'help' lista os comandos, 'salvar' grava e 'sair' encerra."
+    prompt = "taskcrafter> "
+
+    def __init__(self, cli, intervalo: float = 2.0, stdin=None, stdout=None):
+        """Inicializa o shell.
+
+        Args:
+            cli: Instância de ``TaskCrafterCLI``
+            intervalo: Atraso da gravação em segundo plano, em segundos
+            stdin: Entrada alternativa (desativa o readline)
+            stdout: Saída alternativa para as mensagens do próprio shell
+        """
+        super().__init__(stdin=stdin, stdout=stdout)
+        if stdin is not None:
+            self.use_rawinput = False
+        self.cli = cli
+        self.intervalo = intervalo
+        self._parser = cli._line_parser()
+        self._comandos = sorted(_subcomandos(self._parser))
+        self._trava = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._nao_gravadas: List[str] = []
+        self._cache_titulos: Tuple[int, List[str]] = (-1, [])
+
+    @property
+    def manager(self):
+        """Gerenciador residente da CLI."""
+        return self.cli.manager
+
+    def cmdloop(self, intro=None):
+        """Executa o laço interativo dentro de um lote do gerenciador.
+
+        As mutações só alteram a memória; a gravação acontece em segundo
+        plano, no comando ``salvar`` e, por fim, ao sair do lote.
+        """
+        with self.manager.batch():
+            try:
+                super().cmdloop(intro)
+            except KeyboardInterrupt:
+                print(file=self.stdout)
+            finally:
+                self._cancelar_gravacao()
+                self._gravar()
+
+    # Execução
+
+    def default(self, line: str):
+        """Executa a linha como um subcomando da CLI."""
+        with self._trava:
+            revisao = self.manager.revision
+            try:
+                try:
+                    self.cli._run_command_line(self._parser, line)
+                except StoreConflictError:
+                    # Comandos que gravam na hora (archive) recarregam as tarefas ao falhar
+                    self._reaplicar()
+                    revisao = self.manager.revision
+                    self.cli._run_command_line(self._parser, line)
+            except Exception as e:
+                print(f"❌ Erro: {e}", file=sys.stderr)
+            if self.manager.revision != revisao:
+                self._nao_gravadas.append(line)
+        self._agendar_gravacao()
+
+    def emptyline(self):
+        """Linha vazia não repete o último comando."""
+
+    def do_help(self, arg: str):
+        """Mostra a ajuda geral ou de um comando: help [comando]"""
+        if arg in ('salvar', 'sair', 'quit', 'exit'):
+            super().do_help(arg)
+            return
+        with self._trava:
+            try:
+                self.cli._run_command_line(self._parser, f"{arg} --help" if arg else "--help")
+            except ValueError as e:
+                print(f"❌ Erro: {e}", file=sys.stderr)
+        print("\nComandos do shell: salvar, sair", file=self.stdout)
+
+    def do_salvar(self, arg: str):
+        """Grava imediatamente as alterações pendentes: salvar"""
+        with self._trava:
+            self._cancelar_gravacao()
+            if self._flush():
+                print("💾 Alterações gravadas", file=self.stdout)
+            else:
+                print("💾 Nada a gravar", file=self.stdout)
+
+    def do_sair(self, arg: str):
+        """Grava as alterações pendentes e encerra o shell: sair"""
+        return True
+
+    do_quit = do_exit = do_sair
+
+    def do_EOF(self, arg: str):
+        """Encerra o shell com Ctrl+D."""
+        print(file=self.stdout)
+        return True
+
+    # Write-behind
+
+    def _agendar_gravacao(self):
+        """Agenda a gravação das alterações pendentes, se ainda não agendada."""
+        if not self.manager.pending_save:
+            return
+        if self.intervalo <= 0:
+            self._gravar()
+            return
+        with self._trava:
+            if self._timer is None:
+                self._timer = threading.Timer(self.intervalo, self._gravar)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _gravar(self):
+        """Grava as alterações pendentes (executado pelo timer e ao sair)."""
+        with self._trava:
+            self._timer = None
+            try:
+                self._flush()
+            except Exception as e:
+                print(f"❌ Falha ao gravar as alterações: {e}", file=sys.stderr)
+
+    def _flush(self) -> bool:
+        """Grava as alterações pendentes, reaplicando-as se outro processo gravou antes.
+
+        Returns:
+            True se havia alterações pendentes e elas foram gravadas
+
+        Raises:
+            StoreConflictError: Se o conflito persistir após ``TENTATIVAS_CONFLITO`` recargas
+        """
+        tentativas = 1
+        while True:
+            try:
+                gravou = self.manager.flush()
+            except StoreConflictError:
+                if tentativas == TENTATIVAS_CONFLITO:
+                    raise
+                tentativas += 1
+                self._reaplicar()
+                continue
+            self._nao_gravadas = []
+            return gravou
+
+    def _reaplicar(self):
+        """Recarrega as tarefas gravadas por outro processo e reexecuta os comandos não gravados."""
+        linhas, self._nao_gravadas = self._nao_gravadas, []
+        self.manager.load_tasks()
+        falhas = []
+        for linha in linhas:
+            revisao = self.manager.revision
+            saida = io.StringIO()
+            try:
+                with redirect_stdout(saida), redirect_stderr(saida):
+                    self.cli._run_command_line(self._parser, linha)
+            except Exception as e:
+                falhas.append((linha, e))
+            if self.manager.revision != revisao:
+                self._nao_gravadas.append(linha)
+        print(f"⚠️  O arquivo foi alterado por outro processo; {len(linhas) - len(falhas)} "
+              f"comando(s) não gravado(s) reaplicado(s) sobre a versão atual", file=sys.stderr)
+        for linha, erro in falhas:
+            print(f"❌ Não reaplicado: {linha} ({erro})", file=sys.stderr)
+
+    def _cancelar_gravacao(self):
+        """Cancela a gravação agendada (a gravação pendente continua pendente)."""
+        with self._trava:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    # Completação
+
+    def completenames(self, text: str, *ignored) -> List[str]:
+        """Completa o nome do comando."""
+        nomes = self._comandos + ['help', 'salvar', 'sair']
+        return [nome for nome in nomes if nome.startswith(text)]
+
+    def completedefault(self, text: str, line: str, begidx: int, endidx: int) -> List[str]:
+        """Completa tags após -t/--tag/--tags e títulos nos comandos que recebem uma tarefa."""
+        palavras = line[:begidx].split()
+        if not palavras:
+            return []
+        opcoes = [p for p in palavras[1:] if p.startswith('-')]
+        if opcoes and opcoes[-1] in OPCOES_TAG:
+            # O readline pode separar a palavra em "/": completa a tag inteira e devolve o resto
+            palavra = line[line.rfind(' ', 0, endidx) + 1:endidx]
+            deslocamento = len(palavra) - len(text)
+            if deslocamento < 0:
+                return []
+            return [tag[deslocamento:] for tag in self.manager.complete_tags(palavra)]
+        if palavras[0] in COMANDOS_COM_TAREFA and not opcoes:
+            return self._completar_titulo(text, line[len(palavras[0]):endidx])
+        return []
+
+    def _completar_titulo(self, text: str, digitado: str) -> List[str]:
+        """Completa um título, que pode conter espaços (e estar entre aspas).
+
+        Args:
+            text: Palavra sob o cursor (o que o readline vai substituir)
+            digitado: Tudo o que foi digitado após o comando
+        """
+        prefixo = digitado.lstrip()
+        if prefixo[:1] in ('"', "'"):
+            prefixo = prefixo[1:]
+        deslocamento = len(prefixo) - len(text)
+        if deslocamento < 0:
+            return []
+        prefixo = prefixo.lower()
+        return [titulo[deslocamento:] for titulo in self._titulos() if titulo.lower().startswith(prefixo)]
+
+    def _titulos(self) -> List[str]:
+        """Títulos atuais, recalculados apenas quando a revisão muda."""
+        revisao, titulos = self._cache_titulos
+        if revisao != self.manager.revision:
+            titulos = sorted(task.titulo for task in self.manager.tasks)
+            self._cache_titulos = (self.manager.revision, titulos)
+        return titulos
+
+
+def _subcomandos(parser: argparse.ArgumentParser) -> List[str]:
+    """Nomes dos subcomandos registrados no parser (exceto os que não cabem no shell)."""
+    for acao in parser._actions:
+        if isinstance(acao, argparse._SubParsersAction):
+            return [nome for nome in acao.choices if nome not in ('batch', 'shell')]
+    return []
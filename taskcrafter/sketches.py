@@ -0,0 +1,422 @@
+"""Estatísticas aproximadas do TaskCrafter CLI.
+
+Para armazenamentos com arquivos de dezenas de milhões de tarefas, contar
+tudo a cada consulta é lento demais para uso interativo. Os esboços abaixo
+resumem as tarefas em memória fixa, são atualizados a cada mutação e podem
+ser somados (segmentos arquivados), como os esboços de lead time de
+``flow.py``:
+
+* ``HyperLogLog``: quantidade de tags distintas (erro padrão 1,04/√m);
+* ``CountMinSketch`` com uma lista de candidatos (``heavy hitters``): tags
+  mais frequentes, com superestimação de no máximo ε·N (ε = e/largura) com
+  probabilidade 1 − e^−profundidade;
+* ``StatusSample``: amostra de tamanho limitado das tarefas de cada status,
+  de onde sai a distribuição por prioridade com intervalo de confiança.
+
+Os hashes são calculados com ``blake2b``, de modo que esboços gravados por
+processos diferentes continuam compatíveis.
+"""
+
+import base64
+import math
+from collections import Counter
+from hashlib import blake2b
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .models import Task
+
+
+Z_95 = 1.96
+"""Quantil da normal para intervalos de 95%."""
+
+
+def _hash64(texto: str, salt: bytes = b"") -> int:
+    """Hash estável de 64 bits de um texto."""
+    return int.from_bytes(blake2b(texto.encode("utf-8"), digest_size=8, salt=salt).digest(), "little")
+
+
+class HyperLogLog:
+    """Contagem aproximada de elementos distintos.
+
+    Só aceita inclusões: elementos de tarefas removidas continuam contados,
+    então a estimativa inclui tags que já saíram de uso.
+
+    Attributes:
+        precisao: Bits do índice do registrador (m = 2^precisao registradores)
+    """
+
+    def __init__(self, precisao: int = 12):
+        """Inicializa um esboço vazio.
+
+        Args:
+            precisao: Entre 4 e 16; o erro padrão é 1,04/√(2^precisao)
+        """
+        if not 4 <= precisao <= 16:
+            raise ValueError("A precisão do HyperLogLog deve estar entre 4 e 16")
+        self.precisao = precisao
+        self._registradores = bytearray(1 << precisao)
+
+    @property
+    def erro_padrao(self) -> float:
+        """Erro relativo padrão da estimativa."""
+        return 1.04 / math.sqrt(len(self._registradores))
+
+    def add(self, valor: str):
+        """Registra um elemento."""
+        h = _hash64(valor)
+        indice = h >> (64 - self.precisao)
+        resto = h & ((1 << (64 - self.precisao)) - 1)
+        posto = (64 - self.precisao) - resto.bit_length() + 1
+        if posto > self._registradores[indice]:
+            self._registradores[indice] = posto
+
+    def merge(self, outro: 'HyperLogLog'):
+        """Une outro esboço a este.
+
+        Raises:
+            ValueError: Se os esboços tiverem precisões diferentes
+        """
+        if outro.precisao != self.precisao:
+            raise ValueError("Não é possível mesclar HyperLogLogs com precisões diferentes")
+        self._registradores = bytearray(map(max, self._registradores, outro._registradores))
+
+    def estimate(self) -> float:
+        """Estimativa da quantidade de elementos distintos."""
+        m = len(self._registradores)
+        alfa = 0.7213 / (1 + 1.079 / m)
+        estimativa = alfa * m * m / sum(2.0 ** -r for r in self._registradores)
+        vazios = self._registradores.count(0)
+        if estimativa <= 2.5 * m and vazios:
+            # Poucos elementos: contagem linear pelos registradores vazios
+            estimativa = m * math.log(m / vazios)
+        return estimativa
+
+    def to_dict(self) -> dict:
+        """Converte o esboço para dicionário (serializável em JSON)."""
+        return {"precisao": self.precisao,
+                "registradores": base64.b64encode(bytes(self._registradores)).decode("ascii")}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'HyperLogLog':
+        """Cria o esboço a partir de um dicionário."""
+        hll = cls(data["precisao"])
+        hll._registradores = bytearray(base64.b64decode(data["registradores"]))
+        return hll
+
+
+class CountMinSketch:
+    """Frequências aproximadas com candidatos aos mais frequentes.
+
+    Aceita remoções (contagens negativas) enquanto as frequências reais não
+    ficam negativas; a estimativa nunca é menor que a frequência real.
+
+    Attributes:
+        largura: Colunas por linha (ε = e/largura)
+        profundidade: Linhas (δ = e^−profundidade)
+        capacidade: Tamanho da lista de candidatos aos mais frequentes
+        total: Soma das frequências (N)
+    """
+
+    def __init__(self, largura: int = 2048, profundidade: int = 5, capacidade: int = 64):
+        """Inicializa um esboço vazio.
+
+        Args:
+            largura: Colunas por linha
+            profundidade: Linhas
+            capacidade: Candidatos mantidos aos mais frequentes
+        """
+        self.largura = largura
+        self.profundidade = profundidade
+        self.capacidade = capacidade
+        self.total = 0
+        self._linhas = [[0] * largura for _ in range(profundidade)]
+        self._candidatos: Dict[str, int] = {}
+
+    @property
+    def epsilon(self) -> float:
+        """Fração de N que limita a superestimação."""
+        return math.e / self.largura
+
+    @property
+    def delta(self) -> float:
+        """Probabilidade de a superestimação passar de ε·N."""
+        return math.exp(-self.profundidade)
+
+    def _colunas(self, item: str) -> List[int]:
+        digest = blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + linha * h2) % self.largura for linha in range(self.profundidade)]
+
+    def _consultar(self, colunas: List[int]) -> int:
+        return min(linha[coluna] for linha, coluna in zip(self._linhas, colunas))
+
+    def add(self, item: str, n: int = 1):
+        """Acrescenta ``n`` ocorrências do item (``n`` negativo remove)."""
+        colunas = self._colunas(item)
+        for linha, coluna in zip(self._linhas, colunas):
+            linha[coluna] += n
+        self.total += n
+        self._oferecer(item, self._consultar(colunas))
+
+    def _oferecer(self, item: str, estimativa: int):
+        """Atualiza a lista de candidatos com a estimativa atual do item."""
+        candidatos = self._candidatos
+        if item in candidatos or len(candidatos) < self.capacidade:
+            if estimativa > 0:
+                candidatos[item] = estimativa
+            else:
+                candidatos.pop(item, None)
+            return
+        menor = min(candidatos, key=candidatos.get)
+        if estimativa > candidatos[menor]:
+            del candidatos[menor]
+            candidatos[item] = estimativa
+
+    def query(self, item: str) -> int:
+        """Frequência estimada do item (limite superior)."""
+        return self._consultar(self._colunas(item))
+
+    def top(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Os ``n`` candidatos mais frequentes, com as frequências estimadas."""
+        estimativas = [(item, self.query(item)) for item in self._candidatos]
+        estimativas.sort(key=lambda par: (-par[1], par[0]))
+        return [par for par in estimativas[:n] if par[1] > 0]
+
+    def merge(self, outro: 'CountMinSketch'):
+        """Soma outro esboço a este e reavalia os candidatos.
+
+        Raises:
+            ValueError: Se as dimensões forem diferentes
+        """
+        if (outro.largura, outro.profundidade) != (self.largura, self.profundidade):
+            raise ValueError("Não é possível mesclar esboços count-min de dimensões diferentes")
+        for linha, outra in zip(self._linhas, outro._linhas):
+            for coluna, valor in enumerate(outra):
+                if valor:
+                    linha[coluna] += valor
+        self.total += outro.total
+        itens = set(self._candidatos) | set(outro._candidatos)
+        estimativas = sorted(((self.query(item), item) for item in itens), reverse=True)
+        self._candidatos = {item: n for n, item in estimativas[:self.capacidade] if n > 0}
+
+    def to_dict(self) -> dict:
+        """Converte o esboço para dicionário (serializável em JSON)."""
+        return {"largura": self.largura, "profundidade": self.profundidade, "capacidade": self.capacidade,
+                "total": self.total, "linhas": self._linhas, "candidatos": self._candidatos}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CountMinSketch':
+        """Cria o esboço a partir de um dicionário."""
+        sketch = cls(data["largura"], data["profundidade"], data["capacidade"])
+        sketch.total = data["total"]
+        sketch._linhas = data["linhas"]
+        sketch._candidatos = dict(data["candidatos"])
+        return sketch
+
+
+class StatusSample:
+    """Amostra uniforme e mesclável das tarefas de um status.
+
+    Cada tarefa recebe um valor pseudoaleatório fixo, derivado do id; a
+    amostra é formada pelas tarefas com valor abaixo de um limiar, que
+    desce quando a amostra passa da capacidade. Ao contrário de um
+    reservatório clássico, remover uma tarefa não distorce a amostra e duas
+    amostras se unem pelo menor limiar.
+
+    Attributes:
+        capacidade: Tamanho máximo da amostra
+        populacao: Quantidade de tarefas no status
+        limiar: Valor abaixo do qual uma tarefa entra na amostra
+        itens: Prioridade de cada tarefa amostrada, por id
+    """
+
+    def __init__(self, capacidade: int = 512):
+        self.capacidade = capacidade
+        self.populacao = 0
+        self.limiar = 1.0
+        self.itens: Dict[int, Tuple[float, str]] = {}
+
+    @staticmethod
+    def _valor(task_id: int) -> float:
+        return _hash64(str(task_id), salt=b"amostra") / 2.0 ** 64
+
+    def add(self, task_id: int, prioridade: str):
+        """Inclui uma tarefa no status."""
+        self.populacao += 1
+        valor = self._valor(task_id)
+        if valor < self.limiar:
+            self.itens[task_id] = (valor, prioridade)
+            self._cortar()
+
+    def remove(self, task_id: int):
+        """Retira uma tarefa incluída antes com ``add``."""
+        self.populacao -= 1
+        self.itens.pop(task_id, None)
+
+    def _cortar(self):
+        """Descarta as tarefas de maior valor até a amostra caber na capacidade."""
+        if len(self.itens) <= self.capacidade:
+            return
+        ordenados = sorted(self.itens.items(), key=lambda par: par[1][0])
+        self.limiar = ordenados[self.capacidade][1][0]
+        self.itens = dict(ordenados[:self.capacidade])
+
+    def merge(self, outra: 'StatusSample'):
+        """Une outra amostra (de tarefas diferentes) a esta."""
+        self.populacao += outra.populacao
+        self.limiar = min(self.limiar, outra.limiar)
+        itens = {**self.itens, **outra.itens}
+        self.itens = {task_id: item for task_id, item in itens.items() if item[0] < self.limiar}
+        self._cortar()
+
+    def estimate(self) -> Dict[str, Dict[str, int]]:
+        """Estima quantas tarefas do status têm cada prioridade.
+
+        Returns:
+            Por prioridade: ``estimativa`` e ``erro`` (meia largura do
+            intervalo de 95%, com correção para população finita)
+        """
+        n, total = len(self.itens), self.populacao
+        contagens = Counter(item[1] for item in self.itens.values())
+        resultado = {}
+        for valor, k in sorted(contagens.items()):
+            p = k / n
+            correcao = math.sqrt((total - n) / (total - 1)) if total > 1 and total > n else 0.0
+            resultado[valor] = {"estimativa": round(p * total),
+                                "erro": math.ceil(Z_95 * math.sqrt(p * (1 - p) / n) * correcao * total)}
+        return resultado
+
+    def to_dict(self) -> dict:
+        """Converte a amostra para dicionário (serializável em JSON)."""
+        return {"capacidade": self.capacidade, "populacao": self.populacao, "limiar": self.limiar,
+                "itens": [[task_id, valor, prioridade] for task_id, (valor, prioridade) in self.itens.items()]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StatusSample':
+        """Cria a amostra a partir de um dicionário."""
+        amostra = cls(data["capacidade"])
+        amostra.populacao = data["populacao"]
+        amostra.limiar = data["limiar"]
+        amostra.itens = {task_id: (valor, prioridade) for task_id, valor, prioridade in data["itens"]}
+        return amostra
+
+
+def _campos(registro: Union[Task, dict]) -> Tuple[int, str, str, List[str]]:
+    """Extrai id, status, prioridade e tags de uma tarefa ou registro."""
+    if isinstance(registro, Task):
+        return registro.id, registro.status, registro.prioridade, registro.tags
+    return (registro.get("id"), registro.get("status"), registro.get("prioridade"),
+            registro.get("tags") or [])
+
+
+class StoreSketches:
+    """Esboços de um armazenamento (ou de um segmento arquivado).
+
+    Attributes:
+        tags_distintas: HyperLogLog das tags
+        frequencia_tags: Count-min e candidatos das tags mais frequentes
+        amostras: Amostra das tarefas de cada status
+    """
+
+    def __init__(self):
+        self.tags_distintas = HyperLogLog()
+        self.frequencia_tags = CountMinSketch()
+        self.amostras: Dict[str, StatusSample] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Union[Task, dict]]) -> 'StoreSketches':
+        """Calcula os esboços das tarefas (ou registros) em uma passada."""
+        esbocos = cls()
+        for task in tasks:
+            esbocos.add(task)
+        return esbocos
+
+    def _ajustar(self, registro: Union[Task, dict], n: int):
+        task_id, status, prioridade, tags = _campos(registro)
+        for tag in dict.fromkeys(tags):
+            if n > 0:
+                self.tags_distintas.add(tag)
+            self.frequencia_tags.add(tag, n)
+        amostra = self.amostras.get(status)
+        if amostra is None:
+            amostra = self.amostras[status] = StatusSample()
+        if n > 0:
+            amostra.add(task_id, prioridade)
+        else:
+            amostra.remove(task_id)
+
+    def add(self, registro: Union[Task, dict]):
+        """Conta uma tarefa (ou registro)."""
+        self._ajustar(registro, 1)
+
+    def remove(self, registro: Union[Task, dict]):
+        """Desconta uma tarefa (ou registro) contada antes com ``add``."""
+        self._ajustar(registro, -1)
+
+    def apply(self, antes: Optional[Union[Task, dict]], depois: Optional[Union[Task, dict]]):
+        """Aplica uma mutação: desconta o estado anterior e conta o novo.
+
+        Args:
+            antes: Estado anterior (None em inclusões)
+            depois: Estado posterior (None em remoções)
+        """
+        if antes is not None:
+            self.remove(antes)
+        if depois is not None:
+            self.add(depois)
+
+    def merge(self, outros: 'StoreSketches'):
+        """Soma os esboços de outras tarefas (ex.: um segmento arquivado) a estes."""
+        self.tags_distintas.merge(outros.tags_distintas)
+        self.frequencia_tags.merge(outros.frequencia_tags)
+        for status, amostra in outros.amostras.items():
+            if status not in self.amostras:
+                self.amostras[status] = StatusSample(amostra.capacidade)
+            self.amostras[status].merge(amostra)
+
+    def report(self, top: int = 10) -> Dict:
+        """Resume os esboços com os limites de erro de cada estimativa.
+
+        Args:
+            top: Quantidade de tags mais frequentes
+
+        Returns:
+            Dicionário com ``total``, ``por_status`` (total exato e
+            prioridades estimadas pela amostra), ``tags_distintas`` e
+            ``top_tags``
+        """
+        frequencia = self.frequencia_tags
+        distintas = self.tags_distintas.estimate()
+        margem = math.ceil(frequencia.epsilon * frequencia.total)
+        return {
+            "total": sum(amostra.populacao for amostra in self.amostras.values()),
+            "por_status": {
+                status: {"total": amostra.populacao, "amostra": len(amostra.itens),
+                         "por_prioridade": amostra.estimate()}
+                for status, amostra in sorted(self.amostras.items()) if amostra.populacao > 0
+            },
+            "tags_distintas": {"estimativa": round(distintas),
+                               "erro": math.ceil(2 * self.tags_distintas.erro_padrao * distintas)},
+            "top_tags": [
+                {"tag": tag, "estimativa": n, "minimo": max(n - margem, 0)}
+                for tag, n in frequencia.top(top)
+            ],
+            "confianca_top_tags": 1 - frequencia.delta,
+        }
+
+    def to_dict(self) -> dict:
+        """Converte os esboços para dicionário (serializável em JSON)."""
+        return {
+            "tags_distintas": self.tags_distintas.to_dict(),
+            "frequencia_tags": self.frequencia_tags.to_dict(),
+            "amostras": {status: amostra.to_dict() for status, amostra in self.amostras.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StoreSketches':
+        """Cria os esboços a partir de um dicionário."""
+        esbocos = cls()
+        esbocos.tags_distintas = HyperLogLog.from_dict(data["tags_distintas"])
+        esbocos.frequencia_tags = CountMinSketch.from_dict(data["frequencia_tags"])
+        esbocos.amostras = {status: StatusSample.from_dict(a) for status, a in data["amostras"].items()}
+        return esbocos
@@ -0,0 +1,163 @@
+"""Sincronização entre armazenamentos do TaskCrafter CLI.
+
+Cada armazenamento é uma réplica com identificador próprio. A sincronização
+troca apenas as tarefas alteradas desde o último ponto de sincronização
+(lidas do log de mudanças de cada lado) e resolve conflitos de forma
+determinística: vence a versão com a maior chave
+``(modificado_em, replica)``; em empate exato, a remoção vence.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from .manager import TaskManager
+
+
+@dataclass
+class SyncResult:
+    """Resumo de uma sincronização.
+
+    Attributes:
+        enviadas: Versões aplicadas no armazenamento remoto
+        recebidas: Versões aplicadas no armazenamento local
+        conflitos: Tarefas alteradas dos dois lados desde a última sincronização
+        completa: Se foi uma troca completa (primeira sincronização entre o par)
+    """
+
+    enviadas: int = 0
+    recebidas: int = 0
+    conflitos: int = 0
+    completa: bool = False
+
+
+@dataclass
+class _Versao:
+    """Estado de uma tarefa em uma réplica: conteúdo ou remoção."""
+
+    titulo: str
+    dados: Optional[dict]
+    data: str
+    replica: str
+
+    def chave(self) -> Tuple[str, str, int, str]:
+        """Chave total de ordenação usada na resolução de conflitos."""
+        return (self.data, self.replica, self.dados is None,
+                json.dumps(self.dados, sort_keys=True, ensure_ascii=False))
+
+
+def _versao_da_tarefa(dados: dict) -> _Versao:
+    """Monta a versão a partir do estado serializado de uma tarefa."""
+    # Ids são locais a cada armazenamento e não fazem parte da versão
+    dados = {campo: valor for campo, valor in dados.items() if campo != "id"}
+    return _Versao(dados["titulo"], dados,
+                   dados.get("modificado_em") or dados["data_criacao"],
+                   dados.get("replica") or "")
+
+
+def _versoes_do_log(manager: TaskManager, eventos) -> Dict[str, _Versao]:
+    """Reduz uma sequência de eventos à última versão de cada tarefa.
+
+    Os eventos não trazem a descrição; a última versão de uma tarefa que
+    ainda existe é o seu estado atual, lido do armazenamento.
+
+    Args:
+        manager: Armazenamento de onde vieram os eventos
+        eventos: Eventos em ordem crescente de revisão
+
+    Returns:
+        Versões indexadas pelo título em minúsculas
+    """
+    versoes: Dict[str, _Versao] = {}
+    for evento in eventos:
+        if evento.antes and evento.depois and evento.antes["titulo"].lower() != evento.depois["titulo"].lower():
+            # Renomeação: o título antigo deixa de existir
+            versoes[evento.antes["titulo"].lower()] = _Versao(
+                evento.antes["titulo"], None, evento.data, evento.replica or ""
+            )
+        if evento.depois is None:
+            versoes[evento.titulo.lower()] = _Versao(evento.titulo, None, evento.data, evento.replica or "")
+        else:
+            versoes[evento.depois["titulo"].lower()] = _versao_da_tarefa(evento.depois)
+    for chave, versao in versoes.items():
+        if versao.dados is not None:
+            versoes[chave] = _versao_atual(manager, versao.titulo) or versao
+    return versoes
+
+
+def _versoes_completas(manager: TaskManager) -> Dict[str, _Versao]:
+    """Todas as tarefas atuais mais as remoções registradas no log."""
+    versoes = {
+        chave: versao for chave, versao in _versoes_do_log(manager, manager.changes(since=0)).items()
+        if versao.dados is None
+    }
+    for task in manager.tasks:
+        versoes[task.titulo.lower()] = _versao_da_tarefa(task.to_dict())
+    return versoes
+
+
+def _versao_atual(manager: TaskManager, titulo: str) -> Optional[_Versao]:
+    """Versão atual de uma tarefa no armazenamento, se existir."""
+    task = manager.get_task_by_title(titulo)
+    return _versao_da_tarefa(task.to_dict()) if task else None
+
+
+def _aplicar(manager: TaskManager, versao: _Versao) -> bool:
+    """Aplica a versão se ela for mais nova que o estado atual do destino."""
+    atual = _versao_atual(manager, versao.titulo)
+    if versao.dados is None and atual is None:
+        return False
+    if atual is not None and atual.chave() >= versao.chave():
+        return False
+    manager.apply_version(versao.titulo, versao.dados, versao.data, versao.replica)
+    return True
+
+
+def sync_stores(local: TaskManager, remoto: TaskManager) -> SyncResult:
+    """Sincroniza dois armazenamentos nos dois sentidos.
+
+    O trabalho é proporcional às tarefas alteradas desde a última
+    sincronização entre o par; na primeira vez, todas as tarefas são trocadas.
+
+    Args:
+        local: Armazenamento local
+        remoto: Outro armazenamento (outra máquina, montado localmente)
+
+    Returns:
+        Resumo da sincronização
+    """
+    if local.replica_id == remoto.replica_id:
+        raise ValueError("Os dois armazenamentos são a mesma réplica")
+
+    ponto = local.sync_point(remoto.replica_id)
+    resultado = SyncResult(completa=ponto is None)
+    if ponto is None:
+        mudancas_local = _versoes_completas(local)
+        mudancas_remoto = _versoes_completas(remoto)
+    else:
+        mudancas_local = _versoes_do_log(local, local.changes(since=ponto["local"]))
+        mudancas_remoto = _versoes_do_log(remoto, remoto.changes(since=ponto["remoto"]))
+
+    for chave in mudancas_local.keys() | mudancas_remoto.keys():
+        versao_local = mudancas_local.get(chave)
+        versao_remota = mudancas_remoto.get(chave)
+        if versao_local and versao_remota:
+            if versao_local.chave() == versao_remota.chave():
+                continue
+            if not resultado.completa:
+                resultado.conflitos += 1
+        vencedora = max(filter(None, (versao_local, versao_remota)), key=_Versao.chave)
+        if _aplicar(remoto, vencedora):
+            resultado.enviadas += 1
+        if _aplicar(local, vencedora):
+            resultado.recebidas += 1
+
+    if resultado.recebidas:
+        local.save_tasks()
+    if resultado.enviadas:
+        remoto.save_tasks()
+
+    # Registra o ponto de sincronização dos dois lados
+    local.set_sync_point(remoto.replica_id, local.revision, remoto.revision)
+    remoto.set_sync_point(local.replica_id, remoto.revision, local.revision)
+    return resultado
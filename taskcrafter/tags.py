@@ -0,0 +1,178 @@
+"""Tags hierárquicas do TaskCrafter CLI.
+
+Tags podem formar uma taxonomia com ``/`` como separador (ex.:
+``cliente/acme/infra``). Um filtro de tag aceita três formas:
+
+* ``cliente/acme``: exatamente essa tag;
+* ``cliente/acme/*``: a tag e tudo abaixo dela (subárvore);
+* ``cli*``: toda tag que começa com o texto (prefixo).
+
+O ``TagTrie`` guarda as tags em uma árvore de segmentos, com os ids das
+tarefas em cada nó. Filtros, contagens e autocompletar percorrem só os nós
+das tags correspondentes, não as tarefas.
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .models import Task
+
+
+SEPARADOR = "/"
+CURINGA = "*"
+
+
+def tag_matcher(padrao: str) -> Callable[[Iterable[str]], bool]:
+    """Cria o predicado de um filtro de tag, aplicado às tags de uma tarefa.
+
+    Usado onde cada tarefa é avaliada individualmente (visões salvas,
+    agregações); consultas sobre todas as tarefas usam o ``TagTrie``.
+
+    Args:
+        padrao: Tag exata, ``tag/*`` (subárvore) ou ``prefixo*``
+
+    Returns:
+        Função que recebe as tags de uma tarefa e diz se alguma corresponde
+    """
+    if not padrao.endswith(CURINGA):
+        return lambda tags: padrao in tags
+    prefixo = padrao[:-1]
+    raiz = prefixo[:-1] if prefixo.endswith(SEPARADOR) else None
+    return lambda tags: any(tag.startswith(prefixo) or tag == raiz for tag in tags)
+
+
+class _No:
+    """Nó do trie: um segmento de tag."""
+
+    __slots__ = ("filhos", "tarefas")
+
+    def __init__(self):
+        self.filhos: Dict[str, '_No'] = {}
+        self.tarefas: Set[int] = set()
+
+
+class TagTrie:
+    """Árvore de segmentos de tags com as tarefas de cada tag.
+
+    Attributes:
+        tamanho: Quantidade de tags distintas em uso
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """Constrói o trie em O(tags das tarefas).
+
+        Args:
+            tasks: Tarefas iniciais
+        """
+        self._raiz = _No()
+        self._tags: Dict[int, Tuple[str, ...]] = {}
+        self.tamanho = 0
+        for task in tasks:
+            self.apply(task.id, task)
+
+    def apply(self, task_id: int, task: Optional[Task]):
+        """Atualiza o trie após uma mutação (custa O(tags alteradas)).
+
+        Args:
+            task_id: Id da tarefa alterada
+            task: Estado atual da tarefa (None se foi removida)
+        """
+        antigas = self._tags.pop(task_id, ())
+        novas = tuple(dict.fromkeys(task.tags)) if task is not None else ()
+        if novas:
+            self._tags[task_id] = novas
+        if antigas == novas:
+            return
+        for tag in set(antigas).difference(novas):
+            self._remover(tag, task_id)
+        for tag in set(novas).difference(antigas):
+            self._incluir(tag, task_id)
+
+    def _incluir(self, tag: str, task_id: int):
+        no = self._raiz
+        for segmento in tag.split(SEPARADOR):
+            no = no.filhos.setdefault(segmento, _No())
+        if not no.tarefas:
+            self.tamanho += 1
+        no.tarefas.add(task_id)
+
+    def _remover(self, tag: str, task_id: int):
+        caminho = [(None, self._raiz)]
+        for segmento in tag.split(SEPARADOR):
+            no = caminho[-1][1].filhos.get(segmento)
+            if no is None:
+                return
+            caminho.append((segmento, no))
+        no = caminho[-1][1]
+        no.tarefas.discard(task_id)
+        if not no.tarefas:
+            self.tamanho -= 1
+        # Poda os nós que ficaram sem tarefas e sem filhos
+        for (segmento, no), (_, pai) in zip(reversed(caminho[1:]), reversed(caminho[:-1])):
+            if no.tarefas or no.filhos:
+                break
+            del pai.filhos[segmento]
+
+    def _no(self, tag: str) -> Optional[_No]:
+        no = self._raiz
+        for segmento in tag.split(SEPARADOR):
+            no = no.filhos.get(segmento)
+            if no is None:
+                return None
+        return no
+
+    @staticmethod
+    def _subarvore(tag: str, no: _No) -> Iterator[Tuple[str, _No]]:
+        """Nós com tarefas a partir de ``no`` (inclusive), em ordem alfabética."""
+        pilha = [(tag, no)]
+        while pilha:
+            tag, no = pilha.pop()
+            if no.tarefas:
+                yield tag, no
+            for segmento in sorted(no.filhos, reverse=True):
+                pilha.append((f"{tag}{SEPARADOR}{segmento}", no.filhos[segmento]))
+
+    def _nos(self, padrao: str) -> Iterator[Tuple[str, _No]]:
+        """Nós das tags que correspondem ao padrão (ver o módulo), em ordem alfabética."""
+        if not padrao.endswith(CURINGA):
+            no = self._no(padrao)
+            if no is not None and no.tarefas:
+                yield padrao, no
+            return
+        prefixo = padrao[:-1]
+        *caminho, parcial = prefixo.split(SEPARADOR)
+        pai = self._no(SEPARADOR.join(caminho)) if caminho else self._raiz
+        if pai is None:
+            return
+        base = f"{SEPARADOR.join(caminho)}{SEPARADOR}" if caminho else ""
+        if not parcial and caminho and pai.tarefas:
+            # ``tag/*`` inclui a própria tag
+            yield base[:-1], pai
+        for segmento in sorted(pai.filhos):
+            if segmento.startswith(parcial):
+                yield from self._subarvore(base + segmento, pai.filhos[segmento])
+
+    def match(self, padrao: str) -> Set[int]:
+        """Ids das tarefas com alguma tag que corresponde ao padrão.
+
+        Args:
+            padrao: Tag exata, ``tag/*`` (subárvore) ou ``prefixo*``
+        """
+        ids: Set[int] = set()
+        for _, no in self._nos(padrao):
+            ids |= no.tarefas
+        return ids
+
+    def counts(self, padrao: str = CURINGA) -> List[Tuple[str, int]]:
+        """Tags que correspondem ao padrão com a quantidade de tarefas de cada uma.
+
+        Args:
+            padrao: Padrão das tags (padrão: todas)
+
+        Returns:
+            Pares (tag, tarefas), em ordem alfabética por segmento
+        """
+        return [(tag, len(no.tarefas)) for tag, no in self._nos(padrao)]
+
+    def complete(self, texto: str) -> List[str]:
+        """Tags em uso que começam com o texto (autocompletar)."""
+        return [tag for tag, _ in self._nos(texto + CURINGA)]
@@ -0,0 +1,268 @@
+"""Workspaces do TaskCrafter CLI: consultas federadas sobre vários armazenamentos.
+
+Um workspace é um manifesto JSON que lista arquivos de dados nomeados (um
+por equipe, por exemplo)::
+
+    {"lojas": [{"nome": "backend", "arquivo": "backend/tasks.json"},
+               {"nome": "mobile", "arquivo": "/srv/mobile/tasks.json"}]}
+
+Caminhos relativos são resolvidos a partir do diretório do manifesto. Cada
+consulta é executada em paralelo em todos os armazenamentos (um thread por
+armazenamento); cada um filtra, ordena e corta o seu resultado, e os
+resultados já ordenados são intercalados com ``heapq.merge``. Um
+armazenamento que falha, está danificado ou não responde dentro do prazo
+não derruba a consulta: o resultado é marcado como parcial. Os threads são
+daemon, então um armazenamento atrasado também não impede o processo de
+encerrar após o prazo.
+"""
+
+import heapq
+import itertools
+import json
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .aggregation import GroupBy
+from .indexes import CHAVES
+from .manager import TaskManager
+from .models import Task
+from .serialization import write_atomic
+
+
+@dataclass
+class Store:
+    """Armazenamento de um workspace.
+
+    Attributes:
+        nome: Nome único do armazenamento no workspace
+        arquivo: Caminho do arquivo de dados, como escrito no manifesto
+    """
+
+    nome: str
+    arquivo: str
+
+
+@dataclass
+class FederatedResult:
+    """Resultado de uma consulta federada.
+
+    Attributes:
+        itens: Itens do resultado (pares ``(loja, tarefa)`` ou grupos)
+        falhas: Motivo da falha de cada armazenamento que não contribuiu
+            (ou contribuiu só em parte)
+    """
+
+    itens: List[Any] = field(default_factory=list)
+    falhas: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def parcial(self) -> bool:
+        """Se algum armazenamento ficou de fora do resultado."""
+        return bool(self.falhas)
+
+
+class Workspace:
+    """Conjunto de armazenamentos consultados em conjunto.
+
+    Attributes:
+        caminho: Arquivo do manifesto
+        lojas: Armazenamentos, na ordem do manifesto
+    """
+
+    def __init__(self, caminho, lojas: Optional[List[Store]] = None):
+        """Inicializa o workspace.
+
+        Args:
+            caminho: Arquivo do manifesto
+            lojas: Armazenamentos (padrão: nenhum)
+        """
+        self.caminho = Path(caminho)
+        self.lojas = list(lojas or [])
+
+    @classmethod
+    def load(cls, caminho) -> 'Workspace':
+        """Lê o manifesto (um arquivo inexistente é um workspace vazio).
+
+        Raises:
+            ValueError: Se o manifesto for inválido
+        """
+        caminho = Path(caminho)
+        if not caminho.exists():
+            return cls(caminho)
+        try:
+            with open(caminho, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+            lojas = [Store(loja["nome"], loja["arquivo"]) for loja in dados["lojas"]]
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Manifesto de workspace inválido ({caminho}): {e}")
+        return cls(caminho, lojas)
+
+    def save(self):
+        """Grava o manifesto (substituição atômica)."""
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        conteudo = json.dumps({"lojas": [vars(loja) for loja in self.lojas]}, ensure_ascii=False, indent=2)
+        write_atomic(self.caminho, conteudo.encode('utf-8'))
+
+    def add_store(self, nome: str, arquivo: str) -> Store:
+        """Inclui (ou substitui) um armazenamento e grava o manifesto.
+
+        Args:
+            nome: Nome do armazenamento
+            arquivo: Caminho do arquivo de dados (relativo ao manifesto ou absoluto)
+
+        Raises:
+            ValueError: Se o nome for vazio
+        """
+        if not nome or not nome.strip():
+            raise ValueError("Nome do armazenamento não pode ser vazio")
+        loja = Store(nome.strip(), arquivo)
+        self.lojas = [l for l in self.lojas if l.nome != loja.nome] + [loja]
+        self.save()
+        return loja
+
+    def path(self, loja: Store) -> Path:
+        """Caminho do arquivo de dados de um armazenamento."""
+        return self.caminho.parent / Path(loja.arquivo).expanduser()
+
+    def _fan_out(self, consulta: Callable[[TaskManager], Any],
+                 timeout: Optional[float]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Executa a consulta em todos os armazenamentos em paralelo.
+
+        Args:
+            consulta: Função aplicada ao gerenciador de cada armazenamento
+            timeout: Prazo total em segundos (None: sem prazo)
+
+        Returns:
+            Tupla (resultado por armazenamento, falha por armazenamento)
+        """
+        def executar(loja: Store):
+            arquivo = self.path(loja)
+            if not arquivo.exists():
+                raise FileNotFoundError(f"arquivo {arquivo} não encontrado")
+            manager = TaskManager(str(arquivo))
+            dano = f"armazenamento danificado: {manager.damage.erro}" if manager.damage else None
+            return consulta(manager), dano
+
+        saidas: Dict[str, Tuple[bool, Any]] = {}
+
+        def executar_em_thread(loja: Store):
+            try:
+                saidas[loja.nome] = (True, executar(loja))
+            except Exception as e:
+                saidas[loja.nome] = (False, e)
+
+        threads = [
+            threading.Thread(target=executar_em_thread, args=(loja,), name=f"workspace-{loja.nome}", daemon=True)
+            for loja in self.lojas
+        ]
+        for thread in threads:
+            thread.start()
+        # Não espera os atrasados: o resultado parcial sai no prazo
+        prazo = None if timeout is None else time.monotonic() + timeout
+        for thread in threads:
+            thread.join(None if prazo is None else max(prazo - time.monotonic(), 0))
+        concluidas = dict(saidas)
+
+        resultados, falhas = {}, {}
+        for loja in self.lojas:
+            if loja.nome not in concluidas:
+                falhas[loja.nome] = f"tempo esgotado após {timeout:g}s"
+                continue
+            sucesso, valor = concluidas[loja.nome]
+            if not sucesso:
+                falhas[loja.nome] = str(valor) or type(valor).__name__
+                continue
+            resultados[loja.nome], dano = valor
+            if dano:
+                falhas[loja.nome] = dano
+        return resultados, falhas
+
+    def _merge(self, resultados: Dict[str, List[Task]], chave: Callable[[Task], Any],
+               limite: Optional[int]) -> List[Tuple[str, Task]]:
+        """Intercala listas já ordenadas, com desempate pela ordem do manifesto."""
+        fluxos = [
+            [(loja.nome, task) for task in resultados[loja.nome]]
+            for loja in self.lojas if loja.nome in resultados
+        ]
+        intercalados = heapq.merge(*fluxos, key=lambda par: chave(par[1]))
+        return list(itertools.islice(intercalados, limite))
+
+    def list_tasks(self, limite: Optional[int] = None, timeout: Optional[float] = None,
+                   ordenar_por: str = "data_criacao", **filtros) -> FederatedResult:
+        """Lista as tarefas de todos os armazenamentos em uma única ordenação.
+
+        Args:
+            limite: Quantidade máxima de tarefas (aplicada também em cada armazenamento)
+            timeout: Prazo total em segundos
+            ordenar_por: Critério de ordenação (ver ``TaskManager.list_tasks``)
+            **filtros: Filtros de ``TaskManager.list_tasks``
+
+        Returns:
+            Resultado com pares ``(loja, tarefa)``
+
+        Raises:
+            ValueError: Se o critério de ordenação for inválido
+        """
+        if ordenar_por not in CHAVES:
+            raise ValueError(f"Ordenação inválida. Use: {', '.join(CHAVES)}")
+        resultados, falhas = self._fan_out(
+            lambda manager: manager.list_tasks(ordenar_por=ordenar_por, **filtros)[:limite], timeout
+        )
+        return FederatedResult(self._merge(resultados, CHAVES[ordenar_por], limite), falhas)
+
+    def search(self, texto: str, campos: Tuple[str, ...] = ("titulo", "descricao"),
+               limite: Optional[int] = None, timeout: Optional[float] = None) -> FederatedResult:
+        """Busca texto em todos os armazenamentos (ver ``TaskManager.search``).
+
+        Returns:
+            Resultado com pares ``(loja, tarefa)``, em ordem de criação
+
+        Raises:
+            ValueError: Se o texto for vazio
+        """
+        if not texto or not texto.strip():
+            raise ValueError("Texto da busca não pode ser vazio")
+        resultados, falhas = self._fan_out(
+            lambda manager: sorted(manager.search(texto, campos), key=CHAVES["data_criacao"])[:limite],
+            timeout
+        )
+        return FederatedResult(self._merge(resultados, CHAVES["data_criacao"], limite), falhas)
+
+    def aggregate(self, by: List[str], timeout: Optional[float] = None, **filtros) -> FederatedResult:
+        """Soma as agregações de todos os armazenamentos (ver ``TaskManager.aggregate``).
+
+        Returns:
+            Resultado com os grupos somados, na mesma forma de ``TaskManager.aggregate``
+
+        Raises:
+            ValueError: Se uma dimensão ou filtro for inválido
+        """
+        # Valida antes de consultar, para que um erro de uso não pareça falha dos armazenamentos
+        GroupBy(by, {campo: valor for campo, valor in filtros.items() if valor}, ())
+        resultados, falhas = self._fan_out(lambda manager: manager.aggregate(by, **filtros), timeout)
+        totais: Counter = Counter()
+        for grupos in resultados.values():
+            for grupo in grupos:
+                totais[tuple(grupo[d] for d in by)] += grupo["total"]
+        itens = [{**dict(zip(by, chave)), "total": total} for chave, total in sorted(totais.items())]
+        return FederatedResult(itens, falhas)
+
+    def get_statistics(self, timeout: Optional[float] = None) -> FederatedResult:
+        """Soma as estatísticas de todos os armazenamentos.
+
+        Returns:
+            Resultado cujo único item tem a forma de ``TaskManager.get_statistics``
+        """
+        resultados, falhas = self._fan_out(lambda manager: manager.get_statistics(), timeout)
+        soma = {"total": 0, "pendentes": 0, "em_andamento": 0, "concluidas": 0,
+                "por_prioridade": {"baixa": 0, "media": 0, "alta": 0}}
+        for stats in resultados.values():
+            for campo in ("total", "pendentes", "em_andamento", "concluidas"):
+                soma[campo] += stats[campo]
+            for prioridade, n in stats["por_prioridade"].items():
+                soma["por_prioridade"][prioridade] = soma["por_prioridade"].get(prioridade, 0) + n
+        return FederatedResult([soma], falhas)
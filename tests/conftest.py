@@ -2,6 +2,7 @@
 
 import pytest
 import tempfile
+import glob
 import os
 from pathlib import Path
 
@@ -21,9 +22,10 @@ def temp_data_file():
     
     yield temp_file
     
-    # Cleanup
-    if os.path.exists(temp_file):
-        os.unlink(temp_file)
+    # Cleanup (inclui arquivos auxiliares como o log de mudanças)
+    for path in [temp_file, *glob.glob(glob.escape(temp_file) + '.*')]:
+        if os.path.exists(path):
+            os.unlink(path)
 
 
 @pytest.fixture
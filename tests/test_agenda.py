@@ -0,0 +1,67 @@
+"""Testes unitários para o módulo agenda.py."""
+
+import pytest
+from datetime import date, datetime
+
+from taskcrafter.agenda import DeadlineAgenda
+from taskcrafter.models import Task
+
+
+HOJE = date(2025, 11, 20)
+
+
+@pytest.fixture
+def agenda_tasks():
+    """Cria tarefas com vencimentos variados."""
+    return [
+        Task(titulo="Atrasada", data_vencimento="2025-11-10"),
+        Task(titulo="Hoje baixa", prioridade="baixa", data_vencimento="2025-11-20"),
+        Task(titulo="Hoje alta", prioridade="alta", data_vencimento="2025-11-20"),
+        Task(titulo="Futura", data_vencimento="2025-12-01"),
+        Task(titulo="Sem prazo"),
+        Task(titulo="Concluída", status="concluida", data_vencimento="2025-11-01"),
+    ]
+
+
+class TestDeadlineAgenda:
+    """Testes da agenda de vencimentos."""
+    
+    def test_atrasadas_e_proximas(self, agenda_tasks):
+        """Teste 44: Separar tarefas atrasadas dos próximos prazos."""
+        agenda = DeadlineAgenda(agenda_tasks)
+        assert [t.titulo for t in agenda.overdue(HOJE)] == ["Atrasada"]
+        proximas = agenda.upcoming(10, HOJE)
+        assert [t.titulo for t in proximas] == ["Hoje alta", "Hoje baixa", "Futura"]
+    
+    def test_limite_de_proximas(self, agenda_tasks):
+        """Teste 45: Retornar apenas os K próximos prazos."""
+        agenda = DeadlineAgenda(agenda_tasks)
+        assert [t.titulo for t in agenda.upcoming(1, HOJE)] == ["Hoje alta"]
+        # Consultar não consome o heap
+        assert len(agenda.upcoming(10, HOJE)) == 3
+    
+    def test_remocao_preguicosa(self, agenda_tasks):
+        """Teste 46: Tarefas concluídas ou removidas saem da agenda."""
+        agenda = DeadlineAgenda(agenda_tasks)
+        agenda_tasks[0].status = "concluida"
+        agenda.discard(agenda_tasks[3])
+        assert agenda.overdue(HOJE) == []
+        assert [t.titulo for t in agenda.upcoming(10, HOJE)] == ["Hoje alta", "Hoje baixa"]
+    
+    def test_reposicionar_apos_alteracao(self, agenda_tasks):
+        """Teste 47: Alterar prazo ou prioridade reposiciona a tarefa."""
+        agenda = DeadlineAgenda(agenda_tasks)
+        agenda_tasks[1].prioridade = "alta"
+        agenda_tasks[1].data_vencimento = "2025-11-15"
+        agenda.push(agenda_tasks[1])
+        agenda.push(agenda_tasks[1])
+        assert [t.titulo for t in agenda.overdue(HOJE)] == ["Atrasada", "Hoje baixa"]
+        assert [t.titulo for t in agenda.upcoming(10, HOJE)] == ["Hoje alta", "Futura"]
+    
+    def test_proximo_despertar(self, agenda_tasks):
+        """Teste 48: O próximo despertar é a meia-noite do próximo prazo."""
+        agenda = DeadlineAgenda(agenda_tasks)
+        agora = datetime(2025, 11, 20, 15, 30)
+        assert agenda.next_wakeup(agora) == datetime(2025, 11, 21)
+        assert agenda.next_wakeup(datetime(2025, 11, 25)) == datetime(2025, 12, 1)
+        assert agenda.next_wakeup(datetime(2025, 12, 2)) is None
@@ -0,0 +1,69 @@
+"""Testes das agregações agrupadas (aggregation.py)."""
+
+import random
+
+import pytest
+
+from taskcrafter.aggregation import GroupBy
+from taskcrafter.manager import TaskManager
+
+
+class TestAggregations:
+    """Testes do agrupamento em uma passada e da manutenção incremental."""
+    
+    def test_agrupamento_e_filtros(self, task_manager):
+        """Teste 100: Agrupa por várias dimensões, com tags múltiplas e filtros."""
+        task_manager.add_task("A", tags=["casa", "work"], data_vencimento="2026-10-20")
+        task_manager.add_task("B", tags=["casa"], prioridade="alta")
+        task_manager.add_task("C")
+        task_manager.mark_as_done("B")
+        
+        assert task_manager.aggregate(["tag", "status"]) == [
+            {"tag": "-", "status": "pendente", "total": 1},
+            {"tag": "casa", "status": "concluida", "total": 1},
+            {"tag": "casa", "status": "pendente", "total": 1},
+            {"tag": "work", "status": "pendente", "total": 1},
+        ]
+        assert task_manager.aggregate(["vencimento_semana", "vencimento_mes"], tag="work") == [
+            {"vencimento_semana": "2026-W43", "vencimento_mes": "2026-10", "total": 1},
+        ]
+        assert task_manager.aggregate(["prioridade"], status="pendente") == [
+            {"prioridade": "media", "total": 2},
+        ]
+        with pytest.raises(ValueError, match="Dimensão inválida"):
+            task_manager.aggregate(["dono"])
+    
+    def test_cache_incremental(self, task_manager):
+        """Teste 101: A agregação em cache acompanha as mutações sem recontar."""
+        rng = random.Random(7)
+        for i in range(60):
+            task_manager.add_task(f"T{i}", prioridade=rng.choice(["baixa", "media", "alta"]),
+                                  tags=rng.sample(["a", "b", "c"], rng.randint(0, 2)))
+        consultas = [(["tag", "status"], {}), (["prioridade"], {"tag": "a"}),
+                     (["criacao_mes", "status"], {"status": "concluida"})]
+        for by, filtros in consultas:
+            task_manager.aggregate(by, **filtros)
+        
+        for i in range(60):
+            titulo = f"T{rng.randrange(60)}"
+            if not task_manager.get_task_by_title(titulo):
+                continue
+            acao = rng.choice(["update", "done", "delete"])
+            if acao == "update":
+                task_manager.update_task(titulo, prioridade=rng.choice(["baixa", "alta"]),
+                                         tags=rng.sample(["a", "b", "c"], rng.randint(0, 3)))
+            elif acao == "done":
+                task_manager.mark_as_done(titulo)
+            else:
+                task_manager.delete_task(titulo)
+        
+        for by, filtros in consultas:
+            assert task_manager.aggregate(by, **filtros) == GroupBy(by, filtros, task_manager.tasks).rows()
+        stats = task_manager.get_statistics()
+        assert stats["total"] == len(task_manager.tasks)
+        assert stats["concluidas"] == sum(t.status == "concluida" for t in task_manager.tasks)
+        assert sum(stats["por_prioridade"].values()) == stats["total"]
+        assert "agregacao.tag+status" in task_manager.metrics()["indices"]
+        
+        # Uma instância nova começa sem agregações em cache
+        assert "agregacao.tag+status" not in TaskManager(str(task_manager.data_file)).metrics()["indices"]
@@ -0,0 +1,126 @@
+"""Testes do gerador de dados e da comparação de benchmarks."""
+
+import json
+import sys
+from collections import Counter
+
+import pytest
+
+from benchmarks.compare import comparar
+from benchmarks.dataset import gerar_tarefas, vocabulario_tags
+from benchmarks.serialization import comparar_codecs, formatar
+from benchmarks.stress import MISTURA_PADRAO, parse_mix, run_stress, verify
+from benchmarks.threads import escalar, formatar as formatar_threads
+from taskcrafter.manager import TaskManager
+from taskcrafter.models import Task
+
+
+class TestDatasetGenerator:
+    """Testes do gerador sintético."""
+    
+    def test_gerador_deterministico(self):
+        """Teste 50: A mesma semente gera o mesmo armazenamento."""
+        assert list(gerar_tarefas(200, seed=7)) == list(gerar_tarefas(200, seed=7))
+        assert list(gerar_tarefas(200, seed=7)) != list(gerar_tarefas(200, seed=8))
+    
+    def test_gerador_produz_tarefas_validas_e_enviesadas(self):
+        """Teste 51: Tarefas geradas são válidas e as tags seguem Zipf."""
+        dados = list(gerar_tarefas(2000))
+        tasks = [Task.from_dict(d) for d in dados]
+        assert len({t.titulo for t in tasks}) == 2000
+        
+        tags = Counter(tag for t in tasks for tag in t.tags)
+        vocabulario = vocabulario_tags()
+        assert tags[vocabulario[0]] > 5 * tags[vocabulario[50]]
+        prioridades = Counter(t.prioridade for t in tasks)
+        assert prioridades["media"] > prioridades["baixa"] > prioridades["alta"]
+
+
+class TestBenchmarkCompare:
+    """Testes da detecção de regressões."""
+    
+    def test_detectar_regressao_com_limiares(self):
+        """Teste 52: Limiar padrão e limiares específicos por padrão glob."""
+        base = {"resultados": {"10": {"load_tasks": {"min": 1.0}, "cli[stats]": {"min": 1.0}}}}
+        atual = {"resultados": {"10": {"load_tasks": {"min": 1.2}, "cli[stats]": {"min": 1.2},
+                                       "novo": {"min": 9.0}}}}
+        linhas = {nome: regrediu for _, nome, _, _, _, regrediu in
+                  comparar(base, atual, 0.10, {"cli*": 0.5})}
+        assert linhas == {"load_tasks": True, "cli[stats]": False}
+
+
+class TestCodecBenchmark:
+    """Testes da comparação de codecs."""
+    
+    def test_comparar_codecs(self):
+        """Teste 96: A comparação mede gravação, carga e bytes de cada codec."""
+        resultados = comparar_codecs(200, repeticoes=1, codecs=["json", "json-compact", "gzip"])
+        assert list(resultados) == ["json", "json-compact", "gzip"]
+        assert resultados["gzip"]["bytes"] < resultados["json-compact"]["bytes"] < resultados["json"]["bytes"]
+        assert all(r["save_s"] > 0 and r["load_s"] > 0 for r in resultados.values())
+        assert "gzip" in formatar(resultados)
+
+
+class TestStressHarness:
+    """Testes do teste de estresse com vários processos."""
+    
+    def test_verificacao_detecta_atualizacoes_perdidas(self, temp_data_file, tmp_path):
+        """Teste 107: Mutações confirmadas ausentes do arquivo contam como perdidas."""
+        manager = TaskManager(temp_data_file)
+        manager.add_task("w0-0")
+        manager.add_task("w0-1", descricao="v1", prioridade="alta")
+        manager.add_task("w0-2")
+        manager.add_task("intrusa")
+        oraculo = tmp_path / "oracle.0.jsonl"
+        operacoes = [
+            {"op": "add", "titulo": "w0-0", "ok": True},
+            {"op": "add", "titulo": "w0-1", "ok": True},
+            {"op": "update", "titulo": "w0-1", "descricao": "v2", "prioridade": "alta", "ok": True},
+            {"op": "add", "titulo": "w0-2", "ok": True},
+            {"op": "delete", "titulo": "w0-2", "ok": True},
+            {"op": "add", "titulo": "w0-3", "ok": True},
+            {"op": "add", "titulo": "w0-4", "ok": False, "erro": "ValueError: falhou"},
+            {"op": "list", "ok": True},
+        ]
+        oraculo.write_text("".join(json.dumps({**op, "latencia_s": 0.001}) + "\n" for op in operacoes))
+        
+        verificacao = verify(temp_data_file, [oraculo])
+        assert verificacao["integro"] is True
+        assert verificacao["perdidas_por_tipo"] == {"add": 1, "update": 1, "delete": 1}
+        assert verificacao["perdidas"] == 3
+        assert verificacao["nao_confirmadas"] == 1
+    
+    def test_execucao_curta_e_mistura(self, temp_data_file):
+        """Teste 108: Execução curta gera relatório consistente; mistura inválida é rejeitada."""
+        relatorio = run_stress(temp_data_file, 2, 0.3, parse_mix("add=3,list=1"))
+        operacoes = relatorio["operacoes"]
+        assert set(operacoes) <= {"add", "list", "total"}
+        assert operacoes["total"]["operacoes"] == sum(
+            dados["operacoes"] for nome, dados in operacoes.items() if nome != "total"
+        )
+        assert isinstance(relatorio["verificacao"]["integro"], bool)
+        for texto in ("pular=1", "add=x", "add=0"):
+            with pytest.raises(ValueError):
+                parse_mix(texto)
+    
+    @pytest.mark.skipif(sys.platform == "win32", reason="trava entre processos ainda não verificada no Windows")
+    def test_processos_concorrentes_sem_perdas(self, temp_data_file):
+        """Teste 125: Com a mistura padrão, o arquivo termina íntegro e nenhuma mutação confirmada se perde."""
+        relatorio = run_stress(temp_data_file, 2, 1.0, parse_mix(MISTURA_PADRAO))
+        verificacao = relatorio["verificacao"]
+        assert verificacao["integro"], verificacao["erro_fsck"]
+        assert verificacao["perdidas"] == 0, verificacao["perdidas_por_tipo"]
+        assert verificacao["nao_confirmadas"] == 0
+        assert relatorio["operacoes"]["add"]["operacoes"] > relatorio["operacoes"]["add"]["erros"]
+
+
+class TestThreadScaling:
+    """Testes da medição de escala das leituras."""
+    
+    def test_escala_de_leituras(self):
+        """Teste 113: Mede leituras por quantidade de threads, com uma escritora."""
+        resultados = escalar(300, [1, 2], 0.1, escritor=True)
+        assert list(resultados) == [1, 2]
+        assert resultados[1]["aceleracao"] == 1.0
+        assert all(r["leituras_s"] > 0 and r["escritas_s"] > 0 for r in resultados.values())
+        assert "aceleração" in formatar_threads(resultados)
@@ -0,0 +1,68 @@
+"""Testes do cache de carga (cache.py)."""
+
+import os
+
+from taskcrafter.manager import TaskManager
+from taskcrafter.models import DESCRICAO
+from taskcrafter.profiling import Profiler
+
+
+LONGA = "linha de log\n" * 100
+
+
+def _carregar(arquivo):
+    profiler = Profiler(memoria=False)
+    manager = TaskManager(arquivo, profiler=profiler)
+    return manager, {f["fase"] for f in profiler.report()}
+
+
+class TestLoadCache:
+    """Testes do uso e da invalidação do cache."""
+
+    def test_carga_pelo_cache_reproduz_as_tarefas(self, task_manager):
+        """Teste 109: Após gravar, a carga usa o cache e recria as mesmas tarefas."""
+        task_manager.add_task("Log", descricao=LONGA, tags=["ops"])
+        task_manager.add_task("Curta", prioridade="alta", data_vencimento="2026-01-31")
+        task_manager.mark_as_done("Curta")
+
+        manager, fases = _carregar(str(task_manager.data_file))
+        assert "carregar.cache" in fases and "carregar.leitura" not in fases
+        log = manager.get_task("Log")
+        assert not DESCRICAO.is_loaded(log) and log.descricao == LONGA
+        assert [t.to_dict() for t in manager.tasks] == [t.to_dict() for t in task_manager.tasks]
+        assert manager.get_task(2).id == 2
+
+        # Mutações sobre tarefas vindas do cache continuam funcionando
+        manager.update_task("Log", tags=["infra"])
+        assert TaskManager(str(task_manager.data_file), load_cache=False).get_task("Log").tags == ["infra"]
+
+    def test_cache_invalidado_pelo_conteudo(self, task_manager):
+        """Teste 110: Conteúdo alterado (mesmo tamanho e mtime), cache ilegível e arquivo danificado."""
+        task_manager.add_task("Tarefa A")
+        arquivo = task_manager.data_file
+        stat = arquivo.stat()
+        conteudo = arquivo.read_bytes()
+        # Outro editor troca o título e preserva tamanho e mtime; o checksum também é recalculado
+        outro = TaskManager(str(arquivo), load_cache=False)
+        outro.tasks[0].titulo = "Tarefa B"
+        outro.save_tasks()
+        alterado = arquivo.read_bytes()
+        assert len(alterado) == len(conteudo)
+        TaskManager(str(arquivo)).save_tasks()
+        arquivo.write_bytes(alterado)
+        os.utime(arquivo, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        manager, fases = _carregar(str(arquivo))
+        assert "carregar.leitura" in fases
+        assert manager.tasks[0].titulo == "Tarefa B"
+
+        cache = arquivo.with_name(arquivo.name + ".cache")
+        cache.write_bytes(b"\x00\x01lixo")
+        manager, fases = _carregar(str(arquivo))
+        assert "carregar.leitura" in fases and manager.tasks[0].titulo == "Tarefa B"
+
+        arquivo.write_bytes(alterado[:-10])
+        cache.unlink()
+        manager, _ = _carregar(str(arquivo))
+        assert manager.damage is not None
+        assert not cache.exists()
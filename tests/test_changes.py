@@ -0,0 +1,87 @@
+"""Testes unitários para o módulo changes.py."""
+
+import json
+
+from taskcrafter.changes import ChangeEvent, ChangeLog
+from taskcrafter.manager import TaskManager
+
+
+class TestChangeLog:
+    """Testes do log de mudanças persistido."""
+    
+    def test_consultar_desde_revisao(self, tmp_path):
+        """Teste 60: since() lê apenas os eventos posteriores à revisão."""
+        log = ChangeLog(tmp_path / "log.jsonl")
+        assert log.last_revision() == 0
+        log.TAMANHO_BLOCO = 64  # força leitura em vários blocos
+        log.append([ChangeEvent(i, "add", f"Tarefa {i}") for i in range(1, 51)])
+        
+        assert log.last_revision() == 50
+        assert [e.revisao for e in log.since(47)] == [48, 49, 50]
+        assert len(log.since(0)) == 50
+        assert log.since(50) == []
+    
+    def test_linha_parcial_ignorada(self, tmp_path):
+        """Teste 61: Uma gravação interrompida não quebra a leitura do log."""
+        caminho = tmp_path / "log.jsonl"
+        log = ChangeLog(caminho)
+        log.append([ChangeEvent(1, "add", "A")])
+        with open(caminho, 'a', encoding='utf-8') as f:
+            f.write('{"revisao": 2, "oper')
+        assert log.last_revision() == 1
+
+
+class TestManagerChangeFeed:
+    """Testes da revisão, assinaturas e feed de mudanças do TaskManager."""
+    
+    def test_revisao_e_eventos(self, task_manager):
+        """Teste 62: Cada mutação gera uma revisão com estado antes/depois."""
+        recebidos = []
+        cancelar = task_manager.subscribe(recebidos.append)
+        task_manager.add_task("Tarefa 1")
+        task_manager.update_task("Tarefa 1", prioridade="alta")
+        task_manager.mark_as_done("Tarefa 1")
+        cancelar()
+        task_manager.delete_task("Tarefa 1")
+        
+        assert task_manager.revision == 4
+        assert [e.operacao for e in recebidos] == ["add", "update", "done"]
+        update = recebidos[1]
+        assert update.antes["prioridade"] == "media"
+        assert update.depois["prioridade"] == "alta"
+        eventos = task_manager.changes(since=2)
+        assert [(e.revisao, e.operacao) for e in eventos] == [(3, "done"), (4, "delete")]
+        assert eventos[1].depois is None
+    
+    def test_revisao_persistida(self, temp_data_file):
+        """Teste 63: A revisão e o log sobrevivem a uma nova instância."""
+        manager1 = TaskManager(temp_data_file)
+        manager1.add_task("Tarefa 1")
+        manager1.add_task("Tarefa 2")
+        
+        manager2 = TaskManager(temp_data_file)
+        assert manager2.revision == 2
+        manager2.delete_task("Tarefa 1")
+        assert [e.revisao for e in manager2.changes(since=1)] == [2, 3]
+    
+    def test_assinante_com_erro_nao_desfaz_mutacao(self, task_manager, recwarn):
+        """Teste 64: Falha de um assinante vira aviso, não erro da mutação."""
+        def defeituoso(evento):
+            raise RuntimeError("falhou")
+        
+        task_manager.subscribe(defeituoso)
+        task_manager.add_task("Tarefa 1")
+        assert task_manager.get_task_by_title("Tarefa 1") is not None
+        assert any("falhou" in str(w.message) for w in recwarn)
+    
+    def test_update_invalido_desfaz_alteracoes(self, task_manager):
+        """Teste 65: Update inválido não deixa a tarefa pela metade nem gera evento."""
+        task_manager.add_task("Tarefa 1", prioridade="baixa")
+        try:
+            task_manager.update_task("Tarefa 1", prioridade="alta", data_vencimento="31/12/2025")
+        except ValueError:
+            pass
+        task = task_manager.get_task_by_title("Tarefa 1")
+        assert task.prioridade == "baixa"
+        assert task.data_vencimento is None
+        assert task_manager.revision == 1
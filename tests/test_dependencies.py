@@ -0,0 +1,92 @@
+"""Testes das dependências entre tarefas (dependencies.py)."""
+
+import random
+
+import pytest
+
+from taskcrafter.dependencies import DependencyGraph
+from taskcrafter.manager import TaskManager
+
+
+def _prontas(manager):
+    return [task.titulo for task in manager.ready_tasks(ordenar_por="titulo")]
+
+
+class TestDependencyGraph:
+    """Testes da manutenção incremental do grafo."""
+
+    def test_incremental_igual_a_reconstrucao(self, task_manager):
+        """Teste 117: Após mutações aleatórias, prontas e bloqueios batem com um grafo reconstruído."""
+        rng = random.Random(7)
+        with task_manager.batch():
+            for i in range(60):
+                ids = [t.id for t in task_manager.tasks]
+                deps = rng.sample(ids, min(len(ids), rng.randint(0, 3)))
+                task_manager.add_task(f"T{i}", depende_de=deps)
+            grafo = task_manager.dependencies
+            for _ in range(150):
+                task = rng.choice(task_manager.tasks)
+                acao = rng.random()
+                if acao < 0.35:
+                    task_manager.mark_as_done(task.id)
+                elif acao < 0.5:
+                    task_manager.update_task(task.id, status="pendente")
+                elif acao < 0.65:
+                    task_manager.delete_task(task.id)
+                else:
+                    candidatas = rng.sample([t.id for t in task_manager.tasks], 2)
+                    try:
+                        task_manager.update_task(task.id, depende_de=candidatas)
+                    except ValueError as e:
+                        assert "circular" in str(e) or "si mesma" in str(e)
+                if not task_manager.tasks:
+                    break
+                oraculo = DependencyGraph(task_manager.tasks)
+                assert grafo.ready() == oraculo.ready()
+                assert all(grafo.blockers(t.id) == oraculo.blockers(t.id) for t in task_manager.tasks)
+
+        # Prontas: abertas cujas dependências existentes estão todas concluídas
+        existentes = {t.id: t for t in task_manager.tasks}
+        esperadas = {
+            t.id for t in task_manager.tasks
+            if t.status != "concluida"
+            and all(d not in existentes or existentes[d].status == "concluida" for d in t.depende_de)
+        }
+        assert grafo.ready() == esperadas
+
+    def test_prontas_ciclos_e_persistencia(self, task_manager):
+        """Teste 118: done e delete liberam dependentes; ciclos são recusados; dependências persistem."""
+        task_manager.add_task("Projeto")
+        task_manager.add_task("Implementar", depende_de=["Projeto"])
+        task_manager.add_task("Testar", depende_de=["#2"])
+        task_manager.add_task("Documentar", depende_de=[1, "Implementar"])
+        assert _prontas(task_manager) == ["Projeto"]
+
+        task_manager.mark_as_done("Projeto")
+        assert _prontas(task_manager) == ["Implementar"]
+        task_manager.mark_as_done("Implementar")
+        assert _prontas(task_manager) == ["Documentar", "Testar"]
+        task_manager.update_task("Implementar", status="andamento")
+        assert _prontas(task_manager) == ["Implementar"]
+        task_manager.delete_task("Implementar")
+        assert _prontas(task_manager) == ["Documentar", "Testar"]
+
+        with pytest.raises(ValueError, match="circular"):
+            task_manager.update_task("Projeto", depende_de=["Documentar"])
+        with pytest.raises(ValueError, match="si mesma"):
+            task_manager.update_task("Testar", depende_de=["Testar"])
+        with pytest.raises(ValueError, match="não encontrada"):
+            task_manager.add_task("Nova", depende_de=["Inexistente"])
+        assert task_manager.get_task("Projeto").depende_de == []
+        assert task_manager.get_task("Nova") is None
+
+        task_manager.apply_operation({"op": "add", "titulo": "Publicar", "depende_de": ["Testar"]})
+        task_manager.update_task("Testar", depende_de=["Documentar"])
+        assert _prontas(task_manager) == ["Documentar"]
+
+        recarregado = TaskManager(str(task_manager.data_file))
+        assert recarregado.get_task("Publicar").depende_de == [recarregado.get_task("Testar").id]
+        assert _prontas(recarregado) == ["Documentar"]
+        assert recarregado.metrics()["indices"]["dependencias"] == 4
+        sem_cache = TaskManager(str(task_manager.data_file), load_cache=False)
+        assert sem_cache.get_task("Testar").depende_de == [4]
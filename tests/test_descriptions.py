@@ -0,0 +1,122 @@
+"""Testes das descrições fora de linha (descriptions.py)."""
+
+import json
+
+import pytest
+
+from taskcrafter.descriptions import LIMIAR_EXTERNO
+from taskcrafter.manager import TaskManager
+from taskcrafter.models import DESCRICAO
+from taskcrafter.sync import sync_stores
+
+
+LONGA = "linha de log com acentuação\n" * 100
+
+
+def _registros(manager):
+    with open(manager.data_file, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TestLazyDescriptions:
+    """Testes do armazenamento e da leitura preguiçosa das descrições."""
+    
+    def test_descricao_longa_fora_de_linha(self, task_manager):
+        """Teste 89: Descrições longas vão para o arquivo auxiliar e são lidas sob demanda."""
+        task_manager.add_task("Log", descricao=LONGA)
+        task_manager.add_task("Curta", descricao="x" * LIMIAR_EXTERNO)
+        
+        registros = _registros(task_manager)
+        assert "descricao" not in registros[0] and registros[0]["descricao_ref"][0] == 0
+        assert registros[1]["descricao"] == "x" * LIMIAR_EXTERNO
+        
+        recarregado = TaskManager(str(task_manager.data_file))
+        log = recarregado.get_task("Log")
+        recarregado.list_tasks(ordenar_por="titulo")
+        assert not DESCRICAO.is_loaded(log)
+        assert log.descricao == LONGA
+        assert DESCRICAO.is_loaded(log)
+        assert log.to_dict()["descricao"] == LONGA
+    
+    def test_gravacao_nao_le_descricoes_inalteradas(self, task_manager):
+        """Teste 90: Salvar mantém as referências sem ler nem regravar os textos."""
+        task_manager.add_task("Log", descricao=LONGA)
+        tamanho = task_manager.metrics()["gauges"]["store_descriptions_bytes"]
+        
+        recarregado = TaskManager(str(task_manager.data_file))
+        recarregado.add_task("Outra")
+        assert not DESCRICAO.is_loaded(recarregado.get_task("Log"))
+        assert recarregado.metrics()["gauges"]["store_descriptions_bytes"] == tamanho
+        assert TaskManager(str(task_manager.data_file)).get_task("Log").descricao == LONGA
+    
+    def test_compactacao(self, task_manager, monkeypatch):
+        """Teste 91: Texto morto é descartado em uma nova geração do arquivo."""
+        monkeypatch.setattr("taskcrafter.manager.TAMANHO_MINIMO_COMPACTACAO", 0)
+        task_manager.add_task("A", descricao=LONGA)
+        task_manager.add_task("B", descricao=LONGA + "b")
+        task_manager.update_task("A", descricao=LONGA + "nova")
+        task_manager.delete_task("B")
+        
+        registros = _registros(task_manager)
+        geracao = registros[0]["descricao_ref"][0]
+        assert geracao >= 1
+        assert not task_manager._descricoes.path(geracao - 1).exists()
+        assert task_manager._descricoes.size() == len((LONGA + "nova").encode('utf-8'))
+        assert TaskManager(str(task_manager.data_file)).get_task("A").descricao == LONGA + "nova"
+    
+    def test_busca_e_arquivo_ausente(self, task_manager):
+        """Teste 92: search lê a descrição só quando o título não corresponde."""
+        task_manager.add_task("Erro no deploy", descricao=LONGA)
+        task_manager.add_task("Outra", descricao=LONGA + "stacktrace")
+        
+        recarregado = TaskManager(str(task_manager.data_file))
+        assert [t.titulo for t in recarregado.search("DEPLOY")] == ["Erro no deploy"]
+        assert not DESCRICAO.is_loaded(recarregado.get_task("Erro no deploy"))
+        assert [t.titulo for t in recarregado.search("stacktrace")] == ["Outra"]
+        assert recarregado.search("deploy", ("descricao",)) == []
+        with pytest.raises(ValueError, match="vazio"):
+            recarregado.search(" ")
+        with pytest.raises(ValueError, match="inválido"):
+            recarregado.search("x", ("tags",))
+        
+        recarregado._descricoes.path(0).unlink()
+        with pytest.raises(ValueError, match="não encontrado"):
+            TaskManager(str(task_manager.data_file)).get_task("Outra").descricao
+    
+    def test_mutacoes_nao_leem_nem_registram_descricao(self, tmp_path):
+        """Teste 124: Mutações não carregam a descrição externa nem a copiam para o log."""
+        manager = TaskManager(str(tmp_path / "tasks.json"))
+        manager.add_task("Log", descricao=LONGA * 70)
+        manager.add_task("Outra")
+        
+        recarregado = TaskManager(str(manager.data_file))
+        log = recarregado.get_task("Log")
+        recarregado.mark_as_done("Log")
+        recarregado.update_task("Log", prioridade="alta", tags=["infra"])
+        with pytest.raises(ValueError):
+            recarregado.update_task("Log", titulo="Outra")
+        with pytest.raises(ValueError):
+            recarregado.update_task("Log", prioridade="urgente")
+        recarregado.delete_task("Outra")
+        assert not DESCRICAO.is_loaded(log)
+        assert recarregado._sidecar("changes.jsonl").stat().st_size < 8 * 1024
+        eventos = recarregado.changes(since=0)
+        assert all("descricao" not in (e.depois or e.antes) for e in eventos)
+        assert all(e.antes["descricao_versao"] == e.depois["descricao_versao"]
+                   for e in eventos if e.antes and e.depois)
+        assert TaskManager(str(manager.data_file)).get_task("Log").descricao == LONGA * 70
+        
+        # A sincronização incremental ainda leva a descrição das tarefas alteradas
+        servidor = TaskManager(str(tmp_path / "servidor" / "tasks.json"))
+        sync_stores(recarregado, servidor)
+        recarregado.update_task("Log", descricao=LONGA + "nova")
+        # Uma alteração só da descrição ainda aparece no log (o marcador muda)
+        evento = recarregado.changes(since=0)[-1]
+        assert evento.antes["descricao_versao"] != evento.depois["descricao_versao"]
+        recarregado.add_task("Curta", descricao="curta")
+        recarregado.update_task("Curta", descricao="curta!")
+        evento = recarregado.changes(since=0)[-1]
+        antes, depois = evento.antes, evento.depois
+        assert antes != depois and {k for k in antes if antes[k] != depois[k]} <= {"descricao_versao", "modificado_em"}
+        assert not sync_stores(recarregado, servidor).completa
+        assert servidor.get_task("Log").descricao == LONGA + "nova"
@@ -0,0 +1,134 @@
+"""Testes das métricas de fluxo (flow.py) e dos segmentos de arquivo (archive.py)."""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from taskcrafter.archive import read_header, segments
+from taskcrafter.flow import FlowStats, QuantileSketch
+from taskcrafter.manager import TaskManager
+from taskcrafter.profiling import Profiler
+
+
+def _concluir(manager, titulo, dias_atras, horas):
+    """Conclui a tarefa com datas controladas (conclusão há ``dias_atras``, lead time ``horas``)."""
+    task = manager.get_task_by_title(titulo)
+    conclusao = datetime.now() - timedelta(days=dias_atras)
+    task.data_criacao = (conclusao - timedelta(hours=horas)).isoformat()
+    antes = task.to_dict()
+    task.status, task.data_conclusao = "concluida", conclusao.isoformat()
+    manager._registrar_mudanca("done", task, antes)
+    manager._persistir()
+
+
+class TestQuantileSketch:
+    """Testes do esboço de quantis."""
+    
+    def test_erro_relativo_mescla_e_remocao(self):
+        """Teste 102: Quantis com erro relativo <= 1%, mescláveis e com remoção exata."""
+        rng = random.Random(3)
+        valores = [rng.lognormvariate(3, 1.5) for _ in range(5000)]
+        a, b = QuantileSketch(), QuantileSketch()
+        for i, valor in enumerate(valores):
+            (a if i % 2 else b).add(valor)
+        a.merge(b)
+        ordenados = sorted(valores)
+        for q in (0.5, 0.9, 0.99):
+            exato = ordenados[int(q * (len(ordenados) - 1))]
+            assert abs(a.quantile(q) - exato) / exato <= 0.0101
+        
+        for valor in valores[:2500]:
+            a.remove(valor)
+        restante = sorted(valores[2500:])
+        assert a.count == 2500
+        assert abs(a.quantile(0.5) - restante[1249]) / restante[1249] <= 0.0101
+        assert QuantileSketch.from_dict(json.loads(json.dumps(a.to_dict()))).quantile(0.9) == a.quantile(0.9)
+        assert QuantileSketch().quantile(0.5) is None
+        with pytest.raises(ValueError, match="precisões"):
+            a.merge(QuantileSketch(0.05))
+
+
+class TestFlowReport:
+    """Testes do relatório de fluxo e do arquivamento."""
+    
+    def test_fluxo_incremental_pelo_log(self, task_manager):
+        """Teste 103: As métricas gravadas são atualizadas pelo log, sem recalcular."""
+        for i in range(6):
+            task_manager.add_task(f"T{i}", prioridade="alta" if i % 2 else "baixa", tags=["x"])
+        for i in range(3):
+            _concluir(task_manager, f"T{i}", dias_atras=i, horas=10 * (i + 1))
+        relatorio = task_manager.flow_report(por="dia")
+        assert sum(linha["concluidas"] for linha in relatorio["throughput"]) == 3
+        assert relatorio["lead_time"][0]["grupo"] == "total"
+        assert relatorio["lead_time"][0]["n"] == 3
+        
+        # Mutações em outra instância chegam pelo log de mudanças
+        outro = TaskManager(str(task_manager.data_file))
+        _concluir(outro, "T3", dias_atras=0, horas=5)
+        outro.delete_task("T0")
+        outro.update_task("T1", tags=["y"])
+        
+        profiler = Profiler(memoria=False)
+        novo = TaskManager(str(outro.data_file), profiler=profiler)
+        carregado = novo.flow_report(por="dia")
+        fases = {fase["fase"]: fase for fase in profiler.report()}
+        assert fases["fluxo.carga"]["registros"] == 3  # apenas os eventos novos
+        grupos = {g["grupo"]: g["n"] for g in carregado["lead_time"]}
+        assert grupos == {"total": 3, "prioridade:alta": 2, "prioridade:baixa": 1, "tag:x": 2, "tag:y": 1}
+        
+        outro._sidecar("flow.json").unlink()
+        assert TaskManager(str(outro.data_file)).flow_report(por="dia") == carregado
+    
+    def test_arquivo_contribui_com_esbocos(self, task_manager):
+        """Teste 104: Tarefas arquivadas saem do armazenamento e continuam no relatório."""
+        for i in range(10):
+            task_manager.add_task(f"T{i}", tags=["x"])
+            _concluir(task_manager, f"T{i}", dias_atras=40 if i < 6 else 1, horas=24 * (i + 1))
+        antes = task_manager.flow_report(por="semana")
+        
+        selecionadas, segmento = task_manager.archive(timedelta(days=30), dry_run=True)
+        assert len(selecionadas) == 6 and segmento is None
+        arquivadas, segmento = task_manager.archive(timedelta(days=30))
+        assert len(arquivadas) == 6
+        assert segments(task_manager.data_file) == [segmento]
+        assert read_header(segmento)["tarefas"] == 6
+        assert len(TaskManager(str(task_manager.data_file)).tasks) == 4
+        
+        depois = TaskManager(str(task_manager.data_file)).flow_report(por="semana")
+        assert depois["segmentos"] == 1
+        assert depois["throughput"] == antes["throughput"]
+        assert depois["lead_time"] == antes["lead_time"]
+    
+    def test_arquivo_desfeito_se_a_gravacao_falha(self, task_manager, monkeypatch):
+        """Teste 130: Se a gravação do arquivamento falha, o segmento é apagado e nada é contado duas vezes."""
+        for i in range(4):
+            task_manager.add_task(f"T{i}")
+            _concluir(task_manager, f"T{i}", dias_atras=40, horas=24)
+        antes = task_manager.flow_report(por="semana")
+        
+        def falhar(caminho, conteudo):
+            raise OSError("disco cheio")
+        
+        with monkeypatch.context() as m:
+            m.setattr("taskcrafter.manager.write_atomic", falhar)
+            with pytest.raises(OSError, match="disco cheio"):
+                task_manager.archive(timedelta(days=30))
+        assert segments(task_manager.data_file) == []
+        assert len(task_manager.tasks) == 4 and not task_manager.pending_save
+        assert task_manager.flow_report(por="semana") == antes
+        
+        # Outro processo grava durante um lote: o conflito também desfaz o arquivamento
+        with task_manager.batch():
+            task_manager.add_task("Local")
+            TaskManager(str(task_manager.data_file)).add_task("Externa")
+            with pytest.raises(ValueError, match="outro processo"):
+                task_manager.archive(timedelta(days=30))
+            assert segments(task_manager.data_file) == []
+            assert [t.titulo for t in task_manager.tasks] == ["T0", "T1", "T2", "T3", "Externa"]
+        
+        arquivadas, segmento = task_manager.archive(timedelta(days=30))
+        assert len(arquivadas) == 4 and segments(task_manager.data_file) == [segmento]
+        assert [t.titulo for t in TaskManager(str(task_manager.data_file)).tasks] == ["Externa"]
+        assert TaskManager(str(task_manager.data_file)).flow_report(por="semana") == {**antes, "segmentos": 1}
@@ -0,0 +1,71 @@
+"""Testes das visões ordenadas (indexes.py)."""
+
+import random
+
+import pytest
+
+from taskcrafter.indexes import CHAVES
+from taskcrafter.manager import TaskManager
+from taskcrafter.profiling import Profiler
+
+
+def _referencia(manager, criterio, **filtros):
+    """Ordenação estável sobre a lista, como era feita antes das visões."""
+    tasks = [t for t in manager.tasks
+             if all(getattr(t, campo) == valor for campo, valor in filtros.items())]
+    return sorted(tasks, key=CHAVES[criterio])
+
+
+class TestSortedViews:
+    """Testes das visões mantidas a cada mutação."""
+    
+    def test_visoes_equivalem_a_ordenacao(self, task_manager):
+        """Teste 84: Após mutações aleatórias, as visões equivalem a um sort estável."""
+        aleatorio = random.Random(7)
+        prioridades = ["baixa", "media", "alta"]
+        for i in range(60):
+            task_manager.add_task(
+                f"Tarefa {aleatorio.randint(0, 999):03d}-{i}",
+                prioridade=aleatorio.choice(prioridades),
+                data_vencimento=aleatorio.choice([None, "2030-01-01", "2030-02-01"]),
+            )
+        for criterio in CHAVES:
+            task_manager.list_tasks(ordenar_por=criterio)
+        
+        for i in range(80):
+            task = aleatorio.choice(task_manager.tasks)
+            acao = aleatorio.random()
+            if acao < 0.3:
+                task_manager.update_task(task.id, prioridade=aleatorio.choice(prioridades),
+                                         data_vencimento=aleatorio.choice(["2030-03-01", "2029-12-31"]))
+            elif acao < 0.5:
+                task_manager.update_task(task.id, titulo=f"Renomeada {i}")
+            elif acao < 0.7:
+                task_manager.mark_as_done(task.id)
+            elif acao < 0.85:
+                task_manager.delete_task(task.id)
+            else:
+                task_manager.add_task(f"Nova {i}", prioridade=aleatorio.choice(prioridades))
+        
+        for criterio in CHAVES:
+            assert task_manager.list_tasks(ordenar_por=criterio) == _referencia(task_manager, criterio)
+            assert (task_manager.list_tasks(status="concluida", prioridade="alta", ordenar_por=criterio)
+                    == _referencia(task_manager, criterio, status="concluida", prioridade="alta"))
+        
+        recarregado = TaskManager(str(task_manager.data_file))
+        assert ([t.id for t in recarregado.list_tasks(ordenar_por="titulo")]
+                == [t.id for t in task_manager.list_tasks(ordenar_por="titulo")])
+    
+    def test_visao_construida_uma_vez(self, task_manager_with_tasks):
+        """Teste 85: A visão é ordenada na primeira listagem e depois só percorrida."""
+        profiler = Profiler(memoria=False)
+        task_manager_with_tasks.profiler = profiler
+        task_manager_with_tasks.list_tasks(ordenar_por="prioridade")
+        task_manager_with_tasks.add_task("Outra", prioridade="alta")
+        titulos = [t.titulo for t in task_manager_with_tasks.list_tasks(ordenar_por="prioridade")]
+        
+        assert titulos[:2] == ["Comprar mantimentos", "Outra"]
+        fases = {fase["fase"]: fase for fase in profiler.report()}
+        assert fases["listar.ordenacao"]["chamadas"] == 2
+        assert fases["listar.ordenacao"]["registros"] == 3
+        assert task_manager_with_tasks.metrics()["indices"]["ordem.prioridade"] == 4
@@ -5,12 +5,14 @@ Estes testes simulam fluxos completos de uso do sistema.
 
 import pytest
 import tempfile
+import json
 import os
 from io import StringIO
 import sys
 
-from taskcrafter.cli import TaskCrafterCLI
+from taskcrafter.cli import VERIFICACAO_WATCH, TaskCrafterCLI
 from taskcrafter.manager import TaskManager
+from taskcrafter.shell import TaskShell
 
 
 class TestCLIIntegration:
@@ -238,3 +240,557 @@ class TestCLIPersistence:
         cli3 = TaskCrafterCLI(temp_data_file)
         task = cli3.manager.get_task_by_title('Tarefa Persistente')
         assert task.status == 'concluida'
+
+
+class TestCLIAgenda:
+    """Testes de integração do comando agenda."""
+    
+    @pytest.fixture
+    def cli(self, temp_data_file):
+        """Cria instância da CLI para testes."""
+        return TaskCrafterCLI(temp_data_file)
+    
+    def test_agenda_lista_atrasadas_e_proximas(self, cli, capsys):
+        """Teste E2E 14: Agenda mostra atrasadas e próximos vencimentos."""
+        cli.run(['add', 'Prazo vencido', '-v', '2000-01-01'])
+        cli.run(['add', 'Prazo futuro', '-v', '2999-12-31'])
+        cli.run(['add', 'Sem prazo'])
+        capsys.readouterr()
+        
+        cli.run(['next', '-n', '5'])
+        captured = capsys.readouterr()
+        assert 'atrasadas: 1' in captured.out
+        assert 'Próximos vencimentos: 1' in captured.out
+        assert captured.out.index('Prazo vencido') < captured.out.index('Prazo futuro')
+        assert 'Sem prazo' not in captured.out
+    
+    def test_agenda_watch_dorme_ate_o_prazo(self, cli, capsys):
+        """Teste E2E 15: Modo watch espera o próximo prazo em intervalos limitados, sem reler as tarefas."""
+        cli.run(['add', 'Prazo futuro', '-v', '2999-12-31'])
+        esperas = []
+        
+        def sleep_falso(segundos):
+            esperas.append(segundos)
+            if len(esperas) == 3:
+                raise KeyboardInterrupt
+        
+        cli._sleep = sleep_falso
+        cli.run(['agenda', '--watch'])
+        captured = capsys.readouterr()
+        assert esperas == [VERIFICACAO_WATCH] * 3
+        assert captured.out.count('Próximos vencimentos') == 1
+        assert '2999-12-31 00:00:00' in captured.out
+    
+    def test_agenda_vazia(self, cli, capsys):
+        """Teste E2E 16: Agenda sem prazos continua esperando e mostra tarefas criadas por outro processo."""
+        esperas = []
+        
+        def sleep_falso(segundos):
+            esperas.append(segundos)
+            if len(esperas) == 2:
+                TaskManager(cli.data_file).add_task("Nova", data_vencimento="2999-12-31")
+            elif len(esperas) == 3:
+                raise KeyboardInterrupt
+        
+        cli._sleep = sleep_falso
+        cli.run(['agenda', '--watch'])
+        captured = capsys.readouterr()
+        assert 'Nenhuma tarefa com vencimento' in captured.out
+        assert 'aguardando novas tarefas' in captured.out
+        assert esperas[:2] == [VERIFICACAO_WATCH] * 2
+        assert 'Nova' in captured.out and '2999-12-31 00:00:00' in captured.out
+
+
+class TestCLIDiagnostics:
+    """Testes de integração das flags globais de diagnóstico."""
+    
+    def test_profile_imprime_fases(self, temp_data_file, tmp_path, capsys):
+        """Teste E2E 17: --profile mostra as fases e --profile-dump grava o cProfile."""
+        TaskCrafterCLI(temp_data_file).run(['add', 'Tarefa Perfilada'])
+        capsys.readouterr()
+        
+        dump = tmp_path / "perfil.out"
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.run(['--profile', '--profile-dump', str(dump), 'list'])
+        captured = capsys.readouterr()
+        
+        assert 'Tarefa Perfilada' in captured.out
+        # 'add' gravou o cache de carga, então 'list' não faz parse do arquivo
+        for fase in ('carregar.cache', 'listar.filtro', 'listar.ordenacao', 'impressao', 'comando'):
+            assert fase in captured.err
+        assert 'carregar.validacao' not in captured.err
+        assert dump.exists()
+    
+    def test_metrics_file(self, temp_data_file, tmp_path):
+        """Teste E2E 18: --metrics-file grava as métricas após o comando."""
+        destino = tmp_path / "taskcrafter.prom"
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.run(['--metrics-file', str(destino), 'add', 'Tarefa Medida'])
+        texto = destino.read_text(encoding='utf-8')
+        assert 'taskcrafter_operations_total{op="add"} 1' in texto
+        assert 'taskcrafter_operations_total{op="save"} 1' in texto
+
+
+class TestCLIChanges:
+    """Testes de integração do comando changes."""
+    
+    def test_changes_desde_revisao(self, temp_data_file, capsys):
+        """Teste E2E 19: changes --since N lista apenas as mudanças novas."""
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.run(['add', 'Tarefa 1'])
+        cli.run(['add', 'Tarefa 2'])
+        cli.run(['done', 'Tarefa 1'])
+        capsys.readouterr()
+        
+        TaskCrafterCLI(temp_data_file).run(['changes', '--since', '1'])
+        captured = capsys.readouterr()
+        assert '#2' in captured.out and '#3' in captured.out
+        assert '#1 ' not in captured.out
+        assert 'Revisão atual: 3' in captured.out
+        
+        TaskCrafterCLI(temp_data_file).run(['changes', '--since', '2', '-f', 'ndjson'])
+        linhas = capsys.readouterr().out.strip().splitlines()
+        assert len(linhas) == 1
+        assert json.loads(linhas[0])['operacao'] == 'done'
+        
+        TaskCrafterCLI(temp_data_file).run(['changes', '--since', '3'])
+        assert 'Nenhuma mudança' in capsys.readouterr().out
+
+
+class TestCLISync:
+    """Testes de integração do comando sync."""
+    
+    def test_sync_entre_diretorios(self, tmp_path, capsys):
+        """Teste E2E 20: sync aceita o diretório do outro armazenamento."""
+        laptop = TaskCrafterCLI(str(tmp_path / "laptop" / "tasks.json"))
+        servidor = TaskCrafterCLI(str(tmp_path / "servidor" / "tasks.json"))
+        laptop.run(['add', 'Tarefa do laptop'])
+        servidor.run(['add', 'Tarefa do servidor'])
+        capsys.readouterr()
+        
+        laptop.run(['sync', str(tmp_path / "servidor")])
+        captured = capsys.readouterr()
+        assert 'Sincronização completa' in captured.out
+        assert 'Enviadas: 1' in captured.out
+        assert laptop.manager.get_task_by_title('Tarefa do servidor') is not None
+        
+        with pytest.raises(SystemExit):
+            laptop.run(['sync', str(tmp_path / "inexistente")])
+
+
+class TestCLIIds:
+    """Testes de integração do endereçamento por id."""
+    
+    def test_comandos_por_id(self, temp_data_file, capsys):
+        """Teste E2E 21: done, update e delete aceitam o id da tarefa."""
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.run(['add', 'Primeira'])
+        cli.run(['add', 'Segunda'])
+        assert '(#2)' in capsys.readouterr().out
+        
+        cli.run(['update', '#1', '--titulo', 'Primeira renomeada', '-p', 'alta'])
+        cli.run(['done', '2'])
+        cli.run(['list'])
+        captured = capsys.readouterr()
+        assert '#1 Primeira renomeada' in captured.out
+        assert cli.manager.get_task('Segunda').status == 'concluida'
+        
+        cli.run(['delete', '#2'])
+        assert "'#2' removida" in capsys.readouterr().out
+
+
+class TestCLIBulk:
+    """Testes de integração das formas em massa de done, update e delete."""
+    
+    @pytest.fixture
+    def cli(self, temp_data_file):
+        """CLI com tarefas de uma sprint."""
+        cli = TaskCrafterCLI(temp_data_file)
+        for i in range(3):
+            cli.run(['add', f'Sprint {i}', '-t', 'sprint-12'])
+        cli.run(['add', 'Outra'])
+        return cli
+    
+    def test_done_where_com_dry_run(self, cli, capsys):
+        """Teste E2E 22: done --where com e sem --dry-run."""
+        capsys.readouterr()
+        cli.run(['done', '--where', 'tag=sprint-12', '--dry-run'])
+        assert '3 tarefa(s) seriam concluída(s)' in capsys.readouterr().out
+        assert cli.manager.list_tasks(status='concluida') == []
+        
+        cli.run(['done', '--where', 'tag=sprint-12'])
+        assert '3 tarefa(s) concluída(s)' in capsys.readouterr().out
+        assert len(TaskManager(cli.data_file).list_tasks(status='concluida')) == 3
+    
+    def test_update_e_delete_em_massa(self, cli, capsys):
+        """Teste E2E 23: update --where --set e delete --where --older-than."""
+        cli.run(['update', '--where', 'status=pendente', '--set', 'prioridade=alta', '--set', 'tags=a,b'])
+        assert all(t.prioridade == 'alta' and t.tags == ['a', 'b'] for t in cli.manager.tasks)
+        
+        cli.run(['done', '--where', 'status=pendente'])
+        cli.run(['delete', '--where', 'status=concluida', '--older-than', '90d'])
+        assert len(cli.manager.tasks) == 4
+        capsys.readouterr()
+        
+        for argumentos in (['done'], ['done', 'Outra', '--where', 'tag=x'],
+                           ['update', '--where', 'x', '-p', 'alta'],
+                           ['delete', '--older-than', 'ontem'],
+                           ['update', 'Outra', '--set', 'prioridade=alta']):
+            with pytest.raises(SystemExit):
+                cli.run(argumentos)
+        assert capsys.readouterr().err.count('Erro') == 5
+
+
+class TestCLIBatch:
+    """Testes de integração do comando batch."""
+    
+    def test_batch_texto_e_ndjson(self, temp_data_file, tmp_path, capsys):
+        """Teste E2E 24: Lote misto grava uma vez e informa o resultado por linha."""
+        script = tmp_path / "lote.txt"
+        script.write_text(
+            '# criação\n'
+            'add "Primeira tarefa" -p alta -t x\n'
+            'add "Primeira tarefa"\n'
+            '\n'
+            '{"op": "add", "titulo": "Segunda", "vencimento": "2030-01-01"}\n'
+            '{"op": "done", "tarefa": "#1"}\n'
+            '{"op": "fly"}\n'
+            'list -p zzz\n'
+            'batch outro.txt\n',
+            encoding='utf-8'
+        )
+        cli = TaskCrafterCLI(temp_data_file)
+        with pytest.raises(SystemExit) as exc:
+            cli.run(['batch', str(script)])
+        assert exc.value.code == 1
+        
+        out, err = capsys.readouterr()
+        resultados = [json.loads(l) for l in out.splitlines() if l.startswith('{')]
+        assert [(r['linha'], r['ok']) for r in resultados] == [(5, True), (6, True), (7, False)]
+        assert 'Linha 3: Já existe' in err
+        assert 'Linha 8: argument -p/--prioridade' in err
+        assert 'Linha 9: O comando batch' in err
+        assert '7 linha(s), 4 erro(s)' in err
+        
+        assert cli.manager.metrics()['operacoes']['save']['total'] == 1
+        tasks = TaskManager(temp_data_file).tasks
+        assert [(t.id, t.titulo, t.status) for t in tasks] == [
+            (1, 'Primeira tarefa', 'concluida'), (2, 'Segunda', 'pendente')
+        ]
+    
+    def test_batch_stdin_stop_on_error(self, temp_data_file, monkeypatch, capsys):
+        """Teste E2E 25: --stop-on-error interrompe e mantém as linhas anteriores."""
+        monkeypatch.setattr('sys.stdin', StringIO('add A\ndone Z\nadd B\n'))
+        cli = TaskCrafterCLI(temp_data_file)
+        with pytest.raises(SystemExit):
+            cli.run(['batch', '--stop-on-error'])
+        assert '2 linha(s), 1 erro(s)' in capsys.readouterr().err
+        assert [t.titulo for t in TaskManager(temp_data_file).tasks] == ['A']
+        
+        with pytest.raises(SystemExit):
+            cli.run(['batch', 'nao-existe.txt'])
+        assert 'Não foi possível abrir' in capsys.readouterr().err
+
+
+class TestCLIShell:
+    """Testes de integração do comando shell."""
+    
+    def test_shell_via_cli(self, temp_data_file, monkeypatch, capsys):
+        """Teste E2E 26: taskcrafter shell executa comandos e grava ao sair."""
+        monkeypatch.setattr('sys.stdin', StringIO('add "Triagem" -p alta\nlist\nhelp done\nhelp salvar\n'))
+        monkeypatch.setattr(TaskShell, 'use_rawinput', False)
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.run(['shell', '--intervalo', '0'])
+        
+        out = capsys.readouterr().out
+        assert 'Tarefa criada (#1)' in out
+        assert 'Total de tarefas: 1' in out
+        assert 'usage: taskcrafter done' in out
+        assert 'Grava imediatamente' in out
+        assert [t.titulo for t in TaskManager(temp_data_file).tasks] == ['Triagem']
+
+
+class TestCLIViews:
+    """Testes de integração do comando view."""
+    
+    def test_view_save_run_list_delete(self, temp_data_file, capsys):
+        """Teste E2E 27: Ciclo completo de uma visão salva pela CLI."""
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.run(['add', 'Contrato', '-p', 'alta', '-t', 'cliente-x'])
+        cli.run(['add', 'Proposta', '-t', 'cliente-x'])
+        cli.run(['view', 'save', 'cliente', '-t', 'cliente-x', '-o', 'titulo'])
+        cli.run(['view', 'list'])
+        capsys.readouterr()
+        
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.run(['view', 'run', 'cliente'])
+        out = capsys.readouterr().out
+        assert "Visão 'cliente': 2 tarefa(s)" in out
+        assert out.index('Contrato') < out.index('Proposta')
+        
+        cli.run(['done', 'Contrato'])
+        cli.run(['view', 'save', 'cliente', '-t', 'cliente-x', '-s', 'pendente'])
+        cli.run(['view', 'run', 'cliente'])
+        assert "Visão 'cliente': 1 tarefa(s)" in capsys.readouterr().out
+        
+        cli.run(['view', 'delete', 'cliente'])
+        cli.run(['view', 'delete', 'cliente'])
+        cli.run(['view', 'list'])
+        out = capsys.readouterr().out
+        assert "removida" in out and "não encontrada" in out and "Nenhuma visão salva" in out
+
+
+class TestCLIFormatsAndSearch:
+    """Testes de integração de list --format/--campos e do comando search."""
+    
+    def test_list_ndjson_e_search(self, temp_data_file, capsys):
+        """Teste E2E 28: Saída estruturada com campos escolhidos e busca por texto."""
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.run(['add', 'Deploy', '-d', 'log ' * 400, '-p', 'alta'])
+        cli.run(['add', 'Revisão', '-d', 'checar o deploy de ontem'])
+        capsys.readouterr()
+        
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.run(['list', '-f', 'ndjson', '--campos', 'id,titulo,status'])
+        linhas = [json.loads(l) for l in capsys.readouterr().out.splitlines()]
+        assert linhas == [{'id': 1, 'titulo': 'Deploy', 'status': 'pendente'},
+                          {'id': 2, 'titulo': 'Revisão', 'status': 'pendente'}]
+        
+        cli.run(['list', '-f', 'json', '-p', 'alta'])
+        registros = json.loads(capsys.readouterr().out)
+        assert registros[0]['descricao'] == 'log ' * 400
+        
+        cli.run(['search', 'deploy'])
+        assert 'Tarefas com \'deploy\': 2' in capsys.readouterr().out
+        cli.run(['search', 'deploy', '-c', 'titulo'])
+        assert ': 1' in capsys.readouterr().out
+        cli.run(['search', 'nada'])
+        assert 'Nenhuma tarefa' in capsys.readouterr().out
+        
+        for argumentos in (['list', '--campos', 'id'], ['list', '-f', 'json', '--campos', 'cor']):
+            with pytest.raises(SystemExit):
+                cli.run(argumentos)
+        assert capsys.readouterr().err.count('Erro') == 2
+
+
+class TestCLICodec:
+    """Testes de integração da opção --codec."""
+    
+    def test_codec_global(self, tmp_path, monkeypatch):
+        """Teste E2E 29: --codec e TASKCRAFTER_CODEC escolhem o formato gravado."""
+        arquivo = tmp_path / "tasks.json"
+        TaskCrafterCLI(str(arquivo)).run(['--codec', 'gzip', 'add', 'Compacta'])
+        assert arquivo.read_bytes()[:2] == b"\x1f\x8b"
+        
+        monkeypatch.setenv('TASKCRAFTER_CODEC', 'json-compact')
+        cli = TaskCrafterCLI(str(arquivo))
+        cli.run(['add', 'Outra'])
+        assert b'"id":1,"titulo"' in arquivo.read_bytes()
+        cli.run(['--codec', 'json', 'done', 'Outra'])
+        assert b'"id": 1, "titulo"' in arquivo.read_bytes()
+        assert [t.status for t in TaskManager(str(arquivo)).tasks] == ['pendente', 'concluida']
+
+
+class TestCLIFsck:
+    """Testes de integração do comando fsck."""
+    
+    def test_fsck_e_reparo(self, tmp_path, capsys):
+        """Teste E2E 30: Armazenamento danificado é somente leitura até o fsck --repair."""
+        arquivo = tmp_path / "tasks.json"
+        cli = TaskCrafterCLI(str(arquivo))
+        cli.run(['add', 'Alfa'])
+        cli.run(['add', 'Beta'])
+        arquivo.write_bytes(arquivo.read_bytes().replace(b'"Alfa"', b'"Alfo"'))
+        
+        with pytest.raises(SystemExit):
+            TaskCrafterCLI(str(arquivo)).run(['add', 'Gama'])
+        err = capsys.readouterr().err
+        assert "Armazenamento danificado" in err and "fsck --repair" in err
+        
+        with pytest.raises(SystemExit):
+            TaskCrafterCLI(str(arquivo)).run(['fsck'])
+        out = capsys.readouterr().out
+        assert "Registros válidos: 1" in out and "Descartados: 1" in out
+        
+        TaskCrafterCLI(str(arquivo)).run(['fsck', '--repair'])
+        out = capsys.readouterr().out
+        assert "reparado com 1 registro(s)" in out
+        assert list(tmp_path.glob("tasks.json.corrupt-*"))
+        TaskCrafterCLI(str(arquivo)).run(['fsck'])
+        assert "íntegro: 1 registro(s)" in capsys.readouterr().out
+
+
+class TestCLIStatsBy:
+    """Testes de integração de stats --by."""
+    
+    def test_stats_agrupado(self, tmp_path, capsys):
+        """Teste E2E 31: stats --by agrupa e usa os mesmos formatos do list."""
+        cli = TaskCrafterCLI(str(tmp_path / "tasks.json"))
+        cli.run(['add', 'A', '-t', 'casa', 'work'])
+        cli.run(['add', 'B', '-t', 'casa', '-p', 'alta'])
+        cli.run(['done', 'B'])
+        capsys.readouterr()
+        
+        cli.run(['stats', '--by', 'tag,status'])
+        out = capsys.readouterr().out
+        assert "Tarefas por tag, status" in out
+        assert "casa  concluida      1" in out
+        
+        cli.run(['stats', '--by', 'prioridade', '-s', 'pendente', '-f', 'ndjson'])
+        assert [json.loads(l) for l in capsys.readouterr().out.splitlines()] == [
+            {"prioridade": "media", "total": 1}
+        ]
+        cli.run(['stats', '-f', 'json'])
+        assert json.loads(capsys.readouterr().out)["concluidas"] == 1
+        
+        with pytest.raises(SystemExit):
+            cli.run(['stats', '--by', 'dono'])
+        assert "Dimensão inválida" in capsys.readouterr().err
+
+
+class TestCLIFlowReport:
+    """Testes de integração de report flow e archive."""
+    
+    def test_report_flow_e_archive(self, tmp_path, capsys):
+        """Teste E2E 32: report flow mostra vazão e lead time, inclusive de tarefas arquivadas."""
+        cli = TaskCrafterCLI(str(tmp_path / "tasks.json"))
+        cli.run(['report', 'flow'])
+        assert "Nenhuma tarefa concluída" in capsys.readouterr().out
+        
+        cli.run(['add', 'A', '-p', 'alta', '-t', 'api'])
+        cli.run(['add', 'B'])
+        cli.run(['done', 'A'])
+        capsys.readouterr()
+        cli.run(['report', 'flow', '--por', 'dia'])
+        out = capsys.readouterr().out
+        assert "Vazão por dia" in out and "prioridade:alta" in out and "tag:api" in out
+        
+        cli.run(['archive', '--older-than', '0h', '--dry-run'])
+        assert "1 tarefa(s) seriam arquivadas" in capsys.readouterr().out
+        cli.run(['archive', '--older-than', '0h'])
+        assert "arquivada(s) em" in capsys.readouterr().out
+        
+        TaskCrafterCLI(str(tmp_path / "tasks.json")).run(['report', 'flow', '-f', 'json'])
+        relatorio = json.loads(capsys.readouterr().out)
+        assert relatorio["segmentos"] == 1
+        assert relatorio["lead_time"][0]["n"] == 1
+        assert [t.titulo for t in TaskManager(str(tmp_path / "tasks.json")).tasks] == ['B']
+
+
+class TestCLIWorkspace:
+    """Testes de integração de --workspace."""
+    
+    def test_consultas_federadas(self, tmp_path, capsys):
+        """Teste E2E 33: list, search e stats sobre vários armazenamentos com --workspace."""
+        for loja, titulo in (("web", "Login"), ("app", "Push"), ("app", "Login app")):
+            TaskCrafterCLI(str(tmp_path / loja / "tasks.json")).run(['add', titulo, '-t', loja])
+        manifesto = str(tmp_path / "ws.json")
+        cli = TaskCrafterCLI(str(tmp_path / "nao-usado.json"))
+        for loja in ("web", "app", "mobile"):
+            cli.run(['--workspace', manifesto, 'workspace', 'add', loja, f"{loja}/tasks.json"])
+        capsys.readouterr()
+        
+        cli.run(['--workspace', manifesto, 'list', '-f', 'ndjson', '--campos', 'titulo'])
+        capturado = capsys.readouterr()
+        assert [json.loads(l) for l in capturado.out.splitlines()] == [
+            {"loja": "web", "titulo": "Login"}, {"loja": "app", "titulo": "Push"},
+            {"loja": "app", "titulo": "Login app"},
+        ]
+        assert "Resultado parcial" in capturado.err and "mobile" in capturado.err
+        
+        cli.run(['--workspace', manifesto, 'search', 'login', '-n', '1'])
+        assert "1. [web]" in capsys.readouterr().out
+        cli.run(['--workspace', manifesto, 'stats', '-f', 'json'])
+        assert json.loads(capsys.readouterr().out)["total"] == 3
+        
+        with pytest.raises(SystemExit):
+            cli.run(['--workspace', manifesto, 'done', 'Login'])
+        assert "não é suportado com --workspace" in capsys.readouterr().err
+        assert not (tmp_path / "nao-usado.json").exists()
+
+
+class TestCLIReady:
+    """Testes de integração de dependências e do comando ready."""
+    
+    def test_ready_segue_as_dependencias(self, tmp_path, capsys):
+        """Teste E2E 34: add --depende, ready e update --depende entre execuções da CLI."""
+        arquivo = str(tmp_path / "tasks.json")
+        TaskCrafterCLI(arquivo).run(['add', 'Projeto', '-p', 'alta'])
+        TaskCrafterCLI(arquivo).run(['add', 'Código', '--depende', 'Projeto'])
+        TaskCrafterCLI(arquivo).run(['add', 'Revisão', '--depende', '#2'])
+        capsys.readouterr()
+        
+        TaskCrafterCLI(arquivo).run(['ready'])
+        out = capsys.readouterr().out
+        assert "Tarefas prontas: 1" in out and "Projeto" in out and "Código" not in out
+        
+        TaskCrafterCLI(arquivo).run(['done', 'Projeto'])
+        TaskCrafterCLI(arquivo).run(['list'])
+        assert "🔗 Depende de: #1" in capsys.readouterr().out
+        TaskCrafterCLI(arquivo).run(['ready', '-f', 'ndjson', '--campos', 'titulo,depende_de'])
+        assert [json.loads(l) for l in capsys.readouterr().out.splitlines()] == [
+            {"titulo": "Código", "depende_de": [1]}
+        ]
+        
+        with pytest.raises(SystemExit):
+            TaskCrafterCLI(arquivo).run(['update', 'Código', '--depende', 'Revisão'])
+        assert "circular" in capsys.readouterr().err
+        TaskCrafterCLI(arquivo).run(['update', 'Revisão', '--depende'])
+        capsys.readouterr()
+        TaskCrafterCLI(arquivo).run(['ready', '-o', 'titulo', '-f', 'json', '--campos', 'titulo'])
+        assert json.loads(capsys.readouterr().out) == [{"titulo": "Código"}, {"titulo": "Revisão"}]
+
+
+class TestCLITags:
+    """Testes de integração das tags hierárquicas."""
+    
+    def test_tags_e_filtro_por_subarvore(self, tmp_path, capsys):
+        """Teste E2E 35: tags lista contagens e list --tag aceita subárvore e prefixo."""
+        cli = TaskCrafterCLI(str(tmp_path / "tasks.json"))
+        cli.run(['add', 'Servidor', '-t', 'cliente/acme/infra'])
+        cli.run(['add', 'Site', '-t', 'cliente/acme/web', 'cliente/beta'])
+        cli.run(['add', 'Folha', '-t', 'interno/rh'])
+        capsys.readouterr()
+        
+        TaskCrafterCLI(str(tmp_path / "tasks.json")).run(['tags'])
+        out = capsys.readouterr().out
+        assert "Tags: 4" in out and "cliente/acme/infra      1" in out
+        cli.run(['tags', 'cliente/acme/*', '-f', 'ndjson'])
+        assert [json.loads(l) for l in capsys.readouterr().out.splitlines()] == [
+            {"tag": "cliente/acme/infra", "total": 1}, {"tag": "cliente/acme/web", "total": 1}
+        ]
+        
+        cli.run(['list', '-t', 'cliente/*', '-f', 'json', '--campos', 'titulo'])
+        assert json.loads(capsys.readouterr().out) == [{"titulo": "Servidor"}, {"titulo": "Site"}]
+        cli.run(['list', '-t', 'inter*', '-f', 'json', '--campos', 'titulo'])
+        assert json.loads(capsys.readouterr().out) == [{"titulo": "Folha"}]
+        cli.run(['tags', 'nada/*'])
+        assert "Nenhuma tag encontrada" in capsys.readouterr().out
+
+
+class TestCLIApproxStats:
+    """Testes de integração das estatísticas aproximadas."""
+    
+    def test_stats_approx(self, tmp_path, capsys):
+        """Teste E2E 36: stats --approx mostra estimativas com limites de erro."""
+        cli = TaskCrafterCLI(str(tmp_path / "tasks.json"))
+        cli.run(['add', 'Servidor', '-p', 'alta', '-t', 'infra', 'cliente/acme'])
+        cli.run(['add', 'Site', '-t', 'cliente/acme'])
+        cli.run(['add', 'Folha', '-p', 'baixa'])
+        cli.run(['done', 'Folha'])
+        capsys.readouterr()
+        
+        TaskCrafterCLI(str(tmp_path / "tasks.json")).run(['stats', '--approx'])
+        out = capsys.readouterr().out
+        assert "Total de tarefas: 3" in out
+        assert "• pendente: 2 (alta ~1 ±0, media ~1 ±0)" in out
+        assert "Tags distintas: ~2 ±1" in out and "cliente/acme: 1–2" in out
+        
+        cli.run(['stats', '--approx', '-n', '1', '-f', 'json'])
+        stats = json.loads(capsys.readouterr().out)
+        assert stats["top_tags"] == [{"tag": "cliente/acme", "estimativa": 2, "minimo": 1}]
+        assert stats["por_status"]["concluida"]["total"] == 1
+        
+        with pytest.raises(SystemExit):
+            cli.run(['stats', '--approx', '--by', 'tag'])
+        assert "não aceita --by" in capsys.readouterr().err
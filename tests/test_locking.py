@@ -0,0 +1,140 @@
+"""Testes das travas (locking.py) e do TaskManager entre threads e processos."""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from taskcrafter.locking import RWLock
+from taskcrafter.manager import TaskManager
+
+
+class TestRWLock:
+    """Testes da semântica da trava."""
+
+    def test_leitores_em_paralelo_e_escritor_exclusivo(self):
+        """Teste 111: Leitores simultâneos, escritor exclusivo, reentrada e promoção recusada."""
+        trava = RWLock()
+        barreira = threading.Barrier(3, timeout=5)
+
+        def ler():
+            with trava.read():
+                barreira.wait()  # só passa se os três leitores estiverem dentro ao mesmo tempo
+
+        leitores = [threading.Thread(target=ler) for _ in range(3)]
+        for leitor in leitores:
+            leitor.start()
+        for leitor in leitores:
+            leitor.join()
+        assert not barreira.broken
+
+        eventos = []
+        trava.acquire_read()
+        escritor = threading.Thread(target=lambda: (trava.acquire_write(), eventos.append("escreveu"),
+                                                    trava.release_write()))
+        escritor.start()
+        time.sleep(0.05)
+        assert eventos == []  # espera o leitor
+        # Um escritor esperando tem preferência sobre novos leitores, mas não sobre a reentrada
+        novo_leitor = threading.Thread(target=lambda: (trava.acquire_read(), eventos.append("leu"),
+                                                       trava.release_read()))
+        novo_leitor.start()
+        with trava.read():
+            pass
+        with pytest.raises(RuntimeError):
+            trava.acquire_write()
+        trava.release_read()
+        escritor.join(5)
+        novo_leitor.join(5)
+        assert eventos == ["escreveu", "leu"]
+
+        with trava.write():
+            with trava.write():
+                with trava.read():
+                    pass
+        with trava.read():
+            pass
+
+
+class TestThreadSafeManager:
+    """Testes do TaskManager compartilhado entre threads."""
+
+    def test_leituras_concorrentes_com_mutacoes(self, task_manager):
+        """Teste 112: Leitores nunca veem estados parciais e nenhuma mutação se perde."""
+        for i in range(20):
+            task_manager.add_task(f"Base {i}", tags=["base"])
+        erros = []
+        fim = threading.Event()
+
+        def escrever(indice):
+            try:
+                for n in range(15):
+                    task = task_manager.add_task(f"T{indice}-{n}", tags=[f"t{indice}"])
+                    task_manager.update_task(task.id, prioridade="alta")
+                    if n % 3 == 0:
+                        task_manager.mark_as_done(task.id)
+                task_manager.bulk_delete({"tag": f"t{indice}", "status": "concluida"})
+            except Exception as e:
+                erros.append(e)
+
+        def ler():
+            try:
+                while not fim.is_set():
+                    stats = task_manager.get_statistics()
+                    assert stats["total"] == stats["pendentes"] + stats["em_andamento"] + stats["concluidas"]
+                    grupos = task_manager.aggregate(["status"])
+                    assert sum(g["total"] for g in grupos) >= 20
+                    listadas = task_manager.list_tasks(ordenar_por="prioridade")
+                    assert len({t.id for t in listadas}) == len(listadas)
+                    task_manager.get_agenda()
+                    task_manager.metrics()
+            except Exception as e:
+                erros.append(e)
+
+        leitores = [threading.Thread(target=ler) for _ in range(4)]
+        escritores = [threading.Thread(target=escrever, args=(i,)) for i in range(4)]
+        intervalo = sys.getswitchinterval()
+        # Trocas de thread frequentes tornam as corridas reproduzíveis (sem a trava o teste falha)
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in leitores + escritores:
+                thread.start()
+            for thread in escritores:
+                thread.join()
+            fim.set()
+            for thread in leitores:
+                thread.join()
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        assert erros == []
+        # 15 tarefas por escritor, 5 concluídas e removidas em massa
+        assert len(task_manager.tasks) == 20 + 4 * 10
+        assert all(t.prioridade == "alta" for t in task_manager.list_tasks(tag="t0"))
+        recarregado = TaskManager(str(task_manager.data_file))
+        assert sorted(t.titulo for t in recarregado.tasks) == sorted(t.titulo for t in task_manager.tasks)
+        assert task_manager.metrics()["operacoes"]["add"]["total"] == 20 + 4 * 15
+
+
+class TestStoreBetweenProcesses:
+    """Testes de vários gerenciadores (processos) sobre o mesmo arquivo."""
+    
+    def test_mutacao_parte_do_estado_gravado(self, temp_data_file):
+        """Teste 126: Mutações recarregam gravações alheias; gravações adiadas conflitantes são recusadas."""
+        primeiro = TaskManager(temp_data_file)
+        segundo = TaskManager(temp_data_file)
+        primeiro.add_task("A")
+        segundo.add_task("B")
+        primeiro.update_task("A", prioridade="alta")
+        assert sorted(t.titulo for t in TaskManager(temp_data_file).tasks) == ["A", "B"]
+        assert TaskManager(temp_data_file).revision == 3
+        
+        with pytest.raises(ValueError, match="alterado por outro processo"):
+            with primeiro.batch():
+                primeiro.add_task("C")
+                segundo.delete_task("B")
+        assert sorted(t.titulo for t in TaskManager(temp_data_file).tasks) == ["A"]
+        primeiro.load_tasks()
+        primeiro.add_task("C")
+        assert sorted(t.titulo for t in TaskManager(temp_data_file).tasks) == ["A", "C"]
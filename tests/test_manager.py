@@ -3,6 +3,7 @@
 import pytest
 import json
 import os
+from datetime import date, timedelta
 
 from taskcrafter.manager import TaskManager
 from taskcrafter.models import Task
@@ -76,13 +77,18 @@ class TestTaskManagerPersistence:
         assert manager2.tasks[0].titulo == "Tarefa Persistente"
     
     def test_carregar_arquivo_invalido(self, temp_data_file):
-        """Teste 27: Arquivo JSON inválido deve iniciar lista vazia."""
+        """Teste 27: Arquivo JSON inválido deve iniciar lista vazia sem ser sobrescrito."""
         # Escrever JSON inválido
         with open(temp_data_file, 'w') as f:
             f.write("invalid json{")
         
         manager = TaskManager(temp_data_file)
         assert manager.tasks == []
+        assert manager.damage is not None
+        with pytest.raises(ValueError, match="fsck --repair"):
+            manager.add_task("Nova")
+        with open(temp_data_file) as f:
+            assert f.read() == "invalid json{"
 
 
 class TestTaskManagerOperations:
@@ -209,3 +215,153 @@ class TestTaskManagerStatistics:
         assert stats["por_prioridade"]["alta"] == 1
         assert stats["por_prioridade"]["media"] == 1
         assert stats["por_prioridade"]["baixa"] == 1
+
+
+class TestTaskManagerAgenda:
+    """Testes da agenda de vencimentos do gerenciador."""
+    
+    def test_agenda_acompanha_mutacoes(self, task_manager):
+        """Teste 49: A agenda reflete inclusões, conclusões e remoções."""
+        hoje = date(2025, 11, 20)
+        task_manager.add_task("Antiga", data_vencimento="2025-11-01")
+        task_manager.add_task("Próxima", data_vencimento="2025-11-30")
+        atrasadas, proximas = task_manager.get_agenda(hoje=hoje)
+        assert [t.titulo for t in atrasadas] == ["Antiga"]
+        assert [t.titulo for t in proximas] == ["Próxima"]
+        
+        task_manager.add_task("Urgente", prioridade="alta", data_vencimento="2025-11-30")
+        task_manager.mark_as_done("Antiga")
+        task_manager.delete_task("Próxima")
+        atrasadas, proximas = task_manager.get_agenda(hoje=hoje)
+        assert atrasadas == []
+        assert [t.titulo for t in proximas] == ["Urgente"]
+        
+        task_manager.update_task("Antiga", status="pendente")
+        assert [t.titulo for t in task_manager.get_agenda(hoje=hoje)[0]] == ["Antiga"]
+
+
+class TestTaskManagerIds:
+    """Testes de ids estáveis e renomeação."""
+    
+    def test_ids_monotonicos_e_persistidos(self, temp_data_file):
+        """Teste 71: Ids são crescentes e não são reutilizados após remoção."""
+        manager = TaskManager(temp_data_file)
+        ids = [manager.add_task(f"Tarefa {i}").id for i in range(3)]
+        assert ids == [1, 2, 3]
+        manager.delete_task(3)
+        
+        manager2 = TaskManager(temp_data_file)
+        assert [t.id for t in manager2.tasks] == [1, 2]
+        assert manager2.add_task("Nova").id == 4
+    
+    def test_buscar_por_id_ou_titulo(self, task_manager_with_tasks):
+        """Teste 72: Comandos aceitam id, #id ou título."""
+        manager = task_manager_with_tasks
+        assert manager.get_task(2).titulo == "Estudar Python"
+        assert manager.get_task("#3").titulo == "Fazer exercícios"
+        assert manager.get_task("1").titulo == "Comprar mantimentos"
+        assert manager.get_task("estudar python").id == 2
+        assert manager.get_task("#99") is None
+        
+        manager.mark_as_done("#2")
+        assert manager.get_task_by_id(2).status == "concluida"
+        assert manager.delete_task(1)
+        # As posições das tarefas seguintes continuam corretas
+        assert manager.get_task_by_id(3).titulo == "Fazer exercícios"
+    
+    def test_renomear_tarefa(self, task_manager_with_tasks):
+        """Teste 73: Renomear atualiza apenas o índice de títulos."""
+        manager = task_manager_with_tasks
+        task = manager.update_task(2, titulo="Estudar Rust")
+        assert task.id == 2
+        assert manager.get_task_by_title("Estudar Python") is None
+        assert manager.get_task_by_title("estudar rust") is task
+        assert manager.changes(since=manager.revision - 1)[0].antes["titulo"] == "Estudar Python"
+        
+        with pytest.raises(ValueError, match="Já existe"):
+            manager.update_task(2, titulo="Comprar mantimentos")
+        assert manager.get_task_by_id(2).titulo == "Estudar Rust"
+    
+    def test_arquivo_sem_ids_recebe_ids(self, temp_data_file):
+        """Teste 74: Armazenamentos antigos, sem ids, recebem ids estáveis."""
+        with open(temp_data_file, 'w') as f:
+            json.dump([Task(titulo="A").to_dict() | {"id": None},
+                       {"titulo": "B", "data_criacao": "2025-01-01T10:00:00"}], f)
+        
+        manager = TaskManager(temp_data_file)
+        assert [t.id for t in manager.tasks] == [1, 2]
+        assert [t.id for t in TaskManager(temp_data_file).tasks] == [1, 2]
+        manager.add_task("C")
+        with open(temp_data_file) as f:
+            assert [d["id"] for d in json.load(f)] == [1, 2, 3]
+
+
+class TestTaskManagerBulk:
+    """Testes de mutações em massa."""
+    
+    @pytest.fixture
+    def sprint(self, task_manager):
+        """Gerenciador com tarefas de duas sprints."""
+        with task_manager.batch():
+            for i in range(4):
+                task_manager.add_task(f"Sprint 12 - {i}", tags=["sprint-12"])
+            task_manager.add_task("Sprint 13 - 0", tags=["sprint-13"])
+        return task_manager
+    
+    def test_lote_grava_uma_vez(self, sprint):
+        """Teste 75: Mutações dentro de batch() são gravadas uma única vez."""
+        assert sprint.metrics()["operacoes"]["save"]["total"] == 1
+        assert len(TaskManager(str(sprint.data_file)).tasks) == 5
+        assert sprint.revision == 5
+    
+    def test_concluir_em_massa(self, sprint):
+        """Teste 76: bulk_done conclui todas as tarefas do filtro e grava uma vez."""
+        assert len(sprint.bulk_done({"tag": "sprint-12"}, dry_run=True)) == 4
+        assert sprint.list_tasks(status="concluida") == []
+        
+        sprint.bulk_done({"tag": "sprint-12"})
+        assert len(sprint.list_tasks(status="concluida")) == 4
+        assert sprint.metrics()["operacoes"]["save"]["total"] == 2
+    
+    def test_atualizar_e_remover_em_massa(self, sprint):
+        """Teste 77: bulk_update e bulk_delete com idade mínima."""
+        sprint.bulk_update({"status": "pendente", "tag": "sprint-13"}, {"prioridade": "alta"})
+        assert [t.titulo for t in sprint.list_tasks(prioridade="alta")] == ["Sprint 13 - 0"]
+        
+        sprint.bulk_done({"tag": "sprint-12"})
+        assert sprint.bulk_delete({"status": "concluida"}, older_than=timedelta(days=90)) == []
+        removidas = sprint.bulk_delete({"status": "concluida"}, older_than=timedelta(0))
+        assert len(removidas) == 4
+        assert [t.titulo for t in sprint.tasks] == ["Sprint 13 - 0"]
+        assert sprint.get_task_by_id(5).titulo == "Sprint 13 - 0"
+        assert sprint.get_task_by_title("Sprint 12 - 0") is None
+    
+    def test_filtro_invalido(self, sprint):
+        """Teste 78: Filtros desconhecidos e renomeação em massa são rejeitados."""
+        with pytest.raises(ValueError, match="Filtro inválido"):
+            sprint.select({"cor": "azul"})
+        with pytest.raises(ValueError, match="renomear"):
+            sprint.bulk_update({"tag": "sprint-12"}, {"titulo": "X"})
+    
+    def test_aplicar_operacoes(self, task_manager):
+        """Teste 79: apply_operation executa operações descritas como dicionários."""
+        with task_manager.batch():
+            criada = task_manager.apply_operation(
+                {"op": "add", "titulo": "Lote", "vencimento": "2030-01-01", "tags": ["x"]}
+            )
+            task_manager.apply_operation({"op": "update", "id": criada["tarefa"]["id"], "prioridade": "alta"})
+            task_manager.apply_operation({"op": "done", "tarefa": "#1"})
+        
+        task = TaskManager(str(task_manager.data_file)).get_task(1)
+        assert (task.prioridade, task.status, task.data_vencimento) == ("alta", "concluida", "2030-01-01")
+        assert task_manager.apply_operation({"op": "delete", "tarefa": "lote"})["tarefa"]["id"] == 1
+        assert task_manager.tasks == []
+    
+    def test_operacoes_invalidas(self, task_manager):
+        """Teste 80: Operações malformadas levantam ValueError."""
+        for operacao, mensagem in (([], "objeto"), ({"op": "fly"}, "Operação inválida"),
+                                   ({"op": "add"}, "titulo"), ({"op": "done"}, "tarefa"),
+                                   ({"op": "add", "titulo": "X", "cor": "azul"}, "cor"),
+                                   ({"op": "delete", "tarefa": 99}, "não encontrada")):
+            with pytest.raises(ValueError, match=mensagem):
+                task_manager.apply_operation(operacao)
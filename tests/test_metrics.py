@@ -0,0 +1,64 @@
+"""Testes unitários para o módulo metrics.py."""
+
+import pytest
+
+from taskcrafter.metrics import Histogram, render_prometheus, write_textfile
+
+
+class TestHistogram:
+    """Testes do histograma de latências."""
+    
+    def test_buckets_cumulativos(self):
+        """Teste 56: Observações caem no bucket correto e acumulam."""
+        histograma = Histogram((0.01, 0.1))
+        for valor in (0.001, 0.01, 0.05, 3.0):
+            histograma.observe(valor)
+        assert histograma.cumulative() == [2, 3, 4]
+        assert histograma.total == 4
+        assert histograma.soma == pytest.approx(3.061)
+
+
+class TestManagerMetrics:
+    """Testes das métricas coletadas pelo TaskManager."""
+    
+    def test_contadores_e_erros_por_operacao(self, task_manager):
+        """Teste 57: Cada operação é contada, inclusive quando falha."""
+        task_manager.add_task("Tarefa 1")
+        task_manager.list_tasks()
+        task_manager.mark_as_done("Tarefa 1")
+        with pytest.raises(ValueError):
+            task_manager.update_task("Não existe", descricao="x")
+        
+        metricas = task_manager.metrics()
+        operacoes = metricas["operacoes"]
+        assert operacoes["load"]["total"] == 1
+        assert operacoes["add"]["total"] == 1
+        assert operacoes["save"]["total"] == 2
+        assert operacoes["update"]["erros"] == 1
+        assert operacoes["list"]["buckets"]["+Inf"] == 1
+        assert metricas["gauges"]["store_tasks"] == 1
+        assert metricas["gauges"]["store_file_bytes"] > 0
+        assert metricas["indices"]["tarefas"] == 1
+    
+    def test_exportar_textfile_prometheus(self, task_manager, tmp_path):
+        """Teste 58: O arquivo .prom é gravado no formato texto do Prometheus."""
+        task_manager.add_task('Título com "aspas"')
+        task_manager.get_agenda()
+        destino = tmp_path / "textfile" / "taskcrafter.prom"
+        task_manager.write_prometheus(str(destino))
+        
+        texto = destino.read_text(encoding='utf-8')
+        assert '# TYPE taskcrafter_operation_duration_seconds histogram' in texto
+        assert 'taskcrafter_operations_total{op="add"} 1' in texto
+        assert 'taskcrafter_operation_duration_seconds_bucket{op="add",le="+Inf"} 1' in texto
+        assert 'taskcrafter_store_tasks 1' in texto
+        assert 'taskcrafter_index_entries{index="agenda"} 0' in texto
+        assert list(destino.parent.iterdir()) == [destino]
+    
+    def test_rotulos_escapados(self, tmp_path):
+        """Teste 59: Valores de rótulos são escapados e a escrita é atômica."""
+        metricas = {"operacoes": {'a"b': {"total": 0, "erros": 1, "soma_s": 0.0, "buckets": {}}}}
+        texto = render_prometheus(metricas)
+        assert 'op="a\\"b"' in texto
+        write_textfile(tmp_path / "m.prom", texto)
+        assert (tmp_path / "m.prom").read_text(encoding='utf-8') == texto
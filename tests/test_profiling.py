@@ -0,0 +1,53 @@
+"""Testes unitários para o módulo profiling.py."""
+
+import tracemalloc
+
+from taskcrafter.manager import TaskManager
+from taskcrafter.profiling import NULL_PROFILER, Profiler
+
+
+class TestProfiler:
+    """Testes da instrumentação de fases."""
+    
+    def test_fases_do_manager(self, temp_data_file):
+        """Teste 53: O manager reporta as fases de leitura, validação e listagem."""
+        TaskManager(temp_data_file).add_task("Tarefa 1")
+        profiler = Profiler(memoria=False)
+        manager = TaskManager(temp_data_file, profiler=profiler, load_cache=False)
+        manager.list_tasks(ordenar_por="titulo")
+        manager.get_statistics()
+        
+        fases = {f["fase"]: f for f in profiler.report()}
+        assert set(fases) == {"carregar.leitura", "carregar.validacao", "listar.filtro",
+                              "listar.ordenacao", "estatisticas"}
+        assert fases["carregar.validacao"]["registros"] == 1
+        assert fases["listar.filtro"]["chamadas"] == 1
+        assert fases["listar.filtro"]["tempo_s"] >= 0
+    
+    def test_pico_de_memoria_aninhado_e_listeners(self):
+        """Teste 54: O pico de uma fase interna é propagado para a externa."""
+        eventos = []
+        profiler = Profiler(listeners=[lambda *args: eventos.append(args)])
+        profiler.start()
+        try:
+            with profiler.phase("externa"):
+                with profiler.phase("interna", 3) as fase:
+                    dados = [bytes(1024) for _ in range(200)]
+                    fase.registros += 1
+                del dados
+        finally:
+            profiler.stop()
+        assert not tracemalloc.is_tracing()
+        
+        fases = {f["fase"]: f for f in profiler.report()}
+        assert fases["interna"]["registros"] == 4
+        assert fases["interna"]["pico_memoria_bytes"] >= 200 * 1024
+        assert fases["externa"]["pico_memoria_bytes"] >= fases["interna"]["pico_memoria_bytes"]
+        assert [e[0] for e in eventos] == ["interna", "externa"]
+        assert "interna" in profiler.format_report()
+    
+    def test_profiler_nulo(self):
+        """Teste 55: O profiler desativado não registra nada."""
+        with NULL_PROFILER.phase("qualquer", 10) as fase:
+            fase.registros = 5
+        assert NULL_PROFILER.report() == []
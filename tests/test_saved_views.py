@@ -0,0 +1,86 @@
+"""Testes das visões salvas (saved_views.py)."""
+
+from datetime import date
+
+import pytest
+
+from taskcrafter.manager import TaskManager
+from taskcrafter.saved_views import SavedView
+
+
+class TestSavedViews:
+    """Testes de definição, persistência e materialização de visões."""
+    
+    def test_definicao_persistida(self, task_manager):
+        """Teste 86: Visões são gravadas ao lado do armazenamento e validadas."""
+        task_manager.save_view("urgentes", {"prioridade": "alta", "status": "pendente"}, "titulo")
+        task_manager.save_view("cliente", {"tag": "cliente-x"})
+        
+        outro = TaskManager(str(task_manager.data_file))
+        assert [v.nome for v in outro.saved_views()] == ["cliente", "urgentes"]
+        assert outro.saved_views()[1].ordenar_por == "titulo"
+        assert outro.delete_view("cliente") and not outro.delete_view("cliente")
+        
+        for nome, filtros, ordem, mensagem in (("", {}, "titulo", "vazio"),
+                                                ("x", {"cor": "azul"}, "titulo", "Filtro inválido"),
+                                                ("x", {"vence_em": "semana"}, "titulo", "vence_em"),
+                                                ("x", {}, "cor", "Ordenação")):
+            with pytest.raises(ValueError, match=mensagem):
+                SavedView(nome, filtros, ordem)
+        with pytest.raises(ValueError, match="não encontrada"):
+            outro.run_view("cliente")
+    
+    def test_resultado_mantido_incrementalmente(self, task_manager_with_tasks):
+        """Teste 87: Mutações atualizam o resultado materializado sem recalcular."""
+        manager = task_manager_with_tasks
+        manager.save_view("urgentes", {"prioridade": "alta", "status": "pendente"}, "titulo")
+        assert [t.titulo for t in manager.run_view("urgentes")] == ["Comprar mantimentos"]
+        
+        manager.add_task("Apagar incêndio", prioridade="alta")
+        manager.update_task("Estudar Python", prioridade="alta")
+        manager.mark_as_done("Comprar mantimentos")
+        manager.add_task("Baixa", prioridade="baixa")
+        assert manager.metrics()["indices"]["visao.urgentes"] == 2
+        
+        manager.tasks[0].prioridade = "baixa"  # alteração fora do manager não é vista
+        assert [t.titulo for t in manager.run_view("urgentes")] == ["Apagar incêndio", "Estudar Python"]
+        manager.delete_task("Apagar incêndio")
+        assert [t.titulo for t in manager.run_view("urgentes")] == ["Estudar Python"]
+        
+        recarregado = TaskManager(str(manager.data_file))
+        assert [t.titulo for t in recarregado.run_view("urgentes")] == ["Estudar Python"]
+    
+    def test_janela_de_vencimento(self, task_manager):
+        """Teste 88: vence_em usa a data de referência e é recalculada quando o dia muda."""
+        task_manager.add_task("Hoje", data_vencimento="2030-01-01", tags=["cliente-x"])
+        task_manager.add_task("Semana", data_vencimento="2030-01-07", tags=["cliente-x"])
+        task_manager.add_task("Depois", data_vencimento="2030-01-20", tags=["cliente-x"])
+        task_manager.add_task("Sem prazo", tags=["cliente-x"])
+        task_manager.save_view("semana", {"tag": "cliente-x", "vence_em": "7d"}, "data_vencimento")
+        
+        assert [t.titulo for t in task_manager.run_view("semana", date(2030, 1, 1))] == ["Hoje", "Semana"]
+        task_manager.update_task("Depois", data_vencimento="2030-01-05")
+        assert [t.titulo for t in task_manager.run_view("semana", date(2030, 1, 1))] == ["Hoje", "Depois", "Semana"]
+        assert [t.titulo for t in task_manager.run_view("semana", date(2030, 1, 6))] == ["Semana"]
+    
+    def test_definicoes_ilegiveis_nao_sao_sobrescritas(self, task_manager):
+        """Teste 129: Um views.json truncado é um erro, não "nenhuma visão", e não é apagado."""
+        task_manager.save_view("urgentes", {"prioridade": "alta"})
+        task_manager.save_view("cliente", {"tag": "cliente-x"})
+        arquivo = task_manager._sidecar("views.json")
+        truncado = arquivo.read_bytes()[:-20]
+        arquivo.write_bytes(truncado)
+        
+        outro = TaskManager(str(task_manager.data_file))
+        with pytest.raises(ValueError, match="visões salvas inválido"):
+            outro.saved_views()
+        with pytest.raises(ValueError, match="visões salvas inválido"):
+            outro.save_view("nova", {"status": "pendente"})
+        assert arquivo.read_bytes() == truncado
+        
+        arquivo.unlink()
+        outro.load_tasks()
+        assert outro.saved_views() == []
+        outro.save_view("nova", {"status": "pendente"})
+        assert [v.nome for v in TaskManager(str(task_manager.data_file)).saved_views()] == ["nova"]
+        assert not list(arquivo.parent.glob(f".{arquivo.name}.*"))
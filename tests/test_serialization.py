@@ -0,0 +1,138 @@
+"""Testes dos codecs de serialização (serialization.py)."""
+
+import gzip
+import json
+import lzma
+from pathlib import Path
+
+import pytest
+
+from taskcrafter import serialization
+from taskcrafter.manager import TaskManager
+from taskcrafter.serialization import CODECS, codec_for, decode_records, load_bytes
+
+
+REGISTROS = [{"id": 1, "titulo": "Ação", "tags": ["x"], "data_vencimento": None}]
+
+
+class TestCodecs:
+    """Testes de seleção, gravação e leitura dos codecs."""
+    
+    def test_ida_e_volta(self):
+        """Teste 93: Todos os codecs preservam os dados e a leitura detecta a compressão."""
+        for nome, codec in CODECS.items():
+            assert load_bytes(codec.dumps(REGISTROS)) == REGISTROS, nome
+            assert codec.loads(codec.dumps(REGISTROS)) == REGISTROS, nome
+        assert gzip.decompress(CODECS["gzip"].dumps(REGISTROS)).startswith(b'[\n{"_crc":"')
+        assert load_bytes(lzma.decompress(CODECS["xz"].dumps(REGISTROS))) == REGISTROS
+        assert b'"id": 1, "titulo"' in CODECS["json"].dumps(REGISTROS)
+        assert b" " not in CODECS["json-compact"].dumps([{"a": 1}])
+        
+        with pytest.raises(ValueError, match="comprimido"):
+            load_bytes(b"\x1f\x8b" + b"lixo")
+        with pytest.raises(ValueError):
+            load_bytes(b"{lixo")
+    
+    def test_selecao_e_fallback(self, monkeypatch):
+        """Teste 94: O sufixo define o codec, o nome explícito prevalece e orjson é opcional."""
+        assert codec_for("tasks.json").nome == "json"
+        assert codec_for("tasks.json.gz").nome == "gzip"
+        assert codec_for("TASKS.XZ").nome == "xz"
+        assert codec_for("tasks.json.gz", "json-compact").nome == "json-compact"
+        with pytest.raises(ValueError, match="Codec inválido"):
+            codec_for("tasks.json", "bson")
+        
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert CODECS["orjson"].dumps(REGISTROS) == CODECS["json-compact"].dumps(REGISTROS)
+        assert load_bytes(CODECS["json"].dumps(REGISTROS)) == REGISTROS
+    
+    def test_manager_com_codec(self, tmp_path):
+        """Teste 95: O manager grava com o codec escolhido e lê qualquer formato."""
+        arquivo = tmp_path / "tasks.json.gz"
+        manager = TaskManager(str(arquivo))
+        manager.add_task("Comprimida", descricao="x" * 5000)
+        assert arquivo.read_bytes()[:2] == b"\x1f\x8b"
+        
+        # Troca de codec sem conversão: lê gzip e grava xz
+        outro = TaskManager(str(arquivo), codec="xz")
+        assert outro.get_task("Comprimida").descricao == "x" * 5000
+        outro.add_task("Outra")
+        assert arquivo.read_bytes()[:6] == b"\xfd7zXZ\x00"
+        assert [t.titulo for t in TaskManager(str(arquivo)).tasks] == ["Comprimida", "Outra"]
+
+
+class TestChecksums:
+    """Testes dos checksums por registro e da recuperação de arquivos danificados."""
+    
+    def test_byte_corrompido_invalida_so_o_registro(self):
+        """Teste 97: Um byte alterado descarta apenas o registro da sua linha."""
+        registros = [{"id": i, "titulo": f"Tarefa {i}"} for i in range(1, 4)]
+        conteudo = CODECS["json"].dumps(registros).replace(b"Tarefa 2", b"Tarefa X")
+        
+        recuperados, dano = decode_records(conteudo)
+        assert [r["id"] for r in recuperados] == [1, 3]
+        assert dano.recuperados == 2 and dano.descartados == 1
+        assert "checksum" in dano.erro
+        assert decode_records(b"") == ([], None)
+        assert decode_records(b"  \n") == ([], None)
+    
+    def test_salvage_truncado_e_legado(self):
+        """Teste 98: Arquivos truncados (comprimidos ou antigos, sem checksum) são recuperados."""
+        registros = [{"id": i, "titulo": f"T{i}", "tags": ["a"]} for i in range(1, 501)]
+        truncado = CODECS["gzip"].dumps(registros)[:-200]
+        recuperados, dano = decode_records(truncado)
+        assert dano is not None
+        assert 0 < len(recuperados) < 500
+        assert recuperados == registros[:len(recuperados)]
+        
+        legado = json.dumps(registros, indent=2).encode()
+        assert decode_records(legado) == (registros, None)
+        recuperados, dano = decode_records(legado[:len(legado) // 2])
+        assert dano is not None and recuperados == registros[:len(recuperados)]
+    
+    def test_fsck_repara_com_backup(self, tmp_path):
+        """Teste 99: fsck relata o dano e o reparo regrava só os registros válidos."""
+        arquivo = tmp_path / "tasks.json"
+        manager = TaskManager(str(arquivo))
+        for titulo in ("Alfa", "Beta", "Gama"):
+            manager.add_task(titulo)
+        original = arquivo.read_bytes().replace(b"Beta", b"Bet\x00")
+        arquivo.write_bytes(original)
+        
+        danificado = TaskManager(str(arquivo))
+        assert [t.titulo for t in danificado.tasks] == ["Alfa", "Gama"]
+        with pytest.raises(ValueError, match="danificado"):
+            danificado.save_tasks()
+        assert danificado.fsck() == {"ok": False, "erro": danificado.damage.erro,
+                                     "registros": 2, "descartados": 1, "backup": None}
+        
+        relatorio = danificado.fsck(repair=True)
+        assert Path(relatorio["backup"]).read_bytes() == original
+        assert danificado.damage is None
+        assert TaskManager(str(arquivo)).fsck()["ok"]
+        danificado.add_task("Delta")
+        assert [t.titulo for t in TaskManager(str(arquivo)).tasks] == ["Alfa", "Gama", "Delta"]
+    
+    def test_gravacao_interrompida_preserva_arquivo(self, tmp_path, monkeypatch):
+        """Teste 123: Uma gravação interrompida deixa o arquivo anterior inteiro, sem temporários."""
+        arquivo = tmp_path / "tasks.json"
+        manager = TaskManager(str(arquivo))
+        manager.add_task("Alfa", descricao="x" * 5000)
+        manager.add_task("Beta")
+        anterior = arquivo.read_bytes()
+        
+        def interromper(*args):
+            raise OSError("queda simulada")
+        monkeypatch.setattr(serialization.os, "replace", interromper)
+        with pytest.raises(OSError, match="queda simulada"):
+            manager.add_task("Gama")
+        with pytest.raises(OSError, match="queda simulada"):
+            manager._write_meta()
+        monkeypatch.undo()
+        
+        assert arquivo.read_bytes() == anterior
+        assert not list(tmp_path.glob("*.tmp"))
+        recarregado = TaskManager(str(arquivo))
+        assert recarregado.fsck()["ok"] and recarregado.damage is None
+        assert [t.titulo for t in recarregado.tasks] == ["Alfa", "Beta"]
+        assert recarregado.get_task("Alfa").descricao == "x" * 5000
@@ -0,0 +1,165 @@
+"""Testes da API HTTP local (server.py)."""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from taskcrafter.manager import TaskManager
+from taskcrafter.server import TaskServer
+
+
+@pytest.fixture
+def servidor(task_manager):
+    """Servidor em uma porta livre, atendendo em segundo plano."""
+    servidor = TaskServer(("127.0.0.1", 0), task_manager, quiet=True)
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    yield servidor
+    servidor.shutdown()
+    servidor.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def conexao(servidor):
+    """Conexão persistente (keep-alive) com o servidor."""
+    conexao = http.client.HTTPConnection(*servidor.server_address[:2], timeout=5)
+    yield conexao
+    conexao.close()
+
+
+def _pedir(conexao, metodo, caminho, corpo=None, cabecalhos=None):
+    dados = json.dumps(corpo).encode() if corpo is not None else None
+    conexao.request(metodo, caminho, body=dados, headers=cabecalhos or {})
+    resposta = conexao.getresponse()
+    conteudo = resposta.read()
+    return resposta, conteudo
+
+
+def _json(conexao, metodo, caminho, corpo=None, cabecalhos=None):
+    resposta, conteudo = _pedir(conexao, metodo, caminho, corpo, cabecalhos)
+    return resposta, json.loads(conteudo) if conteudo else None
+
+
+class TestHTTPAPI:
+    """Testes dos endpoints da API."""
+
+    def test_crud_e_erros(self, conexao, task_manager):
+        """Teste 114: Criar, obter, atualizar, concluir e remover; erros viram JSON com status."""
+        resposta, tarefa = _json(conexao, "POST", "/tasks",
+                                 {"titulo": "Deploy", "prioridade": "alta", "tags": ["ops"]})
+        assert resposta.status == 201 and resposta.getheader("Location") == f"/tasks/{tarefa['id']}"
+        assert tarefa["titulo"] == "Deploy" and tarefa["status"] == "pendente"
+
+        resposta, obtida = _json(conexao, "GET", "/tasks/Deploy?campos=id,titulo")
+        assert obtida == {"id": tarefa["id"], "titulo": "Deploy"}
+
+        _, atualizada = _json(conexao, "PATCH", f"/tasks/{tarefa['id']}", {"status": "andamento"})
+        assert atualizada["status"] == "andamento"
+        _, concluida = _json(conexao, "POST", "/tasks/Deploy/done")
+        assert concluida["status"] == "concluida"
+        assert TaskManager(str(task_manager.data_file)).get_task("Deploy").status == "concluida"
+
+        resposta, erro = _json(conexao, "POST", "/tasks", {"titulo": "Deploy"})
+        assert resposta.status == 400 and "erro" in erro
+        resposta, erro = _json(conexao, "PATCH", "/tasks/Deploy", {"prioridade": "urgente"})
+        assert resposta.status == 400
+        # O corpo de uma requisição recusada é descartado sem quebrar a conexão
+        assert _json(conexao, "PATCH", "/tasks/Nada", {"status": "pendente"})[0].status == 404
+        assert _json(conexao, "GET", "/tasks/Inexistente")[0].status == 404
+        assert _json(conexao, "GET", "/nada")[0].status == 404
+        resposta, _ = _json(conexao, "PUT", "/tasks/Deploy", {"titulo": "X"})
+        assert resposta.status == 405 and resposta.getheader("Allow") == "GET, PATCH, DELETE"
+        resposta, _ = _json(conexao, "DELETE", "/tasks")
+        assert resposta.status == 405 and resposta.getheader("Allow") == "GET, POST"
+        assert _json(conexao, "GET", "/tasks?limite=0")[0].status == 400
+        assert _json(conexao, "GET", "/tasks?dono=eu")[0].status == 400
+        assert _json(conexao, "GET", "/tasks?campos=dono")[0].status == 400
+
+        resposta, removida = _json(conexao, "DELETE", "/tasks/Deploy")
+        assert resposta.status == 200 and removida["titulo"] == "Deploy"
+        assert task_manager.get_task("Deploy") is None
+
+        # Content-Length inválido: 400 e a conexão é encerrada (o fim do corpo é desconhecido)
+        for valor in ("abc", "-5"):
+            conexao.putrequest("POST", "/tasks")
+            conexao.putheader("Content-Length", valor)
+            conexao.endheaders()
+            resposta = conexao.getresponse()
+            assert resposta.status == 400 and "Content-Length" in json.loads(resposta.read())["erro"]
+            assert resposta.getheader("Connection") == "close"
+        assert _json(conexao, "GET", "/tasks")[0].status == 200
+
+        # Alvo que não é uma URL válida: 400, e a conexão continua utilizável
+        conexao.putrequest("GET", "http://[x/tasks", skip_host=True)
+        conexao.endheaders()
+        resposta = conexao.getresponse()
+        assert resposta.status == 400 and "URL inválida" in json.loads(resposta.read())["erro"]
+        assert _json(conexao, "GET", "/tasks")[0].status == 200
+
+    def test_listagem_paginada_etag_e_ndjson(self, conexao, task_manager):
+        """Teste 115: Filtros e paginação do list, ETag com 304, NDJSON em blocos e keep-alive."""
+        for i in range(5):
+            task_manager.add_task(f"T{i}", prioridade="alta" if i % 2 else "baixa", tags=["api"])
+        task_manager.add_task("Outra")
+
+        resposta, pagina = _json(conexao, "GET", "/tasks?tag=api&ordenar=titulo&limite=2")
+        socket = conexao.sock
+        assert [t["titulo"] for t in pagina["tarefas"]] == ["T0", "T1"]
+        assert pagina["total"] == 5 and pagina["proximo"] == "/tasks?tag=api&ordenar=titulo&limite=2&offset=2"
+        assert resposta.getheader("Link") == f'<{pagina["proximo"]}>; rel="next"'
+        _, seguinte = _json(conexao, "GET", pagina["proximo"])
+        assert [t["titulo"] for t in seguinte["tarefas"]] == ["T2", "T3"]
+        _, ultima = _json(conexao, "GET", "/tasks?tag=api&ordenar=titulo&limite=2&offset=4")
+        assert ultima["proximo"] is None and len(ultima["tarefas"]) == 1
+        _, altas = _json(conexao, "GET", "/tasks?prioridade=alta&campos=titulo")
+        assert altas["tarefas"] == [{"titulo": "T1"}, {"titulo": "T3"}]
+
+        etag = resposta.getheader("ETag")
+        assert etag == f'"{task_manager.revision}"'
+        resposta, corpo = _pedir(conexao, "GET", "/tasks?tag=api", cabecalhos={"If-None-Match": etag})
+        assert resposta.status == 304 and corpo == b""
+        task_manager.update_task("T0", prioridade="media")
+        resposta, _ = _pedir(conexao, "GET", "/tasks?tag=api", cabecalhos={"If-None-Match": etag})
+        assert resposta.status == 200 and resposta.getheader("ETag") != etag
+
+        resposta, corpo = _pedir(conexao, "GET", "/tasks?campos=id,titulo",
+                                 cabecalhos={"Accept": "application/x-ndjson"})
+        assert resposta.getheader("Transfer-Encoding") == "chunked"
+        assert resposta.getheader("X-Total-Count") == "6"
+        linhas = [json.loads(linha) for linha in corpo.decode().splitlines()]
+        assert [linha["titulo"] for linha in linhas] == ["T0", "T1", "T2", "T3", "T4", "Outra"]
+
+        _, achadas = _json(conexao, "GET", "/search?q=outr")
+        assert [t["titulo"] for t in achadas["tarefas"]] == ["Outra"]
+        # Todas as requisições acima usaram a mesma conexão
+        assert conexao.sock is socket
+
+    def test_consultas_e_alteracoes_externas(self, conexao, task_manager):
+        """Teste 116: stats, agenda, changes e metrics; alterações de outro processo são recarregadas."""
+        task_manager.add_task("A", tags=["casa"], data_vencimento="2000-01-01")
+        task_manager.add_task("B", tags=["casa"])
+        revisao = task_manager.revision
+
+        _, stats = _json(conexao, "GET", "/stats")
+        assert stats["total"] == 2
+        _, grupos = _json(conexao, "GET", "/stats?by=tag,status")
+        assert grupos == [{"tag": "casa", "status": "pendente", "total": 2}]
+        assert _json(conexao, "GET", "/stats?status=pendente")[0].status == 400
+        _, agenda = _json(conexao, "GET", "/agenda")
+        assert [t["titulo"] for t in agenda["atrasadas"]] == ["A"]
+
+        # Outro processo (a CLI, por exemplo) altera o arquivo de dados
+        externo = TaskManager(str(task_manager.data_file))
+        externo.add_task("C")
+        _, mudancas = _json(conexao, "GET", f"/changes?since={revisao}")
+        assert [e["titulo"] for e in mudancas["eventos"]] == ["C"]
+        assert task_manager.get_task("C") is not None
+
+        resposta, texto = _pedir(conexao, "GET", "/metrics")
+        texto = texto.decode()
+        assert resposta.getheader("Content-Type").startswith("text/plain")
+        assert 'taskcrafter_operations_total{op="add"}' in texto
+        assert 'taskcrafter_http_operations_total{op="GET /stats"} 3' in texto
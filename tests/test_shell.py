@@ -0,0 +1,157 @@
+"""Testes do shell interativo (shell.py)."""
+
+import time
+from datetime import datetime, timedelta
+from io import StringIO
+
+import pytest
+
+from taskcrafter.archive import segments
+from taskcrafter.cli import TaskCrafterCLI
+from taskcrafter.manager import TaskManager
+from taskcrafter.shell import TaskShell
+
+
+def _salvamentos(manager):
+    return manager.metrics()["operacoes"].get("save", {}).get("total", 0)
+
+
+class TestTaskShell:
+    """Testes do REPL com gravação em segundo plano."""
+    
+    def test_sessao_grava_ao_salvar_e_ao_sair(self, temp_data_file, capsys):
+        """Teste 81: Comandos usam o mesmo manager e só gravam em salvar/sair."""
+        cli = TaskCrafterCLI(temp_data_file)
+        entrada = StringIO(
+            'add "Revisar PR" -t codigo\n'
+            'add "Revisar PR"\n'
+            '\n'
+            'done #1\n'
+            'salvar\n'
+            'salvar\n'
+            'add Outra\n'
+            'batch x.txt\n'
+            'sair\n'
+        )
+        shell = TaskShell(cli, intervalo=60, stdin=entrada, stdout=StringIO())
+        shell.cmdloop()
+        
+        out, err = capsys.readouterr()
+        assert 'Tarefa criada (#1)' in out and 'Tarefa concluída' in out
+        assert "Já existe" in err and "O comando batch" in err
+        assert shell.stdout.getvalue().count('💾') == 2
+        assert _salvamentos(cli.manager) == 2
+        assert [t.titulo for t in TaskManager(temp_data_file).tasks] == ['Revisar PR', 'Outra']
+    
+    def test_gravacao_em_segundo_plano(self, temp_data_file):
+        """Teste 82: Alterações são gravadas pelo timer após o intervalo."""
+        cli = TaskCrafterCLI(temp_data_file)
+        shell = TaskShell(cli, intervalo=0.05, stdout=StringIO())
+        with cli.manager.batch():
+            shell.onecmd('add A')
+            shell.onecmd('add B')
+            assert cli.manager.pending_save
+            prazo = time.monotonic() + 5
+            while cli.manager.pending_save and time.monotonic() < prazo:
+                time.sleep(0.01)
+            assert [t.titulo for t in TaskManager(temp_data_file).tasks] == ['A', 'B']
+        assert _salvamentos(cli.manager) == 1
+    
+    def test_completacao(self, temp_data_file):
+        """Teste 83: Completa comandos, títulos (com espaços) e tags a partir da memória."""
+        cli = TaskCrafterCLI(temp_data_file)
+        cli.manager.add_task("Revisar PR 12", tags=["codigo", "review"])
+        cli.manager.add_task("Revisar docs", tags=["docs"])
+        shell = TaskShell(cli, stdout=StringIO())
+        
+        assert 'done' in shell.completenames('do')
+        assert 'batch' not in shell.completenames('b')
+        assert shell.completedefault('rev', 'done rev', 5, 8) == ['Revisar PR 12', 'Revisar docs']
+        assert shell.completedefault('P', 'done "Revisar P', 14, 15) == ['PR 12']
+        assert shell.completedefault('', 'add X -t codigo ', 16, 16) == ['codigo', 'docs', 'review']
+        assert shell.completedefault('r', 'list --tag r', 11, 12) == ['review']
+        assert shell.completedefault('x', 'list x', 5, 6) == []
+        
+        cli.manager.add_task("Rascunho", tags=["rascunho"])
+        assert shell.completedefault('r', 'list -t r', 8, 9) == ['rascunho', 'review']
+        cli.manager.add_task("Infra", tags=["cliente/acme/infra"])
+        # O readline passa só o trecho após a última "/"
+        assert shell.completedefault('i', 'list -t cliente/acme/i', 21, 22) == ['infra']
+    
+    def test_comando_com_codigo_de_erro_nao_encerra(self, tmp_path, capsys):
+        """Teste 127: fsck com dano falha só na sua linha, no shell e no lote."""
+        arquivo = tmp_path / "tasks.json"
+        manager = TaskManager(str(arquivo))
+        manager.add_task("Alfa")
+        manager.add_task("Beta")
+        arquivo.write_bytes(arquivo.read_bytes().replace(b"Beta", b"Bet\x00"))
+        
+        shell = TaskShell(TaskCrafterCLI(str(arquivo)), intervalo=60,
+                          stdin=StringIO('fsck\nlist\nsair\n'), stdout=StringIO())
+        shell.cmdloop()
+        out, err = capsys.readouterr()
+        assert "Armazenamento danificado" in out and "Alfa" in out.split("fsck --repair")[1]
+        assert "O comando fsck terminou com erro (código 1)" in err
+        
+        lote = tmp_path / "lote.txt"
+        lote.write_text("fsck\nlist\n", encoding="utf-8")
+        with pytest.raises(SystemExit):
+            TaskCrafterCLI(str(arquivo)).run(['batch', str(lote)])
+        out, err = capsys.readouterr()
+        assert "❌ Linha 1: O comando fsck terminou com erro" in err
+        assert "2 linha(s), 1 erro(s)" in err and "Alfa" in out
+    
+    def test_gravacao_de_outro_processo_reaplica_pendentes(self, temp_data_file, capsys):
+        """Teste 128: Após outro processo gravar, salvar e sair reaplicam os comandos não gravados."""
+        TaskManager(temp_data_file).add_task("Compartilhada")
+        
+        def outro_processo(linha):
+            outro = TaskManager(temp_data_file)
+            if linha == 'salvar\n':
+                outro.add_task("Externa")
+                outro.delete_task(outro.get_task_by_title("Compartilhada").id)
+            elif linha == 'sair\n':
+                outro.add_task("Depois")
+        
+        class Entrada(StringIO):
+            """Simula outro processo gravando antes de 'salvar' e de 'sair'."""
+            def readline(self, *args):
+                linha = super().readline(*args)
+                outro_processo(linha)
+                return linha
+        
+        shell = TaskShell(TaskCrafterCLI(temp_data_file), intervalo=60, stdout=StringIO(), stdin=Entrada(
+            'add Minha\n'
+            'done Compartilhada\n'
+            'list\n'
+            'salvar\n'
+            'add Ultima\n'
+            'sair\n'
+        ))
+        shell.cmdloop()
+        
+        _, err = capsys.readouterr()
+        assert err.count("1 comando(s) não gravado(s) reaplicado(s)") == 2
+        assert "❌ Não reaplicado: done Compartilhada" in err
+        assert "Falha ao gravar" not in err and "💾 Alterações gravadas" in shell.stdout.getvalue()
+        assert [t.titulo for t in TaskManager(temp_data_file).tasks] == ["Externa", "Minha", "Depois", "Ultima"]
+    
+    def test_arquivar_apos_gravacao_de_outro_processo(self, temp_data_file, capsys):
+        """Teste 131: archive (que grava na hora) reaplica os comandos pendentes e é repetido."""
+        manager = TaskManager(temp_data_file)
+        manager.add_task("Velha")
+        manager.mark_as_done("Velha").data_conclusao = (datetime.now() - timedelta(days=40)).isoformat()
+        manager.save_tasks()
+        
+        cli = TaskCrafterCLI(temp_data_file)
+        shell = TaskShell(cli, intervalo=60, stdout=StringIO())
+        with cli.manager.batch():
+            shell.onecmd('add Minha')
+            TaskManager(temp_data_file).add_task("Externa")
+            shell.onecmd('archive --older-than 30d')
+            assert not cli.manager.pending_save
+        
+        out, err = capsys.readouterr()
+        assert "1 tarefa(s) arquivada(s)" in out and "1 comando(s) não gravado(s) reaplicado(s)" in err
+        assert len(segments(cli.manager.data_file)) == 1
+        assert [t.titulo for t in TaskManager(temp_data_file).tasks] == ["Externa", "Minha"]
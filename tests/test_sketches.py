@@ -0,0 +1,133 @@
+"""Testes das estatísticas aproximadas (sketches.py)."""
+
+import json
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+
+from taskcrafter.archive import read_header, segments
+from taskcrafter.manager import TaskManager
+from taskcrafter.sketches import CountMinSketch, HyperLogLog, StatusSample, StoreSketches
+
+
+def _registros(n, rng):
+    """Registros com tags de frequência concentrada (poucas tags muito usadas)."""
+    return [
+        {"id": i, "status": rng.choice(["pendente", "andamento", "concluida"]),
+         "prioridade": rng.choices(["baixa", "media", "alta"], [5, 3, 2])[0],
+         "tags": [f"tag{int(rng.paretovariate(1.2))}" for _ in range(2)]}
+        for i in range(1, n + 1)
+    ]
+
+
+class TestSketches:
+    """Testes dos esboços isolados."""
+
+    def test_limites_de_erro_e_mescla(self):
+        """Teste 121: Estimativas dentro dos limites de erro, mescláveis e serializáveis."""
+        rng = random.Random(5)
+        registros = _registros(20000, rng)
+
+        hll = HyperLogLog()
+        for i in range(20000):
+            hll.add(f"t{i}")
+        assert abs(hll.estimate() - 20000) <= 3 * hll.erro_padrao * 20000
+        metade = HyperLogLog()
+        for i in range(10000):
+            metade.add(f"t{i}")
+        outra = HyperLogLog()
+        for i in range(10000, 20000):
+            outra.add(f"t{i}")
+        metade.merge(outra)
+        assert metade.estimate() == hll.estimate()
+        assert HyperLogLog.from_dict(json.loads(json.dumps(hll.to_dict()))).estimate() == hll.estimate()
+
+        reais = Counter(tag for r in registros for tag in set(r["tags"]))
+        esboco = CountMinSketch()
+        for r in registros:
+            for tag in set(r["tags"]):
+                esboco.add(tag)
+        margem = esboco.epsilon * esboco.total
+        assert all(n <= esboco.query(tag) <= n + margem for tag, n in reais.items())
+        assert [tag for tag, _ in esboco.top(5)] == [tag for tag, _ in reais.most_common(5)]
+        esboco.add("tag1", -reais["tag1"])
+        assert esboco.query("tag1") <= margem
+
+        amostra = StatusSample(capacidade=256)
+        for r in registros:
+            amostra.add(r["id"], r["prioridade"])
+        for r in registros[:5000]:
+            amostra.remove(r["id"])
+        assert amostra.populacao == 15000 and len(amostra.itens) <= 256
+        reais = Counter(r["prioridade"] for r in registros[5000:])
+        for prioridade, e in amostra.estimate().items():
+            assert abs(e["estimativa"] - reais[prioridade]) <= 1.5 * e["erro"]
+
+        # Mesclar esboços de partes disjuntas equivale a calcular sobre o todo
+        total = StoreSketches.from_tasks(registros)
+        partes = StoreSketches.from_tasks(registros[:7000])
+        partes.merge(StoreSketches.from_tasks(registros[7000:]))
+        assert partes.report() == total.report()
+        copia = StoreSketches.from_dict(json.loads(json.dumps(total.to_dict())))
+        assert copia.report() == total.report()
+        assert total.report()["por_status"]["pendente"]["total"] == sum(
+            r["status"] == "pendente" for r in registros)
+
+
+class TestApproxStatistics:
+    """Testes da manutenção dos esboços pelo TaskManager."""
+
+    def test_incremental_persistencia_e_arquivo(self, task_manager):
+        """Teste 122: Esboços seguem as mutações, são recarregados pelo log e somam os segmentos."""
+        rng = random.Random(11)
+        tags = ["infra", "web", "cliente/acme", "cliente/beta", "rh"]
+        with task_manager.batch():
+            for i in range(80):
+                task_manager.add_task(f"T{i}", prioridade=rng.choice(["baixa", "media", "alta"]),
+                                      tags=rng.sample(tags, rng.randint(0, 2)))
+        task_manager.approx_statistics()
+        for _ in range(60):
+            task = rng.choice(task_manager.tasks)
+            acao = rng.random()
+            if acao < 0.3:
+                task_manager.mark_as_done(task.id)
+            elif acao < 0.45:
+                task_manager.delete_task(task.id)
+            else:
+                task_manager.update_task(task.id, tags=rng.sample(tags, rng.randint(0, 2)),
+                                         prioridade=rng.choice(["baixa", "media", "alta"]))
+
+        # Poucas tarefas: a amostra é o status inteiro e as contagens são exatas
+        relatorio = task_manager.approx_statistics(top=3)
+        reais = Counter((t.status, t.prioridade) for t in task_manager.tasks)
+        for status, grupo in relatorio["por_status"].items():
+            assert grupo["total"] == sum(n for (s, _), n in reais.items() if s == status)
+            assert grupo["por_prioridade"] == {
+                p: {"estimativa": n, "erro": 0} for (s, p), n in sorted(reais.items()) if s == status
+            }
+        frequencias = Counter(tag for t in task_manager.tasks for tag in t.tags)
+        assert relatorio["top_tags"] == [
+            {"tag": tag, "estimativa": n, "minimo": max(n - 1, 0)}
+            for tag, n in sorted(frequencias.items(), key=lambda par: (-par[1], par[0]))[:3]
+        ]
+        assert relatorio["total"] == len(task_manager.tasks) and relatorio["segmentos"] == 0
+
+        # Recarregado: esboços gravados e atualizados pelos eventos do log
+        assert task_manager._sidecar("sketches.json").exists()
+        assert TaskManager(str(task_manager.data_file)).approx_statistics(top=3) == relatorio
+
+        # Arquivar não muda o relatório; segmentos antigos sem esboços são lidos
+        for task in task_manager.list_tasks(status="concluida"):
+            task.data_conclusao = (datetime.now() - timedelta(days=60)).isoformat()
+        task_manager._persistir()
+        arquivadas, segmento = task_manager.archive(timedelta(days=30))
+        assert arquivadas and "esbocos" in read_header(segmento)
+        depois = TaskManager(str(task_manager.data_file)).approx_statistics(top=3)
+        assert depois == {**relatorio, "segmentos": 1}
+
+        linhas = segmento.read_text(encoding="utf-8").splitlines()
+        cabecalho = json.loads(linhas[0])
+        del cabecalho["esbocos"]
+        segmento.write_text("\n".join([json.dumps(cabecalho)] + linhas[1:]) + "\n", encoding="utf-8")
+        assert segments(task_manager.data_file) == [segmento]
+        assert TaskManager(str(task_manager.data_file)).approx_statistics(top=3) == depois
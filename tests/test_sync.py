@@ -0,0 +1,82 @@
+"""Testes da sincronização entre armazenamentos (sync.py).
+
+Dois diretórios temporários fazem o papel de duas máquinas.
+"""
+
+import pytest
+
+from taskcrafter.manager import TaskManager
+from taskcrafter.sync import sync_stores
+
+
+@pytest.fixture
+def nos(tmp_path):
+    """Cria dois armazenamentos independentes (laptop e servidor)."""
+    laptop = TaskManager(str(tmp_path / "laptop" / "tasks.json"))
+    servidor = TaskManager(str(tmp_path / "servidor" / "tasks.json"))
+    return laptop, servidor
+
+
+def _titulos(manager):
+    return sorted(t.titulo for t in manager.tasks)
+
+
+class TestSync:
+    """Testes de sincronização bidirecional."""
+    
+    def test_metadados_de_revisao(self, task_manager):
+        """Teste 66: Mutações registram data de modificação e réplica."""
+        task = task_manager.add_task("Tarefa 1")
+        assert task.replica == task_manager.replica_id
+        assert task.modificado_em is not None
+        assert TaskManager(str(task_manager.data_file)).replica_id == task_manager.replica_id
+    
+    def test_primeira_sincronizacao_completa(self, nos):
+        """Teste 67: A primeira sincronização troca todas as tarefas."""
+        laptop, servidor = nos
+        laptop.add_task("Do laptop")
+        servidor.add_task("Do servidor")
+        
+        resultado = sync_stores(laptop, servidor)
+        assert resultado.completa
+        assert (resultado.enviadas, resultado.recebidas) == (1, 1)
+        assert _titulos(laptop) == _titulos(servidor) == ["Do laptop", "Do servidor"]
+        # Os dados foram persistidos nos dois diretórios
+        assert _titulos(TaskManager(str(servidor.data_file))) == ["Do laptop", "Do servidor"]
+    
+    def test_sincronizacao_incremental(self, nos):
+        """Teste 68: Depois do primeiro ponto, apenas o que mudou é trocado."""
+        laptop, servidor = nos
+        for i in range(5):
+            laptop.add_task(f"Tarefa {i}")
+        sync_stores(laptop, servidor)
+        
+        laptop.mark_as_done("Tarefa 1")
+        servidor.delete_task("Tarefa 2")
+        resultado = sync_stores(laptop, servidor)
+        assert not resultado.completa
+        assert (resultado.enviadas, resultado.recebidas) == (1, 1)
+        assert servidor.get_task_by_title("Tarefa 1").status == "concluida"
+        assert laptop.get_task_by_title("Tarefa 2") is None
+        
+        # Nada mudou: nada é trocado
+        resultado = sync_stores(laptop, servidor)
+        assert (resultado.enviadas, resultado.recebidas, resultado.conflitos) == (0, 0, 0)
+    
+    def test_conflito_resolvido_deterministicamente(self, nos):
+        """Teste 69: Alterações concorrentes: vence a modificação mais recente."""
+        laptop, servidor = nos
+        laptop.add_task("Compartilhada")
+        sync_stores(laptop, servidor)
+        
+        servidor.update_task("Compartilhada", prioridade="baixa")
+        laptop.update_task("Compartilhada", prioridade="alta")
+        resultado = sync_stores(servidor, laptop)
+        assert resultado.conflitos == 1
+        assert laptop.get_task_by_title("Compartilhada").prioridade == "alta"
+        assert servidor.get_task_by_title("Compartilhada").prioridade == "alta"
+    
+    def test_mesma_replica_rejeitada(self, task_manager):
+        """Teste 70: Sincronizar um armazenamento consigo mesmo é um erro."""
+        with pytest.raises(ValueError, match="mesma réplica"):
+            sync_stores(task_manager, TaskManager(str(task_manager.data_file)))
@@ -0,0 +1,67 @@
+"""Testes das tags hierárquicas (tags.py)."""
+
+import random
+
+from taskcrafter.tags import TagTrie, tag_matcher
+
+
+VOCABULARIO = ["cliente/acme", "cliente/acme/infra", "cliente/acme/web", "cliente/beta",
+               "cliente/beta/infra", "clima", "infra", "interno/rh"]
+PADROES = ["cliente/acme", "cliente/acme/*", "cliente/*", "cli*", "cliente/a*", "infra",
+           "in*", "*", "nada/*", "cliente/acme/infra/*"]
+
+
+class TestTagTrie:
+    """Testes do trie e dos padrões de tag."""
+
+    def test_trie_igual_ao_predicado(self, task_manager):
+        """Teste 119: Após mutações, match e counts do trie batem com uma varredura das tarefas."""
+        rng = random.Random(3)
+        with task_manager.batch():
+            for i in range(40):
+                task_manager.add_task(f"T{i}", tags=rng.sample(VOCABULARIO, rng.randint(0, 3)))
+            trie = task_manager.tag_index
+            for _ in range(80):
+                task = rng.choice(task_manager.tasks)
+                if rng.random() < 0.2:
+                    task_manager.delete_task(task.id)
+                else:
+                    task_manager.update_task(task.id, tags=rng.sample(VOCABULARIO, rng.randint(0, 2)))
+                for padrao in PADROES:
+                    corresponde = tag_matcher(padrao)
+                    assert trie.match(padrao) == {t.id for t in task_manager.tasks if corresponde(t.tags)}
+
+        em_uso = sorted({tag for t in task_manager.tasks for tag in t.tags})
+        assert trie.tamanho == len(em_uso) == len(TagTrie(task_manager.tasks).counts())
+        assert sorted(tag for tag, _ in trie.counts()) == em_uso
+        for tag, total in trie.counts("cliente/*"):
+            assert tag.startswith("cliente/") and total == sum(tag in t.tags for t in task_manager.tasks)
+
+        # Sem tarefas, os nós são podados
+        for task in list(task_manager.tasks):
+            task_manager.delete_task(task.id)
+        assert trie.tamanho == 0 and trie.counts() == [] and not trie._raiz.filhos
+
+    def test_filtros_com_padroes(self, task_manager):
+        """Teste 120: list_tasks, stats --by, visões salvas e autocompletar aceitam padrões."""
+        for i in range(30):
+            task_manager.add_task(f"T{i:02d}", prioridade=["baixa", "media", "alta"][i % 3],
+                                  tags=[VOCABULARIO[i % len(VOCABULARIO)]])
+        task_manager.add_task("Raiz", tags=["cliente"])
+
+        for padrao in ("cliente/acme/infra", "cliente/*", "clima", "in*"):
+            for ordem in ("prioridade", "titulo", "data_criacao"):
+                corresponde = tag_matcher(padrao)
+                esperado = [t for t in task_manager.list_tasks(ordenar_por=ordem) if corresponde(t.tags)]
+                assert task_manager.list_tasks(tag=padrao, ordenar_por=ordem) == esperado
+        assert {t.titulo for t in task_manager.list_tasks(tag="cliente/*")} >= {"Raiz", "T00", "T01"}
+        assert task_manager.list_tasks(tag="cliente") == [task_manager.get_task("Raiz")]
+
+        grupos = task_manager.aggregate(["tag"], tag="cliente/acme/*")
+        assert [g["tag"] for g in grupos] == ["cliente/acme", "cliente/acme/infra", "cliente/acme/web"]
+        task_manager.save_view("acme", {"tag": "cliente/acme/*"})
+        assert len(task_manager.run_view("acme")) == 12
+
+        assert task_manager.complete_tags("cliente/b") == ["cliente/beta", "cliente/beta/infra"]
+        assert task_manager.tags("cli*")[:2] == [("cliente", 1), ("cliente/acme", 4)]
+        assert task_manager.metrics()["indices"]["tags"] == len(VOCABULARIO) + 1
@@ -0,0 +1,107 @@
+"""Testes dos workspaces e das consultas federadas (workspace.py)."""
+
+import random
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from taskcrafter import workspace as workspace_module
+from taskcrafter.indexes import CHAVES
+from taskcrafter.manager import TaskManager
+from taskcrafter.workspace import Workspace
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Workspace com três armazenamentos preenchidos de forma aleatória."""
+    rng = random.Random(11)
+    ws = Workspace(tmp_path / "ws.json")
+    for nome in ("alfa", "beta", "gama"):
+        manager = TaskManager(str(tmp_path / nome / "tasks.json"))
+        with manager.batch():
+            for i in range(25):
+                manager.add_task(f"{nome}-{i}", prioridade=rng.choice(["baixa", "media", "alta"]),
+                                 tags=[rng.choice(["x", "y"])])
+        ws.add_store(nome, f"{nome}/tasks.json")
+    return ws
+
+
+class TestWorkspace:
+    """Testes da intercalação, do top-k e dos resultados parciais."""
+    
+    def test_intercalacao_igual_a_ordenacao_global(self, workspace):
+        """Teste 105: A intercalação federada equivale a ordenar todas as tarefas juntas."""
+        todas = [(loja.nome, task) for loja in workspace.lojas
+                 for task in TaskManager(str(workspace.path(loja))).tasks]
+        for criterio in ("prioridade", "titulo", "data_criacao"):
+            esperado = sorted(todas, key=lambda par: CHAVES[criterio](par[1]))
+            resultado = workspace.list_tasks(ordenar_por=criterio)
+            assert not resultado.parcial
+            assert [(l, t.titulo) for l, t in resultado.itens] == [(l, t.titulo) for l, t in esperado]
+        
+        top = workspace.list_tasks(limite=5, ordenar_por="prioridade", tag="x")
+        filtradas = [par for par in todas if "x" in par[1].tags]
+        assert [t.titulo for _, t in top.itens] == [
+            t.titulo for _, t in sorted(filtradas, key=lambda par: CHAVES["prioridade"](par[1]))[:5]
+        ]
+        
+        grupos = workspace.aggregate(["tag"]).itens
+        assert sum(g["total"] for g in grupos) == 75
+        assert workspace.get_statistics().itens[0]["total"] == 75
+        assert [t.titulo for _, t in workspace.search("beta-1", limite=3).itens] == ["beta-1", "beta-10", "beta-11"]
+        assert Workspace.load(workspace.caminho).lojas == workspace.lojas
+    
+    def test_falhas_e_atrasos_viram_resultado_parcial(self, workspace, monkeypatch):
+        """Teste 106: Armazenamentos ausentes, danificados ou lentos não derrubam a consulta."""
+        workspace.add_store("ausente", "nao/existe.json")
+        (workspace.caminho.parent / "gama" / "tasks.json").write_text("{quebrado")
+        
+        class Lento(TaskManager):
+            def __init__(self, arquivo, *args, **kwargs):
+                if "beta" in arquivo:
+                    time.sleep(1)
+                super().__init__(arquivo, *args, **kwargs)
+        
+        monkeypatch.setattr(workspace_module, "TaskManager", Lento)
+        inicio = time.perf_counter()
+        resultado = workspace.list_tasks(timeout=0.3)
+        assert time.perf_counter() - inicio < 0.9
+        assert resultado.parcial
+        assert set(resultado.falhas) == {"beta", "gama", "ausente"}
+        assert "tempo esgotado" in resultado.falhas["beta"]
+        assert "danificado" in resultado.falhas["gama"]
+        assert {loja for loja, _ in resultado.itens} == {"alfa"}
+        
+        with pytest.raises(ValueError, match="Dimensão inválida"):
+            workspace.aggregate(["dono"])
+        with pytest.raises(ValueError, match="Ordenação inválida"):
+            workspace.list_tasks(ordenar_por="dono")
+        with pytest.raises(ValueError, match="inválido"):
+            workspace.caminho.write_text("[]")
+            Workspace.load(workspace.caminho)
+    
+    def test_armazenamento_atrasado_nao_segura_o_processo(self, workspace):
+        """Teste 132: Após o prazo, o processo encerra sem esperar o armazenamento atrasado."""
+        script = textwrap.dedent(f"""
+            import time
+            from taskcrafter import workspace as modulo
+            from taskcrafter.manager import TaskManager
+
+            class Lento(TaskManager):
+                def __init__(self, arquivo, *args, **kwargs):
+                    if "beta" in arquivo:
+                        time.sleep(30)
+                    super().__init__(arquivo, *args, **kwargs)
+
+            modulo.TaskManager = Lento
+            resultado = modulo.Workspace.load({str(workspace.caminho)!r}).list_tasks(timeout=0.2)
+            print(sorted(resultado.falhas))
+        """)
+        inicio = time.perf_counter()
+        processo = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=20)
+        assert processo.returncode == 0, processo.stderr
+        assert processo.stdout.strip() == "['beta']"
+        assert time.perf_counter() - inicio < 10